@@ -0,0 +1,150 @@
+"""In-process response cache for the REST API.
+
+Responses are kept in a bounded LRU keyed by route and query string. When
+the database generation moves on (any ingest bumps it) the whole cache is
+dropped. A write names the generation its response was computed at and is
+discarded if the generation has moved on since, so a request that raced an
+ingest cannot repopulate the fresh cache with a stale body.
+
+Reading the generation queries the database, so it happens only in
+``refresh``, which async callers run in a worker thread; ``get`` and ``put``
+never block on I/O.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached response body with its validator."""
+
+    body: bytes
+    media_type: str
+    etag: str
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str) -> "CachedResponse":
+        """Wrap a body, deriving a strong ETag from its content hash."""
+        return cls(body=body, media_type=media_type, etag=etag_for(body))
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCache:
+    """Bounded LRU of responses, invalidated by a database generation counter.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        generation: Returns the current database generation (may block)
+        check_interval: Seconds between generation checks, so cache hits do
+            not touch the database on every request
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        generation: Callable[[], int],
+        check_interval: float = 1.0,
+    ):
+        self.maxsize = maxsize
+        self._generation_fn = generation
+        self.check_interval = check_interval
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: int | None = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def needs_refresh(self) -> bool:
+        """Whether the generation is due for a check (no database access)."""
+        with self._lock:
+            return (
+                self._generation is None
+                or time.monotonic() - self._checked_at >= self.check_interval
+            )
+
+    def refresh(self) -> None:
+        """Read the database generation and drop everything if it moved on.
+
+        The lock is not held while the generation is read, so a slow query
+        never stalls ``get`` and ``put``.
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+        generation = self._generation_fn()
+        with self._lock:
+            if generation != self._generation:
+                if self._generation is not None:
+                    self.invalidations += 1
+                self._generation = generation
+                self._entries.clear()
+
+    @property
+    def generation(self) -> int | None:
+        """The generation seen by the last refresh (no database access)."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return a cached response and mark it recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse, generation: int | None = None) -> None:
+        """Cache a response, evicting the least recently used beyond maxsize.
+
+        Args:
+            key: Route and query string
+            entry: The response to cache
+            generation: The generation the response was computed at (read
+                from ``generation`` before computing it); the write is
+                dropped if the cache has since moved to another generation
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | None]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "generation": self._generation,
+            }
@@ -1,14 +1,24 @@
 """FastAPI application for the law archive REST API."""
 
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import date
 from pathlib import Path
+from urllib.parse import urlencode
 
-from fastapi import FastAPI, HTTPException, Query
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 
+from atlas.api.cache import CachedResponse, ResponseCache, etag_matches
 from atlas.archive import Arch
-from atlas.models import Citation, SearchResult, Section
+from atlas.export import gzip_stream, iter_ndjson
+from atlas.models import Citation, SearchResult, Section, Subsection, SubsectionTree
+from atlas.storage.sqlite import SQLiteStorage
 
 
 # Response models
@@ -39,6 +49,52 @@ class SectionResponse(BaseModel):
             referenced_by=section.referenced_by,
         )
 
+    @classmethod
+    def json_response(
+        cls, section: Section, subsections: SubsectionTree | None = None
+    ) -> Response:
+        """Serialize a section to a JSON response.
+
+        When ``subsections`` is given, its stored JSON is spliced into the body
+        as-is instead of being decoded into models and re-encoded.
+        """
+        response = cls.from_section(section)
+        if subsections is None:
+            return Response(response.model_dump_json(), media_type="application/json")
+        body = response.model_dump_json(exclude={"subsections"})
+        return Response(
+            f'{body[:-1]},"subsections":{subsections.raw_json}}}',
+            media_type="application/json",
+        )
+
+
+class SubsectionResponse(BaseModel):
+    """API response for a single subsection and its descendants."""
+
+    citation: str
+    section_title: str
+    identifier: str
+    heading: str | None
+    text: str
+    children: list[dict]
+    source_url: str
+    retrieved_at: date
+
+    @classmethod
+    def from_subsection(
+        cls, section: Section, citation: Citation, subsection: Subsection
+    ) -> "SubsectionResponse":
+        return cls(
+            citation=citation.usc_cite,
+            section_title=section.section_title,
+            identifier=subsection.identifier,
+            heading=subsection.heading,
+            text=subsection.full_text(),
+            children=[c.model_dump() for c in subsection.children],
+            source_url=section.source_url,
+            retrieved_at=section.retrieved_at,
+        )
+
 
 class SearchResultResponse(BaseModel):
     """API response for search results."""
@@ -84,23 +140,111 @@ class ReferencesResponse(BaseModel):
     referenced_by: list[str]
 
 
-def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
+class BatchSectionsRequest(BaseModel):
+    """API request for several sections at once."""
+
+    citations: list[str] = Field(..., min_length=1, max_length=1000)
+    text_only: bool = False
+
+
+class BatchSectionsResponse(BaseModel):
+    """API response mapping each requested citation to its section."""
+
+    sections: dict[str, SectionResponse | None]
+    not_found: list[str]
+
+
+def create_app(
+    db_path: Path | str = "atlas.db",
+    cache_size: int = 1024,
+    cache_max_age: int = 300,
+    read_threads: int = 100,
+) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Endpoints are plain functions, so FastAPI runs them in its thread pool
+    rather than on the event loop; each pool thread reads the database through
+    its own read-only connection.
+
     Args:
         db_path: Path to SQLite database
+        cache_size: Maximum responses held in the in-process cache (0 disables it)
+        cache_max_age: Seconds clients and CDNs may reuse a response (Cache-Control)
+        read_threads: Size of the thread pool that runs endpoint handlers
 
     Returns:
         Configured FastAPI application
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = read_threads
+        # WAL lets the pooled readers run alongside writes. Done at startup
+        # rather than in create_app, which runs on import (``app`` below).
+        archive.storage.enable_wal()
+        yield
+
     app = FastAPI(
         title="Atlas",
         description="Open source US statute text via API",
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
+    # Initialize archive, with concurrent per-thread readers
+    archive = Arch(storage=SQLiteStorage(db_path, read_pool=True))
+
+    # Response cache, dropped whenever an ingest bumps the database generation
+    cache = ResponseCache(cache_size, archive.storage.get_generation) if cache_size > 0 else None
+    cache_control = f"public, max-age={cache_max_age}"
+
+    def _get_with_tree(
+        citation: Citation, as_of: date | None, text_only: bool
+    ) -> tuple[Section, SubsectionTree | None] | None:
+        """A section plus (unless text_only) its stored tree, from one storage read."""
+        if text_only:
+            result = archive.get(citation, as_of=as_of, text_only=True)
+            return (result, None) if result else None
+        return archive.get_with_tree(citation, as_of=as_of)
+
+    def cached_response(request: Request, entry: CachedResponse, status: str) -> Response:
+        headers = {"ETag": entry.etag, "Cache-Control": cache_control, "X-Cache": status}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(entry.body, media_type=entry.media_type, headers=headers)
+
+    # Registered before CORS so CORS stays the outermost layer, hits included
+    @app.middleware("http")
+    async def cache_responses(request: Request, call_next):
+        """Serve repeated GETs from the cache, with ETag revalidation."""
+        path = request.url.path
+        if cache is None or request.method != "GET" or not path.startswith("/v1/"):
+            return await call_next(request)
+        if path == "/v1/metrics" or path.endswith("/export"):
+            return await call_next(request)
+
+        key = f"{path}?{urlencode(sorted(request.query_params.multi_items()))}"
+        if cache.needs_refresh():
+            # The generation is a SQLite read; keep it off the event loop
+            await anyio.to_thread.run_sync(cache.refresh)
+        entry = cache.get(key)
+        if entry is not None:
+            return cached_response(request, entry, "HIT")
+
+        # An ingest during call_next must not let this response into the cache
+        generation = cache.generation
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        entry = CachedResponse.build(
+            body, response.headers.get("content-type", "application/json")
+        )
+        cache.put(key, entry, generation)
+        return cached_response(request, entry, "MISS")
+
     # CORS middleware for browser access
     app.add_middleware(
         CORSMiddleware,
@@ -110,9 +254,6 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Initialize archive
-    archive = Arch(db_path=db_path)
-
     @app.get("/")
     async def root():
         """API root - returns basic info."""
@@ -122,8 +263,13 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
             "docs": "/docs",
         }
 
+    @app.get("/v1/metrics")
+    async def metrics():
+        """Response cache hit/miss counters."""
+        return {"cache": cache.stats() if cache else None}
+
     @app.get("/v1/titles", response_model=list[TitleResponse])
-    async def list_titles():
+    def list_titles():
         """List all available US Code titles."""
         titles = archive.list_titles()
         return [
@@ -137,56 +283,117 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
             for t in titles
         ]
 
+    @app.get("/v1/titles/{title}/export")
+    def export_title(
+        title: int,
+        text_only: bool = Query(False, description="Omit subsection trees"),
+        compress: bool = Query(False, description="Gzip the stream"),
+    ):
+        """Stream every section of a title as NDJSON, one section per line.
+
+        Examples:
+            - /v1/titles/26/export - All of Title 26
+            - /v1/titles/26/export?compress=true - As usc26.ndjson.gz
+        """
+        sections = archive.export_title(title, text_only=text_only)
+        first = next(sections, None)
+        if first is None:
+            raise HTTPException(status_code=404, detail=f"Title {title} not found")
+
+        body = iter_ndjson(itertools.chain([first], sections))
+        # Runs after the stream ends or the client disconnects, releasing
+        # the storage cursor either way
+        close = BackgroundTask(sections.close)
+        if compress:
+            return StreamingResponse(
+                gzip_stream(body),
+                media_type="application/gzip",
+                headers={"Content-Disposition": f'attachment; filename="usc{title}.ndjson.gz"'},
+                background=close,
+            )
+        return StreamingResponse(body, media_type="application/x-ndjson", background=close)
+
     @app.get("/v1/sections/{title}/{section}", response_model=SectionResponse)
-    async def get_section(
+    def get_section(
         title: int,
         section: str,
         as_of: date | None = Query(None, description="Historical version date"),
+        text_only: bool = Query(False, description="Omit the subsection tree"),
     ):
         """Get a specific section by title and section number.
 
         Examples:
             - /v1/sections/26/32 - Get IRC § 32 (EITC)
             - /v1/sections/26/32?as_of=2020-01-01 - Historical version
+            - /v1/sections/26/32?text_only=true - Text without subsections
         """
-        result = archive.get(
-            Citation(title=title, section=section),
-            as_of=as_of,
-        )
-        if not result:
+        citation = Citation(title=title, section=section)
+        found = _get_with_tree(citation, as_of, text_only)
+        if not found:
             raise HTTPException(
                 status_code=404,
                 detail=f"Section {title} USC {section} not found",
             )
-        return SectionResponse.from_section(result)
+        return SectionResponse.json_response(*found)
 
-    @app.get("/v1/sections/{title}/{section}/{subsection:path}", response_model=SectionResponse)
-    async def get_subsection(
+    @app.get(
+        "/v1/sections/{title}/{section}/{subsection:path}", response_model=SubsectionResponse
+    )
+    def get_subsection(
         title: int,
         section: str,
         subsection: str,
         as_of: date | None = Query(None, description="Historical version date"),
     ):
-        """Get a specific subsection.
+        """Get a specific subsection and its descendants.
 
         Examples:
             - /v1/sections/26/32/a/1 - Get IRC § 32(a)(1)
         """
-        # For now, get the full section and let the client navigate
-        # TODO: Return just the subsection
-        result = archive.get(
-            Citation(title=title, section=section, subsection=subsection),
-            as_of=as_of,
-        )
+        citation = Citation(title=title, section=section, subsection=subsection)
+        result = archive.get(citation, as_of=as_of, text_only=True)
         if not result:
             raise HTTPException(
                 status_code=404,
-                detail=f"Section {title} USC {section}({subsection}) not found",
+                detail=f"Section {title} USC {section} not found",
+            )
+        node = archive.get_subsection(citation)
+        if not node:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Subsection {citation.usc_cite} not found",
             )
-        return SectionResponse.from_section(result)
+        return SubsectionResponse.from_subsection(result, citation, node)
+
+    @app.post("/v1/sections:batch", response_model=BatchSectionsResponse)
+    def get_sections_batch(body: BatchSectionsRequest):
+        """Get many sections by citation in one request.
+
+        Citations that cannot be parsed or are not in the archive map to null
+        and are listed in ``not_found``.
+
+        Example body:
+            {"citations": ["26 USC 24", "26 USC 32(a)"], "text_only": true}
+        """
+        parsed = {}
+        for cite in body.citations:
+            try:
+                parsed[cite] = Citation.from_string(cite)
+            except ValueError:
+                continue
+
+        found = archive.get_many(list(parsed.values()), text_only=body.text_only)
+        sections = {}
+        for cite in body.citations:
+            result = found.get(parsed[cite].usc_cite) if cite in parsed else None
+            sections[cite] = SectionResponse.from_section(result) if result else None
+        return BatchSectionsResponse(
+            sections=sections,
+            not_found=[cite for cite, result in sections.items() if result is None],
+        )
 
     @app.get("/v1/search", response_model=SearchResponse)
-    async def search(
+    def search(
         q: str = Query(..., min_length=1, description="Search query"),
         title: int | None = Query(None, description="Limit to specific title"),
         limit: int = Query(20, ge=1, le=100, description="Maximum results"),
@@ -207,7 +414,7 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         )
 
     @app.get("/v1/references/{title}/{section}", response_model=ReferencesResponse)
-    async def get_references(title: int, section: str):
+    def get_references(title: int, section: str):
         """Get cross-references for a section.
 
         Returns sections that this section references and sections that
@@ -221,9 +428,10 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         )
 
     @app.get("/v1/citation/{citation:path}", response_model=SectionResponse)
-    async def get_by_citation(
+    def get_by_citation(
         citation: str,
         as_of: date | None = Query(None, description="Historical version date"),
+        text_only: bool = Query(False, description="Omit the subsection tree"),
     ):
         """Get a section by full citation string.
 
@@ -236,13 +444,13 @@ def create_app(db_path: Path | str = "atlas.db") -> FastAPI:
         except ValueError as e:  # pragma: no cover
             raise HTTPException(status_code=400, detail=str(e)) from e  # pragma: no cover
 
-        result = archive.get(parsed, as_of=as_of)
-        if not result:
+        found = _get_with_tree(parsed, as_of, text_only)
+        if not found:
             raise HTTPException(
                 status_code=404,
                 detail=f"Section {citation} not found",
             )
-        return SectionResponse.from_section(result)
+        return SectionResponse.json_response(*found)
 
     return app
 
@@ -1,12 +1,53 @@
 """Main Arch class - the public API."""
 
+from collections.abc import Iterator, Sequence
+from contextlib import closing, nullcontext
 from datetime import date
 from pathlib import Path
 
-from atlas.models import Citation, SearchResult, Section, TitleInfo
+from atlas.models import (
+    Citation,
+    SearchResult,
+    Section,
+    Subsection,
+    SubsectionTree,
+    TitleInfo,
+)
 from atlas.storage.base import StorageBackend
 from atlas.storage.sqlite import SQLiteStorage
 
+# Positive law titles (enacted into law directly, not just prima facie evidence)
+POSITIVE_LAW_TITLES = {
+    1,
+    3,
+    4,
+    5,
+    9,
+    10,
+    11,
+    13,
+    14,
+    17,
+    18,
+    23,
+    28,
+    31,
+    32,
+    34,
+    35,
+    36,
+    37,
+    38,
+    39,
+    40,
+    41,
+    44,
+    46,
+    49,
+    51,
+    54,
+}
+
 
 class Arch:
     """Main interface for accessing the law archive.
@@ -39,12 +80,14 @@ class Arch:
         self,
         citation: str | Citation,
         as_of: date | None = None,
+        text_only: bool = False,
     ) -> Section | None:
         """Get a section by citation.
 
         Args:
             citation: USC citation string (e.g., "26 USC 32") or Citation object
             as_of: Optional date for historical version
+            text_only: Skip loading the subsection tree and public laws
 
         Returns:
             Section object or None if not found
@@ -62,8 +105,117 @@ class Arch:
             section=citation.section,
             subsection=citation.subsection,
             as_of=as_of,
+            text_only=text_only,
         )
 
+    def get_many(
+        self,
+        citations: Sequence[str | Citation],
+        text_only: bool = False,
+    ) -> dict[str, Section | None]:
+        """Get many sections at once, with a single storage lookup.
+
+        Args:
+            citations: USC citation strings or Citation objects
+            text_only: Skip loading subsection trees and public laws
+
+        Returns:
+            Dict mapping each citation (as given, or ``usc_cite`` for Citation
+            objects) to its Section, or None if not found
+
+        Example:
+            >>> eitc = atlas.get("26 USC 32")
+            >>> refs = atlas.get_many(eitc.references_to)
+        """
+        parsed = {
+            c.usc_cite if isinstance(c, Citation) else c: (
+                c if isinstance(c, Citation) else Citation.from_string(c)
+            )
+            for c in citations
+        }
+        found = self.storage.get_sections(
+            [(c.title, c.section) for c in parsed.values()], text_only=text_only
+        )
+        return {key: found.get((c.title, c.section)) for key, c in parsed.items()}
+
+    def get_subsection(self, citation: str | Citation) -> Subsection | None:
+        """Get just the subsection a citation points at.
+
+        Args:
+            citation: USC citation with a subsection, e.g. "26 USC 32(b)(1)"
+
+        Returns:
+            Subsection (with its children) or None if not found
+
+        Example:
+            >>> atlas.get_subsection("26 USC 32(b)(1)").full_text()
+        """
+        if isinstance(citation, str):
+            citation = Citation.from_string(citation)
+        if not citation.subsection:
+            return None
+
+        return self.storage.get_subsection(citation.title, citation.section, citation.subsection)
+
+    def get_with_tree(
+        self,
+        citation: str | Citation,
+        as_of: date | None = None,
+    ) -> tuple[Section, SubsectionTree] | None:
+        """Get a section with its subsection tree left as stored JSON.
+
+        Both come from one storage read, so they always belong to the same
+        version of the section.
+
+        Args:
+            citation: USC citation string or Citation object
+            as_of: Optional date for historical version
+
+        Returns:
+            (Section without decoded subsections, SubsectionTree) or None
+
+        Example:
+            >>> section, tree = atlas.get_with_tree("26 USC 32")
+        """
+        if isinstance(citation, str):
+            citation = Citation.from_string(citation)
+
+        return self.storage.get_section_with_tree(citation.title, citation.section, as_of=as_of)
+
+    def get_subsection_tree(self, citation: str | Citation) -> SubsectionTree | None:
+        """Get a section's subsection hierarchy without building models for it.
+
+        Args:
+            citation: USC citation string or Citation object
+
+        Returns:
+            SubsectionTree (decoded on first access) or None if not found
+
+        Example:
+            >>> tree = atlas.get_subsection_tree("26 USC 32")
+            >>> tree.get("b/1")["text"]
+        """
+        if isinstance(citation, str):
+            citation = Citation.from_string(citation)
+
+        return self.storage.get_subsection_tree(citation.title, citation.section)
+
+    def export_title(self, title: int, text_only: bool = False) -> Iterator[Section]:
+        """Stream every section of a title, in section order.
+
+        Args:
+            title: Title number
+            text_only: Skip loading subsection trees and public laws
+
+        Returns:
+            Iterator of Section objects (empty if the title is not archived)
+
+        Example:
+            >>> for section in atlas.export_title(26):
+            ...     print(section.citation.usc_cite)
+        """
+        return self.storage.iter_sections(title, text_only=text_only)
+
     def search(
         self,
         query: str,
@@ -131,55 +283,79 @@ class Arch:
         """
         from atlas.parsers.us.statutes import USLMParser
 
-        parser = USLMParser(xml_path)
-        count = 0
+        # Stream sections so memory is bounded by the largest section, not the title
+        parser = USLMParser(xml_path, streaming=True)
 
         title_num = parser.get_title_number()
         title_name = parser.get_title_name()
 
         print(f"Ingesting Title {title_num}: {title_name}")
 
-        for section in parser.iter_sections():
-            self.storage.store_section(section)
-            count += 1
-            if count % 100 == 0:
-                print(f"  Processed {count} sections...")
-
-        # Update title metadata
-        # Positive law titles (enacted into law directly, not just prima facie evidence)
-        positive_law_titles = {
-            1,
-            3,
-            4,
-            5,
-            9,
-            10,
-            11,
-            13,
-            14,
-            17,
-            18,
-            23,
-            28,
-            31,
-            32,
-            34,
-            35,
-            36,
-            37,
-            38,
-            39,
-            40,
-            41,
-            44,
-            46,
-            49,
-            51,
-            54,
-        }
-        is_positive_law = title_num in positive_law_titles
+        def with_progress(sections: Iterator[Section]) -> Iterator[Section]:
+            for n, section in enumerate(sections, 1):
+                yield section
+                if n % 100 == 0:
+                    print(f"  Processed {n} sections...")
+
+        count = self.storage.store_sections(with_progress(parser.iter_sections()))
+
+        is_positive_law = title_num in POSITIVE_LAW_TITLES
 
         self.storage.update_title_metadata(title_num, title_name, is_positive_law)
 
         print(f"Completed: {count} sections from Title {title_num}")
         return count
+
+    def ingest_titles(
+        self,
+        xml_paths: Sequence[Path | str],
+        workers: int | None = None,
+        batch_size: int = 500,
+    ) -> int:
+        """Ingest several US Code titles, parsing them in parallel.
+
+        Each title is parsed in its own worker process while this process
+        writes the parsed sections to storage in batches. For SQLite the FTS
+        index is rebuilt once at the end rather than row by row.
+
+        Args:
+            xml_paths: Paths to USLM XML files
+            workers: Number of parser processes (default: CPU count)
+            batch_size: Sections per write batch
+
+        Returns:
+            Total number of sections ingested
+
+        Example:
+            >>> atlas.ingest_titles(sorted(Path("data/uscode").glob("usc*.xml")), workers=16)
+        """
+        from atlas.parsers.us.statutes import iter_titles_parallel
+
+        total = 0
+        bulk = (
+            self.storage.deferred_fts()
+            if isinstance(self.storage, SQLiteStorage)
+            else nullcontext()
+        )
+        print(f"Ingesting {len(xml_paths)} titles...")
+
+        parsed = iter_titles_parallel(xml_paths, workers=workers, chunk_size=batch_size)
+        # closing() stops the parse workers promptly if storing fails
+        with bulk, closing(parsed) as chunks:
+            for chunk in chunks:
+                if chunk.sections:
+                    total += self.storage.store_sections(chunk.sections, batch_size=batch_size)
+                if not chunk.final:
+                    continue
+                if chunk.error:
+                    print(f"Error ingesting {chunk.xml_path}: {chunk.error}")
+                    continue
+
+                self.storage.update_title_metadata(
+                    chunk.title_num,
+                    chunk.title_name,
+                    chunk.title_num in POSITIVE_LAW_TITLES,
+                )
+                print(f"Completed: {chunk.count} sections from Title {chunk.title_num}")
+
+        return total
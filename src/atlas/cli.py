@@ -1,5 +1,6 @@
 """Command-line interface for the law archive."""
 
+from itertools import chain
 from pathlib import Path
 
 import click
@@ -125,20 +126,105 @@ def titles(ctx: click.Context):
 
 
 @main.command()
-@click.argument("xml_path", type=click.Path(exists=True, path_type=Path))
+@click.argument("xml_paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option("--all", "ingest_all", is_flag=True, help="Ingest every usc*.xml in --input-dir")
+@click.option(
+    "--input-dir",
+    type=click.Path(path_type=Path),
+    default=Path("data/uscode"),
+    help="Directory of USLM files for --all",
+)
+@click.option("--workers", "-w", type=int, help="Parallel parser processes (default: CPU count)")
 @click.pass_context
-def ingest(ctx: click.Context, xml_path: Path):
-    """Ingest a US Code title from USLM XML file.
+def ingest(
+    ctx: click.Context,
+    xml_paths: tuple[Path, ...],
+    ingest_all: bool,
+    input_dir: Path,
+    workers: int | None,
+):
+    """Ingest US Code titles from USLM XML files.
+
+    Several titles (or --all) are parsed in parallel worker processes.
 
     Example:
         atlas ingest data/uscode/usc26.xml
+        atlas ingest --all --workers 16
     """
+    paths = list(xml_paths)
+    if ingest_all:
+        paths.extend(sorted(input_dir.glob("usc*.xml")))
+    if not paths:
+        raise click.UsageError("Provide XML paths or --all")
+
     archive = Arch(db_path=ctx.obj["db"])
-    with console.status(f"Ingesting {xml_path}..."):
-        count = archive.ingest_title(xml_path)
+    if len(paths) == 1:
+        with console.status(f"Ingesting {paths[0]}..."):
+            count = archive.ingest_title(paths[0])
+    else:
+        with console.status(f"Ingesting {len(paths)} titles..."):
+            count = archive.ingest_titles(paths, workers=workers)
     console.print(f"[green]Successfully ingested {count} sections[/green]")
 
 
+@main.command()
+@click.option("--title", "-t", "title_num", type=int, required=True, help="Title to export")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["ndjson", "parquet"]),
+    default="ndjson",
+    help="Output format",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    help="Output file (default: usc<title>.ndjson[.gz] or usc<title>.parquet)",
+)
+@click.option("--gzip", "compress", is_flag=True, help="Gzip NDJSON output")
+@click.option("--text-only", is_flag=True, help="Omit subsection trees")
+@click.pass_context
+def export(
+    ctx: click.Context,
+    title_num: int,
+    fmt: str,
+    output: Path | None,
+    compress: bool,
+    text_only: bool,
+):
+    """Export every section of a title in one sequential scan.
+
+    Example:
+        atlas export --title 26
+        atlas export --title 26 --format parquet -o usc26.parquet
+    """
+    from atlas.export import write_ndjson, write_parquet
+
+    archive = Arch(db_path=ctx.obj["db"])
+    sections = iter(archive.export_title(title_num, text_only=text_only))
+
+    # Check before opening the output, so an empty title leaves no file behind
+    first = next(sections, None)
+    if first is None:
+        console.print(f"[red]No sections found for Title {title_num}[/red]")
+        raise SystemExit(1)
+    sections = chain([first], sections)
+
+    with console.status(f"Exporting Title {title_num}..."):
+        if fmt == "parquet":
+            output = output or Path(f"usc{title_num}.parquet")
+            try:
+                count = write_parquet(sections, output)
+            except ImportError as e:
+                raise click.ClickException(str(e)) from e
+        else:
+            output = output or Path(f"usc{title_num}.ndjson{'.gz' if compress else ''}")
+            count = write_ndjson(sections, output, compress=compress)
+
+    console.print(f"[green]Exported {count} sections to {output}[/green]")
+
+
 @main.command()
 @click.argument("title_num", type=int)
 @click.option(
@@ -2042,5 +2128,161 @@ def sb_stats():
     )
 
 
+@main.command("r2-sync")
+@click.argument("prefix", default="us/statutes/states/")
+@click.option(
+    "--bucket",
+    type=click.Choice(["atlas", "rules-xml"]),
+    default="atlas",
+    help="Bucket to list",
+)
+@click.option(
+    "--manifest",
+    "manifest_path",
+    type=click.Path(path_type=Path),
+    default=Path("data/r2-manifest.db"),
+    help="Local SQLite manifest to update",
+)
+@click.option("--workers", type=int, default=8, help="Sub-prefixes listed in parallel")
+def r2_sync(prefix: str, bucket: str, manifest_path: Path, workers: int):
+    """Refresh the local manifest of R2 objects under a prefix.
+
+    Reports the keys added, changed or removed since the last sync, then the
+    object count and size, without listing the bucket again.
+
+    Example:
+        atlas r2-sync us/statutes/states/ak/
+        atlas r2-sync us/statutes/states/ --bucket rules-xml
+    """
+    from atlas.storage.r2 import get_r2_atlas, get_r2_rules_xml
+    from atlas.storage.r2_manifest import R2Manifest
+
+    r2 = get_r2_atlas() if bucket == "atlas" else get_r2_rules_xml()
+    manifest = R2Manifest(manifest_path, r2.bucket)
+    try:
+        previous = manifest.last_synced(prefix)
+        with console.status(f"Listing {r2.bucket}/{prefix}..."):
+            changes = manifest.sync(r2, prefix, workers=workers)
+        stats = manifest.stats(prefix)
+    finally:
+        manifest.close()
+
+    console.print(
+        Panel(
+            f"[bold]Objects:[/bold] {stats['count']:,} ({stats['total_bytes']:,} bytes)\n"
+            f"[green]Added:[/green] {len(changes.added):,}\n"
+            f"[yellow]Changed:[/yellow] {len(changes.changed):,}\n"
+            f"[red]Removed:[/red] {len(changes.removed):,}\n"
+            f"[dim]Previous sync: {previous or 'never'}[/dim]",
+            title=f"{r2.bucket}/{prefix}",
+        )
+    )
+
+
+@main.command("sb-ingest")
+@click.option(
+    "--title", "-t", "titles", type=int, multiple=True, help="Title(s) to ingest (default: all)"
+)
+@click.option(
+    "--input-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path("data/uscode"),
+    help="Directory of usc*.xml files",
+)
+@click.option("--workers", "-w", type=int, help="Parallel parser processes")
+@click.option(
+    "--copy", "use_copy", is_flag=True, help="Load with COPY over a direct database connection"
+)
+@click.option(
+    "--db-url",
+    envvar="COSILICO_SUPABASE_DB_URL",
+    help="PostgreSQL URL for --copy (default: COSILICO_SUPABASE_DB_URL)",
+)
+def sb_ingest(
+    titles: tuple[int, ...],
+    input_dir: Path,
+    workers: int | None,
+    use_copy: bool,
+    db_url: str | None,
+):
+    """Ingest US Code titles into the Supabase rules table (arch.rules).
+
+    By default rules are upserted through the REST API. With --copy they are
+    streamed into Postgres with COPY and merged in batches, which is much
+    faster for full-corpus loads.
+
+    Examples:
+        arch sb-ingest -t 26
+        arch sb-ingest --copy --workers 8
+    """
+    from atlas.ingest import SupabaseIngestor
+
+    if use_copy and not db_url:
+        raise click.UsageError("--copy needs --db-url or COSILICO_SUPABASE_DB_URL")
+
+    with SupabaseIngestor(db_url=db_url if use_copy else None) as ingestor:
+        count = ingestor.ingest_all_usc(
+            uscode_path=input_dir, titles=list(titles) or None, workers=workers
+        )
+    console.print(f"[green]Upserted {count:,} rules[/green]")
+
+
+@main.command("sb-store")
+@click.argument("jurisdiction")
+@click.option("--code", "-c", "codes", multiple=True, help="Code(s) to store (default: all)")
+@click.option("--max-sections", type=int, help="Limit sections per code (for testing)")
+@click.option(
+    "--copy/--no-copy",
+    "use_copy",
+    default=True,
+    help="Load in COPY batches (default) or insert one statute at a time",
+)
+@click.option(
+    "--db-url",
+    envvar="COSILICO_SUPABASE_DB_URL",
+    help="PostgreSQL URL (default: COSILICO_SUPABASE_DB_URL)",
+)
+@click.option(
+    "--http-cache",
+    "http_cache_dir",
+    type=click.Path(path_type=Path),
+    help="Keep fetched pages here and revalidate them (ETag/Last-Modified) on later runs",
+)
+def sb_store(
+    jurisdiction: str,
+    codes: tuple[str, ...],
+    max_sections: int | None,
+    use_copy: bool,
+    db_url: str | None,
+    http_cache_dir: Path | None,
+):
+    """Download a jurisdiction's statutes into Supabase (arch.statutes).
+
+    Examples:
+        arch sb-store us-ca -c RTC
+        arch sb-store us-ny --no-copy --max-sections 10
+        arch sb-store us-oh --http-cache data/http-cache
+    """
+    from atlas.http_cache import HTTPCache
+    from atlas.sources.base import load_source
+    from atlas.storage.supabase import SupabaseStorage
+
+    http_cache = HTTPCache(http_cache_dir) if http_cache_dir else None
+    source = load_source(jurisdiction, http_cache=http_cache)
+    storage = SupabaseStorage(db_url=db_url)
+    try:
+        statutes = source.download_jurisdiction(
+            codes=list(codes) or None, max_sections_per_code=max_sections
+        )
+        count = storage.batch_store(statutes, copy=use_copy)
+        storage.update_jurisdiction_stats(jurisdiction)
+    finally:
+        source.close()
+        storage.close()
+    console.print(f"[green]Stored {count:,} statutes for {jurisdiction}[/green]")
+    if http_cache:
+        console.print(f"HTTP cache: {http_cache.stats()}")
+
+
 if __name__ == "__main__":
     main()
@@ -18,14 +18,19 @@ import asyncio
 import hashlib
 import re
 import time
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import click
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
+from atlas.crawl_frontier import FAILED, FETCHED, UPLOADED, CrawlFrontier
+from atlas.http_cache import HTTPCache, is_revalidated
+from atlas.rate_limit import HostRateLimiter
 from atlas.sources.registry import SourceConfig, get_all_configs
 from atlas.sources.specs import get_section_pattern
 
@@ -125,6 +130,45 @@ SECTION_PATTERNS: dict[str, str] = {
     "_default": r"(?:section|§|sec|statute)[\-_/]?\d+[\.\d]*",
 }
 
+# Words in a link's href or text that mark it as a TOC page worth following
+NAV_LINK_PATTERN = re.compile(
+    r"title|chapter|article|part|division|subtitle|subchapter|code|revised", re.IGNORECASE
+)
+
+
+def iter_page_links(html: str) -> Iterator[tuple[str, str]]:
+    """Yield (href, link text) for every ``<a href>`` on an HTML page.
+
+    Uses lxml's C parser rather than BeautifulSoup, since discovery pages
+    can hold tens of thousands of links and are parsed for nothing else.
+    """
+    if not html.strip():
+        return
+    # lxml rejects str input carrying an XML encoding declaration, so hand
+    # it UTF-8 bytes and say so
+    try:
+        doc = lxml.html.document_fromstring(
+            html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+        )
+    except etree.ParserError:
+        return
+    for anchor in doc.iter("a"):
+        href = anchor.get("href")
+        if href:
+            yield href, anchor.text_content().strip()
+
+
+def open_frontier(
+    jurisdiction: str, frontier_path: Path | None, resume: bool
+) -> CrawlFrontier | None:
+    """Open a jurisdiction's crawl frontier, clearing it unless resuming."""
+    if frontier_path is None:
+        return None
+    frontier = CrawlFrontier(frontier_path, jurisdiction)
+    if not resume:
+        frontier.reset()
+    return frontier
+
 
 def get_all_jurisdictions() -> list[str]:
     """Get list of all configured state jurisdictions."""
@@ -139,6 +183,10 @@ async def crawl_jurisdiction(
     concurrency: int = 20,
     delay: float = 0.1,
     dry_run: bool = False,
+    frontier_path: Path | None = None,
+    resume: bool = False,
+    http_cache: HTTPCache | None = None,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> dict:
     """Crawl a single jurisdiction and optionally save to disk.
 
@@ -149,6 +197,11 @@ async def crawl_jurisdiction(
         concurrency: Max concurrent requests
         delay: Delay between requests
         dry_run: If True, don't upload/save
+        frontier_path: SQLite file recording crawl progress (None: in memory only)
+        resume: Continue the crawl recorded in frontier_path instead of restarting
+        http_cache: Revalidate previously fetched pages (ETag/Last-Modified)
+        rate_limiter: Per-host adaptive limiter, shared with other crawls
+            (default: one starting at 1/delay requests per second)
 
     Returns:
         Dict with crawl statistics
@@ -160,7 +213,16 @@ async def crawl_jurisdiction(
     config = configs[jurisdiction]
 
     # Create crawler
-    crawler = StateCrawler(config, concurrency, dry_run, delay)
+    frontier = open_frontier(jurisdiction, frontier_path, resume)
+    crawler = StateCrawler(
+        config,
+        concurrency,
+        dry_run,
+        delay,
+        frontier=frontier,
+        http_cache=http_cache,
+        rate_limiter=rate_limiter,
+    )
 
     # Override upload if output_dir specified
     if output_dir and not dry_run:
@@ -206,10 +268,15 @@ async def crawl_jurisdiction(
             filepath = output_dir / filename
             filepath.write_text(html, encoding="utf-8")
             crawler.stats.bytes_uploaded += len(html.encode("utf-8"))
+            return True
 
         crawler.upload_to_r2 = save_to_disk
 
-    stats = await crawler.crawl(max_sections)
+    try:
+        stats = await crawler.crawl(max_sections)
+    finally:
+        if frontier:
+            frontier.close()
 
     return {
         "source": "html",
@@ -217,6 +284,7 @@ async def crawl_jurisdiction(
         "bytes": stats.bytes_fetched,
         "duration": stats.duration,
         "rate": stats.rate,
+        "not_modified": stats.sections_not_modified,
         "errors": stats.errors_count,
     }
 
@@ -357,6 +425,7 @@ class CrawlStats:
     sections_discovered: int = 0
     sections_fetched: int = 0
     sections_failed: int = 0
+    sections_not_modified: int = 0  # Fetches answered by a 304 revalidation
     bytes_fetched: int = 0
     bytes_uploaded: int = 0
     start_time: float = field(default_factory=time.time)
@@ -408,8 +477,13 @@ class StateCrawler:
         max_concurrent: int = 20,  # Reduced from 50 to avoid rate limits
         dry_run: bool = False,
         delay_between_requests: float = 0.1,  # 100ms between requests
+        frontier: CrawlFrontier | None = None,
+        http_cache: HTTPCache | None = None,
+        rate_limiter: HostRateLimiter | None = None,
     ):
         self.config = config
+        self.frontier = frontier  # Durable progress, so the crawl can resume
+        self.http_cache = http_cache  # Revalidate cached pages instead of re-downloading
         self.max_concurrent = max_concurrent
         self.dry_run = dry_run
         self.delay = delay_between_requests
@@ -419,8 +493,14 @@ class StateCrawler:
             codes=len(config.codes),
         )
         self._r2 = None
+        self._section_pattern: re.Pattern | None = None
+        self._base_domain = urlparse(config.base_url).netloc
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._last_request = 0.0
+        # Every request goes through the per-host limiter, starting at one per
+        # delay_between_requests and adapting to the site (no delay: unlimited)
+        if rate_limiter is None and delay_between_requests > 0:
+            rate_limiter = HostRateLimiter(rate=1 / delay_between_requests)
+        self.rate_limiter = rate_limiter
 
     @property
     def r2(self):
@@ -439,39 +519,67 @@ class StateCrawler:
     def _get_section_pattern(self) -> re.Pattern:
         """Get the section URL regex pattern for this state.
 
-        Checks YAML specs first, falls back to hardcoded patterns.
+        Checks YAML specs first, falls back to hardcoded patterns. The
+        pattern is compiled once and reused for every link on every page.
         """
-        # Check spec file first
-        spec_pattern = get_section_pattern(self.config.jurisdiction)
-        if spec_pattern:
-            return re.compile(spec_pattern, re.IGNORECASE)
-
-        # Fall back to hardcoded patterns
-        pattern = SECTION_PATTERNS.get(self.config.jurisdiction, SECTION_PATTERNS["_default"])
-        return re.compile(pattern, re.IGNORECASE)
+        if self._section_pattern is None:
+            # Check spec file first, then fall back to hardcoded patterns
+            pattern = get_section_pattern(self.config.jurisdiction) or SECTION_PATTERNS.get(
+                self.config.jurisdiction, SECTION_PATTERNS["_default"]
+            )
+            self._section_pattern = re.compile(pattern, re.IGNORECASE)
+        return self._section_pattern
 
     def _is_section_url(self, url: str) -> bool:
         """Check if a URL looks like a section page."""
-        pattern = self._get_section_pattern()
-        return bool(pattern.search(url))
+        return bool(self._get_section_pattern().search(url))
 
     def _is_same_domain(self, url: str) -> bool:
         """Check if URL is on the same domain as base_url."""
-        base_domain = urlparse(self.config.base_url).netloc
         url_domain = urlparse(url).netloc
-        return url_domain == base_domain or url_domain == ""
+        return url_domain == self._base_domain or url_domain == ""
 
-    async def discover_sections(self, client: httpx.AsyncClient, max_depth: int = 3) -> list[str]:
-        """Discover all section URLs via recursive BFS crawl.
+    async def discover_sections(
+        self,
+        client: httpx.AsyncClient,
+        max_depth: int = 3,
+        on_section: Callable[[str], Awaitable[None]] | None = None,
+    ) -> list[str]:
+        """Discover all section URLs via a breadth-first crawl of TOC pages.
 
         Starts from TOC pages and follows links within the domain
-        up to max_depth levels, collecting section URLs.
+        up to max_depth levels, collecting section URLs. ``max_concurrent``
+        workers pull pages from a shared queue, so a slow page only holds up
+        its own worker.
+
+        With a frontier, crawled pages and found sections are recorded as they
+        come in; a resumed run continues from the uncrawled pages, or skips
+        discovery entirely if a previous run completed it.
+
+        Args:
+            client: HTTP client
+            max_depth: Link levels to follow below the TOC pages
+            on_section: Awaited with each section URL as soon as it is found
+                (including ones recorded by an earlier run), so fetching can
+                start while discovery continues
         """
+        if self.frontier and self.frontier.discovery_complete():
+            section_list = self.frontier.section_urls()
+            print(
+                f"  [{self.config.jurisdiction}] Resuming: {len(section_list)} sections "
+                "already discovered"
+            )
+            self.stats.sections_discovered = len(section_list)
+            if on_section:
+                for url in section_list:
+                    await on_section(url)
+            return section_list
+
         section_urls: set[str] = set()
         visited: set[str] = set()
 
         # Start with TOC URLs for each code
-        frontier: list[tuple[str, int]] = []  # (url, depth)
+        start: list[tuple[str, int]] = []  # (url, depth)
 
         for code_id in self.config.codes:
             if self.config.toc_url_pattern:
@@ -479,48 +587,77 @@ class StateCrawler:
                 toc_url = self.config.toc_url_pattern.format(code=code_id, title=code_id)
                 if not toc_url.startswith("http"):
                     toc_url = f"{self.config.base_url}{toc_url}"
-                frontier.append((toc_url, 0))
+                start.append((toc_url, 0))
             else:
                 # Fall back to base URL
-                frontier.append((self.config.base_url, 0))
-
-        print(
-            f"  [{self.config.jurisdiction}] Starting discovery from {len(frontier)} TOC pages..."
-        )
-
-        while frontier:
-            # Process current frontier in parallel
-            current_batch = frontier[: self.max_concurrent]
-            frontier = frontier[self.max_concurrent :]
-
-            tasks = []
-            for url, depth in current_batch:
-                if url not in visited:
-                    visited.add(url)
-                    tasks.append(self._crawl_page_for_links(client, url, depth))
-
-            if not tasks:
-                continue
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            for result in results:
-                if isinstance(result, Exception):
-                    continue
-
-                page_sections, child_links, depth = result
-                section_urls.update(page_sections)
-
-                # Add child links to frontier if within depth limit
-                if depth < max_depth:
-                    for link in child_links:
-                        if link not in visited:
-                            frontier.append((link, depth + 1))
-
-            # Progress update
-            if len(section_urls) % 100 == 0 and len(section_urls) > 0:
-                print(f"  [{self.config.jurisdiction}] Found {len(section_urls)} sections...")
+                start.append((self.config.base_url, 0))
+
+        if self.frontier:
+            self.frontier.add_pages(start)
+            visited = self.frontier.crawled_pages()
+            start = self.frontier.pending_pages()
+            known = self.frontier.section_urls()
+            section_urls.update(known)
+            if on_section:
+                for url in known:
+                    await on_section(url)
+
+        print(f"  [{self.config.jurisdiction}] Starting discovery from {len(start)} TOC pages...")
+
+        pages: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        for url, depth in start:
+            visited.add(url)
+            pages.put_nowait((url, depth))
+
+        async def worker() -> None:
+            while True:
+                url, depth = await pages.get()
+                try:
+                    page_sections, child_links, _ = await self._crawl_page_for_links(
+                        client, url, depth
+                    )
+                    new_sections = page_sections - section_urls
+                    section_urls.update(new_sections)
+
+                    # Queue child links if within depth limit
+                    children = []
+                    if depth < max_depth:
+                        for link in child_links:
+                            if link not in visited:
+                                visited.add(link)
+                                children.append((link, depth + 1))
+                                pages.put_nowait((link, depth + 1))
+
+                    if self.frontier:
+                        self.frontier.add_sections(new_sections)
+                        self.frontier.add_pages(children)
+                        self.frontier.mark_crawled(url)
+
+                    if new_sections and len(section_urls) // 100 > (
+                        len(section_urls) - len(new_sections)
+                    ) // 100:
+                        print(
+                            f"  [{self.config.jurisdiction}] Found {len(section_urls)} sections..."
+                        )
+
+                    if on_section:
+                        for section_url in new_sections:
+                            await on_section(section_url)
+                except Exception as e:
+                    self.stats.errors.append(f"Discover {url}: {e}")
+                finally:
+                    pages.task_done()
 
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrent)]
+        try:
+            await pages.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.frontier:
+            self.frontier.mark_discovery_complete()
         self.stats.sections_discovered = len(section_urls)
         return list(section_urls)
 
@@ -537,10 +674,7 @@ class StateCrawler:
                 if resp.status_code != 200:
                     return section_urls, child_links, depth
 
-                soup = BeautifulSoup(resp.text, "html.parser")
-
-                for link in soup.find_all("a", href=True):
-                    href = link["href"]
+                for href, text in iter_page_links(resp.text):
                     full_url = urljoin(url, href)
 
                     # Skip non-HTTP and external links
@@ -554,25 +688,9 @@ class StateCrawler:
 
                     if self._is_section_url(full_url):
                         section_urls.add(full_url)
-                    else:
-                        # Add to child links for further crawling
-                        # Only include navigation-like links
-                        text = link.get_text(strip=True).lower()
-                        if any(
-                            x in href.lower() or x in text
-                            for x in [
-                                "title",
-                                "chapter",
-                                "article",
-                                "part",
-                                "division",
-                                "subtitle",
-                                "subchapter",
-                                "code",
-                                "revised",
-                            ]
-                        ):
-                            child_links.append(full_url)
+                    elif NAV_LINK_PATTERN.search(href) or NAV_LINK_PATTERN.search(text):
+                        # Only follow navigation-like links further
+                        child_links.append(full_url)
 
                 return section_urls, child_links, depth
 
@@ -580,32 +698,29 @@ class StateCrawler:
                 self.stats.errors.append(f"Crawl {url}: {e}")
                 return section_urls, child_links, depth
 
-    async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        if self.delay > 0:
-            now = time.time()
-            elapsed = now - self._last_request
-            if elapsed < self.delay:
-                await asyncio.sleep(self.delay - elapsed)
-            self._last_request = time.time()
-
     async def fetch_section(
         self, client: httpx.AsyncClient, url: str, max_retries: int = 3
     ) -> tuple[str, str | None]:
-        """Fetch a single section with retry on rate limit."""
-        await self._rate_limit()
+        """Fetch a single section with retry on rate limit.
+
+        Requests are spaced by the client's rate-limited transport, which also
+        backs off (honoring Retry-After) when the site answers 429.
+        """
         async with self._semaphore:
             for attempt in range(max_retries):
                 try:
                     resp = await client.get(url, timeout=30)
                     if resp.status_code == 200:
                         self.stats.sections_fetched += 1
-                        self.stats.bytes_fetched += len(resp.content)
+                        if is_revalidated(resp):
+                            self.stats.sections_not_modified += 1
+                        else:
+                            self.stats.bytes_fetched += len(resp.content)
                         return url, resp.text
                     elif resp.status_code == 429:
-                        # Rate limited - exponential backoff
-                        wait_time = (2**attempt) + (attempt * 0.5)
-                        await asyncio.sleep(wait_time)
+                        if not self.rate_limiter:
+                            # Unlimited crawl - fall back to exponential backoff
+                            await asyncio.sleep((2**attempt) + (attempt * 0.5))
                         continue
                     else:
                         self.stats.sections_failed += 1
@@ -642,35 +757,90 @@ class StateCrawler:
             self.stats.errors.append(f"R2 upload: {e}")
             return False
 
+    async def _fetch_and_store(self, client: httpx.AsyncClient, url: str) -> None:
+        """Fetch one section and upload it immediately, recording progress."""
+        url, html = await self.fetch_section(client, url)
+        if html is None:
+            if self.frontier:
+                self.frontier.mark(url, FAILED)
+            return
+        if self.frontier:
+            self.frontier.mark(url, FETCHED)
+        # boto3 blocks, so upload off the event loop to keep the other workers going.
+        # Dry runs leave sections "fetched", so a later real run still uploads them
+        uploaded = await asyncio.to_thread(self.upload_to_r2, url, html)
+        if uploaded and self.frontier and not self.dry_run:
+            self.frontier.mark(url, UPLOADED)
+
     async def crawl(self, max_sections: int | None = None) -> CrawlStats:
-        """Crawl all sections for this state."""
+        """Crawl all sections for this state.
+
+        Discovery feeds a bounded queue drained by ``max_concurrent`` fetch
+        workers, so fetching starts with the first section found, each page
+        is stored and released as soon as it arrives, and memory stays flat
+        however large the state is. When the queue is full, discovery waits.
+        """
+        uploaded: set[str] = set()
+        if self.frontier:
+            # Only fetch what an earlier run didn't get into storage
+            remaining = set(self.frontier.remaining_sections())
+            uploaded = set(self.frontier.section_urls()) - remaining
+
+        sections: asyncio.Queue[str] = asyncio.Queue(maxsize=self.max_concurrent * 2)
+        queued: set[str] = set()
+        enough = asyncio.Event()
+
+        async def enqueue(url: str) -> None:
+            if url in uploaded or url in queued or enough.is_set():
+                return
+            queued.add(url)
+            await sections.put(url)  # Blocks while the fetch workers are saturated
+            if max_sections and len(queued) >= max_sections:
+                enough.set()
+
+        async def fetch_worker(client: httpx.AsyncClient) -> None:
+            while True:
+                url = await sections.get()
+                try:
+                    await self._fetch_and_store(client, url)
+                except Exception as e:
+                    self.stats.errors.append(f"Store {url}: {e}")
+                finally:
+                    sections.task_done()
+
+        client_kwargs = {}
+        transport = self.rate_limiter.async_transport() if self.rate_limiter else None
+        if self.http_cache:
+            transport = self.http_cache.async_transport(transport)
+        if transport:
+            client_kwargs["transport"] = transport
         async with httpx.AsyncClient(
             headers=self._get_headers(),
             follow_redirects=True,
             timeout=30,
+            **client_kwargs,
         ) as client:
-            # Discover sections
-            print(f"  [{self.config.jurisdiction}] Discovering sections...")
-            section_urls = await self.discover_sections(client)
-
-            if max_sections:
-                section_urls = section_urls[:max_sections]
-
-            if not section_urls:
+            print(f"  [{self.config.jurisdiction}] Discovering and fetching sections...")
+            workers = [
+                asyncio.create_task(fetch_worker(client)) for _ in range(self.max_concurrent)
+            ]
+            discovery = asyncio.create_task(self.discover_sections(client, on_section=enqueue))
+            limit_reached = asyncio.create_task(enough.wait())
+            try:
+                await asyncio.wait({discovery, limit_reached}, return_when=asyncio.FIRST_COMPLETED)
+                if not discovery.done():
+                    # --max-sections reached; the rest of discovery isn't needed
+                    discovery.cancel()
+                await asyncio.gather(discovery, return_exceptions=True)
+                await sections.join()
+            finally:
+                limit_reached.cancel()
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(limit_reached, *workers, return_exceptions=True)
+
+            if not queued:
                 print(f"  [{self.config.jurisdiction}] No sections found")
-                self.stats.end_time = time.time()
-                return self.stats
-
-            print(f"  [{self.config.jurisdiction}] Fetching {len(section_urls)} sections...")
-
-            # Fetch all sections concurrently
-            tasks = [self.fetch_section(client, url) for url in section_urls]
-            results = await asyncio.gather(*tasks)
-
-            # Upload to R2
-            for url, html in results:
-                if html:
-                    self.upload_to_r2(url, html)
 
         self.stats.end_time = time.time()
         return self.stats
@@ -682,6 +852,10 @@ async def crawl_state(
     max_sections: int | None = None,
     dry_run: bool = False,
     delay: float = 0.1,
+    frontier_path: Path | None = None,
+    resume: bool = False,
+    http_cache: HTTPCache | None = None,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> CrawlStats:
     """Crawl a single state."""
     configs = get_all_configs()
@@ -689,8 +863,21 @@ async def crawl_state(
         raise ValueError(f"Unknown jurisdiction: {jurisdiction}")
 
     config = configs[jurisdiction]
-    crawler = StateCrawler(config, max_concurrent, dry_run, delay)
-    return await crawler.crawl(max_sections)
+    frontier = open_frontier(jurisdiction, frontier_path, resume)
+    crawler = StateCrawler(
+        config,
+        max_concurrent,
+        dry_run,
+        delay,
+        frontier=frontier,
+        http_cache=http_cache,
+        rate_limiter=rate_limiter,
+    )
+    try:
+        return await crawler.crawl(max_sections)
+    finally:
+        if frontier:
+            frontier.close()
 
 
 async def crawl_all_states(
@@ -699,8 +886,18 @@ async def crawl_all_states(
     max_sections_per_state: int | None = None,
     dry_run: bool = False,
     delay: float = 0.1,
+    frontier_path: Path | None = None,
+    resume: bool = False,
+    http_cache: HTTPCache | None = None,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> list[CrawlStats]:
-    """Crawl all states in parallel."""
+    """Crawl all states in parallel.
+
+    All states share one per-host limiter, so states served from the same
+    host are throttled together rather than each at the full rate.
+    """
+    if rate_limiter is None and delay > 0:
+        rate_limiter = HostRateLimiter(rate=1 / delay)
     configs = get_all_configs()
     jurisdictions = sorted([j for j in configs if j.startswith("us-") and j != "us"])
 
@@ -716,8 +913,21 @@ async def crawl_all_states(
     async def crawl_with_semaphore(jurisdiction: str) -> CrawlStats:
         async with semaphore:
             config = configs[jurisdiction]
-            crawler = StateCrawler(config, max_concurrent_per_state, dry_run, delay)
-            stats = await crawler.crawl(max_sections_per_state)
+            frontier = open_frontier(jurisdiction, frontier_path, resume)
+            crawler = StateCrawler(
+                config,
+                max_concurrent_per_state,
+                dry_run,
+                delay,
+                frontier=frontier,
+                http_cache=http_cache,
+                rate_limiter=rate_limiter,
+            )
+            try:
+                stats = await crawler.crawl(max_sections_per_state)
+            finally:
+                if frontier:
+                    frontier.close()
             print(
                 f"  [{jurisdiction}] Done: {stats.sections_fetched} sections "
                 f"in {stats.duration:.1f}s ({stats.rate:.1f}/s)"
@@ -748,7 +958,10 @@ async def crawl_all_states(
 
     total_sections = sum(s.sections_fetched for s in stats)
     total_bytes = sum(s.bytes_fetched for s in stats)
+    total_not_modified = sum(s.sections_not_modified for s in stats)
     print(f"Total sections: {total_sections:,}")
+    if http_cache:
+        print(f"Not modified (304): {total_not_modified:,}")
     print(f"Total data: {total_bytes / 1024 / 1024:.1f} MB")
     print(f"Overall rate: {total_sections / duration:.1f} sections/second")
 
@@ -767,8 +980,32 @@ async def crawl_all_states(
 @click.option("--max-sections", type=int, help="Limit sections per state")
 @click.option("--max-states", type=int, default=20, help="Concurrent states")
 @click.option("--max-concurrent", type=int, default=20, help="Concurrent requests per state")
-@click.option("--delay", type=float, default=0.1, help="Delay between requests (seconds)")
+@click.option(
+    "--delay", type=float, default=0.1, help="Starting delay between requests per host (seconds)"
+)
+@click.option(
+    "--max-rate",
+    type=float,
+    default=20.0,
+    show_default=True,
+    help="Most requests/second per host the adaptive limiter will ramp up to",
+)
 @click.option("--dry-run", is_flag=True, help="Don't upload to R2")
+@click.option(
+    "--frontier",
+    "frontier_path",
+    type=click.Path(path_type=Path),
+    default=Path("data/crawl-frontier.db"),
+    show_default=True,
+    help="SQLite file recording crawl progress",
+)
+@click.option("--resume", is_flag=True, help="Continue the previous crawl instead of restarting")
+@click.option(
+    "--http-cache",
+    "http_cache_dir",
+    type=click.Path(path_type=Path),
+    help="Keep fetched pages here and revalidate them (ETag/Last-Modified) on later crawls",
+)
 def main(
     jurisdiction: tuple[str, ...],
     crawl_all: bool,
@@ -777,7 +1014,11 @@ def main(
     max_states: int,
     max_concurrent: int,
     delay: float,
+    max_rate: float,
     dry_run: bool,
+    frontier_path: Path,
+    resume: bool,
+    http_cache_dir: Path | None,
 ):
     """Crawl state statutes and upload to R2.
 
@@ -794,6 +1035,9 @@ def main(
 
         # Download all Archive.org states
         uv run python -m arch.crawl --archive --all
+
+        # Pick up an interrupted crawl, fetching only what's missing
+        uv run python -m arch.crawl --all --resume
     """
     # Archive.org mode
     if archive:
@@ -812,6 +1056,8 @@ def main(
         return
 
     # Web crawler mode
+    http_cache = HTTPCache(http_cache_dir) if http_cache_dir else None
+    rate_limiter = HostRateLimiter(rate=1 / delay, max_rate=max_rate) if delay > 0 else None
     if crawl_all:
         asyncio.run(
             crawl_all_states(
@@ -820,6 +1066,10 @@ def main(
                 max_sections_per_state=max_sections,
                 dry_run=dry_run,
                 delay=delay,
+                frontier_path=frontier_path,
+                resume=resume,
+                http_cache=http_cache,
+                rate_limiter=rate_limiter,
             )
         )
     elif jurisdiction and len(jurisdiction) == 1:
@@ -830,12 +1080,18 @@ def main(
                 max_sections=max_sections,
                 dry_run=dry_run,
                 delay=delay,
+                frontier_path=frontier_path,
+                resume=resume,
+                http_cache=http_cache,
+                rate_limiter=rate_limiter,
             )
         )
         print(f"\n{stats.name}:")
         print(f"  Sections discovered: {stats.sections_discovered}")
         print(f"  Sections fetched: {stats.sections_fetched}")
         print(f"  Sections failed: {stats.sections_failed}")
+        if http_cache:
+            print(f"  Not modified (304): {stats.sections_not_modified}")
         print(f"  Data fetched: {stats.bytes_fetched / 1024:.1f} KB")
         print(f"  Duration: {stats.duration:.1f}s")
         print(f"  Rate: {stats.rate:.1f} sections/second")
@@ -853,6 +1109,10 @@ def main(
                     max_sections=max_sections,
                     dry_run=dry_run,
                     delay=delay,
+                    frontier_path=frontier_path,
+                    resume=resume,
+                    http_cache=http_cache,
+                    rate_limiter=rate_limiter,
                 )
             )
             print(f"\n{stats.name}: {stats.sections_fetched} sections in {stats.duration:.1f}s")
@@ -0,0 +1,181 @@
+"""Durable crawl frontier so interrupted StateCrawler runs can resume.
+
+The frontier records, per jurisdiction, every discovery page crawled and
+every section URL found, along with how far each section got (fetched,
+uploaded, failed). Once discovery finishes it is marked complete, so a
+resumed run skips straight to fetching the sections that were never
+uploaded.
+
+Example:
+    >>> frontier = CrawlFrontier(Path("data/crawl-frontier.db"), "us-oh")
+    >>> crawler = StateCrawler(config, frontier=frontier)
+    >>> await crawler.crawl()  # Ctrl-C halfway through...
+    >>> await crawler.crawl()  # ...and this picks up where it stopped
+"""
+
+import sqlite3
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+FRONTIER_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    jurisdiction TEXT NOT NULL,
+    url TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    crawled INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (jurisdiction, url)
+);
+CREATE TABLE IF NOT EXISTS sections (
+    jurisdiction TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'discovered',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT,
+    PRIMARY KEY (jurisdiction, url)
+);
+CREATE INDEX IF NOT EXISTS sections_status ON sections (jurisdiction, status);
+CREATE TABLE IF NOT EXISTS discovery (
+    jurisdiction TEXT PRIMARY KEY,
+    completed_at TEXT NOT NULL
+);
+"""
+
+# Section states, in the order a section moves through them
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+UPLOADED = "uploaded"
+FAILED = "failed"
+
+
+class CrawlFrontier:
+    """SQLite-backed record of one jurisdiction's crawl progress.
+
+    Several frontiers (one per jurisdiction) may share a database file.
+
+    Args:
+        path: SQLite database file (":memory:" for a throwaway frontier)
+        jurisdiction: Jurisdiction this frontier tracks (e.g. 'us-oh')
+    """
+
+    def __init__(self, path: Path | str, jurisdiction: str):
+        self.path = str(path)
+        self.jurisdiction = jurisdiction
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(FRONTIER_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def reset(self) -> None:
+        """Forget all progress for this jurisdiction (start a fresh crawl)."""
+        with self._conn:
+            for table in ("pages", "sections", "discovery"):
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE jurisdiction = ?", (self.jurisdiction,)
+                )
+
+    # Discovery
+
+    def add_pages(self, pages: Iterable[tuple[str, int]]) -> None:
+        """Queue discovery pages as (url, depth); already-known pages are kept."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO pages (jurisdiction, url, depth) VALUES (?, ?, ?)",
+                [(self.jurisdiction, url, depth) for url, depth in pages],
+            )
+
+    def mark_crawled(self, url: str) -> None:
+        """Record that a discovery page has been crawled for links."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE pages SET crawled = 1 WHERE jurisdiction = ? AND url = ?",
+                (self.jurisdiction, url),
+            )
+
+    def crawled_pages(self) -> set[str]:
+        """Discovery pages already crawled."""
+        rows = self._conn.execute(
+            "SELECT url FROM pages WHERE jurisdiction = ? AND crawled = 1",
+            (self.jurisdiction,),
+        )
+        return {url for (url,) in rows}
+
+    def pending_pages(self) -> list[tuple[str, int]]:
+        """Discovery pages queued but not yet crawled, as (url, depth)."""
+        return self._conn.execute(
+            "SELECT url, depth FROM pages WHERE jurisdiction = ? AND crawled = 0 "
+            "ORDER BY depth, url",
+            (self.jurisdiction,),
+        ).fetchall()
+
+    def discovery_complete(self) -> bool:
+        """Whether a previous run finished discovering sections."""
+        row = self._conn.execute(
+            "SELECT 1 FROM discovery WHERE jurisdiction = ?", (self.jurisdiction,)
+        ).fetchone()
+        return row is not None
+
+    def mark_discovery_complete(self) -> None:
+        """Record that discovery finished, so resumed runs skip it."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO discovery (jurisdiction, completed_at) VALUES (?, ?)",
+                (self.jurisdiction, datetime.now(timezone.utc).isoformat()),
+            )
+
+    # Sections
+
+    def add_sections(self, urls: Iterable[str]) -> None:
+        """Record discovered section URLs; already-known sections keep their status."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO sections (jurisdiction, url) VALUES (?, ?)",
+                [(self.jurisdiction, url) for url in urls],
+            )
+
+    def mark(self, url: str, status: str) -> None:
+        """Move a section to a new status, counting fetch attempts."""
+        attempted = 1 if status in (FETCHED, FAILED) else 0
+        with self._conn:
+            self._conn.execute(
+                "UPDATE sections SET status = ?, attempts = attempts + ?, updated_at = ? "
+                "WHERE jurisdiction = ? AND url = ?",
+                (
+                    status,
+                    attempted,
+                    datetime.now(timezone.utc).isoformat(),
+                    self.jurisdiction,
+                    url,
+                ),
+            )
+
+    def section_urls(self, exclude_status: str | None = None) -> list[str]:
+        """Discovered section URLs, optionally leaving out one status."""
+        if exclude_status is None:
+            rows = self._conn.execute(
+                "SELECT url FROM sections WHERE jurisdiction = ? ORDER BY url",
+                (self.jurisdiction,),
+            )
+        else:
+            rows = self._conn.execute(
+                "SELECT url FROM sections WHERE jurisdiction = ? AND status != ? ORDER BY url",
+                (self.jurisdiction, exclude_status),
+            )
+        return [url for (url,) in rows]
+
+    def remaining_sections(self) -> list[str]:
+        """Section URLs not yet uploaded (new, fetched-but-not-uploaded, or failed)."""
+        return self.section_urls(exclude_status=UPLOADED)
+
+    def counts(self) -> dict[str, int]:
+        """Number of sections in each status."""
+        rows = self._conn.execute(
+            "SELECT status, COUNT(*) FROM sections WHERE jurisdiction = ? GROUP BY status",
+            (self.jurisdiction,),
+        )
+        return dict(rows.fetchall())
@@ -22,6 +22,21 @@ import click
 from playwright.async_api import Page, async_playwright
 
 from atlas.crawl import R2_BUCKET, get_r2_client
+from atlas.rate_limit import HostRateLimiter
+
+
+async def goto_limited(page: Page, url: str, rate_limiter: HostRateLimiter | None) -> None:
+    """Navigate to a section page, spaced and adapted by the per-host limiter."""
+    if rate_limiter:
+        await rate_limiter.acquire(url)
+    try:
+        response = await page.goto(url, wait_until="networkidle", timeout=30000)
+    except Exception:
+        if rate_limiter:
+            rate_limiter.record(url, None)
+        raise
+    if rate_limiter and response is not None:
+        rate_limiter.record(url, response.status, response.headers.get("retry-after"))
 
 
 @dataclass
@@ -86,9 +101,12 @@ class AlabamaCrawler:
     - Section links: /code-of-alabama?section=X-X-X
     """
 
-    def __init__(self, page: Page, dry_run: bool = False):
+    def __init__(
+        self, page: Page, dry_run: bool = False, rate_limiter: HostRateLimiter | None = None
+    ):
         self.page = page
         self.dry_run = dry_run
+        self.rate_limiter = rate_limiter
         self.stats = PlaywrightStats(jurisdiction="us-al", name="Alabama")
         self._r2 = None
 
@@ -212,11 +230,7 @@ class AlabamaCrawler:
     async def fetch_section(self, section: dict) -> str | None:
         """Fetch a single section's content."""
         try:
-            await self.page.goto(
-                section["url"],
-                wait_until="networkidle",
-                timeout=30000,
-            )
+            await goto_limited(self.page, section["url"], self.rate_limiter)
             await self.page.wait_for_timeout(500)
 
             # Get the main content
@@ -259,9 +273,12 @@ class AlaskaCrawler:
     expands to show chapters. Chapters contain direct section links.
     """
 
-    def __init__(self, page: Page, dry_run: bool = False):
+    def __init__(
+        self, page: Page, dry_run: bool = False, rate_limiter: HostRateLimiter | None = None
+    ):
         self.page = page
         self.dry_run = dry_run
+        self.rate_limiter = rate_limiter
         self.stats = PlaywrightStats(jurisdiction="us-ak", name="Alaska")
         self._r2 = None
 
@@ -407,11 +424,7 @@ class AlaskaCrawler:
     async def fetch_section(self, section: dict) -> str | None:
         """Fetch a single section's content."""
         try:
-            await self.page.goto(
-                section["url"],
-                wait_until="networkidle",
-                timeout=30000,
-            )
+            await goto_limited(self.page, section["url"], self.rate_limiter)
             await self.page.wait_for_timeout(500)
 
             content = await self.page.content()
@@ -487,9 +500,12 @@ class TexasCrawler:
         "Water Code": "WA",
     }
 
-    def __init__(self, page: Page, dry_run: bool = False):
+    def __init__(
+        self, page: Page, dry_run: bool = False, rate_limiter: HostRateLimiter | None = None
+    ):
         self.page = page
         self.dry_run = dry_run
+        self.rate_limiter = rate_limiter
         self.stats = PlaywrightStats(jurisdiction="us-tx", name="Texas")
         self._r2 = None
 
@@ -636,11 +652,7 @@ class TexasCrawler:
     async def fetch_section(self, section: dict) -> str | None:
         """Fetch a single section's content."""
         try:
-            await self.page.goto(
-                section["url"],
-                wait_until="networkidle",
-                timeout=30000,
-            )
+            await goto_limited(self.page, section["url"], self.rate_limiter)
             await self.page.wait_for_timeout(1000)
 
             content = await self.page.content()
@@ -683,6 +695,7 @@ async def crawl_state(
     max_sections: int | None = None,
     dry_run: bool = False,
     headless: bool = True,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> dict:
     """Crawl a SPA state and optionally save to disk.
 
@@ -693,6 +706,7 @@ async def crawl_state(
         output_dir: If provided, save HTML files here instead of R2
         max_sections: Limit number of sections
         dry_run: If True, don't save/upload
+        rate_limiter: Per-host adaptive limiter for section page loads
 
     Returns:
         Dict with crawl statistics
@@ -706,6 +720,7 @@ async def crawl_state(
         max_sections=max_sections,
         dry_run=dry_run,
         headless=headless,
+        rate_limiter=rate_limiter,
     )
 
     return {
@@ -724,6 +739,7 @@ async def crawl_spa_state(
     max_sections: int | None = None,
     dry_run: bool = False,
     headless: bool = True,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> PlaywrightStats:
     """Crawl a single SPA state using Playwright."""
     if jurisdiction not in SPA_STATES:
@@ -749,11 +765,11 @@ async def crawl_spa_state(
 
         # Select crawler based on state
         if jurisdiction == "us-al":
-            crawler = AlabamaCrawler(page, dry_run)
+            crawler = AlabamaCrawler(page, dry_run, rate_limiter)
         elif jurisdiction == "us-ak":
-            crawler = AlaskaCrawler(page, dry_run)
+            crawler = AlaskaCrawler(page, dry_run, rate_limiter)
         elif jurisdiction == "us-tx":
-            crawler = TexasCrawler(page, dry_run)
+            crawler = TexasCrawler(page, dry_run, rate_limiter)
         else:
             raise ValueError(f"No crawler for {jurisdiction}")
 
@@ -832,6 +848,7 @@ async def crawl_all_spa_states(
     max_sections: int | None = None,
     dry_run: bool = False,
     headless: bool = True,
+    rate_limiter: HostRateLimiter | None = None,
 ) -> list[PlaywrightStats]:
     """Crawl all SPA states."""
     results = []
@@ -843,6 +860,7 @@ async def crawl_all_spa_states(
                 max_sections=max_sections,
                 dry_run=dry_run,
                 headless=headless,
+                rate_limiter=rate_limiter,
             )
             results.append(stats)
 
@@ -887,12 +905,20 @@ async def crawl_all_spa_states(
 @click.option("--max-sections", type=int, help="Limit sections per state")
 @click.option("--dry-run", is_flag=True, help="Don't upload to R2")
 @click.option("--headed", is_flag=True, help="Run with visible browser")
+@click.option(
+    "--rate", type=float, default=1.0, show_default=True, help="Starting page loads/second"
+)
+@click.option(
+    "--max-rate", type=float, default=5.0, show_default=True, help="Most page loads/second"
+)
 def main(
     jurisdiction: str | None,
     crawl_all: bool,
     max_sections: int | None,
     dry_run: bool,
     headed: bool,
+    rate: float,
+    max_rate: float,
 ):
     """Crawl JavaScript SPA state statute sites using Playwright.
 
@@ -908,6 +934,7 @@ def main(
         uv run python -m arch.crawl_playwright us-tx --dry-run
     """
     headless = not headed
+    rate_limiter = HostRateLimiter(rate=rate, max_rate=max_rate)
 
     if crawl_all:
         asyncio.run(
@@ -915,6 +942,7 @@ def main(
                 max_sections=max_sections,
                 dry_run=dry_run,
                 headless=headless,
+                rate_limiter=rate_limiter,
             )
         )
     elif jurisdiction:
@@ -924,6 +952,7 @@ def main(
                 max_sections=max_sections,
                 dry_run=dry_run,
                 headless=headless,
+                rate_limiter=rate_limiter,
             )
         )
 
@@ -0,0 +1,131 @@
+"""Bulk export of archived sections to NDJSON or Parquet.
+
+Each NDJSON line is a section's JSON form (``Section.model_dump_json``), the
+same shape ``atlas get --json`` prints. Parquet files hold one row per section
+with the structured fields (subsections, public laws) as JSON strings.
+
+Usage:
+    from atlas.export import write_ndjson
+
+    write_ndjson(archive.export_title(26), Path("usc26.ndjson.gz"), compress=True)
+"""
+
+import gzip
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from atlas.models import Section
+
+# Sections per Parquet row group
+PARQUET_BATCH_SIZE = 1000
+
+
+def iter_ndjson(sections: Iterable[Section]) -> Iterator[bytes]:
+    """Encode sections as NDJSON, one line per section."""
+    for section in sections:
+        yield section.model_dump_json().encode() + b"\n"
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def write_ndjson(sections: Iterable[Section], path: Path, compress: bool = False) -> int:
+    """Write sections to an NDJSON file (gzipped if ``compress``).
+
+    Returns:
+        Number of sections written
+    """
+    count = 0
+    opener = gzip.open if compress else open
+    with opener(path, "wb") as f:
+        for line in iter_ndjson(sections):
+            f.write(line)
+            count += 1
+    return count
+
+
+def section_record(section: Section) -> dict:
+    """Flatten a section into a Parquet row."""
+    return {
+        "citation": section.citation.usc_cite,
+        "title": section.citation.title,
+        "section": section.citation.section,
+        "title_name": section.title_name,
+        "section_title": section.section_title,
+        "text": section.text,
+        "subsections_json": json.dumps([s.model_dump() for s in section.subsections]),
+        "enacted_date": section.enacted_date,
+        "last_amended": section.last_amended,
+        "public_laws": section.public_laws,
+        "effective_date": section.effective_date,
+        "references_to": section.references_to,
+        "referenced_by": section.referenced_by,
+        "source_url": section.source_url,
+        "retrieved_at": section.retrieved_at,
+        "uslm_id": section.uslm_id,
+    }
+
+
+def write_parquet(
+    sections: Iterable[Section],
+    path: Path,
+    batch_size: int = PARQUET_BATCH_SIZE,
+) -> int:
+    """Write sections to a Parquet file, one row group per batch.
+
+    Requires pyarrow (``pip install atlas[parquet]``).
+
+    Returns:
+        Number of sections written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow. Install with: pip install atlas[parquet]"
+        ) from e
+
+    schema = pa.schema(
+        [
+            ("citation", pa.string()),
+            ("title", pa.int32()),
+            ("section", pa.string()),
+            ("title_name", pa.string()),
+            ("section_title", pa.string()),
+            ("text", pa.string()),
+            ("subsections_json", pa.string()),
+            ("enacted_date", pa.date32()),
+            ("last_amended", pa.date32()),
+            ("public_laws", pa.list_(pa.string())),
+            ("effective_date", pa.date32()),
+            ("references_to", pa.list_(pa.string())),
+            ("referenced_by", pa.list_(pa.string())),
+            ("source_url", pa.string()),
+            ("retrieved_at", pa.date32()),
+            ("uslm_id", pa.string()),
+        ]
+    )
+
+    count = 0
+    with pq.ParquetWriter(str(path), schema) as writer:
+        batch: list[dict] = []
+        for section in sections:
+            batch.append(section_record(section))
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
@@ -0,0 +1,301 @@
+"""Conditional HTTP revalidation shared by crawlers, sources and converters.
+
+Statute pages change a few times a year, so re-downloading them on every
+crawl wastes bandwidth and the legislature's capacity. An HTTPCache keeps
+each response body with its validators (ETag / Last-Modified). Requests made
+through its transports send ``If-None-Match`` / ``If-Modified-Since``; a
+``304 Not Modified`` is answered from the cache as an ordinary 200 response
+carrying an ``X-Cache: REVALIDATED`` header, so callers need no changes.
+
+It plugs in at the httpx transport level, which every fetch path shares:
+
+    >>> cache = HTTPCache(Path("data/http-cache"))
+    >>> client = httpx.Client(transport=cache.transport())        # sync callers
+    >>> client = httpx.AsyncClient(transport=cache.async_transport())  # StateCrawler
+    >>> cache.install(converter)  # swap a converter's lazily created client
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Responses kept in memory when there is no cache directory (or on top of one)
+MEMORY_CACHE_SIZE = 512
+
+CACHE_STATUS_HEADER = "X-Cache"
+REVALIDATED = "REVALIDATED"
+
+# Headers that describe the wire encoding rather than the (decoded) cached body
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body and the validators needed to revalidate it."""
+
+    url: str
+    headers: list[tuple[str, str]]
+    content: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers asking the server to answer 304 if unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild a 200 response for a request the server confirmed unchanged."""
+        headers = httpx.Headers(self.headers)
+        headers[CACHE_STATUS_HEADER] = REVALIDATED
+        return httpx.Response(200, headers=headers, content=self.content, request=request)
+
+
+def is_revalidated(response: httpx.Response) -> bool:
+    """Whether a response was served from the cache after a 304."""
+    return response.headers.get(CACHE_STATUS_HEADER) == REVALIDATED
+
+
+class HTTPCache:
+    """Response store with validators, persisted to disk when ``root`` is given.
+
+    Each entry is ``<sha256(url)>.json`` (validators and headers) plus
+    ``<sha256(url)>.body``, written atomically.
+
+    Args:
+        root: Directory to persist responses in (None: memory only)
+        memory_size: Responses held in the in-memory LRU
+    """
+
+    def __init__(self, root: Path | str | None = None, memory_size: int = MEMORY_CACHE_SIZE):
+        self.root = Path(root) if root else None
+        self.memory_size = memory_size
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.revalidated = 0  # 304s answered from the cache
+        self.stored = 0
+        if self.root:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.root / digest[:2] / f"{digest}{suffix}"  # type: ignore[operator]
+
+    def _remember(self, entry: CachedResponse) -> None:
+        with self._lock:
+            self._memory[entry.url] = entry
+            self._memory.move_to_end(entry.url)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached response for a URL, or None."""
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+                return entry
+
+        if self.root:
+            meta_path = self._path(url, ".json")
+            body_path = self._path(url, ".body")
+            if meta_path.exists() and body_path.exists():
+                meta = json.loads(meta_path.read_text())
+                entry = CachedResponse(
+                    url=url,
+                    headers=[tuple(h) for h in meta["headers"]],
+                    content=body_path.read_bytes(),
+                    etag=meta.get("etag"),
+                    last_modified=meta.get("last_modified"),
+                )
+                self._remember(entry)
+        return entry
+
+    def put(self, entry: CachedResponse) -> None:
+        """Store a response (written atomically when disk-backed)."""
+        self._remember(entry)
+        with self._lock:
+            self.stored += 1
+        if not self.root:
+            return
+
+        meta = {
+            "url": entry.url,
+            "headers": entry.headers,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        body_path = self._path(entry.url, ".body")
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        # Body first: a reader only trusts an entry once its metadata exists
+        for path, data in (
+            (body_path, entry.content),
+            (self._path(entry.url, ".json"), json.dumps(meta).encode()),
+        ):
+            fd, tmp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+    def discard(self, url: str) -> None:
+        """Forget a URL's cached response, in memory and on disk."""
+        with self._lock:
+            self._memory.pop(url, None)
+        if self.root:
+            # Metadata first, so a concurrent reader never trusts a stale body
+            self._path(url, ".json").unlink(missing_ok=True)
+            self._path(url, ".body").unlink(missing_ok=True)
+
+    def prepare(self, request: httpx.Request) -> CachedResponse | None:
+        """Add validators to a cacheable request; return the entry they came from."""
+        if request.method != "GET":
+            return None
+        if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+            return None  # The caller is doing its own revalidation
+        with self._lock:
+            self.requests += 1
+        entry = self.get(str(request.url))
+        if entry is not None:
+            request.headers.update(entry.conditional_headers())
+        return entry
+
+    def finish(
+        self, request: httpx.Request, response: httpx.Response, entry: CachedResponse | None
+    ) -> httpx.Response:
+        """Turn a 304 into the cached 200; store a fresh 200 that has validators.
+
+        A fresh 200 without validators replaces nothing, so any older entry
+        for the URL is discarded rather than served on a later 304.
+        ``response`` must already be read.
+        """
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.revalidated += 1
+            return entry.to_response(request)
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if response.status_code != 200:
+            return response
+        if not (etag or last_modified):
+            self.discard(str(request.url))
+            return response
+
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS]
+        self.put(
+            CachedResponse(
+                url=str(request.url),
+                headers=headers,
+                content=response.content,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        )
+        return httpx.Response(200, headers=headers, content=response.content, request=request)
+
+    def stats(self) -> dict[str, Any]:
+        """Request, revalidation and storage counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "revalidated": self.revalidated,
+                "stored": self.stored,
+            }
+
+    def transport(self, inner: httpx.BaseTransport | None = None) -> "RevalidatingTransport":
+        """A sync transport sending requests through this cache."""
+        return RevalidatingTransport(self, inner or httpx.HTTPTransport())
+
+    def async_transport(
+        self, inner: httpx.AsyncBaseTransport | None = None
+    ) -> "AsyncRevalidatingTransport":
+        """An async transport sending requests through this cache."""
+        return AsyncRevalidatingTransport(self, inner or httpx.AsyncHTTPTransport())
+
+    def install(self, owner: Any, inner: httpx.BaseTransport | None = None) -> bool:
+        """Give an object's lazily created ``_client`` this cache (see replace_client).
+
+        Args:
+            owner: StatuteSource or state converter
+            inner: Transport beneath the cache (e.g. a rate limiter's)
+        """
+        return replace_client(owner, self.transport(inner))
+
+
+def replace_client(owner: Any, transport: httpx.BaseTransport) -> bool:
+    """Swap an object's lazily created ``_client`` for one using ``transport``.
+
+    Works for StatuteSource and the state converters, whose ``client``
+    property creates ``self._client`` on first use. The new client keeps
+    the original's headers, timeout and redirect setting.
+
+    Returns:
+        True if a client was installed
+    """
+    if not hasattr(owner, "_client"):
+        return False
+    original = owner.client
+    if not isinstance(original, httpx.Client):
+        return False
+    owner._client = httpx.Client(
+        transport=transport,
+        headers=original.headers,
+        timeout=original.timeout,
+        follow_redirects=original.follow_redirects,
+    )
+    original.close()
+    return True
+
+
+class RevalidatingTransport(httpx.BaseTransport):
+    """Sync httpx transport that revalidates cached responses."""
+
+    def __init__(self, cache: HTTPCache, inner: httpx.BaseTransport):
+        self.cache = cache
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.cache.prepare(request)
+        response = self.inner.handle_request(request)
+        if request.method != "GET":
+            return response
+        response.read()
+        response.close()
+        return self.cache.finish(request, response, entry)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncRevalidatingTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport that revalidates cached responses."""
+
+    def __init__(self, cache: HTTPCache, inner: httpx.AsyncBaseTransport):
+        self.cache = cache
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = await asyncio.to_thread(self.cache.prepare, request)
+        response = await self.inner.handle_async_request(request)
+        if request.method != "GET":
+            return response
+        await response.aread()
+        await response.aclose()
+        return await asyncio.to_thread(self.cache.finish, request, response, entry)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
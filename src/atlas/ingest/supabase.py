@@ -12,20 +12,34 @@ Usage:
     ingestor.ingest_uk_act(2020, 1)
 """
 
+import json
 import os
 import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterable, Iterator
 from uuid import uuid4, uuid5, NAMESPACE_URL
 
 import httpx
 
 from atlas.parsers.canada import CanadaStatuteParser
-from atlas.parsers.us.statutes import USLMParser
+from atlas.parsers.us.statutes import USLMParser, iter_titles_parallel
 from atlas.parsers.clml import parse_act_metadata, parse_section
 from atlas.models_canada import CanadaSection, CanadaSubsection
 from atlas.models import Section, Subsection
 from atlas.models_uk import UKSection, UKSubsection
+from atlas.query.supabase import HTTP2_AVAILABLE
+from atlas.rate_limit import parse_retry_after
+from atlas.storage.bulk import RULES_TABLE, PostgresBulkLoader
+from atlas.storage.bulk import BATCH_ROWS as BULK_BATCH_ROWS
+
+# Batches are closed at whichever limit comes first
+MAX_BATCH_BYTES = 1_000_000
+MAX_BATCH_ROWS = 1000
+# Batches posted concurrently while parsing continues
+MAX_IN_FLIGHT = 4
 
 
 def _deterministic_id(citation_path: str) -> str:
@@ -33,27 +47,93 @@ def _deterministic_id(citation_path: str) -> str:
     return str(uuid5(NAMESPACE_URL, f"atlas:{citation_path}"))
 
 
+def _add_line_count(rule: dict) -> dict:
+    """Set a rule's line_count from its body text."""
+    body = rule.get("body") or ""
+    rule["line_count"] = len(body.split("\n"))
+    return rule
+
+
 class SupabaseIngestor:
-    """Ingest parsed statutes into Supabase rules table."""
+    """Ingest parsed statutes into Supabase rules table.
+
+    Rules are posted over one pooled, keep-alive HTTP/2 client in batches
+    sized by payload bytes, with several batches in flight while parsing
+    continues. With ``db_url``, rules are instead loaded straight into
+    Postgres with COPY (see atlas.storage.bulk). Use as a context manager
+    (or call ``close``) to release the connections.
+    """
 
     def __init__(
         self,
         url: str | None = None,
         key: str | None = None,
+        max_in_flight: int = MAX_IN_FLIGHT,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        client: httpx.Client | None = None,
+        db_url: str | None = None,
     ):
         """Initialize with Supabase credentials.
 
         Args:
             url: Supabase project URL (or COSILICO_SUPABASE_URL env var)
             key: Supabase service role key (or from Management API)
+            max_in_flight: Batches posted concurrently
+            max_batch_bytes: Target JSON payload size per batch
+            client: HTTP client to post with (default: a pooled client
+                owned by the ingestor)
+            db_url: PostgreSQL connection URL; if given, load with COPY
+                instead of the REST API (no service key needed)
         """
         self.url = url or os.environ.get(
             "COSILICO_SUPABASE_URL",
             "https://nsupqhfchdtqclomlrgs.supabase.co",
         )
+        self.db_url = db_url
         # Get service role key from Management API if not provided
-        self.key = key or self._get_service_key()
+        self.key = key or (None if db_url else self._get_service_key())
         self.rest_url = f"{self.url}/rest/v1"
+        self.max_in_flight = max_in_flight
+        self.max_batch_bytes = max_batch_bytes
+        self._client = client
+        self._owns_client = client is None
+        self._loader: PostgresBulkLoader | None = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled client reused for every batch, so connections stay open."""
+        if self._client is None:
+            self._client = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(180.0, connect=30.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_in_flight,
+                    max_keepalive_connections=self.max_in_flight,
+                ),
+            )
+        return self._client
+
+    @property
+    def loader(self) -> PostgresBulkLoader:
+        """COPY loader on a direct database connection (requires db_url)."""
+        if self._loader is None:
+            self._loader = PostgresBulkLoader(self.db_url)
+        return self._loader
+
+    def close(self) -> None:
+        """Close the pooled client if the ingestor created it, and any database connection."""
+        if self._client is not None and self._owns_client:
+            self._client.close()
+            self._client = None
+        if self._loader is not None:
+            self._loader.close()
+            self._loader = None
+
+    def __enter__(self) -> "SupabaseIngestor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def _get_service_key(self) -> str:
         """Get service role key from Supabase Management API."""
@@ -81,6 +161,76 @@ class SupabaseIngestor:
 
         raise ValueError("Could not find service_role key")
 
+    @staticmethod
+    def _encode_rule(rule: dict) -> bytes:
+        """JSON-encode a rule, adding line_count based on its body text."""
+        return json.dumps(_add_line_count(rule), separators=(",", ":")).encode("utf-8")
+
+    def _iter_batches(
+        self, rules: Iterable[dict], batch_size: int
+    ) -> Iterator[tuple[bytes, int, list]]:
+        """Group rules into JSON array payloads of about max_batch_bytes.
+
+        A batch closes when the next rule would push it past max_batch_bytes
+        or it holds batch_size rules, so long sections travel in small
+        batches and short ones in large. Yields (payload, row count, ids).
+
+        A batch holds each id once (ON CONFLICT cannot update the same row
+        twice in one statement). A repeated id replaces the earlier row,
+        keeping the last as PostgresBulkLoader does.
+        """
+        encoded: dict[Any, bytes] = {}
+        size = 0
+        for rule in rules:
+            row = self._encode_rule(rule)
+            key = rule.get("id") or rule.get("citation_path") or object()
+            previous = encoded.pop(key, None)
+            if previous is not None:
+                size -= len(previous) + 1
+            if encoded and (size + len(row) > self.max_batch_bytes or len(encoded) >= batch_size):
+                yield b"[" + b",".join(encoded.values()) + b"]", len(encoded), list(encoded)
+                encoded, size = {}, 0
+            encoded[key] = row
+            size += len(row) + 1
+        if encoded:
+            yield b"[" + b",".join(encoded.values()) + b"]", len(encoded), list(encoded)
+
+    def _post_batch(self, payload: bytes, rows: int, max_retries: int = 5) -> int:
+        """Post one JSON array of rules, retrying transport errors, 429s and 5xx.
+
+        A 429 or 503 waits for the server's Retry-After when it gives one;
+        otherwise retries back off exponentially.
+        """
+        for attempt in range(max_retries):
+            try:
+                response = self.client.post(
+                    f"{self.rest_url}/rules",
+                    headers={
+                        "apikey": self.key,
+                        "Authorization": f"Bearer {self.key}",
+                        "Content-Type": "application/json",
+                        "Content-Profile": "arch",  # Write to arch schema
+                        # Upsert: on conflict with citation_path, update
+                        "Prefer": "resolution=merge-duplicates,return=minimal",
+                    },
+                    content=payload,
+                )
+                response.raise_for_status()
+                return rows
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+                retryable = status is None or status == 429 or status >= 500
+                if not retryable or attempt == max_retries - 1:
+                    raise
+
+                wait_time = 2**attempt
+                if status in (429, 503):
+                    wait_time = parse_retry_after(e.response.headers.get("Retry-After")) or wait_time
+                print(f"    Retry {attempt + 1}/{max_retries} after {wait_time:.0f}s...")
+                time.sleep(wait_time)
+
+        return rows
+
     def _upsert_rules(self, rules: list[dict], max_retries: int = 5) -> int:
         """Upsert rules into Supabase (insert or update on citation_path conflict).
 
@@ -91,53 +241,89 @@ class SupabaseIngestor:
         Returns:
             Number of rows upserted
         """
-        import time
-
         if not rules:
             return 0
 
-        # Add line_count to all rules based on body text
-        for rule in rules:
-            body = rule.get("body") or ""
-            rule["line_count"] = len(body.split("\n"))
-
-        timeout = httpx.Timeout(180.0, connect=30.0, read=180.0, write=180.0)
-
-        for attempt in range(max_retries):
-            try:
-                with httpx.Client(timeout=timeout) as client:
-                    response = client.post(
-                        f"{self.rest_url}/rules",
-                        headers={
-                            "apikey": self.key,
-                            "Authorization": f"Bearer {self.key}",
-                            "Content-Type": "application/json",
-                            "Content-Profile": "arch",  # Write to arch schema
-                            # Upsert: on conflict with citation_path, update
-                            "Prefer": "resolution=merge-duplicates,return=minimal",
-                        },
-                        json=rules,
-                    )
-                    response.raise_for_status()
-                return len(rules)
-            except (httpx.ReadTimeout, httpx.HTTPStatusError) as e:
-                is_server_error = isinstance(e, httpx.HTTPStatusError) and e.response.status_code >= 500
-                is_timeout = isinstance(e, httpx.ReadTimeout)
-
-                if (is_server_error or is_timeout) and attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
-                    print(f"    Retry {attempt + 1}/{max_retries} after {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                raise
-
-        return len(rules)
+        total = 0
+        for payload, rows, _ in self._iter_batches(rules, batch_size=len(rules)):
+            total += self._post_batch(payload, rows, max_retries)
+        return total
 
     # Keep old method for backwards compatibility
     def _insert_rules(self, rules: list[dict], max_retries: int = 5) -> int:
         """Insert rules (deprecated, use _upsert_rules)."""
         return self._upsert_rules(rules, max_retries)
 
+    def upsert_stream(
+        self,
+        rules: Iterable[dict],
+        batch_size: int = MAX_BATCH_ROWS,
+        progress: bool = True,
+    ) -> int:
+        """Upsert rules as they are produced, with several batches in flight.
+
+        The iterable is consumed lazily and at most ``2 * max_in_flight``
+        batches are held at once, so memory stays bounded while a parser
+        keeps producing rules. A batch that still fails after its retries
+        raises once the batches already posted have finished.
+
+        A rule whose id repeats keeps the last row: within a batch it
+        replaces the earlier one, and a batch repeating an id from an earlier
+        batch waits for the batches in flight to finish before it is posted,
+        so the later row is always written last.
+
+        With ``db_url`` set, rules are COPYed into arch.rules instead, in
+        batches of ``BULK_BATCH_ROWS``.
+
+        Args:
+            rules: Rule dictionaries with citation_path
+            batch_size: Most rules per batch (batches are otherwise sized
+                by max_batch_bytes)
+            progress: Print a running total as batches complete
+
+        Returns:
+            Number of rows upserted
+        """
+        if self.db_url:
+            return self._copy_rules(rules, progress)
+
+        total = 0
+
+        def collect(done: set) -> None:
+            nonlocal total
+            for future in done:
+                total += future.result()
+            if progress and done:
+                print(f"  Upserted {total} rules...")
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            pending: set = set()
+            posted_ids: set = set()
+            try:
+                for payload, rows, ids in self._iter_batches(rules, batch_size):
+                    if not posted_ids.isdisjoint(ids):
+                        done, pending = wait(pending)
+                        collect(done)
+                    elif len(pending) >= self.max_in_flight * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    posted_ids.update(ids)
+                    pending.add(pool.submit(self._post_batch, payload, rows))
+            finally:
+                done, pending = wait(pending)
+            collect(done)
+
+        return total
+
+    def _copy_rules(self, rules: Iterable[dict], progress: bool = True) -> int:
+        """Load rules into arch.rules over a direct connection with COPY."""
+        return self.loader.load(
+            RULES_TABLE,
+            map(_add_line_count, rules),
+            batch_size=BULK_BATCH_ROWS,
+            progress=(lambda total: print(f"  Upserted {total} rules...")) if progress else None,
+        )
+
     def _section_to_rules(
         self,
         section: CanadaSection,
@@ -222,14 +408,14 @@ class SupabaseIngestor:
         self,
         consolidated_number: str,
         arch_path: Path | None = None,
-        batch_size: int = 50,
+        batch_size: int = MAX_BATCH_ROWS,
     ) -> int:
         """Ingest a Canadian federal act into the rules table.
 
         Args:
             consolidated_number: e.g., "I-3.3" for Income Tax Act
             arch_path: Path to arch directory (default ~/.arch)
-            batch_size: Number of rules to insert per batch
+            batch_size: Most rules per batch (batches are sized by bytes)
 
         Returns:
             Total number of rules inserted
@@ -242,25 +428,15 @@ class SupabaseIngestor:
             raise FileNotFoundError(f"Not found: {xml_path}")
 
         parser = CanadaStatuteParser(xml_path)
-        total_inserted = 0
-        batch: list[dict] = []
 
         print(f"Ingesting {consolidated_number}...")
 
-        for section in parser.iter_sections():
-            for rule in self._section_to_rules(section, act_id=consolidated_number):
-                batch.append(rule)
-
-                if len(batch) >= batch_size:
-                    inserted = self._insert_rules(batch)
-                    total_inserted += inserted
-                    print(f"  Inserted {total_inserted} rules...")
-                    batch = []
-
-        # Insert remaining
-        if batch:
-            inserted = self._insert_rules(batch)
-            total_inserted += inserted
+        rules = (
+            rule
+            for section in parser.iter_sections()
+            for rule in self._section_to_rules(section, act_id=consolidated_number)
+        )
+        total_inserted = self.upsert_stream(rules, batch_size=batch_size)
 
         print(f"Done! Inserted {total_inserted} rules for {consolidated_number}")
         return total_inserted
@@ -388,14 +564,14 @@ class SupabaseIngestor:
         self,
         title_num: int,
         uscode_path: Path | None = None,
-        batch_size: int = 50,
+        batch_size: int = MAX_BATCH_ROWS,
     ) -> int:
         """Ingest a US Code title into the rules table.
 
         Args:
             title_num: Title number (e.g., 26 for IRC)
             uscode_path: Path to uscode directory (default arch/data/uscode)
-            batch_size: Number of rules to insert per batch
+            batch_size: Most rules per batch (batches are sized by bytes)
 
         Returns:
             Total number of rules inserted
@@ -408,26 +584,16 @@ class SupabaseIngestor:
         if not xml_path.exists():
             raise FileNotFoundError(f"Not found: {xml_path}")
 
-        parser = USLMParser(xml_path)
-        total_inserted = 0
-        batch: list[dict] = []
+        parser = USLMParser(xml_path, streaming=True)
 
         title_name = parser.get_title_name()
         print(f"Ingesting Title {title_num}: {title_name}...")
 
-        for section in parser.iter_sections():
-            for rule in self._usc_section_to_rules(section):
-                batch.append(rule)
-
-                if len(batch) >= batch_size:
-                    inserted = self._upsert_rules(batch)
-                    total_inserted += inserted
-                    print(f"  Upserted {total_inserted} rules...")
-                    batch = []
-
-        if batch:
-            inserted = self._upsert_rules(batch)
-            total_inserted += inserted
+        # Parsing continues while earlier batches are being posted
+        rules = (
+            rule for section in parser.iter_sections() for rule in self._usc_section_to_rules(section)
+        )
+        total_inserted = self.upsert_stream(rules, batch_size=batch_size)
 
         print(f"Done! Upserted {total_inserted} rules for Title {title_num}")
         return total_inserted
@@ -436,12 +602,17 @@ class SupabaseIngestor:
         self,
         uscode_path: Path | None = None,
         titles: list[int] | None = None,
+        workers: int | None = None,
+        batch_size: int = MAX_BATCH_ROWS,
     ) -> int:
         """Ingest all US Code titles.
 
         Args:
             uscode_path: Path to uscode directory
             titles: Specific titles to ingest (default: all available)
+            workers: Parse titles in this many worker processes, upserting
+                from this process as sections arrive (default: one at a time)
+            batch_size: Most rules per batch (batches are sized by bytes)
 
         Returns:
             Total number of rules inserted
@@ -461,16 +632,52 @@ class SupabaseIngestor:
                 except ValueError:
                     continue
 
+        if workers:
+            return self._ingest_usc_parallel(uscode_path, titles, workers, batch_size)
+
         total = 0
         for title_num in titles:
             try:
-                count = self.ingest_usc_title(title_num, uscode_path)
+                count = self.ingest_usc_title(title_num, uscode_path, batch_size=batch_size)
                 total += count
             except Exception as e:
                 print(f"Error ingesting Title {title_num}: {e}")
 
         return total
 
+    def _ingest_usc_parallel(
+        self,
+        uscode_path: Path,
+        titles: list[int],
+        workers: int,
+        batch_size: int,
+    ) -> int:
+        """Parse titles in a process pool and upsert their rules as chunks arrive."""
+        xml_paths = []
+        for title_num in titles:
+            xml_path = uscode_path / f"usc{title_num}.xml"
+            if xml_path.exists():
+                xml_paths.append(xml_path)
+            else:
+                print(f"Error ingesting Title {title_num}: Not found: {xml_path}")
+
+        def iter_rules() -> Iterator[dict]:
+            with closing(iter_titles_parallel(xml_paths, workers=workers)) as chunks:
+                for chunk in chunks:
+                    if chunk.error:
+                        print(f"Error ingesting {chunk.xml_path}: {chunk.error}")
+                    for section in chunk.sections:
+                        yield from self._usc_section_to_rules(section)
+                    if chunk.final and not chunk.error:
+                        print(f"  Parsed Title {chunk.title_num}: {chunk.count} sections")
+
+        # Closing stops the parse workers if an upsert fails part way
+        with closing(iter_rules()) as rules:
+            total_inserted = self.upsert_stream(rules, batch_size=batch_size, progress=False)
+
+        print(f"Done! Upserted {total_inserted} rules for {len(xml_paths)} titles")
+        return total_inserted
+
     # -------------------------------------------------------------------------
     # UK Legislation Ingestion
     # -------------------------------------------------------------------------
@@ -573,7 +780,7 @@ class SupabaseIngestor:
         year: int,
         chapter: int,
         uk_path: Path | None = None,
-        batch_size: int = 50,
+        batch_size: int = MAX_BATCH_ROWS,
     ) -> int:
         """Ingest a UK Act into the rules table.
 
@@ -581,7 +788,7 @@ class SupabaseIngestor:
             year: Year of the act (e.g., 2020)
             chapter: Chapter number (e.g., 1)
             uk_path: Path to UK legislation directory
-            batch_size: Number of rules to insert per batch
+            batch_size: Most rules per batch (batches are sized by bytes)
 
         Returns:
             Total number of rules inserted
@@ -596,9 +803,6 @@ class SupabaseIngestor:
         # Read and parse the XML
         xml_content = xml_path.read_text()
 
-        total_inserted = 0
-        batch: list[dict] = []
-
         # Parse act metadata
         try:
             act = parse_act_metadata(xml_content)
@@ -607,22 +811,14 @@ class SupabaseIngestor:
             print(f"Ingesting ukpga/{year}/{chapter}...")
 
         # Parse sections (the XML contains the full act)
+        rules: list[dict] = []
         try:
             section = parse_section(xml_content)
-            for rule in self._uk_section_to_rules(section):
-                batch.append(rule)
-
-                if len(batch) >= batch_size:
-                    inserted = self._insert_rules(batch)
-                    total_inserted += inserted
-                    print(f"  Inserted {total_inserted} rules...")
-                    batch = []
+            rules = list(self._uk_section_to_rules(section))
         except Exception as e:
             print(f"  Warning: Could not parse sections: {e}")
 
-        if batch:
-            inserted = self._insert_rules(batch)
-            total_inserted += inserted
+        total_inserted = self.upsert_stream(rules, batch_size=batch_size)
 
         print(f"Done! Inserted {total_inserted} rules for ukpga/{year}/{chapter}")
         return total_inserted
@@ -762,14 +958,14 @@ class SupabaseIngestor:
         self,
         xml_path: Path | str,
         state_code: str,
-        batch_size: int = 50,
+        batch_size: int = MAX_BATCH_ROWS,
     ) -> int:
         """Ingest a state statute USLM XML file into the rules table.
 
         Args:
             xml_path: Path to USLM-style XML file
             state_code: Two-letter state code (e.g., "oh", "ca")
-            batch_size: Number of rules to insert per batch
+            batch_size: Most rules per batch (batches are sized by bytes)
 
         Returns:
             Total number of rules inserted
@@ -779,30 +975,17 @@ class SupabaseIngestor:
             raise FileNotFoundError(f"Not found: {xml_path}")
 
         parser = USLMParser(xml_path)
-        total_inserted = 0
 
         title_name = parser.get_title_name()
         print(f"Ingesting {state_code.upper()} - {title_name}...")
 
-        for section in parser.iter_sections():
-            # Collect all rules for this section
-            all_rules = list(self._state_section_to_rules(section, state_code))
-
-            # Deduplicate by citation_path (HTML parsing may create duplicates)
-            seen_paths: set[str] = set()
-            unique_rules: list[dict] = []
-            for rule in all_rules:
-                path = rule.get("citation_path", "")
-                if path and path not in seen_paths:
-                    seen_paths.add(path)
-                    unique_rules.append(rule)
-
-            # Insert in batches
-            for i in range(0, len(unique_rules), batch_size):
-                batch = unique_rules[i : i + batch_size]
-                inserted = self._upsert_rules(batch)
-                total_inserted += inserted
-                print(f"  Upserted {total_inserted} rules...")
+        # HTML parsing may repeat a citation_path; upsert_stream keeps the last
+        rules = (
+            rule
+            for section in parser.iter_sections()
+            for rule in self._state_section_to_rules(section, state_code)
+        )
+        total_inserted = self.upsert_stream(rules, batch_size=batch_size)
 
         print(f"Done! Upserted {total_inserted} rules for {state_code.upper()}")
         return total_inserted
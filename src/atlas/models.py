@@ -1,8 +1,32 @@
 """Data models for statute representation."""
 
+import json
+from collections.abc import Callable, Sequence
 from datetime import date
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+_Node = TypeVar("_Node")
+
+
+def _index_paths(
+    nodes: Sequence[_Node],
+    identifier: Callable[[_Node], str],
+    children: Callable[[_Node], Sequence[_Node]],
+) -> dict[str, _Node]:
+    """Map slash-separated paths (e.g., 'b/1/A') to nodes of a subsection tree.
+
+    Where siblings share an identifier, the first one wins.
+    """
+    index: dict[str, _Node] = {}
+    stack = [("", node) for node in reversed(nodes)]
+    while stack:
+        prefix, node = stack.pop()
+        path = f"{prefix}{identifier(node)}"
+        index.setdefault(path, node)
+        stack.extend((f"{path}/", child) for child in reversed(children(node)))
+    return index
 
 
 class Citation(BaseModel):
@@ -77,6 +101,56 @@ class Subsection(BaseModel):
             parts.append(child.full_text())
         return "\n".join(parts)
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Subsection":
+        """Build a subsection (and its children) from its stored dict form."""
+        return cls(
+            identifier=d["identifier"],
+            heading=d.get("heading"),
+            text=d["text"],
+            children=[cls.from_dict(c) for c in d.get("children", [])],
+        )
+
+
+class SubsectionTree:
+    """A section's subsection hierarchy, kept as stored JSON until first used.
+
+    Decoding goes straight to plain dicts, so callers that only re-serialize
+    the tree (or one branch of it) never build pydantic models, and
+    ``raw_json`` can be passed through untouched.
+    """
+
+    def __init__(self, raw_json: str | None):
+        self.raw_json = raw_json or "[]"
+        self._nodes: list[dict[str, Any]] | None = None
+        self._index: dict[str, dict[str, Any]] | None = None
+
+    @property
+    def nodes(self) -> list[dict[str, Any]]:
+        """Top-level subsections as dicts, decoded on first access."""
+        if self._nodes is None:
+            self._nodes = json.loads(self.raw_json)
+        return self._nodes
+
+    def get(self, path: str) -> dict[str, Any] | None:
+        """Look up a subsection dict by slash-separated path (e.g., 'b/1/A')."""
+        if not path:
+            return None
+        if self._index is None:
+            self._index = _index_paths(
+                self.nodes, lambda d: d["identifier"], lambda d: d.get("children", [])
+            )
+        return self._index.get(path)
+
+    def get_subsection(self, path: str) -> Subsection | None:
+        """Build the model for just one branch of the tree."""
+        node = self.get(path)
+        return Subsection.from_dict(node) if node is not None else None
+
+    def to_subsections(self) -> list[Subsection]:
+        """Build models for the whole tree."""
+        return [Subsection.from_dict(d) for d in self.nodes]
+
 
 class Section(BaseModel):
     """A complete statute section with full metadata."""
@@ -114,19 +188,19 @@ class Section(BaseModel):
 
     model_config = {"extra": "forbid"}
 
+    # Path index over `subsections`, built on the first lookup
+    _subsection_index: tuple[list[Subsection], dict[str, Subsection]] | None = PrivateAttr(
+        default=None
+    )
+
     def get_subsection(self, path: str) -> "Subsection | None":
-        """Walk the subsection tree by slash-separated path (e.g., 'c', 'b/1/A')."""
+        """Look up a subsection by slash-separated path (e.g., 'c', 'b/1/A')."""
         if not path:
             return None
-        segments = path.split("/")
-        children = self.subsections
-        node = None
-        for seg in segments:
-            node = next((c for c in children if c.identifier == seg), None)
-            if node is None:
-                return None
-            children = node.children
-        return node
+        if self._subsection_index is None or self._subsection_index[0] is not self.subsections:
+            index = _index_paths(self.subsections, lambda s: s.identifier, lambda s: s.children)
+            self._subsection_index = (self.subsections, index)
+        return self._subsection_index[1].get(path)
 
     def get_subsection_text(self, path: str) -> str | None:
         """Get the full recursive text for a subsection by path."""
@@ -6,7 +6,13 @@ the Law Revision Counsel at uscode.house.gov.
 Schema documentation: https://uscode.house.gov/download/resources/USLM-User-Guide.pdf
 """
 
-from collections.abc import Iterator
+import multiprocessing
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
@@ -20,32 +26,47 @@ USLM_NS_HOUSE = {"uslm": "http://xml.house.gov/schemas/uslm/1.0"}
 
 
 class USLMParser:
-    """Parser for USLM XML files from uscode.house.gov."""
+    """Parser for USLM XML files from uscode.house.gov.
 
-    def __init__(self, xml_path: Path | str):
+    By default the whole document is loaded into an lxml tree. With
+    ``streaming=True`` sections are parsed incrementally with ``iterparse``
+    and each one is discarded once yielded, so memory stays bounded by the
+    largest single section rather than the whole title.
+    """
+
+    def __init__(self, xml_path: Path | str, streaming: bool = False):
         """Initialize parser with path to USLM XML file.
 
         Args:
             xml_path: Path to the USLM XML file (e.g., usc26.xml for Title 26)
+            streaming: Parse incrementally instead of loading the full DOM
         """
-        self.xml_path = Path(xml_path)  # pragma: no cover
-        self._tree: etree._ElementTree | None = None  # pragma: no cover
-        self._ns: dict[str, str] = {}  # Detected namespace  # pragma: no cover
+        self.xml_path = Path(xml_path)
+        self.streaming = streaming
+        self._tree: etree._ElementTree | None = None
+        self._ns: dict[str, str] = {}  # Detected namespace
+        # Title metadata captured from the header while streaming
+        self._title_num: int | None = None
+        self._title_name: str | None = None
 
     def _detect_namespace(self) -> dict[str, str]:
         """Detect which USLM namespace the document uses."""
-        root = self.tree.getroot()  # pragma: no cover
-        ns = root.nsmap.get(None, "")  # Default namespace  # pragma: no cover
+        return self._namespace_for(self.tree.getroot())  # pragma: no cover
 
-        if "xml.house.gov" in ns:  # pragma: no cover
-            return USLM_NS_HOUSE  # pragma: no cover
-        elif "schemas.gpo.gov" in ns:  # pragma: no cover
-            return USLM_NS_GPO  # pragma: no cover
+    @staticmethod
+    def _namespace_for(root: etree._Element) -> dict[str, str]:
+        """Pick the USLM namespace dict matching a root element."""
+        ns = root.nsmap.get(None, "")  # Default namespace
+
+        if "xml.house.gov" in ns:
+            return USLM_NS_HOUSE
+        elif "schemas.gpo.gov" in ns:
+            return USLM_NS_GPO
         else:
             # Try to detect from root element
-            if "house.gov" in str(root.tag):  # pragma: no cover
-                return USLM_NS_HOUSE  # pragma: no cover
-            return USLM_NS_GPO  # pragma: no cover
+            if "house.gov" in str(root.tag):
+                return USLM_NS_HOUSE
+            return USLM_NS_GPO
 
     @property
     def ns(self) -> dict[str, str]:
@@ -63,6 +84,13 @@ class USLMParser:
 
     def get_title_number(self) -> int:
         """Extract the title number from the XML."""
+        if self.streaming and self._tree is None:
+            if self._title_num is None:
+                self._scan_header()
+            if self._title_num is None:
+                raise ValueError(f"Cannot determine title number from {self.xml_path}")
+            return self._title_num
+
         root = self.tree.getroot()  # pragma: no cover
         # Try to get from docNumber in meta first (most reliable)
         doc_num = root.find(".//docNumber", self.ns)  # pragma: no cover
@@ -91,6 +119,11 @@ class USLMParser:
 
     def get_title_name(self) -> str:
         """Extract the title name (e.g., 'Internal Revenue Code')."""
+        if self.streaming and self._tree is None:
+            if self._title_name is None:
+                self._scan_header()
+            return self._title_name or f"Title {self.get_title_number()}"
+
         root = self.tree.getroot()  # pragma: no cover
         # Try with namespace
         heading = root.find(".//uslm:title/uslm:heading", self.ns)  # pragma: no cover
@@ -110,6 +143,10 @@ class USLMParser:
         Yields:
             Section objects for each section in the title
         """
+        if self.streaming:
+            yield from self._iter_sections_streaming()
+            return
+
         root = self.tree.getroot()  # pragma: no cover
         title_num = self.get_title_number()  # pragma: no cover
         title_name = self.get_title_name()  # pragma: no cover
@@ -125,6 +162,87 @@ class USLMParser:
                 identifier = section_elem.get("identifier", "unknown")  # pragma: no cover
                 print(f"Warning: Failed to parse section {identifier}: {e}")  # pragma: no cover
 
+    def _iterparse(self) -> Iterator[tuple[str, etree._Element]]:
+        """Stream start/end events, detecting the namespace from the root element."""
+        # Opened here so closing the generator also closes the file
+        with open(self.xml_path, "rb") as source:
+            context = etree.iterparse(source, events=("start", "end"), huge_tree=True)
+            for event, elem in context:
+                if not self._ns:
+                    self._ns = self._namespace_for(elem)
+                yield event, elem
+
+    def _capture_header(self, event: str, elem: etree._Element) -> None:
+        """Record title number/name from header elements as they stream past."""
+        localname = etree.QName(elem).localname
+        if event == "start":
+            # Fallback: /us/usc/t26 on the <title> element (attributes are set on start)
+            identifier = elem.get("identifier", "")
+            if localname == "title" and self._title_num is None and "/t" in identifier:
+                self._title_num = int(identifier.split("/t")[-1].split("/")[0])
+            return
+
+        if localname == "docNumber" and elem.text and self._title_num is None:
+            # docNumber lives in <meta> ahead of <main>, so it takes precedence
+            self._title_num = int(elem.text.strip())
+        elif localname == "heading" and self._title_name is None and elem.text:
+            parent = elem.getparent()
+            if parent is not None and etree.QName(parent).localname == "title":
+                self._title_name = elem.text.strip()
+
+    def _scan_header(self) -> None:
+        """Read title metadata, stopping at the first section."""
+        # Stops early, so close the stream rather than leave it to the GC
+        with closing(self._iterparse()) as events:
+            for event, elem in events:
+                if etree.QName(elem).localname == "section":
+                    break
+                self._capture_header(event, elem)
+
+    def _iter_sections_streaming(self) -> Iterator[Section]:
+        """Yield sections as each top-level <section> closes, then free it."""
+        section_tag = None
+        header: tuple[int, str] | None = None
+        depth = 0  # Open <section> elements (quoted amendments can nest them)
+
+        for event, elem in self._iterparse():
+            if section_tag is None:
+                section_tag = f"{{{self.ns.get('uslm', '')}}}section"
+            is_section = elem.tag == section_tag
+
+            if event == "start":
+                if is_section:
+                    depth += 1
+                elif depth == 0:
+                    self._capture_header(event, elem)
+                continue
+
+            if is_section:
+                depth -= 1
+                if depth:
+                    continue
+                if header is None:
+                    header = (self.get_title_number(), self.get_title_name())
+                title_num, title_name = header
+                # Same document order as the DOM path: the section, then any nested ones
+                for section_elem in elem.iter(section_tag):
+                    try:
+                        section = self._parse_section(section_elem, title_num, title_name)
+                        if section:
+                            yield section
+                    except Exception as e:
+                        identifier = section_elem.get("identifier", "unknown")
+                        print(f"Warning: Failed to parse section {identifier}: {e}")
+            elif depth:
+                continue
+            else:
+                self._capture_header(event, elem)
+
+            # Release everything already processed at this level
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
     def get_section(self, section_num: str) -> Section | None:
         """Get a specific section by number.
 
@@ -276,6 +394,126 @@ class USLMParser:
         return list(set(references))  # Deduplicate  # pragma: no cover
 
 
+@dataclass
+class ParsedChunk:
+    """A batch of sections parsed from one title by a worker process.
+
+    The last chunk for each title has ``final`` set, carrying the total
+    section count (or ``error`` if the title could not be parsed).
+    """
+
+    xml_path: str
+    title_num: int | None = None
+    title_name: str | None = None
+    sections: list[Section] = field(default_factory=list)
+    final: bool = False
+    count: int = 0
+    error: str | None = None
+
+
+def _put(out: "queue.Queue[tuple]", stop: "threading.Event", message: tuple) -> bool:
+    """Put on the bounded queue, giving up once the consumer has stopped."""
+    while not stop.is_set():
+        try:
+            out.put(message, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _parse_title_to_queue(
+    xml_path: str, out: "queue.Queue[tuple]", stop: "threading.Event", chunk_size: int
+) -> None:
+    """Worker: stream-parse one title, pushing JSON-serialized section chunks."""
+    count = 0
+    title_num = title_name = None
+    try:
+        parser = USLMParser(xml_path, streaming=True)
+        title_num = parser.get_title_number()
+        title_name = parser.get_title_name()
+        chunk: list[str] = []
+        for section in parser.iter_sections():
+            chunk.append(section.model_dump_json())
+            count += 1
+            if len(chunk) >= chunk_size:
+                if not _put(out, stop, (xml_path, title_num, title_name, chunk, False, count, None)):
+                    return
+                chunk = []
+        _put(out, stop, (xml_path, title_num, title_name, chunk, True, count, None))
+    except Exception as e:
+        _put(out, stop, (xml_path, title_num, title_name, [], True, count, str(e)))
+
+
+def iter_titles_parallel(
+    xml_paths: Sequence[Path | str],
+    workers: int | None = None,
+    chunk_size: int = 500,
+) -> Iterator[ParsedChunk]:
+    """Parse several USLM titles concurrently in a fixed pool of processes.
+
+    A pool of ``workers`` processes pulls titles one at a time and parses each
+    with the streaming parser. Sections come back in chunks through a Manager
+    queue bounded at ``workers * 2`` chunks, so fast parsers block instead of
+    buffering whole titles, and the caller acts as the single writer while
+    parsing proceeds in parallel.
+
+    If the caller stops early (or raises), closing the generator stops the
+    workers and cancels titles not yet started. Wrap it in
+    ``contextlib.closing`` so that happens promptly rather than at garbage
+    collection.
+
+    Args:
+        xml_paths: USLM XML files to parse
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Sections per chunk sent back from a worker
+
+    Yields:
+        ParsedChunk objects, interleaved across titles as workers produce them
+    """
+    workers = workers or multiprocessing.cpu_count()
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=workers) as pool:
+        # Bounded so fast parsers block instead of piling sections up in memory
+        out = manager.Queue(maxsize=workers * 2)
+        # Set when the consumer goes away, so workers stop waiting on the queue
+        stop = manager.Event()
+        futures = [
+            pool.submit(_parse_title_to_queue, str(path), out, stop, chunk_size)
+            for path in xml_paths
+        ]
+
+        def drain(timeout: float | None) -> Iterator[ParsedChunk]:
+            while True:
+                try:
+                    message = out.get(timeout=timeout) if timeout else out.get_nowait()
+                except queue.Empty:
+                    return
+                path, title_num, title_name, chunk, final, count, error = message
+                yield ParsedChunk(
+                    xml_path=path,
+                    title_num=title_num,
+                    title_name=title_name,
+                    sections=[Section.model_validate_json(s) for s in chunk],
+                    final=final,
+                    count=count,
+                    error=error,
+                )
+
+        try:
+            while not all(f.done() for f in futures):
+                yield from drain(timeout=0.5)
+            # Workers put their last chunk before returning, so nothing is left behind
+            yield from drain(timeout=None)
+            for future in futures:
+                future.result()
+        finally:
+            # A no-op after a full run; after an early exit, running workers
+            # see the event within a put timeout and the pool can shut down
+            stop.set()
+            for future in futures:
+                future.cancel()
+
+
 def download_title(title_num: int, output_dir: Path) -> Path:
     """Download a US Code title from uscode.house.gov.
 
@@ -2,7 +2,11 @@
 
 import argparse
 
-from atlas.pipeline.runner import STATE_CONVERTERS, StatePipeline
+from atlas.http_cache import HTTPCache
+from atlas.pipeline.fetch_cache import DISK_MAX_AGE, FetchCache
+from atlas.pipeline.runner import STATE_CONVERTERS, StatePipeline, run_states
+from atlas.rate_limit import HostRateLimiter
+from atlas.storage.r2_manifest import DEFAULT_MANIFEST_PATH
 
 
 def main():
@@ -13,8 +17,45 @@ def main():
     parser.add_argument("--state", help="State code (e.g., ak, ny)")
     parser.add_argument("--all-states", action="store_true", help="Process all states")
     parser.add_argument("--dry-run", action="store_true", help="Don't upload anything")
+    parser.add_argument(
+        "--workers", type=int, default=8, help="States processed concurrently with --all-states"
+    )
+    parser.add_argument("--cache-dir", help="Persist fetched pages here and reuse them on re-runs")
+    parser.add_argument(
+        "--offline", action="store_true", help="Parse only from --cache-dir; no network"
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=DISK_MAX_AGE,
+        help="Seconds a --cache-dir page is reused by online runs before it is refetched",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Don't re-upload objects whose content already matches the R2 manifest",
+    )
+    parser.add_argument(
+        "--manifest",
+        default=DEFAULT_MANIFEST_PATH,
+        help="SQLite manifest of R2 objects used by --skip-unchanged (see atlas r2-sync)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        help="Keep converter responses here and revalidate them (ETag/Last-Modified) next run",
+    )
+    parser.add_argument(
+        "--adaptive-rate",
+        type=float,
+        help="Starting converter requests/second per host (default: 2); the rate "
+        "adapts to 429/5xx responses",
+    )
     args = parser.parse_args()
 
+    if args.offline and not args.cache_dir:
+        print("--offline requires --cache-dir")
+        return
+
     if args.all_states:
         states = list(STATE_CONVERTERS.keys())
     elif args.state:
@@ -27,13 +68,41 @@ def main():
         "sections_found": 0,
         "raw_uploaded": 0,
         "akn_uploaded": 0,
+        "skipped": 0,
         "errors": 0,
     }
 
-    for state in states:
-        pipeline = StatePipeline(state, dry_run=args.dry_run)
-        stats = pipeline.run()
+    fetch_cache = (
+        FetchCache(args.cache_dir, offline=args.offline, max_age=args.cache_max_age)
+        if args.cache_dir
+        else None
+    )
+    http_cache = HTTPCache(args.http_cache) if args.http_cache else None
+    host_limiter = HostRateLimiter(rate=args.adaptive_rate) if args.adaptive_rate else None
+    if len(states) > 1:
+        results = run_states(
+            states,
+            workers=args.workers,
+            dry_run=args.dry_run,
+            fetch_cache=fetch_cache,
+            skip_unchanged=args.skip_unchanged,
+            http_cache=http_cache,
+            host_limiter=host_limiter,
+            manifest_path=args.manifest,
+        )
+    else:
+        pipeline = StatePipeline(
+            states[0],
+            dry_run=args.dry_run,
+            fetch_cache=fetch_cache,
+            skip_unchanged=args.skip_unchanged,
+            http_cache=http_cache,
+            host_limiter=host_limiter,
+            manifest_path=args.manifest,
+        )
+        results = {states[0]: pipeline.run()}
 
+    for state, stats in results.items():
         for k, v in stats.items():
             total_stats[k] += v
 
@@ -48,7 +117,10 @@ def main():
     print(f"  Sections found: {total_stats['sections_found']}")
     print(f"  Raw uploaded:   {total_stats['raw_uploaded']}")
     print(f"  AKN uploaded:   {total_stats['akn_uploaded']}")
+    print(f"  Unchanged:      {total_stats['skipped']}")
     print(f"  Errors:         {total_stats['errors']}")
+    if http_cache:
+        print(f"  HTTP cache:     {http_cache.stats()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+"""Fetch-through page cache shared by the pipeline and state converters.
+
+The pipeline fetches each chapter page to archive it, and the converter then
+downloads the same page again to parse it. Routing both through a FetchCache
+means every URL is fetched at most once per run. With a cache directory the
+pages persist, so a later run with ``offline=True`` can re-parse everything
+without touching the network. Online runs only reuse disk pages younger than
+``max_age``; older ones are fetched again (and revalidated by the HTTPCache,
+if the fetcher has one).
+
+Example:
+    >>> cache = FetchCache(Path("data/fetch-cache"))
+    >>> html = cache.fetch(url, converter._get)
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+Content = str | bytes
+
+# Pages kept in memory; enough to cover a chapter and its sections
+MEMORY_CACHE_SIZE = 256
+
+# Seconds a disk-cached page is reused by online runs
+DISK_MAX_AGE = 24 * 60 * 60
+
+
+class FetchCacheMissError(Exception):
+    """Raised in offline mode when a URL is not in the cache."""
+
+    def __init__(self, url: str):
+        super().__init__(f"Not in fetch cache (offline): {url}")
+        self.url = url
+
+
+class FetchCache:
+    """URL-keyed page cache with a small in-memory LRU and optional disk store.
+
+    Pages are stored under ``root`` by the SHA-256 of their URL, as ``.txt``
+    (decoded text) or ``.bin`` (raw bytes) to match what the fetcher returned.
+
+    Args:
+        root: Directory to persist pages in (None: memory only)
+        offline: Never call the fetcher; raise FetchCacheMissError on a miss
+        memory_size: Pages held in the in-memory LRU
+        max_age: Seconds a disk page stays fresh for online runs (None: no
+            limit). Offline runs use disk pages of any age.
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        offline: bool = False,
+        memory_size: int = MEMORY_CACHE_SIZE,
+        max_age: float | None = DISK_MAX_AGE,
+    ):
+        self.root = Path(root) if root else None
+        self.offline = offline
+        self.memory_size = memory_size
+        self.max_age = max_age
+        self._memory: OrderedDict[str, Content] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.root:
+            self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, suffix: str) -> Path:
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.root / digest[:2] / f"{digest}{suffix}"  # type: ignore[operator]
+
+    def _remember(self, url: str, content: Content) -> None:
+        with self._lock:
+            self._memory[url] = content
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, url: str) -> Content | None:
+        """Return the cached page for a URL, or None."""
+        with self._lock:
+            content = self._memory.get(url)
+            if content is not None:
+                self._memory.move_to_end(url)
+                return content
+
+        if self.root:
+            text_path = self._path(url, ".txt")
+            bin_path = self._path(url, ".bin")
+            if self._fresh(text_path):
+                content = text_path.read_text(encoding="utf-8")
+            elif self._fresh(bin_path):
+                content = bin_path.read_bytes()
+            if content is not None:
+                self._remember(url, content)
+        return content
+
+    def _fresh(self, path: Path) -> bool:
+        """Whether a disk page exists and may be served without refetching."""
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if self.offline or self.max_age is None:
+            return True
+        return time.time() - mtime < self.max_age
+
+    def put(self, url: str, content: Content) -> None:
+        """Cache a page (written atomically when disk-backed)."""
+        self._remember(url, content)
+        if not self.root:
+            return
+
+        is_text = isinstance(content, str)
+        path = self._path(url, ".txt" if is_text else ".bin")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode("utf-8") if is_text else content
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def fetch(self, url: str, fetcher: Callable[[str], Content]) -> Content:
+        """Return the cached page, fetching and caching it on a miss."""
+        content = self.get(url)
+        with self._lock:
+            if content is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if content is not None:
+            return content
+
+        if self.offline:
+            raise FetchCacheMissError(url)
+        content = fetcher(url)
+        if isinstance(content, (str, bytes)):
+            self.put(url, content)
+        return content
+
+    def wrap(self, fetcher: Callable[..., object]) -> Callable[..., object]:
+        """Wrap a converter's ``_get(url)`` so single-URL calls go through the cache.
+
+        Calls with extra arguments (e.g. API query params) are not cached: they
+        pass straight through online and raise FetchCacheMissError offline.
+        """
+
+        def cached_get(url: str, *args: object, **kwargs: object) -> object:
+            if args or kwargs:
+                if self.offline:
+                    with self._lock:
+                        self.misses += 1
+                    raise FetchCacheMissError(url)
+                return fetcher(url, *args, **kwargs)
+            return self.fetch(url, fetcher)  # type: ignore[arg-type]
+
+        return cached_get
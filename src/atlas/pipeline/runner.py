@@ -6,18 +6,35 @@ This module runs the full pipeline for processing state statutes:
 3. Parse into sections using state-specific converters
 4. Convert to Akoma Ntoso XML
 5. Upload AKN XML to R2 rules-xml bucket
+
+Chapters are fetched on the calling thread while earlier ones are parsed,
+converted and uploaded in worker stages behind bounded queues (see
+stages.py). Parsing stays on a thread because the converters fetch through
+their own clients; AKN conversion is CPU-bound and runs in a process pool.
+
+Every request a converter makes goes through an adaptive per-host
+HostRateLimiter. Many states can be run at once with run_states(); they share
+one limiter, so each legislature's site is paced as a whole however many
+states (or converters) point at it.
 """
 
 import hashlib
 import importlib
 import inspect
-import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
+from atlas.http_cache import HTTPCache, replace_client
 from atlas.models import Section
 from atlas.pipeline.akn import section_to_akn_xml
+from atlas.pipeline.fetch_cache import FetchCache
+from atlas.pipeline.stages import STAGE_QUEUE_SIZE, Stage, StageMetrics
+from atlas.rate_limit import HostRateLimiter
 from atlas.storage.r2 import R2Storage, get_r2_atlas, get_r2_rules_xml
+from atlas.storage.r2_manifest import DEFAULT_MANIFEST_PATH, R2Manifest
 
 
 # State converter module paths
@@ -72,6 +89,23 @@ STATE_CONVERTERS = {
 }
 
 
+# Upload batches sent at once (e.g. a chapter's raw HTML alongside its sections)
+UPLOAD_BATCHES_IN_FLIGHT = 2
+
+
+def _section_to_akn(section: Section, state: str) -> tuple[str | None, str | None]:
+    """Convert one section, returning (xml, None) or (None, error)."""
+    try:
+        return section_to_akn_xml(section, state), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _sections_to_akn(state: str, sections_json: list[str]) -> list[tuple[str | None, str | None]]:
+    """Worker: convert JSON-serialized sections to AKN XML, one result per section."""
+    return [_section_to_akn(Section.model_validate_json(s), state) for s in sections_json]
+
+
 class StatePipeline:
     """Pipeline for processing a single state's statutes.
 
@@ -87,6 +121,15 @@ class StatePipeline:
         dry_run: bool = False,
         r2_arch: R2Storage | None = None,
         r2_rules: R2Storage | None = None,
+        fetch_cache: FetchCache | None = None,
+        convert_workers: int = 2,
+        convert_in_processes: bool = True,
+        upload_workers: int = 8,
+        queue_size: int = STAGE_QUEUE_SIZE,
+        skip_unchanged: bool = False,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+        manifest_path: Path | str = DEFAULT_MANIFEST_PATH,
     ):
         """Initialize the pipeline.
 
@@ -95,18 +138,50 @@ class StatePipeline:
             dry_run: If True, don't upload anything
             r2_arch: Optional pre-configured R2Storage for arch bucket
             r2_rules: Optional pre-configured R2Storage for rules-xml bucket
+            fetch_cache: Page cache shared by archiving and the converter, so each
+                URL is fetched once (default: in-memory for this run)
+            convert_workers: Workers converting chapters to AKN XML
+            convert_in_processes: Convert in a pool of ``convert_workers``
+                processes so conversion is not bound by the GIL (False:
+                convert on the stage's threads)
+            upload_workers: Concurrent uploads within each batch sent to R2
+            queue_size: Items allowed to wait between stages before the
+                producer blocks
+            skip_unchanged: Skip uploads whose content already matches the
+                persisted R2 manifest
+            http_cache: Revalidate the converter's requests (ETag/Last-Modified)
+                against pages fetched in earlier runs
+            host_limiter: Adaptive per-host limiter applied to every request
+                the converter makes, shared when running states concurrently
+                (default: a private limiter)
+            manifest_path: SQLite manifest of R2 objects used by skip_unchanged
+                (see ``atlas r2-sync``)
         """
         self.state = state.lower()
         self.dry_run = dry_run
         self.r2_arch = r2_arch or get_r2_atlas()
         self.r2_rules = r2_rules or get_r2_rules_xml()
+        self.fetch_cache = fetch_cache or FetchCache()
+        self.convert_workers = convert_workers
+        self.convert_in_processes = convert_in_processes
+        self._convert_pool: ProcessPoolExecutor | None = None
+        self.upload_workers = upload_workers
+        self.queue_size = queue_size
+        self.skip_unchanged = skip_unchanged
+        self.http_cache = http_cache
+        self.host_limiter = host_limiter or HostRateLimiter()
+        self.manifest_path = manifest_path
         self.converter: Any = None
         self.stats = {
             "sections_found": 0,
             "raw_uploaded": 0,
             "akn_uploaded": 0,
+            "skipped": 0,
             "errors": 0,
         }
+        self._stats_lock = threading.Lock()
+        self._manifests: dict[str, R2Manifest] = {}  # bucket -> manifest
+        self.metrics: dict[str, StageMetrics] = {}
 
     def _load_converter(self) -> Any:
         """Dynamically load the state converter."""
@@ -128,6 +203,31 @@ class StatePipeline:
 
         raise ValueError(f"No converter class found in {module_path}")  # pragma: no cover
 
+    def _install_transports(self) -> None:
+        """Put the converter's HTTP client behind the revalidation cache and limiter.
+
+        The limiter then paces the converter's requests, so its own fixed
+        delay between requests is switched off.
+        """
+        inner = self.host_limiter.transport()
+        if self.http_cache:
+            installed = self.http_cache.install(self.converter, inner)
+        else:
+            installed = replace_client(self.converter, inner)
+        if installed and hasattr(self.converter, "rate_limit_delay"):
+            self.converter.rate_limit_delay = 0
+
+    def _install_fetch_cache(self) -> None:
+        """Route the converter's page fetches through the shared fetch cache.
+
+        The raw-archive step and the converter's own parsing both call
+        ``converter._get``, so wrapping it there serves the second request
+        (and any re-run with a disk cache) without hitting the network.
+        """
+        get = getattr(self.converter, "_get", None)
+        if callable(get):
+            self.converter._get = self.fetch_cache.wrap(get)
+
     def _get_chapter_url(self, chapter: Any, title: int | str | None = None) -> str:
         """Get the URL for a chapter.
 
@@ -163,6 +263,7 @@ class StatePipeline:
             else:
                 import httpx
 
+                self.host_limiter.wait(url)
                 response = httpx.get(url, follow_redirects=True, timeout=30)
                 return response.text
         except Exception as e:
@@ -247,11 +348,148 @@ class StatePipeline:
 
         return sections
 
+    def _count(self, stat: str, n: int = 1) -> None:
+        """Increment a stat; stages update stats from several threads."""
+        with self._stats_lock:
+            self.stats[stat] += n
+
+    def _stage_error(self, item: Any, error: Exception) -> None:
+        """Record a convert or upload failure."""
+        print(f"  [{self.state.upper()}] ERROR: {error}")
+        self._count("errors")
+
+    def _fetch_chapter(
+        self, chapter_num: Any, title_or_code: Any, parse: Stage, upload: Stage
+    ) -> None:
+        """Fetch one chapter, queueing its raw upload and handing it to the parse stage."""
+        display_name = f"{title_or_code}-{chapter_num}" if title_or_code else str(chapter_num)
+        label = f"  [{self.state.upper()}] Chapter {display_name}:"
+
+        try:
+            # 1. Get chapter URL and fetch raw HTML (paced by the host limiter)
+            url = self._get_chapter_url(chapter_num, title_or_code)
+            raw_html = self._fetch_raw_html(url)
+
+            # 2. Queue raw HTML for the R2 arch bucket (chapter level)
+            safe_chapter = display_name.replace("/", "-").replace(".", "-")
+            raw_key = f"us/statutes/states/{self.state}/raw/chapter-{safe_chapter}.html"
+
+            if raw_html and not self.dry_run:
+                metadata = {
+                    "source-url": url[:256],
+                    "state": self.state,
+                    "chapter": display_name,
+                    "fetched-at": datetime.now(timezone.utc).isoformat(),
+                }
+                upload.put((self.r2_arch, [(raw_key, raw_html, metadata)], "raw_uploaded"))
+
+            # 3. Parse in the next stage while the next chapter is fetched
+            # (blocks while it is saturated)
+            parse.put((chapter_num, title_or_code, display_name, raw_key))
+
+        except Exception as e:  # pragma: no cover
+            print(f"{label} ERROR: {e}")  # pragma: no cover
+            self._count("errors")  # pragma: no cover
+
+    def _parse_chapter(self, job: tuple[Any, Any, str, str], convert: Stage) -> None:
+        """Parse a fetched chapter into sections and hand them to the convert stage."""
+        chapter_num, title_or_code, display_name, raw_key = job
+        label = f"  [{self.state.upper()}] Chapter {display_name}:"
+
+        # The converter fetches through the cache, so the chapter page is reused
+        sections = self._get_sections(chapter_num, title_or_code)
+
+        if not sections:
+            print(f"{label} no sections")  # pragma: no cover
+            return  # pragma: no cover
+
+        print(f"{label} {len(sections)} sections")
+        self._count("sections_found", len(sections))
+        convert.put((sections, display_name, raw_key))
+
+    def _convert_chapter(self, job: tuple[list[Section], str, str]) -> tuple:
+        """Convert a chapter's sections to AKN XML, returning one upload batch.
+
+        With a process pool the sections travel to a worker as JSON. A section
+        that fails to convert is counted as an error and left out of the
+        batch; the rest of the chapter is still uploaded.
+        """
+        sections, display_name, raw_key = job
+        if self._convert_pool:
+            payload = [section.model_dump_json() for section in sections]
+            results = self._convert_pool.submit(_sections_to_akn, self.state, payload).result()
+        else:
+            results = [_section_to_akn(section, self.state) for section in sections]
+
+        items = []
+        for section, (akn_xml, error) in zip(sections, results, strict=True):
+            if akn_xml is None:
+                self._stage_error(section, ValueError(error))
+                continue
+            items.append(self._akn_item(section, akn_xml, display_name, raw_key))
+        return (self.r2_rules, items, "akn_uploaded")
+
+    def _akn_item(
+        self, section: Section, akn_xml: str, display_name: str, raw_key: str
+    ) -> tuple[str, str, dict[str, str]]:
+        """Build a converted section's (key, xml, metadata) upload item."""
+        section_id = (
+            section.citation.section
+            if hasattr(section.citation, "section")
+            else str(section.citation)
+        )
+        safe_id = section_id.replace("/", "-").replace(".", "-")
+        metadata = {
+            "raw-key": raw_key,
+            "state": self.state,
+            "section-id": section_id,
+            "chapter": display_name,
+        }
+        akn_key = f"us/statutes/states/{self.state}/{safe_id}.xml"
+        return (akn_key, akn_xml, metadata)
+
+    def _open_manifests(self) -> None:
+        """Open the persisted manifest of each bucket for this state's objects.
+
+        The manifests are kept current as objects are uploaded, so the bucket
+        is only listed the first time a state's prefix is seen.
+        """
+        prefix = f"us/statutes/states/{self.state}/"
+        for storage in (self.r2_arch, self.r2_rules):
+            manifest = R2Manifest(self.manifest_path, storage.bucket)
+            if manifest.last_synced(prefix) is None:
+                manifest.sync(storage, prefix)
+            self._manifests[storage.bucket] = manifest
+        known = sum(m.stats(prefix)["count"] for m in self._manifests.values())
+        print(f"  [{self.state.upper()}] {known} objects already in R2")
+
+    def _close_manifests(self) -> None:
+        """Close the manifests opened by _open_manifests."""
+        for manifest in self._manifests.values():
+            manifest.close()
+        self._manifests.clear()
+
+    def _upload(self, job: tuple[R2Storage, list[tuple], str]) -> None:
+        """Upload one batch (nothing on dry runs) and count the results."""
+        storage, items, stat = job
+        if self.dry_run:
+            self._count(stat, len(items))
+            return
+        summary = storage.upload_many(
+            items, workers=self.upload_workers, manifest=self._manifests.get(storage.bucket)
+        )
+        self._count(stat, summary.uploaded)
+        self._count("skipped", summary.skipped)
+        for key, error in summary.failed:
+            print(f"  [{self.state.upper()}] ERROR: {key}: {error}")
+            self._count("errors")
+
     def run(self) -> dict[str, int]:
         """Run the pipeline for this state.
 
         Returns:
-            Stats dict with sections_found, raw_uploaded, akn_uploaded, errors
+            Stats dict with sections_found, raw_uploaded, akn_uploaded,
+            skipped (unchanged objects not re-sent), errors
         """
         print(f"\n{'='*60}")
         print(f"Processing {self.state.upper()}")
@@ -268,6 +506,8 @@ class StatePipeline:
             return self.stats
 
         print(f"Converter: {type(self.converter).__name__}")
+        self._install_transports()
+        self._install_fetch_cache()
 
         # Get chapters to process
         chapters = self._get_chapters()
@@ -277,83 +517,121 @@ class StatePipeline:
             print("No chapters found - check converter configuration")
             return self.stats
 
-        # Process each chapter
-        for chapter_num, title_or_code in chapters:
-            display_name = (
-                f"{title_or_code}-{chapter_num}" if title_or_code else str(chapter_num)
-            )
-            print(f"\n  Chapter {display_name}...", end=" ", flush=True)
-
-            try:
-                # 1. Get chapter URL and fetch raw HTML
-                url = self._get_chapter_url(chapter_num, title_or_code)
-                raw_html = self._fetch_raw_html(url)
-
-                # 2. Archive raw HTML to R2 arch bucket (chapter level)
-                safe_chapter = display_name.replace("/", "-").replace(".", "-")
-                raw_key = f"us/statutes/states/{self.state}/raw/chapter-{safe_chapter}.html"
-
-                if raw_html and not self.dry_run:
-                    self.r2_arch.upload_raw(
-                        raw_key,
-                        raw_html,
-                        metadata={
-                            "source-url": url[:256],
-                            "state": self.state,
-                            "chapter": display_name,
-                            "fetched-at": datetime.now(timezone.utc).isoformat(),
-                        },
-                    )
-                    self.stats["raw_uploaded"] += 1
-
-                # 3. Parse into sections
-                sections = self._get_sections(chapter_num, title_or_code)
-
-                if not sections:
-                    print("no sections")  # pragma: no cover
-                    continue  # pragma: no cover
-
-                print(f"{len(sections)} sections")
-                self.stats["sections_found"] += len(sections)
-
-                # 4. Convert each section to AKN and upload
-                for section in sections:
-                    section_id = (
-                        section.citation.section
-                        if hasattr(section.citation, "section")
-                        else str(section.citation)
-                    )
-                    safe_id = section_id.replace("/", "-").replace(".", "-")
-
-                    try:
-                        # Convert to AKN
-                        akn_xml = section_to_akn_xml(section, self.state)
-
-                        # Upload AKN to rules-xml bucket
-                        akn_key = f"us/statutes/states/{self.state}/{safe_id}.xml"
-
-                        if not self.dry_run:
-                            self.r2_rules.upload_raw(
-                                akn_key,
-                                akn_xml,
-                                metadata={
-                                    "raw-key": raw_key,
-                                    "state": self.state,
-                                    "section-id": section_id,
-                                    "chapter": display_name,
-                                },
-                            )
-                        self.stats["akn_uploaded"] += 1
-
-                    except Exception as e:  # pragma: no cover
-                        print(f"    ERROR {section_id}: {e}")  # pragma: no cover
-                        self.stats["errors"] += 1  # pragma: no cover
-
-                # Rate limiting between chapters
-                time.sleep(0.5)
-
-            except Exception as e:  # pragma: no cover
-                print(f"ERROR: {e}")  # pragma: no cover
-                self.stats["errors"] += 1  # pragma: no cover
+        if self.skip_unchanged and not self.dry_run:
+            self._open_manifests()
+
+        # Fetch here; parse, convert and upload in worker stages, so network,
+        # CPU and upload latency overlap instead of adding up. Each upload
+        # batch is sent concurrently by upload_many.
+        if self.convert_in_processes:
+            self._convert_pool = ProcessPoolExecutor(max_workers=max(1, self.convert_workers))
+        upload = Stage(
+            "upload",
+            self._upload,
+            workers=UPLOAD_BATCHES_IN_FLIGHT,
+            maxsize=self.queue_size,
+            on_error=self._stage_error,
+        )
+        convert = Stage(
+            "convert",
+            lambda job: upload.put(self._convert_chapter(job)),
+            workers=self.convert_workers,
+            maxsize=self.queue_size,
+            on_error=self._stage_error,
+        )
+        # One parser thread: converters are not written for concurrent use
+        parse = Stage(
+            "parse",
+            lambda job: self._parse_chapter(job, convert),
+            workers=1,
+            maxsize=self.queue_size,
+            on_error=self._stage_error,
+        )
+        fetch = StageMetrics("fetch")
+        try:
+            for chapter_num, title_or_code in chapters:
+                with fetch.timed():
+                    self._fetch_chapter(chapter_num, title_or_code, parse, upload)
+        finally:
+            fetch.finish()
+            parse.close()
+            convert.close()
+            upload.close()
+            if self._convert_pool:
+                self._convert_pool.shutdown()
+                self._convert_pool = None
+            self._close_manifests()
+
+        stages = (fetch, parse.metrics, convert.metrics, upload.metrics)
+        self.metrics = {m.name: m for m in stages}
+        for m in self.metrics.values():
+            print(f"  [{self.state.upper()}] {m.summary()}")
 
         return self.stats
+
+
+def run_states(
+    states: list[str],
+    workers: int = 8,
+    dry_run: bool = False,
+    fetch_cache: FetchCache | None = None,
+    skip_unchanged: bool = False,
+    http_cache: HTTPCache | None = None,
+    host_limiter: HostRateLimiter | None = None,
+    manifest_path: Path | str = DEFAULT_MANIFEST_PATH,
+) -> dict[str, dict[str, int]]:
+    """Run the pipeline for several states concurrently.
+
+    States are independent and mostly wait on their legislature's site, so
+    they run in a thread pool. One HostRateLimiter and one pair of R2
+    clients are shared by all of them.
+
+    Args:
+        states: State codes to process
+        workers: Maximum states processed at once
+        dry_run: If True, don't upload anything
+        fetch_cache: Shared page cache (default: each state gets an in-memory one)
+        skip_unchanged: Skip uploads whose content already matches the R2 manifest
+        http_cache: Shared revalidation cache for the converters' requests
+        host_limiter: Shared adaptive per-host limiter for the converters'
+            requests (default: one built here)
+        manifest_path: SQLite manifest of R2 objects used by skip_unchanged
+
+    Returns:
+        Stats dict per state, in the order given
+    """
+    host_limiter = host_limiter or HostRateLimiter()
+    r2_arch = get_r2_atlas()
+    r2_rules = get_r2_rules_xml()
+
+    def run_one(state: str) -> dict[str, int]:
+        pipeline = StatePipeline(
+            state,
+            dry_run=dry_run,
+            r2_arch=r2_arch,
+            r2_rules=r2_rules,
+            fetch_cache=fetch_cache,
+            skip_unchanged=skip_unchanged,
+            http_cache=http_cache,
+            host_limiter=host_limiter,
+            manifest_path=manifest_path,
+        )
+        return pipeline.run()
+
+    results: dict[str, dict[str, int]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(run_one, state): state for state in states}
+        for future in as_completed(futures):
+            state = futures[future]
+            try:
+                results[state] = future.result()
+            except Exception as e:
+                print(f"ERROR: {state.upper()} failed: {e}")
+                results[state] = {
+                    "sections_found": 0,
+                    "raw_uploaded": 0,
+                    "akn_uploaded": 0,
+                    "skipped": 0,
+                    "errors": 1,
+                }
+    return {state: results[state] for state in states}
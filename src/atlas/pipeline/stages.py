@@ -0,0 +1,149 @@
+"""Worker stages connected by bounded queues.
+
+A Stage owns a queue and a few worker threads that feed each item to a
+handler. Handlers may put their results into the next stage. Because
+``Stage.put`` blocks while the queue is full, a slow downstream stage
+throttles everything upstream of it rather than letting work pile up.
+
+Example:
+    >>> upload = Stage("upload", r2_put, workers=8)
+    >>> convert = Stage("convert", lambda s: upload.put(to_xml(s)), workers=2)
+    >>> for section in sections:
+    ...     convert.put(section)
+    >>> convert.close()
+    >>> upload.close()
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+# Default bound on items waiting between stages
+STAGE_QUEUE_SIZE = 64
+
+_DONE = object()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one stage."""
+
+    name: str
+    workers: int = 1
+    items: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0  # Time producers spent blocked on a full queue
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds from start to close (or now)."""
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items handled per wall-clock second."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of worker time spent handling items."""
+        capacity = self.elapsed * self.workers
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+    @contextmanager
+    def timed(self) -> Iterator[None]:
+        """Count one item and the time spent on it (for work done outside a Stage)."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.busy_seconds += time.monotonic() - start
+            self.items += 1
+
+    def finish(self) -> None:
+        """Mark the stage as done, fixing its elapsed time."""
+        self.finished_at = time.monotonic()
+
+    def summary(self) -> str:
+        """One-line human-readable summary."""
+        return (
+            f"{self.name}: {self.items} items, {self.throughput:.1f}/s, "
+            f"{self.utilization:.0%} busy, {self.wait_seconds:.1f}s backpressure, "
+            f"{self.errors} errors"
+        )
+
+
+class Stage:
+    """A bounded queue drained by worker threads.
+
+    Args:
+        name: Stage name, used in metrics and thread names
+        handler: Called with each item; exceptions are counted, not raised
+        workers: Number of worker threads
+        maxsize: Items allowed to wait in the queue before ``put`` blocks
+        on_error: Called with (item, exception) when the handler fails
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], None],
+        workers: int = 1,
+        maxsize: int = STAGE_QUEUE_SIZE,
+        on_error: Callable[[Any, Exception], None] | None = None,
+    ):
+        self.name = name
+        self.handler = handler
+        self.on_error = on_error
+        self.metrics = StageMetrics(name, workers=workers)
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, item: Any) -> None:
+        """Queue an item, blocking while the stage is saturated."""
+        start = time.monotonic()
+        self._queue.put(item)
+        waited = time.monotonic() - start
+        if waited > 0.001:
+            with self._lock:
+                self.metrics.wait_seconds += waited
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            start = time.monotonic()
+            try:
+                self.handler(item)
+                failed = False
+            except Exception as e:
+                failed = True
+                if self.on_error:
+                    self.on_error(item, e)
+            with self._lock:
+                self.metrics.busy_seconds += time.monotonic() - start
+                self.metrics.items += 1
+                self.metrics.errors += failed
+
+    def close(self) -> StageMetrics:
+        """Finish queued items, stop the workers, and return the metrics."""
+        for _ in self._threads:
+            self._queue.put(_DONE)
+        for thread in self._threads:
+            thread.join()
+        self.metrics.finish()
+        return self.metrics
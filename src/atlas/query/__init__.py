@@ -1,5 +1,5 @@
 """Query modules for fetching statute data."""
 
-from atlas.query.supabase import SupabaseQuery
+from atlas.query.supabase import AsyncSupabaseQuery, SupabaseQuery
 
-__all__ = ["SupabaseQuery"]
+__all__ = ["AsyncSupabaseQuery", "SupabaseQuery"]
@@ -16,14 +16,34 @@ Usage:
 
     # Get section with children (subsections)
     section = query.get_section_with_children("26/32")
+
+    # Look up many sections at once
+    rules = query.get_many(["26/24", "26/32"])
+
+Inside asyncio code, AsyncSupabaseQuery has the same methods as coroutines.
 """
 
+import asyncio
+import importlib.util
 import os
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Optional
 
 import httpx
 
+# Rows per get_rule_subtree page (see supabase/migrations/*_rules_subtree.sql)
+SUBTREE_PAGE_SIZE = 5000
+# Source paths per in.(...) lookup, keeping request URLs a sensible length
+GET_MANY_CHUNK = 100
+# Connections kept open by the pooled client
+MAX_CONNECTIONS = 10
+# Jurisdictions counted by get_stats
+STATS_JURISDICTIONS = ("us", "uk", "canada")
+
+# HTTP/2 multiplexes concurrent requests when h2 is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 @dataclass
 class Rule:
@@ -76,19 +96,25 @@ class Section:
         return self.rule.source_path or self.rule.id
 
 
-class SupabaseQuery:
-    """Query the Supabase rules table."""
+class _SupabaseQueryBase:
+    """Configuration and request/response shaping shared by both clients.
+
+    Subclasses supply the transport (blocking or asyncio); everything about
+    which PostgREST requests to make and how to read them lives here.
+    """
 
     def __init__(
         self,
         url: Optional[str] = None,
         anon_key: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
     ):
         """Initialize the query client.
 
         Args:
             url: Supabase project URL. Defaults to COSILICO_SUPABASE_URL env var.
             anon_key: Supabase anon key. Defaults to SUPABASE_ANON_KEY env var.
+            max_connections: Size of the pooled client's connection pool
         """
         self.url = url or os.environ.get(
             "COSILICO_SUPABASE_URL",
@@ -105,23 +131,24 @@ class SupabaseQuery:
             "Authorization": f"Bearer {self.anon_key}",
             "Accept-Profile": "arch",  # Query arch schema
         }
+        self.max_connections = max_connections
+
+    def _client_kwargs(self) -> dict:
+        """Settings for the long-lived pooled client (keep-alive, HTTP/2)."""
+        return {
+            "http2": HTTP2_AVAILABLE,
+            "timeout": httpx.Timeout(30.0),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        }
 
-    def _request(
-        self,
-        table: str,
-        params: Optional[dict] = None,
-        single: bool = False,
-    ) -> dict | list[dict] | None:
-        """Make a request to the Supabase REST API."""
-        url = f"{self.rest_url}/{table}"
+    def _request_args(self, table: str, single: bool) -> tuple[str, dict]:
         headers = self.headers.copy()
         if single:
             headers["Accept"] = "application/vnd.pgrst.object+json"
-
-        with httpx.Client() as client:
-            response = client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        return f"{self.rest_url}/{table}", headers
 
     def _to_rule(self, data: dict) -> Rule:
         """Convert a dict to a Rule object."""
@@ -143,6 +170,212 @@ class SupabaseQuery:
             citation_path=data.get("citation_path"),
         )
 
+    @staticmethod
+    def _candidates(source_path: str, jurisdiction: str) -> list[str]:
+        """Stored paths a source path may match, exact spelling first."""
+        candidates = [source_path]
+        # US Code paths may be given without their "usc/" prefix
+        if jurisdiction == "us" and not source_path.startswith("usc/"):
+            candidates.append(f"usc/{source_path}")
+        return candidates
+
+    @staticmethod
+    def _in_params(paths: Sequence[str], jurisdiction: str) -> dict:
+        """Filter on any of several source paths with one ``in.(...)``.
+
+        Unlimited, since a path stored more than once would otherwise crowd
+        other paths out of a ``limit=len(paths)`` page; _resolve keeps one
+        row per path.
+        """
+        quoted = ",".join(f'"{path}"' for path in paths)
+        return {
+            "source_path": f"in.({quoted})",
+            "jurisdiction": f"eq.{jurisdiction}",
+        }
+
+    def _resolve(
+        self, source_paths: Sequence[str], jurisdiction: str, results: list[dict]
+    ) -> dict[str, Optional[Rule]]:
+        """Match looked-up rows back to the paths asked for."""
+        by_path: dict[str, dict] = {}
+        for row in results:
+            by_path.setdefault(row["source_path"], row)
+        resolved: dict[str, Optional[Rule]] = {}
+        for path in source_paths:
+            row = next(
+                (by_path[c] for c in self._candidates(path, jurisdiction) if c in by_path), None
+            )
+            resolved[path] = self._to_rule(row) if row else None
+        return resolved
+
+    def _lookup_chunks(self, source_paths: Sequence[str], jurisdiction: str) -> list[dict]:
+        """``in.(...)`` params covering every candidate path, GET_MANY_CHUNK at a time."""
+        candidates = [c for p in source_paths for c in self._candidates(p, jurisdiction)]
+        unique = list(dict.fromkeys(candidates))
+        return [
+            self._in_params(unique[i : i + GET_MANY_CHUNK], jurisdiction)
+            for i in range(0, len(unique), GET_MANY_CHUNK)
+        ]
+
+    @staticmethod
+    def _subtree_params(
+        source_path: str, jurisdiction: str, page_size: int, after: Optional[dict]
+    ) -> dict:
+        """RPC params for the page after row ``after`` (keyset on source_path, id)."""
+        params = {
+            "p_source_path": source_path,
+            "p_jurisdiction": jurisdiction,
+            "p_limit": str(page_size),
+        }
+        if after is not None:
+            params["p_after"] = after["source_path"]
+            params["p_after_id"] = str(after["id"])
+        return params
+
+    @staticmethod
+    def _rpc_missing(error: httpx.HTTPStatusError) -> bool:
+        """Whether PostgREST 404'd because get_rule_subtree isn't deployed."""
+        return error.response.status_code == 404
+
+    @staticmethod
+    def _descendants_params(rule: Rule, source_path: str, jurisdiction: str) -> dict:
+        """Prefix query for a section's descendants, for databases without the RPC."""
+        base_path = rule.source_path or source_path
+        return {
+            "source_path": f"like.{base_path}/*",
+            "jurisdiction": f"eq.{jurisdiction}",
+            "order": "source_path",
+            "limit": "1000",  # Reasonable limit for deep fetch
+        }
+
+    @staticmethod
+    def _children_params(rule: Rule) -> dict:
+        return {
+            "parent_id": f"eq.{rule.id}",
+            "order": "ordinal",
+        }
+
+    @staticmethod
+    def _deep_text(section: Section, source_path: str) -> str:
+        """Concatenate a section and its descendants, indented by depth."""
+        parts = []
+
+        # Add main section
+        if section.rule.heading:
+            parts.append(f"# {section.rule.source_path}: {section.rule.heading}")
+        if section.rule.body:
+            parts.append(section.rule.body)
+
+        # Add all descendants, preserving hierarchy via indentation
+        for child in section.children:
+            # Calculate depth from path
+            child_path = child.source_path or ""
+            base_path = section.rule.source_path or source_path
+            depth = child_path.replace(base_path, "").count("/")
+            indent = "  " * depth
+
+            if child.heading:
+                parts.append(f"\n{indent}## {child.source_path}: {child.heading}")
+            if child.body:
+                # Indent the body text
+                indented_body = "\n".join(f"{indent}{line}" for line in (child.body or "").split("\n"))
+                parts.append(indented_body)
+
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _search_params(query: str, jurisdiction: Optional[str], limit: int) -> dict:
+        params = {
+            "fts": f"wfts.{query}",  # websearch full-text search
+            "limit": str(limit),
+            "order": "jurisdiction,source_path",
+        }
+        if jurisdiction:
+            params["jurisdiction"] = f"eq.{jurisdiction}"
+        return params
+
+    def _count_args(self, jurisdiction: str) -> tuple[str, dict, dict]:
+        """HEAD request args whose content-range carries an exact row count."""
+        params = {
+            "jurisdiction": f"eq.{jurisdiction}",
+            "select": "id",
+            "limit": "1",
+        }
+        headers = {
+            **self.headers,
+            "Prefer": "count=exact",
+            "Accept-Profile": "arch",  # Query arch schema
+        }
+        return f"{self.rest_url}/rules", params, headers
+
+    @staticmethod
+    def _parse_count(response: httpx.Response) -> int:
+        content_range = response.headers.get("content-range", "")
+        # Parse "0-0/12345" to get 12345
+        if "/" in content_range:
+            return int(content_range.split("/")[1])
+        return 0
+
+
+class SupabaseQuery(_SupabaseQueryBase):
+    """Query the Supabase rules table.
+
+    Requests share one pooled keep-alive client (HTTP/2 when available), so
+    repeated lookups skip connection setup. Use as a context manager (or call
+    ``close``) to release the connections.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        anon_key: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        client: Optional[httpx.Client] = None,
+    ):
+        """Initialize the query client.
+
+        Args:
+            url: Supabase project URL. Defaults to COSILICO_SUPABASE_URL env var.
+            anon_key: Supabase anon key. Defaults to SUPABASE_ANON_KEY env var.
+            max_connections: Size of the pooled client's connection pool
+            client: HTTP client to query with (default: a pooled client
+                owned by this object)
+        """
+        super().__init__(url, anon_key, max_connections)
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Pooled client reused for every request."""
+        if self._client is None:
+            self._client = httpx.Client(**self._client_kwargs())
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled client if this object created it."""
+        if self._client is not None and self._owns_client:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "SupabaseQuery":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _request(
+        self,
+        table: str,
+        params: Optional[dict] = None,
+        single: bool = False,
+    ) -> dict | list[dict] | None:
+        """Make a request to the Supabase REST API."""
+        url, headers = self._request_args(table, single)
+        response = self.client.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
     def get_section(self, source_path: str, jurisdiction: str = "us") -> Optional[Rule]:
         """Get a section by its source path.
 
@@ -153,25 +386,72 @@ class SupabaseQuery:
         Returns:
             The Rule or None if not found
         """
-        # Try exact match first
-        params = {
-            "source_path": f"eq.{source_path}",
-            "jurisdiction": f"eq.{jurisdiction}",
-            "limit": "1",
-        }
+        # Look up the path with and without the "usc/" prefix in one request,
+        # preferring an exact match
+        return self.get_many([source_path], jurisdiction)[source_path]
 
-        results = self._request("rules", params)
-        if results and len(results) > 0:
-            return self._to_rule(results[0])
+    def get_many(
+        self,
+        source_paths: Sequence[str],
+        jurisdiction: str = "us",
+    ) -> dict[str, Optional[Rule]]:
+        """Get many sections with ``in.(...)`` filters instead of one request each.
 
-        # Try with "usc/" prefix for US Code
-        if jurisdiction == "us" and not source_path.startswith("usc/"):
-            params["source_path"] = f"eq.usc/{source_path}"
-            results = self._request("rules", params)
-            if results and len(results) > 0:
-                return self._to_rule(results[0])
+        Args:
+            source_paths: Source paths (US Code paths may omit "usc/")
+            jurisdiction: The jurisdiction
+
+        Returns:
+            Dict mapping each path as given to its Rule, or None if not found
+        """
+        results: list[dict] = []
+        for params in self._lookup_chunks(source_paths, jurisdiction):
+            results.extend(self._request("rules", params) or [])
+        return self._resolve(source_paths, jurisdiction, results)
+
+    def get_subtree(
+        self,
+        source_path: str,
+        jurisdiction: str = "us",
+        page_size: int = SUBTREE_PAGE_SIZE,
+    ) -> list[Rule]:
+        """Get a section and ALL its descendants, ordered by source path.
+
+        Calls the ``arch.get_rule_subtree`` RPC, which resolves the "usc/"
+        prefix and walks the source_path index server-side. Sections bigger
+        than one page are fetched page by page, so nothing is truncated.
+        Against a database without the RPC (it 404s), falls back to a
+        ``like.`` prefix query capped at 1000 descendants.
+
+        Args:
+            source_path: The source path (e.g., "26/32")
+            jurisdiction: The jurisdiction
+            page_size: Rows per RPC call
 
-        return None
+        Returns:
+            The section's rule followed by its descendants, or [] if not found
+        """
+        rules: list[Rule] = []
+        after: Optional[dict] = None
+        while True:
+            params = self._subtree_params(source_path, jurisdiction, page_size, after)
+            try:
+                page = self._request("rpc/get_rule_subtree", params) or []
+            except httpx.HTTPStatusError as e:
+                if rules or not self._rpc_missing(e):
+                    raise
+                return self._get_subtree_by_prefix(source_path, jurisdiction)
+            rules.extend(self._to_rule(r) for r in page)
+            if len(page) < page_size:
+                return rules
+            after = page[-1]
+
+    def _get_subtree_by_prefix(self, source_path: str, jurisdiction: str) -> list[Rule]:
+        rule = self.get_section(source_path, jurisdiction)
+        if not rule:
+            return []
+        params = self._descendants_params(rule, source_path, jurisdiction)
+        return [rule, *(self._to_rule(r) for r in self._request("rules", params) or [])]
 
     def get_section_with_children(
         self,
@@ -189,30 +469,21 @@ class SupabaseQuery:
         Returns:
             Section with rule and children, or None
         """
+        if deep:
+            # The section and ALL descendants come back from one RPC, e.g.
+            # "usc/26/32" with "usc/26/32/a", "usc/26/32/a/1", etc.
+            subtree = self.get_subtree(source_path, jurisdiction)
+            if not subtree:
+                return None
+            return Section(rule=subtree[0], children=subtree[1:])
+
         rule = self.get_section(source_path, jurisdiction)
         if not rule:
             return None
 
-        if deep:
-            # Fetch ALL descendants by source_path prefix
-            # e.g., "usc/26/32" gets "usc/26/32/a", "usc/26/32/a/1", etc.
-            base_path = rule.source_path or source_path
-            params = {
-                "source_path": f"like.{base_path}/*",
-                "jurisdiction": f"eq.{jurisdiction}",
-                "order": "source_path",
-                "limit": "1000",  # Reasonable limit for deep fetch
-            }
-            children_data = self._request("rules", params) or []
-            children = [self._to_rule(c) for c in children_data]
-        else:
-            # Fetch only direct children
-            params = {
-                "parent_id": f"eq.{rule.id}",
-                "order": "ordinal",
-            }
-            children_data = self._request("rules", params) or []
-            children = [self._to_rule(c) for c in children_data]
+        # Fetch only direct children
+        children_data = self._request("rules", self._children_params(rule)) or []
+        children = [self._to_rule(c) for c in children_data]
 
         return Section(rule=rule, children=children)
 
@@ -224,7 +495,8 @@ class SupabaseQuery:
         """Get a section with ALL descendants as concatenated text.
 
         This is optimized for encoder agents that need the full statute text
-        in a single response.
+        in a single response: the whole subtree comes from one indexed RPC
+        call (see get_subtree).
 
         Args:
             source_path: The source path (e.g., "usc/26/32")
@@ -236,31 +508,7 @@ class SupabaseQuery:
         section = self.get_section_with_children(source_path, jurisdiction, deep=True)
         if not section:
             return None
-
-        parts = []
-
-        # Add main section
-        if section.rule.heading:
-            parts.append(f"# {section.rule.source_path}: {section.rule.heading}")
-        if section.rule.body:
-            parts.append(section.rule.body)
-
-        # Add all descendants, preserving hierarchy via indentation
-        for child in section.children:
-            # Calculate depth from path
-            child_path = child.source_path or ""
-            base_path = section.rule.source_path or source_path
-            depth = child_path.replace(base_path, "").count("/")
-            indent = "  " * depth
-
-            if child.heading:
-                parts.append(f"\n{indent}## {child.source_path}: {child.heading}")
-            if child.body:
-                # Indent the body text
-                indented_body = "\n".join(f"{indent}{line}" for line in (child.body or "").split("\n"))
-                parts.append(indented_body)
-
-        return "\n\n".join(parts)
+        return self._deep_text(section, source_path)
 
     def search(
         self,
@@ -278,16 +526,7 @@ class SupabaseQuery:
         Returns:
             List of matching rules
         """
-        params = {
-            "fts": f"wfts.{query}",  # websearch full-text search
-            "limit": str(limit),
-            "order": "jurisdiction,source_path",
-        }
-
-        if jurisdiction:
-            params["jurisdiction"] = f"eq.{jurisdiction}"
-
-        results = self._request("rules", params) or []
+        results = self._request("rules", self._search_params(query, jurisdiction, limit)) or []
         return [self._to_rule(r) for r in results]
 
     def get_by_citation(
@@ -316,27 +555,189 @@ class SupabaseQuery:
             Dict with jurisdiction counts
         """
         stats = {}
-        for jur in ["us", "uk", "canada"]:
-            params = {
-                "jurisdiction": f"eq.{jur}",
-                "select": "id",
-                "limit": "1",
-            }
+        for jur in STATS_JURISDICTIONS:
             # Use HEAD request with Prefer: count=exact
-            url = f"{self.rest_url}/rules"
-            headers = {
-                **self.headers,
-                "Prefer": "count=exact",
-                "Accept-Profile": "arch",  # Query arch schema
-            }
-            with httpx.Client() as client:
-                response = client.head(url, params=params, headers=headers)
-                content_range = response.headers.get("content-range", "")
-                # Parse "0-0/12345" to get 12345
-                if "/" in content_range:
-                    stats[jur] = int(content_range.split("/")[1])
-                else:
-                    stats[jur] = 0
+            url, params, headers = self._count_args(jur)
+            response = self.client.head(url, params=params, headers=headers)
+            stats[jur] = self._parse_count(response)
 
         stats["total"] = sum(stats.values())
         return stats
+
+
+class AsyncSupabaseQuery(_SupabaseQueryBase):
+    """Asyncio version of SupabaseQuery with the same methods, as coroutines.
+
+    For agents that issue many lookups from inside an event loop: requests
+    share one pooled ``httpx.AsyncClient`` and never block the loop. Use as
+    an async context manager (or await ``aclose``).
+
+    Example:
+        async with AsyncSupabaseQuery() as query:
+            rules = await query.get_many(["26/24", "26/32"])
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        anon_key: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize the query client.
+
+        Args:
+            url: Supabase project URL. Defaults to COSILICO_SUPABASE_URL env var.
+            anon_key: Supabase anon key. Defaults to SUPABASE_ANON_KEY env var.
+            max_connections: Size of the pooled client's connection pool
+            client: Async HTTP client to query with (default: a pooled
+                client owned by this object)
+        """
+        super().__init__(url, anon_key, max_connections)
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled client reused for every request."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_kwargs())
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client if this object created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncSupabaseQuery":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        table: str,
+        params: Optional[dict] = None,
+        single: bool = False,
+    ) -> dict | list[dict] | None:
+        """Make a request to the Supabase REST API."""
+        url, headers = self._request_args(table, single)
+        response = await self.client.get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_section(self, source_path: str, jurisdiction: str = "us") -> Optional[Rule]:
+        """Get a section by its source path (see SupabaseQuery.get_section)."""
+        return (await self.get_many([source_path], jurisdiction))[source_path]
+
+    async def get_many(
+        self,
+        source_paths: Sequence[str],
+        jurisdiction: str = "us",
+    ) -> dict[str, Optional[Rule]]:
+        """Get many sections with ``in.(...)`` filters (see SupabaseQuery.get_many).
+
+        Chunks of a long path list are requested concurrently.
+        """
+        pages = await asyncio.gather(
+            *(
+                self._request("rules", params)
+                for params in self._lookup_chunks(source_paths, jurisdiction)
+            )
+        )
+        results = [row for page in pages for row in (page or [])]
+        return self._resolve(source_paths, jurisdiction, results)
+
+    async def get_subtree(
+        self,
+        source_path: str,
+        jurisdiction: str = "us",
+        page_size: int = SUBTREE_PAGE_SIZE,
+    ) -> list[Rule]:
+        """Get a section and ALL its descendants (see SupabaseQuery.get_subtree)."""
+        rules: list[Rule] = []
+        after: Optional[dict] = None
+        while True:
+            params = self._subtree_params(source_path, jurisdiction, page_size, after)
+            try:
+                page = await self._request("rpc/get_rule_subtree", params) or []
+            except httpx.HTTPStatusError as e:
+                if rules or not self._rpc_missing(e):
+                    raise
+                return await self._get_subtree_by_prefix(source_path, jurisdiction)
+            rules.extend(self._to_rule(r) for r in page)
+            if len(page) < page_size:
+                return rules
+            after = page[-1]
+
+    async def _get_subtree_by_prefix(self, source_path: str, jurisdiction: str) -> list[Rule]:
+        rule = await self.get_section(source_path, jurisdiction)
+        if not rule:
+            return []
+        params = self._descendants_params(rule, source_path, jurisdiction)
+        return [rule, *(self._to_rule(r) for r in await self._request("rules", params) or [])]
+
+    async def get_section_with_children(
+        self,
+        source_path: str,
+        jurisdiction: str = "us",
+        deep: bool = False,
+    ) -> Optional[Section]:
+        """Get a section with its children (see SupabaseQuery.get_section_with_children)."""
+        if deep:
+            subtree = await self.get_subtree(source_path, jurisdiction)
+            if not subtree:
+                return None
+            return Section(rule=subtree[0], children=subtree[1:])
+
+        rule = await self.get_section(source_path, jurisdiction)
+        if not rule:
+            return None
+
+        children_data = await self._request("rules", self._children_params(rule)) or []
+        return Section(rule=rule, children=[self._to_rule(c) for c in children_data])
+
+    async def get_section_deep(
+        self,
+        source_path: str,
+        jurisdiction: str = "us",
+    ) -> Optional[str]:
+        """Get a section with ALL descendants as concatenated text."""
+        section = await self.get_section_with_children(source_path, jurisdiction, deep=True)
+        if not section:
+            return None
+        return self._deep_text(section, source_path)
+
+    async def search(
+        self,
+        query: str,
+        jurisdiction: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[Rule]:
+        """Search for rules by text (see SupabaseQuery.search)."""
+        params = self._search_params(query, jurisdiction, limit)
+        results = await self._request("rules", params) or []
+        return [self._to_rule(r) for r in results]
+
+    async def get_by_citation(
+        self,
+        title: int,
+        section: str,
+        jurisdiction: str = "us",
+    ) -> Optional[Section]:
+        """Get a US Code section by title and section number."""
+        return await self.get_section_with_children(f"usc/{title}/{section}", jurisdiction)
+
+    async def get_stats(self) -> dict[str, int]:
+        """Get counts by jurisdiction, counting all jurisdictions concurrently."""
+
+        async def count(jur: str) -> int:
+            url, params, headers = self._count_args(jur)
+            return self._parse_count(await self.client.head(url, params=params, headers=headers))
+
+        counts = await asyncio.gather(*(count(jur) for jur in STATS_JURISDICTIONS))
+        stats = dict(zip(STATS_JURISDICTIONS, counts, strict=True))
+        stats["total"] = sum(counts)
+        return stats
@@ -0,0 +1,225 @@
+"""Per-host adaptive rate limiting shared by crawlers and converters.
+
+Each host gets a token bucket whose rate adapts AIMD-style: every successful
+response nudges the rate up by ``increase`` requests/second, and a 429 or
+5xx cuts it by ``decrease`` (honoring ``Retry-After``). Crawls therefore
+settle near what each legislature's site actually tolerates instead of a
+fixed global delay.
+
+Slots are reserved under a lock, so any number of threads or coroutines
+sharing one limiter are spaced correctly, and hosts never wait on each other.
+
+Example:
+    >>> limiter = HostRateLimiter(rate=2.0, max_rate=20.0)
+    >>> await limiter.acquire(url)          # async crawlers
+    >>> limiter.record(url, resp.status_code, resp.headers.get("retry-after"))
+    >>> client = httpx.Client(transport=limiter.transport())  # sync converters
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import httpx
+
+# Statuses that mean "slow down"
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Seconds after a cut before the rate may be cut again, so a burst of
+# in-flight requests failing together counts as one congestion signal
+DECREASE_COOLDOWN = 1.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+@dataclass
+class HostBucket:
+    """Token bucket state for one host."""
+
+    rate: float  # Requests per second currently allowed
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    last_decrease: float = 0.0
+    successes: int = 0
+    throttles: int = 0
+
+
+class HostRateLimiter:
+    """Token-bucket limiter per host with additive-increase/multiplicative-decrease.
+
+    Args:
+        rate: Starting requests/second per host
+        min_rate: Floor the rate never drops below
+        max_rate: Ceiling additive increases stop at
+        burst: Requests a host may receive back to back after idling
+        increase: Requests/second added per successful response
+        decrease: Factor the rate is multiplied by on a throttle response
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        min_rate: float = 0.1,
+        max_rate: float = 20.0,
+        burst: float = 1.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+    ):
+        self.initial_rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self._buckets: dict[str, HostBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        """Bucket key for a URL."""
+        return urlparse(url).netloc or url
+
+    def _bucket(self, host: str, now: float) -> HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = HostBucket(rate=self.initial_rate, tokens=self.burst, updated=now)
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, url: str) -> float:
+        """Take a slot for the URL's host and return the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(self.host(url), now)
+            # While blocked by Retry-After, slots are handed out from the block's end
+            start = max(now, bucket.blocked_until)
+            if start > bucket.updated:
+                refill = (start - bucket.updated) * bucket.rate
+                bucket.tokens = min(self.burst, bucket.tokens + refill)
+                bucket.updated = start
+            bucket.tokens -= 1
+            # Negative tokens are slots already promised to earlier callers
+            queued = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return start - now + queued
+
+    def wait(self, url: str) -> float:
+        """Block the calling thread until the host may be requested.
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire(self, url: str) -> float:
+        """Wait (without blocking the event loop) until the host may be requested.
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def record(self, url: str, status: int | None, retry_after: str | None = None) -> None:
+        """Adapt the host's rate to a response status (None for a failed request)."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(self.host(url), now)
+            if status is not None and status not in THROTTLE_STATUSES:
+                bucket.successes += 1
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+                return
+
+            bucket.throttles += 1
+            if now - bucket.last_decrease >= DECREASE_COOLDOWN:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                bucket.last_decrease = now
+            wait = parse_retry_after(retry_after)
+            if wait:
+                # At most one request when the block lifts, then the reduced
+                # rate; slots already promised (negative tokens) stay queued
+                bucket.blocked_until = max(bucket.blocked_until, now + wait)
+                bucket.updated = bucket.blocked_until
+                bucket.tokens = min(bucket.tokens, 1.0)
+            else:
+                # Drop any saved-up burst so the slower rate applies immediately
+                bucket.tokens = min(bucket.tokens, 0.0)
+
+    def rates(self) -> dict[str, float]:
+        """Current requests/second per host."""
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    def transport(self, inner: httpx.BaseTransport | None = None) -> "RateLimitedTransport":
+        """A sync transport that waits for a slot before each request."""
+        return RateLimitedTransport(self, inner or httpx.HTTPTransport())
+
+    def async_transport(
+        self, inner: httpx.AsyncBaseTransport | None = None
+    ) -> "AsyncRateLimitedTransport":
+        """An async transport that waits for a slot before each request."""
+        return AsyncRateLimitedTransport(self, inner or httpx.AsyncHTTPTransport())
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """Sync httpx transport spacing requests through a HostRateLimiter."""
+
+    def __init__(self, limiter: HostRateLimiter, inner: httpx.BaseTransport):
+        self.limiter = limiter
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.limiter.wait(url)
+        try:
+            response = self.inner.handle_request(request)
+        except httpx.TransportError:
+            self.limiter.record(url, None)
+            raise
+        self.limiter.record(url, response.status_code, response.headers.get("retry-after"))
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """Async httpx transport spacing requests through a HostRateLimiter."""
+
+    def __init__(self, limiter: HostRateLimiter, inner: httpx.AsyncBaseTransport):
+        self.limiter = limiter
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        await self.limiter.acquire(url)
+        try:
+            response = await self.inner.handle_async_request(request)
+        except httpx.TransportError:
+            self.limiter.record(url, None)
+            raise
+        self.limiter.record(url, response.status_code, response.headers.get("retry-after"))
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
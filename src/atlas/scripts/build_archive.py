@@ -100,16 +100,24 @@ def download_uscode(titles: list[int], output_dir: str = "data/uscode") -> None:
         run_arch_command(["download", str(title), "-o", output_dir])
 
 
-def ingest_uscode(titles: list[int], input_dir: str = "data/uscode") -> None:
-    """Ingest US Code titles into database."""
+def ingest_uscode(
+    titles: list[int], input_dir: str = "data/uscode", workers: int | None = None
+) -> None:
+    """Ingest US Code titles into database, parsing titles in parallel."""
     print(f"\n📥 Ingesting {len(titles)} US Code titles...")
+    xml_paths = []
     for title in titles:
         xml_path = Path(input_dir) / f"usc{title}.xml"
         if xml_path.exists():
-            print(f"\n  Ingesting Title {title}...")
-            run_arch_command(["ingest", str(xml_path)])
+            xml_paths.append(str(xml_path))
         else:
             print(f"  ⚠️  Title {title} not found at {xml_path}")
+    if not xml_paths:
+        return
+    args = ["ingest", *xml_paths]
+    if workers:
+        args.extend(["--workers", str(workers)])
+    run_arch_command(args)
 
 
 def fetch_guidance(years: list[int], download_pdfs: bool = True) -> None:
@@ -190,6 +198,8 @@ def main():
                         help="Upload to R2 after building")
     parser.add_argument("--no-ingest", action="store_true",
                         help="Skip database ingestion")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="Parallel parser processes for ingestion (default: CPU count)")
 
     args = parser.parse_args()
 
@@ -209,7 +219,7 @@ def main():
     if titles:
         download_uscode(titles)
         if not args.no_ingest:
-            ingest_uscode(titles)
+            ingest_uscode(titles, workers=args.workers)
 
     if do_guidance:
         fetch_guidance(years)
@@ -11,7 +11,9 @@ from datetime import datetime
 
 import httpx
 
+from atlas.http_cache import HTTPCache
 from atlas.models_statute import Statute, StatuteSubsection
+from atlas.rate_limit import HostRateLimiter
 from atlas.sources.base import SourceConfig, StatuteSource
 
 
@@ -25,8 +27,13 @@ class APISource(StatuteSource):
     - Response parsing
     """
 
-    def __init__(self, config: SourceConfig):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: SourceConfig,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+    ):
+        super().__init__(config, http_cache=http_cache, host_limiter=host_limiter)
 
     def _api_get(self, endpoint: str, params: dict | None = None) -> dict:
         """Make authenticated API request."""
@@ -77,7 +84,12 @@ class NYLegislationSource(APISource):
         "WKC": "Workers' Compensation Law",
     }
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+    ):
         config = SourceConfig(
             jurisdiction="us-ny",
             name="New York",
@@ -87,7 +99,7 @@ class NYLegislationSource(APISource):
             codes=self.NY_CODES,
             rate_limit=0.5,
         )
-        super().__init__(config)
+        super().__init__(config, http_cache=http_cache, host_limiter=host_limiter)
 
     def get_section(self, code: str, section: str, **kwargs) -> Statute | None:
         """Fetch a section from NY Open Legislation API."""
@@ -176,7 +188,12 @@ class LegiScanSource(APISource):
     Note: Requires API key (free registration)
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+    ):
         config = SourceConfig(
             jurisdiction="",  # Set per-state
             name="LegiScan",
@@ -185,7 +202,7 @@ class LegiScanSource(APISource):
             api_key=api_key,
             rate_limit=1.0,  # LegiScan has strict rate limits
         )
-        super().__init__(config)
+        super().__init__(config, http_cache=http_cache, host_limiter=host_limiter)
 
     def get_section(self, code: str, section: str, **kwargs) -> Statute | None:
         """LegiScan is for bills, not codified statutes."""
@@ -21,7 +21,9 @@ from typing import Any, Callable
 
 import httpx
 
+from atlas.http_cache import HTTPCache
 from atlas.models_statute import Statute, StatuteSubsection
+from atlas.rate_limit import HostRateLimiter
 
 
 @dataclass
@@ -53,7 +55,7 @@ class SourceConfig:
     codes: dict[str, str] = field(default_factory=dict)  # code_id -> code_name
 
     # Rate limiting
-    rate_limit: float = 0.5  # seconds between requests
+    rate_limit: float = 0.5  # starting seconds between requests (adapts to 429/5xx)
     max_retries: int = 3
 
     # Custom parsing
@@ -67,18 +69,42 @@ class StatuteSource(ABC):
     - USLMSource: Parses USLM XML (federal)
     - APISource: Calls JSON APIs (NY, LegiScan)
     - HTMLSource: Scrapes HTML (most states)
+
+    Args:
+        config: Source configuration
+        http_cache: Revalidate previously fetched pages (ETag/Last-Modified)
+            instead of re-downloading them
+        host_limiter: Adaptive per-host limiter for every request, shared
+            when several sources or crawls hit the same sites (default: a
+            private one starting at ``config.rate_limit`` spacing)
     """
 
-    def __init__(self, config: SourceConfig):
+    def __init__(
+        self,
+        config: SourceConfig,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+    ):
         self.config = config
         self._client: httpx.Client | None = None
-        self._last_request = 0.0
+        self.http_cache = http_cache
+        if host_limiter is None and config.rate_limit > 0:
+            host_limiter = HostRateLimiter(rate=1 / config.rate_limit)
+        self.host_limiter = host_limiter
 
     @property
     def client(self) -> httpx.Client:
-        """Lazy-initialize HTTP client."""
+        """Lazy-initialize HTTP client.
+
+        Requests pass through the revalidation cache (if any), then the host
+        limiter, so revalidations are rate limited too.
+        """
         if self._client is None:
+            transport = self.host_limiter.transport() if self.host_limiter else None
+            if self.http_cache:
+                transport = self.http_cache.transport(transport)
             self._client = httpx.Client(
+                transport=transport,
                 timeout=30,
                 follow_redirects=True,
                 headers={
@@ -96,18 +122,8 @@ class StatuteSource(ABC):
     def __del__(self):
         self.close()
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        import time
-
-        elapsed = time.time() - self._last_request
-        if elapsed < self.config.rate_limit:
-            time.sleep(self.config.rate_limit - elapsed)
-        self._last_request = time.time()
-
     def _get(self, url: str, **kwargs) -> httpx.Response:
-        """Make a rate-limited GET request."""
-        self._rate_limit()
+        """Make a rate-limited GET request (spaced by the client's transport)."""
         return self.client.get(url, **kwargs)
 
     @abstractmethod
@@ -214,11 +230,17 @@ class StatuteSource(ABC):
         )
 
 
-def load_source(jurisdiction: str) -> StatuteSource:
+def load_source(
+    jurisdiction: str,
+    http_cache: HTTPCache | None = None,
+    host_limiter: HostRateLimiter | None = None,
+) -> StatuteSource:
     """Load source adapter for a jurisdiction.
 
     Args:
         jurisdiction: Jurisdiction ID (e.g., "us", "us-ca")
+        http_cache: Revalidation cache shared by the source's requests
+        host_limiter: Adaptive per-host limiter shared by the source's requests
 
     Returns:
         StatuteSource instance
@@ -228,7 +250,9 @@ def load_source(jurisdiction: str) -> StatuteSource:
     """
     from atlas.sources.registry import get_source_for_jurisdiction
 
-    source = get_source_for_jurisdiction(jurisdiction)
+    source = get_source_for_jurisdiction(
+        jurisdiction, http_cache=http_cache, host_limiter=host_limiter
+    )
     if not source:
         raise ValueError(f"No source configured for jurisdiction: {jurisdiction}")
     return source
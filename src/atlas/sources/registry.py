@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 import yaml
 
+from atlas.http_cache import HTTPCache
+from atlas.rate_limit import HostRateLimiter
 from atlas.sources.base import SourceConfig, StatuteSource
 
 if TYPE_CHECKING:
@@ -4219,11 +4221,17 @@ def get_config_for_jurisdiction(jurisdiction: str) -> SourceConfig | None:
     return configs.get(jurisdiction.lower())
 
 
-def get_source_for_jurisdiction(jurisdiction: str) -> StatuteSource | None:
+def get_source_for_jurisdiction(
+    jurisdiction: str,
+    http_cache: HTTPCache | None = None,
+    host_limiter: HostRateLimiter | None = None,
+) -> StatuteSource | None:
     """Get a source adapter instance for a jurisdiction.
 
     Args:
         jurisdiction: Jurisdiction ID (e.g., "us", "us-ca")
+        http_cache: Revalidation cache shared by the source's requests
+        host_limiter: Adaptive per-host limiter shared by the source's requests
 
     Returns:
         StatuteSource instance or None if not configured
@@ -4236,19 +4244,21 @@ def get_source_for_jurisdiction(jurisdiction: str) -> StatuteSource | None:
     if config.source_type == "uslm":
         from atlas.sources.uslm import USLMSource
 
-        return USLMSource(config)
+        return USLMSource(config, http_cache=http_cache, host_limiter=host_limiter)
     elif config.source_type == "api":
         from atlas.sources.api import APISource
 
         if jurisdiction == "us-ny":
             from atlas.sources.api import NYLegislationSource
 
-            return NYLegislationSource(config.api_key)
-        return APISource(config)
+            return NYLegislationSource(
+                config.api_key, http_cache=http_cache, host_limiter=host_limiter
+            )
+        return APISource(config, http_cache=http_cache, host_limiter=host_limiter)
     else:
         from atlas.sources.html import HTMLSource
 
-        return HTMLSource(config)
+        return HTMLSource(config, http_cache=http_cache, host_limiter=host_limiter)
 
 
 def list_supported_jurisdictions() -> list[dict]:
@@ -9,7 +9,9 @@ from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
+from atlas.http_cache import HTTPCache
 from atlas.models_statute import Statute, StatuteSubsection
+from atlas.rate_limit import HostRateLimiter
 from atlas.sources.base import SourceConfig, StatuteSource
 
 
@@ -89,8 +91,15 @@ class USLMSource(StatuteSource):
     the existing USLM parser, then converts to unified Statute model.
     """
 
-    def __init__(self, config: SourceConfig | None = None):
-        super().__init__(config or get_federal_config())
+    def __init__(
+        self,
+        config: SourceConfig | None = None,
+        http_cache: HTTPCache | None = None,
+        host_limiter: HostRateLimiter | None = None,
+    ):
+        super().__init__(
+            config or get_federal_config(), http_cache=http_cache, host_limiter=host_limiter
+        )
         self._parser = None
 
     @property
@@ -1,9 +1,11 @@
 """Abstract base class for storage backends."""
 
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date
 
-from atlas.models import SearchResult, Section, TitleInfo
+from atlas.models import SearchResult, Section, Subsection, SubsectionTree, TitleInfo
 
 
 class StorageBackend(ABC):
@@ -14,6 +16,18 @@ class StorageBackend(ABC):
         """Store a section in the database."""
         pass
 
+    def store_sections(self, sections: Iterable[Section], batch_size: int = 500) -> int:
+        """Store many sections, returning how many were stored.
+
+        Backends with a bulk write path should override this; the default
+        stores one section at a time.
+        """
+        count = 0
+        for section in sections:
+            self.store_section(section)
+            count += 1
+        return count
+
     @abstractmethod
     def get_section(
         self,
@@ -21,10 +35,80 @@ class StorageBackend(ABC):
         section: str,
         subsection: str | None = None,
         as_of: date | None = None,
+        text_only: bool = False,
     ) -> Section | None:
-        """Retrieve a section by citation."""
+        """Retrieve a section by citation.
+
+        Backends may skip loading subsections and public laws when
+        ``text_only`` is set.
+        """
         pass
 
+    def get_sections(
+        self,
+        keys: Sequence[tuple[int, str]],
+        text_only: bool = False,
+    ) -> dict[tuple[int, str], Section]:
+        """Retrieve many sections by (title, section), omitting those not found.
+
+        Backends that can fetch several rows in one query should override
+        this; the default looks sections up one at a time.
+        """
+        found = {}
+        for title, section in dict.fromkeys(keys):
+            result = self.get_section(title, section, text_only=text_only)
+            if result is not None:
+                found[(title, section)] = result
+        return found
+
+    @abstractmethod
+    def iter_sections(self, title: int, text_only: bool = False) -> Iterator[Section]:
+        """Stream every section of a title in section order, for bulk export.
+
+        Section order is numeric on the leading digits (2, 10, 32, 32A), with
+        sections that have no number last.
+        """
+        pass
+
+    def get_section_with_tree(
+        self,
+        title: int,
+        section: str,
+        as_of: date | None = None,
+    ) -> tuple[Section, SubsectionTree] | None:
+        """Get a section and its subsection tree from a single read.
+
+        The default loads the full section and re-serializes its subsections;
+        backends that store the tree as JSON should read both from one row.
+        """
+        result = self.get_section(title, section, as_of=as_of)
+        if result is None:
+            return None
+        return result, SubsectionTree(json.dumps([s.model_dump() for s in result.subsections]))
+
+    def get_subsection_tree(self, title: int, section: str) -> SubsectionTree | None:
+        """Get a section's subsection hierarchy as a lazily decoded tree.
+
+        The default re-serializes the loaded section; backends that store the
+        tree as JSON should return it directly.
+        """
+        result = self.get_section(title, section)
+        if result is None:
+            return None
+        return SubsectionTree(json.dumps([s.model_dump() for s in result.subsections]))
+
+    def get_subsection(self, title: int, section: str, path: str) -> Subsection | None:
+        """Get one subsection by slash-separated path (e.g., 'b/1/A')."""
+        result = self.get_section(title, section)
+        return result.get_subsection(path) if result else None
+
+    def get_generation(self) -> int:
+        """Counter that changes whenever stored data changes, for cache invalidation.
+
+        Backends that cannot track writes return a constant.
+        """
+        return 0
+
     @abstractmethod
     def search(
         self,
@@ -6,6 +6,7 @@ sections with full-text search using pg_trgm and GIN indexes.
 
 import json
 import os
+from collections.abc import Iterator, Sequence
 from datetime import date
 
 from atlas.models import Citation, SearchResult, Section, Subsection, TitleInfo
@@ -23,6 +24,22 @@ except ImportError:
 
 Base = declarative_base() if POSTGRES_AVAILABLE else None
 
+# Weighted document for sections.search_vector: title (A) ranks above body (B)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', COALESCE(section_title, '')), 'A') || "
+    "setweight(to_tsvector('english', COALESCE(text, '')), 'B')"
+)
+
+# Which row wins when a (title, section) is stored under several doc_types:
+# the statute, then the first doc_type alphabetically
+DOC_TYPE_ORDER_SQL = "doc_type = 'statute' DESC, doc_type"
+
+# What search matches on in tables created before search_vector existed
+# (the expression behind idx_sections_text_search)
+LEGACY_SEARCH_VECTOR_SQL = (
+    "to_tsvector('english', COALESCE(section_title, '') || ' ' || COALESCE(text, ''))"
+)
+
 
 def get_engine(database_url: str | None = None):
     """Create SQLAlchemy engine from URL or environment."""
@@ -67,7 +84,7 @@ class PostgresStorage(StorageBackend):
 
             # Main sections table
             conn.execute(
-                text("""
+                text(f"""
                 CREATE TABLE IF NOT EXISTS sections (
                     id TEXT PRIMARY KEY,
                     title INTEGER NOT NULL,
@@ -86,6 +103,7 @@ class PostgresStorage(StorageBackend):
                     referenced_by JSONB,
                     source_url TEXT,
                     retrieved_at DATE,
+                    search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED,
 
                     UNIQUE(title, section, jurisdiction, doc_type)
                 )
@@ -112,15 +130,33 @@ class PostgresStorage(StorageBackend):
             """)
             )
 
-            # GIN index for full-text search on section_title and text
-            conn.execute(
-                text("""
-                CREATE INDEX IF NOT EXISTS idx_sections_text_search
-                ON sections USING GIN (
-                    (to_tsvector('english', COALESCE(section_title, '') || ' ' || COALESCE(text, '')))
-                )
-            """)
+            # Tables created before the stored search_vector (title weighted
+            # A, body B) keep their expression index until
+            # migrate_search_vector() is run; adding the column here would
+            # rewrite the table on startup
+            self.has_search_vector = bool(
+                conn.execute(
+                    text("""
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_schema = current_schema()
+                      AND table_name = 'sections' AND column_name = 'search_vector'
+                """)
+                ).scalar()
             )
+            if self.has_search_vector:
+                conn.execute(
+                    text("""
+                    CREATE INDEX IF NOT EXISTS idx_sections_search_vector
+                    ON sections USING GIN (search_vector)
+                """)
+                )
+            else:
+                conn.execute(
+                    text(f"""
+                    CREATE INDEX IF NOT EXISTS idx_sections_text_search
+                    ON sections USING GIN (({LEGACY_SEARCH_VECTOR_SQL}))
+                """)
+                )
 
             # Trigram index for fuzzy matching
             conn.execute(
@@ -165,6 +201,33 @@ class PostgresStorage(StorageBackend):
 
             conn.commit()
 
+    def migrate_search_vector(self) -> None:
+        """Add the stored, weighted search_vector to a table created without it.
+
+        ``ADD COLUMN ... GENERATED ... STORED`` rewrites every row of
+        ``sections`` under an ACCESS EXCLUSIVE lock, blocking reads and
+        writes for the duration (minutes on a full corpus), so run it in a
+        maintenance window rather than from application startup. Afterwards
+        search ranks title matches above body matches and the old
+        expression index is dropped. A no-op on tables that already have it.
+        """
+        with self.engine.connect() as conn:
+            conn.execute(
+                text(f"""
+                ALTER TABLE sections ADD COLUMN IF NOT EXISTS search_vector tsvector
+                GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED
+            """)
+            )
+            conn.execute(
+                text("""
+                CREATE INDEX IF NOT EXISTS idx_sections_search_vector
+                ON sections USING GIN (search_vector)
+            """)
+            )
+            conn.execute(text("DROP INDEX IF EXISTS idx_sections_text_search"))
+            conn.commit()
+        self.has_search_vector = True
+
     def store_section(
         self, section: Section, jurisdiction: str = "federal", doc_type: str = "statute"
     ) -> None:
@@ -275,13 +338,18 @@ class PostgresStorage(StorageBackend):
         subsection: str | None = None,
         as_of: date | None = None,
         jurisdiction: str = "federal",
+        text_only: bool = False,
     ) -> Section | None:
-        """Retrieve a section by citation."""
+        """Retrieve a section by citation.
+
+        With ``text_only`` the subsection tree and public laws are not decoded.
+        """
         with self.Session() as session:
             result = session.execute(
-                text("""
+                text(f"""
                 SELECT * FROM sections
                 WHERE title = :title AND section = :section AND jurisdiction = :jurisdiction
+                ORDER BY {DOC_TYPE_ORDER_SQL}
                 LIMIT 1
             """),
                 {"title": title, "section": section, "jurisdiction": jurisdiction},
@@ -290,14 +358,70 @@ class PostgresStorage(StorageBackend):
             if not result:
                 return None
 
-            return self._row_to_section(result._mapping)
+            return self._row_to_section(result._mapping, text_only=text_only)
 
-    def _row_to_section(self, row: dict) -> Section:
+    def get_sections(
+        self,
+        keys: Sequence[tuple[int, str]],
+        text_only: bool = False,
+        jurisdiction: str = "federal",
+    ) -> dict[tuple[int, str], Section]:
+        """Retrieve many sections in a single query, omitting those not found.
+
+        Picks the same row per (title, section) as get_section.
+        """
+        unique = list(dict.fromkeys((int(t), str(s)) for t, s in keys))
+        if not unique:
+            return {}
+
+        params: dict[str, object] = {"jurisdiction": jurisdiction}
+        pairs = []
+        for i, (title, section) in enumerate(unique):
+            params[f"t{i}"] = title
+            params[f"s{i}"] = section
+            pairs.append(f"(:t{i}, :s{i})")
+
+        with self.Session() as session:
+            results = session.execute(
+                text(f"""
+                SELECT DISTINCT ON (title, section) * FROM sections
+                WHERE jurisdiction = :jurisdiction
+                  AND (title, section) IN ({", ".join(pairs)})
+                ORDER BY title, section, {DOC_TYPE_ORDER_SQL}
+            """),
+                params,
+            ).fetchall()
+
+            return {
+                (row.title, row.section): self._row_to_section(row._mapping, text_only=text_only)
+                for row in results
+            }
+
+    def iter_sections(
+        self,
+        title: int,
+        text_only: bool = False,
+        jurisdiction: str = "federal",
+    ) -> Iterator[Section]:
+        """Stream a title's sections in section order through a server-side cursor."""
+        with self.Session() as session:
+            results = session.execute(
+                text("""
+                SELECT * FROM sections
+                WHERE title = :title AND jurisdiction = :jurisdiction
+                ORDER BY substring(section from '^[0-9]+')::int NULLS LAST, section
+            """),
+                {"title": title, "jurisdiction": jurisdiction},
+                execution_options={"stream_results": True, "yield_per": 200},
+            )
+            for row in results:
+                yield self._row_to_section(row._mapping, text_only=text_only)
+
+    def _row_to_section(self, row: dict, text_only: bool = False) -> Section:
         """Convert a database row to a Section model."""
-        subsections = [
-            self._dict_to_subsection(d)
-            for d in (json.loads(row["subsections"]) if row["subsections"] else [])
-        ]
+        subsections = []
+        if row["subsections"] and not text_only:
+            subsections = [self._dict_to_subsection(d) for d in json.loads(row["subsections"])]
 
         return Section(
             citation=Citation(title=row["title"], section=row["section"]),
@@ -307,7 +431,9 @@ class PostgresStorage(StorageBackend):
             subsections=subsections,
             enacted_date=row["enacted_date"],
             last_amended=row["last_amended"],
-            public_laws=json.loads(row["public_laws"]) if row["public_laws"] else [],
+            public_laws=(
+                json.loads(row["public_laws"]) if row["public_laws"] and not text_only else []
+            ),
             effective_date=row["effective_date"],
             references_to=json.loads(row["references_to"]) if row["references_to"] else [],
             referenced_by=json.loads(row["referenced_by"]) if row["referenced_by"] else [],
@@ -341,24 +467,28 @@ class PostgresStorage(StorageBackend):
                 params["doc_type"] = doc_type
 
             where_clause = " AND ".join(conditions)
+            vector = "search_vector" if self.has_search_vector else LEGACY_SEARCH_VECTOR_SQL
 
-            # Use ts_rank for relevance scoring
+            # Rank from the stored, GIN-indexed search_vector, then build
+            # headlines (which re-parse the full text) for the top rows only
             results = session.execute(
                 text(f"""
                 SELECT
-                    title, section, section_title,
-                    ts_headline('english', text, plainto_tsquery('english', :query),
+                    top.title, top.section, top.section_title,
+                    ts_headline('english', top.text, plainto_tsquery('english', :query),
                         'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15') as snippet,
-                    ts_rank(
-                        to_tsvector('english', COALESCE(section_title, '') || ' ' || COALESCE(text, '')),
-                        plainto_tsquery('english', :query)
-                    ) as score
-                FROM sections
-                WHERE {where_clause}
-                    AND to_tsvector('english', COALESCE(section_title, '') || ' ' || COALESCE(text, ''))
-                        @@ plainto_tsquery('english', :query)
-                ORDER BY score DESC
-                LIMIT :limit
+                    top.score
+                FROM (
+                    SELECT
+                        title, section, section_title, text,
+                        ts_rank({vector}, plainto_tsquery('english', :query)) as score
+                    FROM sections
+                    WHERE {where_clause}
+                        AND {vector} @@ plainto_tsquery('english', :query)
+                    ORDER BY score DESC
+                    LIMIT :limit
+                ) AS top
+                ORDER BY top.score DESC
             """),
                 params,
             ).fetchall()
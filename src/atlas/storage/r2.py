@@ -12,13 +12,43 @@ Structure in R2:
 
 import json
 import hashlib
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from atlas.storage.r2_manifest import R2Manifest
+
+# HTTP connections kept open per client, and the default upload_many concurrency
+MAX_POOL_CONNECTIONS = 32
+
+# Keys per list_objects_v2 page (the S3/R2 maximum)
+LIST_PAGE_SIZE = 1000
+
+
+@dataclass
+class UploadSummary:
+    """Outcome of an upload_many call."""
+
+    uploaded: int = 0
+    skipped: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)  # (key, error)
+
+
+def content_md5(content: bytes | str) -> str:
+    """MD5 hex digest, which is the ETag R2 gives a single-part upload."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()
+
 
 class R2Storage:
     """Cloudflare R2 storage for raw document archiving.
@@ -35,6 +65,7 @@ class R2Storage:
         access_key_id: str,
         secret_access_key: str,
         bucket: str = "atlas",
+        max_pool_connections: int = MAX_POOL_CONNECTIONS,
     ):
         """Initialize R2 storage.
 
@@ -43,6 +74,8 @@ class R2Storage:
             access_key_id: R2 access key
             secret_access_key: R2 secret key
             bucket: Bucket name (default: arch)
+            max_pool_connections: HTTP connections the client keeps open, so
+                concurrent uploads reuse them rather than reconnecting
         """
         self.bucket = bucket
         self.client = boto3.client(
@@ -50,6 +83,7 @@ class R2Storage:
             endpoint_url=endpoint_url,
             aws_access_key_id=access_key_id,
             aws_secret_access_key=secret_access_key,
+            config=Config(max_pool_connections=max_pool_connections),
         )
 
     @classmethod
@@ -75,24 +109,14 @@ class R2Storage:
             bucket=creds.get("bucket", "arch"),
         )
 
-    def upload_raw(
+    def _put_args(
         self,
         key: str,
         content: bytes | str,
         content_type: str | None = None,
         metadata: dict[str, str] | None = None,
-    ) -> str:
-        """Upload raw content to R2.
-
-        Args:
-            key: Object key (path in bucket)
-            content: Raw content bytes or string
-            content_type: MIME type (auto-detected if not provided)
-            metadata: Optional metadata dict
-
-        Returns:
-            The object key
-        """
+    ) -> dict[str, Any]:
+        """Build put_object arguments, detecting content type and adding metadata."""
         if isinstance(content, str):
             content = content.encode('utf-8')
 
@@ -117,16 +141,94 @@ class R2Storage:
         if metadata:
             upload_metadata.update(metadata)
 
-        self.client.put_object(
-            Bucket=self.bucket,
-            Key=key,
-            Body=content,
-            ContentType=content_type,
-            Metadata=upload_metadata,
-        )
+        return {
+            'Bucket': self.bucket,
+            'Key': key,
+            'Body': content,
+            'ContentType': content_type,
+            'Metadata': upload_metadata,
+        }
+
+    def upload_raw(
+        self,
+        key: str,
+        content: bytes | str,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> str:
+        """Upload raw content to R2.
+
+        Args:
+            key: Object key (path in bucket)
+            content: Raw content bytes or string
+            content_type: MIME type (auto-detected if not provided)
+            metadata: Optional metadata dict
 
+        Returns:
+            The object key
+        """
+        self.client.put_object(**self._put_args(key, content, content_type, metadata))
         return key
 
+    def upload_many(
+        self,
+        uploads: Iterable[tuple[str, bytes | str] | tuple[str, bytes | str, dict[str, str]]],
+        workers: int = MAX_POOL_CONNECTIONS,
+        manifest: R2Manifest | None = None,
+    ) -> UploadSummary:
+        """Upload many objects concurrently over the client's connection pool.
+
+        Args:
+            uploads: (key, content) or (key, content, metadata) tuples,
+                consumed lazily
+            workers: Concurrent uploads (keep within max_pool_connections)
+            manifest: Persisted listing of this bucket; objects whose content
+                MD5 matches the recorded ETag are skipped, and each upload is
+                recorded so the next run skips it without re-listing
+
+        Returns:
+            UploadSummary with counts of uploaded and skipped objects, and
+            any failures (which do not stop the rest)
+        """
+        summary = UploadSummary()
+        lock = threading.Lock()
+
+        def upload_one(item: tuple) -> None:
+            key, content = item[0], item[1]
+            metadata = item[2] if len(item) > 2 else None
+            if isinstance(content, str):
+                content = content.encode('utf-8')
+            digest = content_md5(content)
+            try:
+                known = manifest.get(key) if manifest else None
+                if known and known['etag'] == digest:
+                    uploaded = False
+                else:
+                    self.upload_raw(key, content, metadata=metadata)
+                    if manifest:
+                        manifest.record(key, digest, len(content))
+                    uploaded = True
+            except Exception as e:
+                with lock:
+                    summary.failed.append((key, str(e)))
+                return
+            with lock:
+                if uploaded:
+                    summary.uploaded += 1
+                else:
+                    summary.skipped += 1
+
+        # Keep a bounded number of uploads in flight so huge iterables stream
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            pending: set = set()
+            for item in uploads:
+                if len(pending) >= workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.add(pool.submit(upload_one, item))
+            wait(pending)
+
+        return summary
+
     def upload_state_statute(
         self,
         state: str,
@@ -245,22 +347,79 @@ class R2Storage:
         response = self.client.get_object(Bucket=self.bucket, Key=key)
         return response['Body'].read()
 
-    def list_prefix(self, prefix: str, max_keys: int = 1000) -> list[dict[str, Any]]:
+    def iter_prefix(
+        self, prefix: str, page_size: int = LIST_PAGE_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every object under a prefix, following continuation tokens.
+
+        Args:
+            prefix: Key prefix to filter by
+            page_size: Keys requested per list_objects_v2 call
+
+        Yields:
+            Object info dicts (Key, Size, ETag, LastModified, ...)
+        """
+        kwargs = {'Bucket': self.bucket, 'Prefix': prefix, 'MaxKeys': page_size}
+        while True:
+            response = self.client.list_objects_v2(**kwargs)
+            yield from response.get('Contents', [])
+            token = response.get('NextContinuationToken')
+            if not response.get('IsTruncated') or not token:
+                return
+            kwargs['ContinuationToken'] = token
+
+    def list_prefix(self, prefix: str, max_keys: int | None = None) -> list[dict[str, Any]]:
         """List objects with a given prefix.
 
         Args:
             prefix: Key prefix to filter by
-            max_keys: Maximum objects to return
+            max_keys: Maximum objects to return (None: all of them)
 
         Returns:
             List of object info dicts
         """
-        response = self.client.list_objects_v2(
-            Bucket=self.bucket,
-            Prefix=prefix,
-            MaxKeys=max_keys,
-        )
-        return response.get('Contents', [])
+        page_size = min(max_keys or LIST_PAGE_SIZE, LIST_PAGE_SIZE)
+        objects = self.iter_prefix(prefix, page_size=page_size)
+        if max_keys is None:
+            return list(objects)
+        return list(islice(objects, max_keys))
+
+    def list_shards(self, prefix: str) -> tuple[list[str], list[dict[str, Any]]]:
+        """Split a prefix into its immediate "subdirectories".
+
+        Returns:
+            (sub-prefixes, objects stored directly under the prefix)
+        """
+        kwargs = {'Bucket': self.bucket, 'Prefix': prefix, 'Delimiter': '/'}
+        shards: list[str] = []
+        objects: list[dict[str, Any]] = []
+        while True:
+            response = self.client.list_objects_v2(**kwargs)
+            shards.extend(p['Prefix'] for p in response.get('CommonPrefixes', []))
+            objects.extend(response.get('Contents', []))
+            token = response.get('NextContinuationToken')
+            if not response.get('IsTruncated') or not token:
+                return shards, objects
+            kwargs['ContinuationToken'] = token
+
+    def iter_prefix_sharded(self, prefix: str, workers: int = 8) -> Iterator[dict[str, Any]]:
+        """Yield every object under a prefix, listing its sub-prefixes in parallel.
+
+        Listing is sequential within a prefix (each page needs the previous
+        page's token), so a large tree such as ``us/statutes/states/`` is
+        split on ``/`` and each shard is paged through by its own thread.
+        Each shard's listing is collected in full, then yielded as soon as
+        that shard finishes (so in completion order, not key order); memory
+        is bounded by the finished-but-unconsumed shards, not the whole tree.
+        """
+        shards, objects = self.list_shards(prefix)
+        yield from objects
+        if not shards:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(lambda p: list(self.iter_prefix(p)), s) for s in shards]
+            for future in as_completed(futures):
+                yield from future.result()
 
     def get_state_stats(self, state: str) -> dict[str, int]:
         """Get statistics for a state's archived content.
@@ -272,11 +431,11 @@ class R2Storage:
             Dict with 'count' and 'total_bytes'
         """
         prefix = f"us/statutes/states/{state.lower()}/"
-        objects = self.list_prefix(prefix)
-        return {
-            'count': len(objects),
-            'total_bytes': sum(obj['Size'] for obj in objects),
-        }
+        count = total_bytes = 0
+        for obj in self.iter_prefix(prefix):
+            count += 1
+            total_bytes += obj['Size']
+        return {'count': count, 'total_bytes': total_bytes}
 
 
 # Convenience functions for scripts
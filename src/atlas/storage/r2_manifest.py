@@ -0,0 +1,200 @@
+"""Local SQLite manifest of R2 objects for incremental jobs.
+
+Listing a bucket costs one request per 1000 keys, so jobs that need archive
+stats or "what changed" keep a local copy of the listing (key, size, ETag)
+and refresh it with ``sync``, which reports the keys added, changed, or
+removed since the last sync. The ETag of a single-part upload is the MD5 of
+its content, so ``R2Storage.upload_many`` checks the manifest to skip
+unchanged uploads, and records what it uploads to keep it current.
+
+Example:
+    >>> manifest = R2Manifest(Path("data/r2-manifest.db"), r2.bucket)
+    >>> changes = manifest.sync(r2, "us/statutes/states/")
+    >>> print(f"{len(changes.changed)} objects changed")
+    >>> manifest.stats("us/statutes/states/ak/")
+    {'count': 5120, 'total_bytes': 48211873}
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Where the CLI and the statute pipeline keep the manifest by default
+DEFAULT_MANIFEST_PATH = Path("data/r2-manifest.db")
+
+MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    etag TEXT NOT NULL,
+    last_modified TEXT,
+    PRIMARY KEY (bucket, key)
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (bucket, prefix)
+);
+"""
+
+UPSERT_OBJECT_SQL = """
+INSERT INTO objects (bucket, key, size, etag, last_modified) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (bucket, key) DO UPDATE SET
+    size = excluded.size, etag = excluded.etag, last_modified = excluded.last_modified
+"""
+
+# Rows written per executemany batch during a sync
+SYNC_BATCH_SIZE = 1000
+
+
+@dataclass
+class ManifestChanges:
+    """Keys that differ between the manifest and the bucket after a sync."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
+
+
+def _prefix_bounds(prefix: str) -> tuple[str, str] | None:
+    """Key range [low, high) covering a prefix, so lookups use the primary key."""
+    if not prefix:
+        return None
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class R2Manifest:
+    """SQLite-backed listing of one bucket's objects.
+
+    Args:
+        path: SQLite database file (":memory:" for a throwaway manifest)
+        bucket: Bucket whose objects this manifest tracks
+    """
+
+    def __init__(self, path: Path | str, bucket: str):
+        self.path = str(path)
+        self.bucket = bucket
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(MANIFEST_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _where(self, prefix: str) -> tuple[str, list[Any]]:
+        bounds = _prefix_bounds(prefix)
+        if bounds is None:
+            return "bucket = ?", [self.bucket]
+        return "bucket = ? AND key >= ? AND key < ?", [self.bucket, *bounds]
+
+    def _rows(self, columns: str, prefix: str) -> list[tuple]:
+        where, params = self._where(prefix)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT {columns} FROM objects WHERE {where} ORDER BY key", params
+            ).fetchall()
+
+    def etags(self, prefix: str = "") -> dict[str, str]:
+        """Key -> ETag (content MD5) for objects under a prefix."""
+        return dict(self._rows("key, etag", prefix))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Stored size/etag/last_modified for one key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, etag, last_modified FROM objects WHERE bucket = ? AND key = ?",
+                (self.bucket, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"key": key, "size": row[0], "etag": row[1], "last_modified": row[2]}
+
+    def stats(self, prefix: str = "") -> dict[str, int]:
+        """Object count and total bytes under a prefix, from the manifest."""
+        where, params = self._where(prefix)
+        with self._lock:
+            count, total = self._conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects WHERE {where}", params
+            ).fetchone()
+        return {"count": count, "total_bytes": total}
+
+    def last_synced(self, prefix: str = "") -> str | None:
+        """ISO timestamp of the last sync of exactly this prefix, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM syncs WHERE bucket = ? AND prefix = ?",
+                (self.bucket, prefix),
+            ).fetchone()
+        return row[0] if row else None
+
+    def record(self, key: str, etag: str, size: int) -> None:
+        """Note an object just uploaded, so the manifest stays current between syncs."""
+        with self._lock, self._conn:
+            self._conn.execute(UPSERT_OBJECT_SQL, (self.bucket, key, size, etag, None))
+
+    def diff(self, local: dict[str, str]) -> list[str]:
+        """Keys in ``local`` (key -> MD5) that are missing or different in the manifest."""
+        known = self.etags()
+        return [key for key, digest in local.items() if known.get(key) != digest]
+
+    def sync(self, r2: Any, prefix: str = "", workers: int = 8) -> ManifestChanges:
+        """Re-list a prefix from R2 and bring the manifest up to date.
+
+        Args:
+            r2: R2Storage for this manifest's bucket
+            prefix: Key prefix to refresh (others are left alone)
+            workers: Threads listing sub-prefixes in parallel
+
+        Returns:
+            Keys added, changed (different ETag), and removed under the prefix
+        """
+        known = self.etags(prefix)
+        changes = ManifestChanges()
+        seen: set[str] = set()
+        batch: list[tuple] = []
+
+        def flush() -> None:
+            with self._lock, self._conn:
+                self._conn.executemany(UPSERT_OBJECT_SQL, batch)
+            batch.clear()
+
+        for obj in r2.iter_prefix_sharded(prefix, workers=workers):
+            key = obj["Key"]
+            etag = obj.get("ETag", "").strip('"')
+            seen.add(key)
+            previous = known.get(key)
+            if previous is None:
+                changes.added.append(key)
+            elif previous != etag:
+                changes.changed.append(key)
+            modified = obj.get("LastModified")
+            if isinstance(modified, datetime):
+                modified = modified.isoformat()
+            batch.append((self.bucket, key, obj.get("Size", 0), etag, modified))
+            if len(batch) >= SYNC_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+        changes.removed = sorted(set(known) - seen)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM objects WHERE bucket = ? AND key = ?",
+                [(self.bucket, key) for key in changes.removed],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO syncs (bucket, prefix, synced_at) VALUES (?, ?, ?)",
+                (self.bucket, prefix, datetime.now(timezone.utc).isoformat()),
+            )
+        return changes
@@ -1,28 +1,206 @@
 """SQLite storage backend with full-text search."""
 
 import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import closing, contextmanager, nullcontext
 from datetime import date
 from pathlib import Path
 
 import sqlite_utils
 
-from atlas.models import Citation, SearchResult, Section, Subsection, TitleInfo
+from atlas.models import (
+    Citation,
+    SearchResult,
+    Section,
+    Subsection,
+    SubsectionTree,
+    TitleInfo,
+)
 from atlas.storage.base import StorageBackend
 
+# Triggers that keep sections_fts in sync with sections, row by row
+FTS_TRIGGERS = {
+    "sections_ai": """
+        CREATE TRIGGER IF NOT EXISTS sections_ai AFTER INSERT ON sections BEGIN
+            INSERT INTO sections_fts(rowid, section_title, text)
+            VALUES (new.rowid, new.section_title, new.text);
+        END
+    """,
+    "sections_ad": """
+        CREATE TRIGGER IF NOT EXISTS sections_ad AFTER DELETE ON sections BEGIN
+            INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
+            VALUES ('delete', old.rowid, old.section_title, old.text);
+        END
+    """,
+    "sections_au": """
+        CREATE TRIGGER IF NOT EXISTS sections_au AFTER UPDATE ON sections BEGIN
+            INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
+            VALUES ('delete', old.rowid, old.section_title, old.text);
+            INSERT INTO sections_fts(rowid, section_title, text)
+            VALUES (new.rowid, new.section_title, new.text);
+        END
+    """,
+}
+
+# Explicit column order shared by reads and writes
+SECTION_COLUMNS = (
+    "id",
+    "title",
+    "section",
+    "title_name",
+    "section_title",
+    "text",
+    "subsections_json",
+    "enacted_date",
+    "last_amended",
+    "public_laws_json",
+    "effective_date",
+    "references_to_json",
+    "referenced_by_json",
+    "source_url",
+    "retrieved_at",
+)
+# Everything except the structured JSON blobs, for callers that only need text
+TEXT_COLUMNS = tuple(
+    c for c in SECTION_COLUMNS if c not in ("subsections_json", "public_laws_json")
+)
+
+# Constant SQL strings let sqlite3 reuse its cached prepared statements
+SELECT_SECTION_SQL = (
+    f"SELECT {', '.join(SECTION_COLUMNS)} FROM sections WHERE title = ? AND section = ?"
+)
+SELECT_SECTION_TEXT_SQL = (
+    f"SELECT {', '.join(TEXT_COLUMNS)} FROM sections WHERE title = ? AND section = ?"
+)
+SELECT_SECTION_TREE_SQL = (
+    f"SELECT {', '.join(TEXT_COLUMNS)}, subsections_json "
+    "FROM sections WHERE title = ? AND section = ?"
+)
+
+# (title, section) pairs per IN (...) lookup, well under SQLite's bound-variable limit
+GET_MANY_CHUNK = 400
+
+# Rows pulled from the cursor at a time when streaming a title
+EXPORT_FETCH_SIZE = 200
+
+BUMP_GENERATION_SQL = """
+    INSERT INTO meta (key, value) VALUES ('generation', 1)
+    ON CONFLICT (key) DO UPDATE SET value = value + 1
+"""
+
+INSERT_PATH_SQL = (
+    "INSERT OR IGNORE INTO subsection_paths (title, section, path, start, length) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """sqlite3 row factory mapping column names to values."""
+    return {desc[0]: value for desc, value in zip(cursor.description, row, strict=True)}
+
+
+# Memory-map up to this much of the database file on read connections
+READ_MMAP_SIZE = 256 * 1024 * 1024
+
+
+class SQLiteReadPool:
+    """Read-only SQLite connections, one per thread.
+
+    sqlite3 connections may not be shared across threads, so each thread that
+    reads gets its own, opened lazily and kept for the thread's lifetime. With
+    the database in WAL mode these readers run concurrently with each other
+    and with the single writer.
+
+    Args:
+        db_path: Path to the SQLite database file
+        mmap_size: Bytes of the database to memory-map per connection
+    """
+
+    def __init__(self, db_path: Path | str, mmap_size: int = READ_MMAP_SIZE):
+        self.db_path = Path(db_path)
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+
+    def open(self) -> sqlite3.Connection:
+        """Open a new read-only connection that the caller must close.
+
+        For long reads such as exports, whose open statement would otherwise
+        pin an old snapshot on a pooled connection and hold back checkpoints.
+        """
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's read connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.open()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection the pool has opened."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+# Use INSERT OR REPLACE to handle duplicate (title, section) pairs
+# This can occur when the same section number appears multiple times
+# in the XML with different USLM IDs (e.g., parsing anomalies in Title 10)
+INSERT_SECTION_SQL = f"""
+    INSERT OR REPLACE INTO sections ({", ".join(SECTION_COLUMNS)})
+    VALUES ({", ".join("?" for _ in SECTION_COLUMNS)})
+"""
+
 
 class SQLiteStorage(StorageBackend):
     """SQLite-based storage with FTS5 full-text search."""
 
-    def __init__(self, db_path: Path | str = "atlas.db"):
+    def __init__(self, db_path: Path | str = "atlas.db", read_pool: bool = False):
         """Initialize SQLite storage.
 
         Args:
             db_path: Path to SQLite database file
+            read_pool: Serve reads from per-thread read-only connections so
+                they can run concurrently, e.g. from a server's thread pool.
+                Call enable_wal() too so they also run alongside the writer.
+                Ignored for in-memory databases.
         """
         self.db_path = Path(db_path)
         self.db = sqlite_utils.Database(str(self.db_path))
         self._init_schema()
 
+        self.read_pool: SQLiteReadPool | None = None
+        if read_pool and str(db_path) != ":memory:":
+            self.read_pool = SQLiteReadPool(self.db_path)
+
+    def enable_wal(self) -> None:
+        """Switch the database file to WAL mode (persists across connections).
+
+        Kept out of __init__ because it writes to the file: callers opt in
+        when they start serving, not whenever storage is opened. Uses its own
+        short-lived connection, so it can be called from any thread.
+        """
+        if str(self.db_path) == ":memory:":
+            return
+        with closing(sqlite3.connect(str(self.db_path))) as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+
+    def _reader(self) -> sqlite3.Connection:
+        """Connection to run read queries on."""
+        return self.read_pool.connection() if self.read_pool else self.db.conn
+
     def _init_schema(self) -> None:
         """Create database tables if they don't exist."""
         # Main sections table
@@ -63,32 +241,7 @@ class SQLiteStorage(StorageBackend):
             )
 
             # Triggers to keep FTS in sync
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS sections_ai AFTER INSERT ON sections BEGIN
-                    INSERT INTO sections_fts(rowid, section_title, text)
-                    VALUES (new.rowid, new.section_title, new.text);
-                END
-            """
-            )
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS sections_ad AFTER DELETE ON sections BEGIN
-                    INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
-                    VALUES ('delete', old.rowid, old.section_title, old.text);
-                END
-            """
-            )
-            self.db.execute(
-                """
-                CREATE TRIGGER IF NOT EXISTS sections_au AFTER UPDATE ON sections BEGIN
-                    INSERT INTO sections_fts(sections_fts, rowid, section_title, text)
-                    VALUES ('delete', old.rowid, old.section_title, old.text);
-                    INSERT INTO sections_fts(rowid, section_title, text)
-                    VALUES (new.rowid, new.section_title, new.text);
-                END
-            """
-            )
+            self._create_fts_triggers()
 
         # Cross-references table for efficient lookups
         if "cross_references" not in self.db.table_names():
@@ -103,6 +256,24 @@ class SQLiteStorage(StorageBackend):
             )
             self.db["cross_references"].create_index(["to_title", "to_section"], if_not_exists=True)
 
+        # Where each subsection path's object sits inside subsections_json, so a
+        # single subtree can be sliced out with substr() instead of decoding it all
+        if "subsection_paths" not in self.db.table_names():
+            self.db["subsection_paths"].create(
+                {
+                    "title": int,
+                    "section": str,
+                    "path": str,
+                    "start": int,
+                    "length": int,
+                },
+                pk=("title", "section", "path"),
+            )
+
+        # Database generation, bumped by every write so readers can invalidate caches
+        if "meta" not in self.db.table_names():
+            self.db["meta"].create({"key": str, "value": int}, pk="key")
+
         # Title metadata
         if "titles" not in self.db.table_names():
             self.db["titles"].create(
@@ -116,84 +287,208 @@ class SQLiteStorage(StorageBackend):
                 pk="number",
             )
 
+    def _create_fts_triggers(self) -> None:
+        """Create the triggers that keep sections_fts in sync."""
+        for sql in FTS_TRIGGERS.values():
+            self.db.execute(sql)
+
+    def _drop_fts_triggers(self) -> None:
+        """Drop the FTS sync triggers (bulk loads rebuild the index instead)."""
+        for name in FTS_TRIGGERS:
+            self.db.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    @contextmanager
+    def deferred_fts(self) -> Iterator[None]:
+        """Suspend per-row FTS updates for a bulk load, rebuilding the index on exit."""
+        self._drop_fts_triggers()
+        try:
+            yield
+        finally:
+            self._create_fts_triggers()
+            self.rebuild_fts()
+
+    def rebuild_fts(self) -> None:
+        """Rebuild the sections_fts index from the sections table."""
+        self.db.execute("INSERT INTO sections_fts(sections_fts) VALUES ('rebuild')")
+        self._bump_generation()
+        self.db.conn.commit()
+
+    def _bump_generation(self) -> None:
+        """Advance the database generation (callers commit)."""
+        self.db.execute(BUMP_GENERATION_SQL)
+
+    def get_generation(self) -> int:
+        """Current database generation; changes whenever data is written."""
+        conn = self._reader()
+        row = conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return row[0] if row else 0
+
+    def _section_row(self, section: Section, subsections_json: str) -> tuple:
+        """Flatten a section into a row for INSERT_SECTION_SQL."""
+        return (
+            section.uslm_id or f"{section.citation.title}/{section.citation.section}",
+            section.citation.title,
+            section.citation.section,
+            section.title_name,
+            section.section_title,
+            section.text,
+            subsections_json,
+            section.enacted_date.isoformat() if section.enacted_date else None,
+            section.last_amended.isoformat() if section.last_amended else None,
+            json.dumps(section.public_laws),
+            section.effective_date.isoformat() if section.effective_date else None,
+            json.dumps(section.references_to),
+            json.dumps(section.referenced_by),
+            section.source_url,
+            section.retrieved_at.isoformat(),
+        )
+
+    def _dump_subsections(
+        self, subsections: list[Subsection]
+    ) -> tuple[str, list[tuple[str, int, int]]]:
+        """Serialize subsections to JSON, recording where each path's object sits.
+
+        The text is identical to ``json.dumps`` of the dict form. Alongside it
+        come (path, start, length) character spans; json.dumps escapes to ASCII,
+        so these match SQLite's substr() offsets. Children are recorded before
+        their parent, and earlier siblings before later ones.
+        """
+        spans: list[tuple[str, int, int]] = []
+
+        def dump(nodes: list[Subsection], prefix: str, offset: int) -> str:
+            parts = []
+            pos = offset + 1  # Past the opening "["
+            for i, sub in enumerate(nodes):
+                if i:
+                    pos += 2  # ", " separator
+                path = f"{prefix}{sub.identifier}"
+                head = (
+                    f'{{"identifier": {json.dumps(sub.identifier)}, '
+                    f'"heading": {json.dumps(sub.heading)}, '
+                    f'"text": {json.dumps(sub.text)}, "children": '
+                )
+                node = f"{head}{dump(sub.children, f'{path}/', pos + len(head))}}}"
+                spans.append((path, pos, len(node)))
+                parts.append(node)
+                pos += len(node)
+            return f"[{', '.join(parts)}]"
+
+        return dump(subsections, "", 0), spans
+
+    def _path_rows(
+        self, section: Section, spans: list[tuple[str, int, int]]
+    ) -> list[tuple[int, str, str, int, int]]:
+        """Build subsection_paths rows for a section."""
+        return [
+            (section.citation.title, section.citation.section, path, start, length)
+            for path, start, length in spans
+        ]
+
     def store_section(self, section: Section) -> None:
         """Store a section in the database."""
-        # Serialize subsections to JSON
-        subsections_json = json.dumps([self._subsection_to_dict(s) for s in section.subsections])
-
-        record = {
-            "id": section.uslm_id or f"{section.citation.title}/{section.citation.section}",
-            "title": section.citation.title,
-            "section": section.citation.section,
-            "title_name": section.title_name,
-            "section_title": section.section_title,
-            "text": section.text,
-            "subsections_json": subsections_json,
-            "enacted_date": section.enacted_date.isoformat() if section.enacted_date else None,
-            "last_amended": section.last_amended.isoformat() if section.last_amended else None,
-            "public_laws_json": json.dumps(section.public_laws),
-            "effective_date": (
-                section.effective_date.isoformat() if section.effective_date else None
-            ),
-            "references_to_json": json.dumps(section.references_to),
-            "referenced_by_json": json.dumps(section.referenced_by),
-            "source_url": section.source_url,
-            "retrieved_at": section.retrieved_at.isoformat(),
-        }
-
-        # Use INSERT OR REPLACE to handle duplicate (title, section) pairs
-        # This can occur when the same section number appears multiple times
-        # in the XML with different USLM IDs (e.g., parsing anomalies in Title 10)
+        subsections_json, spans = self._dump_subsections(section.subsections)
+        self.db.execute(INSERT_SECTION_SQL, self._section_row(section, subsections_json))
         self.db.execute(
-            """
-            INSERT OR REPLACE INTO sections (
-                id, title, section, title_name, section_title, text,
-                subsections_json, enacted_date, last_amended, public_laws_json,
-                effective_date, references_to_json, referenced_by_json,
-                source_url, retrieved_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                record["id"],
-                record["title"],
-                record["section"],
-                record["title_name"],
-                record["section_title"],
-                record["text"],
-                record["subsections_json"],
-                record["enacted_date"],
-                record["last_amended"],
-                record["public_laws_json"],
-                record["effective_date"],
-                record["references_to_json"],
-                record["referenced_by_json"],
-                record["source_url"],
-                record["retrieved_at"],
-            ],
+            "DELETE FROM subsection_paths WHERE title = ? AND section = ?",
+            [section.citation.title, section.citation.section],
         )
+        self.db.conn.executemany(INSERT_PATH_SQL, self._path_rows(section, spans))
+        self._bump_generation()
         # Commit after raw execute (sqlite_utils methods auto-commit, but execute doesn't)
         self.db.conn.commit()
 
         # Update cross-references
         self._update_cross_references(section)
 
-    def _subsection_to_dict(self, sub: Subsection) -> dict:
-        """Convert Subsection to dictionary for JSON serialization."""
-        return {
-            "identifier": sub.identifier,
-            "heading": sub.heading,
-            "text": sub.text,
-            "children": [self._subsection_to_dict(c) for c in sub.children],
-        }
+    def store_sections(
+        self,
+        sections: Iterable[Section],
+        batch_size: int = 500,
+        defer_fts: bool = False,
+    ) -> int:
+        """Store many sections, committing one transaction per batch.
+
+        Args:
+            sections: Sections to store (consumed lazily)
+            batch_size: Number of sections per transaction
+            defer_fts: Skip the per-row FTS triggers and rebuild the index once
+                at the end. Faster for large loads, but the rebuild covers the
+                whole table, so only worth it when loading most of the database.
+
+        Returns:
+            Number of sections stored
+        """
+        count = 0
+        batch: list[Section] = []
+
+        with self.deferred_fts() if defer_fts else nullcontext():
+            for section in sections:
+                batch.append(section)
+                if len(batch) >= batch_size:
+                    self._write_batch(batch)
+                    count += len(batch)
+                    batch = []
+
+            # Store remaining
+            if batch:
+                self._write_batch(batch)
+                count += len(batch)
+
+        return count
+
+    def _write_batch(self, batch: list[Section]) -> None:
+        """Write sections, path spans and cross-references in a single transaction."""
+        conn = self.db.conn
+        dumped = [self._dump_subsections(s.subsections) for s in batch]
+        keys = [(s.citation.title, s.citation.section) for s in batch]
+        with conn:
+            conn.executemany(
+                INSERT_SECTION_SQL,
+                [self._section_row(s, js) for s, (js, _) in zip(batch, dumped, strict=True)],
+            )
+            conn.executemany("DELETE FROM subsection_paths WHERE title = ? AND section = ?", keys)
+            conn.executemany(
+                INSERT_PATH_SQL,
+                [
+                    row
+                    for s, (_, spans) in zip(batch, dumped, strict=True)
+                    for row in self._path_rows(s, spans)
+                ],
+            )
+            conn.executemany(
+                "DELETE FROM cross_references WHERE from_title = ? AND from_section = ?", keys
+            )
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO cross_references
+                    (from_title, from_section, to_title, to_section)
+                VALUES (?, ?, ?, ?)
+                """,
+                [row for s in batch for row in self._reference_rows(s)],
+            )
+            conn.execute(BUMP_GENERATION_SQL)
 
     def _dict_to_subsection(self, d: dict) -> Subsection:
         """Convert dictionary to Subsection."""
-        return Subsection(
-            identifier=d["identifier"],
-            heading=d.get("heading"),
-            text=d["text"],
-            children=[self._dict_to_subsection(c) for c in d.get("children", [])],
-        )
+        return Subsection.from_dict(d)
+
+    def _reference_rows(self, section: Section) -> list[tuple[int, str, int, str]]:
+        """Build cross_references rows for a section's outgoing references."""
+        rows = []
+        for ref in section.references_to:
+            try:
+                ref_citation = Citation.from_string(ref)
+            except ValueError:
+                continue  # Skip malformed references
+            rows.append(
+                (
+                    section.citation.title,
+                    section.citation.section,
+                    ref_citation.title,
+                    ref_citation.section,
+                )
+            )
+        return rows
 
     def _update_cross_references(self, section: Section) -> None:
         """Update cross-reference table for a section."""
@@ -204,20 +499,16 @@ class SQLiteStorage(StorageBackend):
         )
 
         # Add new references
-        for ref in section.references_to:
-            try:
-                ref_citation = Citation.from_string(ref)
-                self.db["cross_references"].insert(
-                    {
-                        "from_title": section.citation.title,
-                        "from_section": section.citation.section,
-                        "to_title": ref_citation.title,
-                        "to_section": ref_citation.section,
-                    },
-                    ignore=True,
-                )
-            except ValueError:
-                pass  # Skip malformed references
+        for from_title, from_section, to_title, to_section in self._reference_rows(section):
+            self.db["cross_references"].insert(
+                {
+                    "from_title": from_title,
+                    "from_section": from_section,
+                    "to_title": to_title,
+                    "to_section": to_section,
+                },
+                ignore=True,
+            )
 
     def get_section(
         self,
@@ -225,43 +516,147 @@ class SQLiteStorage(StorageBackend):
         section: str,
         subsection: str | None = None,
         as_of: date | None = None,
+        text_only: bool = False,
     ) -> Section | None:
-        """Retrieve a section by citation."""
+        """Retrieve a section by citation.
+
+        With ``text_only`` the subsection tree and public laws are neither
+        read nor decoded, and come back empty.
+        """
         # TODO: Implement historical versions (as_of parameter)
-        row = self.db.execute(
-            "SELECT * FROM sections WHERE title = ? AND section = ?", [title, section]
+        cursor = self._reader().cursor()
+        cursor.row_factory = _dict_row
+        record = cursor.execute(
+            SELECT_SECTION_TEXT_SQL if text_only else SELECT_SECTION_SQL, (title, section)
         ).fetchone()
 
-        if not row:
+        if not record:
             return None
 
         # Convert row to Section
-        return self._row_to_section(row)
+        return self._row_to_section(record)
 
-    def _row_to_section(self, row: tuple) -> Section:
-        """Convert a database row to a Section model."""
-        # Get column names
-        cursor = self.db.execute("SELECT * FROM sections LIMIT 0")
-        columns = [desc[0] for desc in cursor.description]
-        record = dict(zip(columns, row, strict=True))
+    def get_section_with_tree(
+        self,
+        title: int,
+        section: str,
+        as_of: date | None = None,
+    ) -> tuple[Section, SubsectionTree] | None:
+        """Read a section's text and its raw subsection JSON from one row.
 
-        subsections = [
-            self._dict_to_subsection(d) for d in json.loads(record["subsections_json"] or "[]")
-        ]
+        The subsections are left undecoded (the returned Section has none).
+        """
+        # TODO: Implement historical versions (as_of parameter)
+        cursor = self._reader().cursor()
+        cursor.row_factory = _dict_row
+        record = cursor.execute(SELECT_SECTION_TREE_SQL, (title, section)).fetchone()
+        if not record:
+            return None
+        raw_json = record.pop("subsections_json")
+        return self._row_to_section(record), SubsectionTree(raw_json)
+
+    def get_sections(
+        self,
+        keys: Sequence[tuple[int, str]],
+        text_only: bool = False,
+    ) -> dict[tuple[int, str], Section]:
+        """Retrieve many sections with one ``(title, section) IN (...)`` query per chunk."""
+        unique = list(dict.fromkeys((int(t), str(s)) for t, s in keys))
+        columns = ", ".join(TEXT_COLUMNS if text_only else SECTION_COLUMNS)
+        cursor = self._reader().cursor()
+        cursor.row_factory = _dict_row
+
+        found = {}
+        for i in range(0, len(unique), GET_MANY_CHUNK):
+            chunk = unique[i : i + GET_MANY_CHUNK]
+            placeholders = ", ".join("(?, ?)" for _ in chunk)
+            rows = cursor.execute(
+                f"SELECT {columns} FROM sections "
+                f"WHERE (title, section) IN (VALUES {placeholders})",
+                [value for key in chunk for value in key],
+            ).fetchall()
+            for record in rows:
+                found[(record["title"], record["section"])] = self._row_to_section(record)
+        return found
+
+    def iter_sections(self, title: int, text_only: bool = False) -> Iterator[Section]:
+        """Stream a title's sections in natural section order (2, 10, 32, 32A).
+
+        Sections without a leading number sort last, as in PostgresStorage.
+
+        Rows are pulled from one cursor in small batches, so memory stays flat
+        however large the title. With a read pool the cursor gets a dedicated
+        connection, since a stream may be advanced from other threads and
+        outlive the request; it is closed when the generator finishes or is
+        closed.
+        """
+        columns = ", ".join(TEXT_COLUMNS if text_only else SECTION_COLUMNS)
+        conn = self.read_pool.open() if self.read_pool else None
+        cursor = (conn or self.db.conn).cursor()
+        try:
+            cursor.row_factory = _dict_row
+            cursor.execute(
+                f"SELECT {columns} FROM sections WHERE title = ? "
+                # CAST() gives 0 for unnumbered sections; sort them after the numbered ones
+                "ORDER BY section NOT GLOB '[0-9]*', CAST(section AS INTEGER), section",
+                (title,),
+            )
+            while rows := cursor.fetchmany(EXPORT_FETCH_SIZE):
+                for record in rows:
+                    yield self._row_to_section(record)
+        finally:
+            cursor.close()
+            if conn is not None:
+                conn.close()
+
+    def get_subsection_tree(self, title: int, section: str) -> SubsectionTree | None:
+        """Get a section's stored subsection JSON without decoding it."""
+        row = self._reader().execute(
+            "SELECT subsections_json FROM sections WHERE title = ? AND section = ?",
+            (title, section),
+        ).fetchone()
+        return SubsectionTree(row[0]) if row else None
+
+    def get_subsection(self, title: int, section: str, path: str) -> Subsection | None:
+        """Get one subsection by path, decoding only its own subtree."""
+        row = self._reader().execute(
+            """
+            SELECT substr(s.subsections_json, p.start + 1, p.length)
+            FROM subsection_paths p
+            JOIN sections s ON s.title = p.title AND s.section = p.section
+            WHERE p.title = ? AND p.section = ? AND p.path = ?
+            """,
+            (title, section, path),
+        ).fetchone()
+        if row:
+            return Subsection.from_dict(json.loads(row[0]))
+
+        # Sections stored before subsection_paths existed have no spans
+        tree = self.get_subsection_tree(title, section)
+        return tree.get_subsection(path) if tree else None
+
+    def _row_to_section(self, record: dict) -> Section:
+        """Convert a database row (as a column -> value dict) to a Section model."""
+        subsections_json = record.get("subsections_json")
+        public_laws_json = record.get("public_laws_json")
 
         return Section(
             citation=Citation(title=record["title"], section=record["section"]),
             title_name=record["title_name"],
             section_title=record["section_title"],
             text=record["text"],
-            subsections=subsections,
+            subsections=(
+                [self._dict_to_subsection(d) for d in json.loads(subsections_json)]
+                if subsections_json
+                else []
+            ),
             enacted_date=(
                 date.fromisoformat(record["enacted_date"]) if record["enacted_date"] else None
             ),
             last_amended=(
                 date.fromisoformat(record["last_amended"]) if record["last_amended"] else None
             ),
-            public_laws=json.loads(record["public_laws_json"] or "[]"),
+            public_laws=json.loads(public_laws_json) if public_laws_json else [],
             effective_date=(
                 date.fromisoformat(record["effective_date"]) if record["effective_date"] else None
             ),
@@ -290,7 +685,7 @@ class SQLiteStorage(StorageBackend):
                 ORDER BY score
                 LIMIT ?
             """
-            rows = self.db.execute(sql, [query, title, limit]).fetchall()
+            rows = self._reader().execute(sql, [query, title, limit]).fetchall()
         else:
             sql = """
                 SELECT s.title, s.section, s.section_title,
@@ -302,7 +697,7 @@ class SQLiteStorage(StorageBackend):
                 ORDER BY score
                 LIMIT ?
             """
-            rows = self.db.execute(sql, [query, limit]).fetchall()
+            rows = self._reader().execute(sql, [query, limit]).fetchall()
 
         results = []
         for row in rows:
@@ -320,7 +715,7 @@ class SQLiteStorage(StorageBackend):
 
     def list_titles(self) -> list[TitleInfo]:
         """List all available titles with metadata."""
-        rows = self.db.execute("SELECT * FROM titles ORDER BY number").fetchall()
+        rows = self._reader().execute("SELECT * FROM titles ORDER BY number").fetchall()
         return [
             TitleInfo(
                 number=row[0],
@@ -334,7 +729,7 @@ class SQLiteStorage(StorageBackend):
 
     def get_references_to(self, title: int, section: str) -> list[str]:
         """Get sections that this section references."""
-        rows = self.db.execute(
+        rows = self._reader().execute(
             "SELECT to_title, to_section FROM cross_references WHERE from_title = ? AND from_section = ?",
             [title, section],
         ).fetchall()
@@ -342,7 +737,7 @@ class SQLiteStorage(StorageBackend):
 
     def get_referenced_by(self, title: int, section: str) -> list[str]:
         """Get sections that reference this section."""
-        rows = self.db.execute(
+        rows = self._reader().execute(
             "SELECT from_title, from_section FROM cross_references WHERE to_title = ? AND to_section = ?",
             [title, section],
         ).fetchall()
@@ -365,3 +760,5 @@ class SQLiteStorage(StorageBackend):
             },
             pk="number",
         )
+        self._bump_generation()
+        self.db.conn.commit()
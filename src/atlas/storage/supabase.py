@@ -21,6 +21,7 @@ from atlas.models_statute import (
     StatuteSearchResult,
     StatuteSubsection,
 )
+from atlas.storage.bulk import BATCH_ROWS, STATUTES_TABLE, PostgresBulkLoader
 
 # Optional dependency - only needed for Supabase storage
 try:
@@ -195,10 +196,6 @@ class SupabaseStorage:
     def store_statute(self, statute: Statute) -> None:
         """Store a statute in the database."""
         with self.conn.cursor() as cur:
-            subsections_json = json.dumps(
-                [self._subsection_to_dict(s) for s in statute.subsections]
-            )
-
             cur.execute(
                 """
                 INSERT INTO arch.statutes (
@@ -238,34 +235,40 @@ class SupabaseStorage:
                     source_id = EXCLUDED.source_id,
                     retrieved_at = EXCLUDED.retrieved_at
                 """,
-                {
-                    "jurisdiction": statute.jurisdiction,
-                    "code": statute.code,
-                    "code_name": statute.code_name,
-                    "section": statute.section,
-                    "subsection_path": statute.subsection_path,
-                    "title": statute.title,
-                    "text": statute.text,
-                    "subsections_json": subsections_json,
-                    "division": statute.division,
-                    "part": statute.part,
-                    "chapter": statute.chapter,
-                    "subchapter": statute.subchapter,
-                    "article": statute.article,
-                    "history": statute.history,
-                    "enacted_date": statute.enacted_date,
-                    "last_amended": statute.last_amended,
-                    "effective_date": statute.effective_date,
-                    "public_laws": json.dumps(statute.public_laws),
-                    "references_to": json.dumps(statute.references_to),
-                    "referenced_by": json.dumps(statute.referenced_by),
-                    "source_url": statute.source_url,
-                    "source_id": statute.source_id,
-                    "retrieved_at": statute.retrieved_at,
-                },
+                self._statute_row(statute),
             )
             self.conn.commit()
 
+    def _statute_row(self, statute: Statute) -> dict[str, Any]:
+        """Column values for a statute, with JSONB columns encoded."""
+        return {
+            "jurisdiction": statute.jurisdiction,
+            "code": statute.code,
+            "code_name": statute.code_name,
+            "section": statute.section,
+            "subsection_path": statute.subsection_path,
+            "title": statute.title,
+            "text": statute.text,
+            "subsections_json": json.dumps(
+                [self._subsection_to_dict(s) for s in statute.subsections]
+            ),
+            "division": statute.division,
+            "part": statute.part,
+            "chapter": statute.chapter,
+            "subchapter": statute.subchapter,
+            "article": statute.article,
+            "history": statute.history,
+            "enacted_date": statute.enacted_date,
+            "last_amended": statute.last_amended,
+            "effective_date": statute.effective_date,
+            "public_laws": json.dumps(statute.public_laws),
+            "references_to": json.dumps(statute.references_to),
+            "referenced_by": json.dumps(statute.referenced_by),
+            "source_url": statute.source_url,
+            "source_id": statute.source_id,
+            "retrieved_at": statute.retrieved_at,
+        }
+
     def _subsection_to_dict(self, sub: StatuteSubsection) -> dict:
         """Convert subsection to JSON-serializable dict."""
         return {
@@ -466,22 +469,34 @@ class SupabaseStorage:
             row = cur.fetchone()
             return row["count"] if row else 0
 
-    def batch_store(self, statutes: Iterator[Statute], batch_size: int = 100) -> int:
-        """Store multiple statutes in batches for efficiency."""
-        count = 0
-        batch = []
+    def batch_store(
+        self,
+        statutes: Iterator[Statute],
+        batch_size: int = BATCH_ROWS,
+        copy: bool = True,
+    ) -> int:
+        """Store multiple statutes in batches for efficiency.
 
-        for statute in statutes:
-            batch.append(statute)
-            if len(batch) >= batch_size:
-                for s in batch:
-                    self.store_statute(s)
-                count += len(batch)
-                batch = []
-
-        # Store remaining
-        for s in batch:
-            self.store_statute(s)
-        count += len(batch)
+        COPY mode stages each batch in a session temp table, so it needs a
+        direct or session-mode connection (port 5432). Through Supabase's
+        transaction pooler (port 6543) pass ``copy=False``.
+
+        Args:
+            statutes: Statutes to store, consumed lazily
+            batch_size: Statutes per COPY batch (and per commit)
+            copy: Load each batch with COPY and one merge statement; if
+                False, insert statutes one at a time
 
+        Returns:
+            Number of statutes stored
+        """
+        if copy:
+            loader = PostgresBulkLoader(conn=self.conn)
+            rows = (self._statute_row(s) for s in statutes)
+            return loader.load(STATUTES_TABLE, rows, batch_size=batch_size)
+
+        count = 0
+        for statute in statutes:
+            self.store_statute(statute)
+            count += 1
         return count
@@ -0,0 +1,74 @@
+-- Subtree fetch for arch.rules
+-- Returns a section and all of its descendants in one indexed query, so
+-- encoder agents get a whole statute (however large) from a single RPC:
+--
+--   GET /rest/v1/rpc/get_rule_subtree?p_source_path=26/32&p_jurisdiction=us
+--   (with Accept-Profile: arch)
+--
+-- Descendants are found by source_path prefix ("usc/26/32" -> "usc/26/32/a",
+-- "usc/26/32/a/1", ...), so no recursion over parent_id is needed.
+
+-- ============================================================================
+-- INDEX: Prefix scans on source_path
+-- ============================================================================
+-- text_pattern_ops compares byte-wise, which makes "path/" .. "path0" a
+-- contiguous index range regardless of the database collation.
+
+CREATE INDEX IF NOT EXISTS idx_rules_source_path_pattern
+    ON arch.rules (jurisdiction, source_path text_pattern_ops);
+
+-- ============================================================================
+-- FUNCTION: Section plus all descendants, ordered by path
+-- ============================================================================
+-- p_source_path may omit the "usc/" prefix for US Code sections; the exact
+-- path wins if both exist.
+--
+-- Pagination is keyset-based on (source_path, id): pass the last row's
+-- source_path and id as p_after / p_after_id to get the next page, so rows
+-- sharing a source_path are not skipped at a page boundary. Pages are
+-- ordered byte-wise (COLLATE "C"), which puts the section itself first,
+-- before its descendants.
+
+CREATE OR REPLACE FUNCTION arch.get_rule_subtree(
+    p_source_path TEXT,
+    p_jurisdiction TEXT DEFAULT 'us',
+    p_after TEXT DEFAULT NULL,
+    p_after_id TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 5000
+)
+RETURNS SETOF arch.rules AS $$
+    WITH root AS (
+        SELECT r.source_path
+        FROM arch.rules r
+        WHERE r.jurisdiction = p_jurisdiction
+          AND (
+              r.source_path = p_source_path
+              OR (
+                  p_jurisdiction = 'us'
+                  AND p_source_path NOT LIKE 'usc/%'
+                  AND r.source_path = 'usc/' || p_source_path
+              )
+          )
+        ORDER BY r.source_path = p_source_path DESC
+        LIMIT 1
+    )
+    SELECT r.*
+    FROM root
+    JOIN arch.rules r
+      ON r.jurisdiction = p_jurisdiction
+     AND (
+         r.source_path = root.source_path
+         OR (
+             r.source_path ~>=~ (root.source_path || '/')
+             AND r.source_path ~<~ (root.source_path || '0')
+         )
+     )
+    WHERE p_after IS NULL
+       OR r.source_path ~>~ p_after
+       OR (r.source_path = p_after AND r.id::text COLLATE "C" > p_after_id)
+    ORDER BY r.source_path COLLATE "C", r.id::text COLLATE "C"
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION arch.get_rule_subtree(TEXT, TEXT, TEXT, TEXT, INTEGER)
+    TO anon, authenticated, service_role;
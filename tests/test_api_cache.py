@@ -0,0 +1,99 @@
+"""Tests for the API response cache."""
+
+from atlas.api.cache import CachedResponse, ResponseCache, etag_for, etag_matches
+
+
+def _entry(body: bytes = b"{}") -> CachedResponse:
+    return CachedResponse.build(body, "application/json")
+
+
+class TestEtags:
+    def test_etag_is_quoted_content_hash(self):
+        assert etag_for(b"a") == etag_for(b"a")
+        assert etag_for(b"a") != etag_for(b"b")
+        assert etag_for(b"a").startswith('"') and etag_for(b"a").endswith('"')
+
+    def test_etag_matches(self):
+        etag = etag_for(b"a")
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestResponseCache:
+    def test_hit_and_miss(self):
+        cache = ResponseCache(2, lambda: 1)
+        assert cache.get("a") is None
+        cache.put("a", _entry())
+
+        assert cache.get("a") == _entry()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(2, lambda: 1)
+        cache.put("a", _entry(b"a"))
+        cache.put("b", _entry(b"b"))
+        cache.get("a")
+        cache.put("c", _entry(b"c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["size"] == 2
+
+    def test_generation_change_drops_entries(self):
+        generation = [1]
+        cache = ResponseCache(10, lambda: generation[0], check_interval=0)
+        cache.refresh()
+        cache.put("a", _entry())
+        assert cache.get("a") is not None
+
+        generation[0] = 2
+        cache.refresh()
+        assert cache.get("a") is None
+        assert cache.stats()["invalidations"] == 1
+        assert cache.stats()["generation"] == 2
+
+    def test_put_from_older_generation_is_dropped(self):
+        generation = [1]
+        cache = ResponseCache(10, lambda: generation[0], check_interval=0)
+        cache.refresh()
+        # Request A starts computing at generation 1
+        started_at = cache.generation
+
+        # An ingest bumps the generation and request B refreshes the cache
+        generation[0] = 2
+        cache.refresh()
+
+        # A finishes with a body from generation 1, which must not be served
+        cache.put("a", _entry(b"stale"), started_at)
+        assert cache.get("a") is None
+
+        cache.put("a", _entry(b"fresh"), cache.generation)
+        assert cache.get("a") == _entry(b"fresh")
+
+    def test_refresh_due_at_interval(self):
+        calls = []
+        cache = ResponseCache(10, lambda: calls.append(1) or 1, check_interval=60)
+        assert cache.needs_refresh()
+        cache.refresh()
+        for _ in range(5):
+            assert not cache.needs_refresh()
+            cache.get("a")
+        assert len(calls) == 1
+
+    def test_get_and_put_never_read_generation(self):
+        def generation():
+            raise AssertionError("generation read outside refresh()")
+
+        cache = ResponseCache(10, generation)
+        cache.put("a", _entry())
+        assert cache.get("a") is not None
+
+    def test_clear(self):
+        cache = ResponseCache(10, lambda: 1)
+        cache.put("a", _entry())
+        cache.clear()
+        assert cache.get("a") is None
@@ -1,5 +1,7 @@
 """Tests for the FastAPI application."""
 
+import json
+import sqlite3
 from datetime import date
 from unittest.mock import MagicMock, patch
 
@@ -13,7 +15,14 @@ from atlas.api.main import (
     TitleResponse,
     create_app,
 )
-from atlas.models import Citation, SearchResult, Section, Subsection, TitleInfo
+from atlas.models import (
+    Citation,
+    SearchResult,
+    Section,
+    Subsection,
+    SubsectionTree,
+    TitleInfo,
+)
 
 
 @pytest.fixture
@@ -43,6 +52,20 @@ class TestSectionResponse:
         assert response.references_to == ["26 USC 24"]
         assert response.referenced_by == ["26 USC 1"]
 
+    def test_json_response_passes_stored_subsections_through(self, section):
+        raw = '[{"identifier": "a", "heading": null, "text": "Stored", "children": []}]'
+        response = SectionResponse.json_response(section, SubsectionTree(raw))
+
+        assert response.media_type == "application/json"
+        assert raw.encode() in response.body
+        data = json.loads(response.body)
+        assert data["citation"] == "26 USC 32"
+        assert data["subsections"][0]["text"] == "Stored"
+
+    def test_json_response_without_tree(self, section):
+        data = json.loads(SectionResponse.json_response(section).body)
+        assert data["subsections"][0]["text"] == "Allowance of credit"
+
 
 class TestSearchResultResponse:
     def test_from_result(self):
@@ -150,14 +173,42 @@ class TestAppEndpoints:
     def test_get_section_found(self, mock_arch_cls, section):
         from fastapi.testclient import TestClient
 
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.get_with_tree.return_value = (
+            section,
+            SubsectionTree(
+                '[{"identifier": "a", "heading": null, "text": "Allowance", "children": []}]'
+            ),
+        )
+
+        app = create_app(db_path=":memory:")
+        client = TestClient(app)
+        response = client.get("/v1/sections/26/32?as_of=2020-01-01")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["section_title"] == "Earned income tax credit"
+        assert data["subsections"][0]["text"] == "Allowance"
+        # Row and tree come from one read, honoring as_of
+        mock_arch.get_with_tree.assert_called_once_with(
+            Citation(title=26, section="32"), as_of=date(2020, 1, 1)
+        )
+        mock_arch.get.assert_not_called()
+
+    @patch("atlas.api.main.Arch")
+    def test_get_section_text_only(self, mock_arch_cls, section):
+        from fastapi.testclient import TestClient
+
         mock_arch = MagicMock()
         mock_arch_cls.return_value = mock_arch
         mock_arch.get.return_value = section
 
         app = create_app(db_path=":memory:")
         client = TestClient(app)
-        response = client.get("/v1/sections/26/32")
+        response = client.get("/v1/sections/26/32?text_only=true")
         assert response.status_code == 200
+        assert mock_arch.get.call_args.kwargs["text_only"] is True
+        mock_arch.get_with_tree.assert_not_called()
 
     @patch("atlas.api.main.Arch")
     def test_get_section_not_found(self, mock_arch_cls):
@@ -165,7 +216,7 @@ class TestAppEndpoints:
 
         mock_arch = MagicMock()
         mock_arch_cls.return_value = mock_arch
-        mock_arch.get.return_value = None
+        mock_arch.get_with_tree.return_value = None
 
         app = create_app(db_path=":memory:")
         client = TestClient(app)
@@ -179,11 +230,40 @@ class TestAppEndpoints:
         mock_arch = MagicMock()
         mock_arch_cls.return_value = mock_arch
         mock_arch.get.return_value = section
+        mock_arch.get_subsection.return_value = Subsection(
+            identifier="1",
+            heading="In general",
+            text="The credit is allowed.",
+            children=[Subsection(identifier="A", text="One child.")],
+        )
 
         app = create_app(db_path=":memory:")
         client = TestClient(app)
         response = client.get("/v1/sections/26/32/a/1")
         assert response.status_code == 200
+        data = response.json()
+        assert data["citation"] == "26 USC 32(a)(1)"
+        assert data["identifier"] == "1"
+        assert data["text"] == "(1) In general\nThe credit is allowed.\nOne child."
+        assert data["children"][0]["identifier"] == "A"
+        assert "subsections" not in data
+        cite = mock_arch.get_subsection.call_args.args[0]
+        assert cite.subsection == "a/1"
+
+    @patch("atlas.api.main.Arch")
+    def test_get_subsection_missing_path(self, mock_arch_cls, section):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.get.return_value = section
+        mock_arch.get_subsection.return_value = None
+
+        app = create_app(db_path=":memory:")
+        client = TestClient(app)
+        response = client.get("/v1/sections/26/32/z")
+        assert response.status_code == 404
+        assert "26 USC 32(z)" in response.json()["detail"]
 
     @patch("atlas.api.main.Arch")
     def test_get_subsection_not_found(self, mock_arch_cls):
@@ -204,12 +284,13 @@ class TestAppEndpoints:
 
         mock_arch = MagicMock()
         mock_arch_cls.return_value = mock_arch
-        mock_arch.get.return_value = section
+        mock_arch.get_with_tree.return_value = (section, SubsectionTree("[]"))
 
         app = create_app(db_path=":memory:")
         client = TestClient(app)
         response = client.get("/v1/citation/26 USC 32")
         assert response.status_code == 200
+        assert response.json()["subsections"] == []
 
     @patch("atlas.api.main.Arch")
     def test_get_by_citation_not_found(self, mock_arch_cls):
@@ -217,13 +298,44 @@ class TestAppEndpoints:
 
         mock_arch = MagicMock()
         mock_arch_cls.return_value = mock_arch
-        mock_arch.get.return_value = None
+        mock_arch.get_with_tree.return_value = None
 
         app = create_app(db_path=":memory:")
         client = TestClient(app)
         response = client.get("/v1/citation/26 USC 32")
         assert response.status_code == 404
 
+    @patch("atlas.api.main.Arch")
+    def test_get_sections_batch(self, mock_arch_cls, section):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.get_many.return_value = {"26 USC 32(a)": section, "26 USC 24": None}
+
+        app = create_app(db_path=":memory:")
+        client = TestClient(app)
+        response = client.post(
+            "/v1/sections:batch",
+            json={"citations": ["26 USC 32(a)", "26 USC 24", "not a cite"], "text_only": True},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["sections"]["26 USC 32(a)"]["section_title"] == "Earned income tax credit"
+        assert data["sections"]["26 USC 24"] is None
+        assert data["not_found"] == ["26 USC 24", "not a cite"]
+        cites, = mock_arch.get_many.call_args.args
+        assert [c.usc_cite for c in cites] == ["26 USC 32(a)", "26 USC 24"]
+        assert mock_arch.get_many.call_args.kwargs["text_only"] is True
+
+    @patch("atlas.api.main.Arch")
+    def test_get_sections_batch_requires_citations(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        client = TestClient(create_app(db_path=":memory:"))
+        assert client.post("/v1/sections:batch", json={"citations": []}).status_code == 422
+
     @patch("atlas.api.main.Arch")
     def test_get_references(self, mock_arch_cls):
         from fastapi.testclient import TestClient
@@ -265,3 +377,211 @@ class TestAppEndpoints:
         data = response.json()
         assert len(data) == 1
         assert data[0]["number"] == 26
+
+
+class TestExportEndpoint:
+    @patch("atlas.api.main.Arch")
+    def test_export_ndjson(self, mock_arch_cls, section):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.export_title.return_value = (s for s in [section, section])
+
+        client = TestClient(create_app(db_path=":memory:"))
+        response = client.get("/v1/titles/26/export?text_only=true")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "etag" not in response.headers
+        lines = response.text.splitlines()
+        assert len(lines) == 2
+        assert Section.model_validate_json(lines[0]).citation.section == "32"
+        mock_arch.export_title.assert_called_once_with(26, text_only=True)
+
+    @patch("atlas.api.main.Arch")
+    def test_export_gzip(self, mock_arch_cls, section):
+        import gzip
+
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.export_title.return_value = (s for s in [section])
+
+        client = TestClient(create_app(db_path=":memory:"))
+        response = client.get("/v1/titles/26/export?compress=true")
+
+        assert response.status_code == 200
+        assert "usc26.ndjson.gz" in response.headers["content-disposition"]
+        assert json.loads(gzip.decompress(response.content))["section_title"] == (
+            "Earned income tax credit"
+        )
+
+    @patch("atlas.api.main.Arch")
+    def test_export_unknown_title(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.export_title.return_value = (s for s in [])
+
+        client = TestClient(create_app(db_path=":memory:"))
+        assert client.get("/v1/titles/99/export").status_code == 404
+
+
+class TestConcurrentReads:
+    def test_concurrent_requests_against_sqlite(self, tmp_path, section):
+        from concurrent.futures import ThreadPoolExecutor
+
+        import anyio.to_thread
+        from fastapi.testclient import TestClient
+
+        from atlas.storage.sqlite import SQLiteStorage
+
+        db_path = tmp_path / "atlas.db"
+        SQLiteStorage(db_path).store_section(section)
+
+        app = create_app(db_path=db_path, cache_size=0, read_threads=8)
+        # Creating the app (as importing the module does) leaves the file alone
+        assert sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+        with TestClient(app) as client:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                statuses = list(
+                    pool.map(lambda _: client.get("/v1/sections/26/32").status_code, range(16))
+                )
+            limiter = client.portal.call(anyio.to_thread.current_default_thread_limiter)
+
+        assert statuses == [200] * 16
+        assert limiter.total_tokens == 8
+        assert sqlite3.connect(db_path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestResponseCaching:
+    @patch("atlas.api.main.Arch")
+    def test_repeat_get_served_from_cache(self, mock_arch_cls, section):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.return_value = 1
+        mock_arch.get_with_tree.return_value = (section, SubsectionTree("[]"))
+
+        client = TestClient(create_app(db_path=":memory:", cache_max_age=60))
+        first = client.get("/v1/sections/26/32")
+        second = client.get("/v1/sections/26/32")
+
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.json() == first.json()
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["cache-control"] == "public, max-age=60"
+        assert mock_arch.get_with_tree.call_count == 1
+
+        metrics = client.get("/v1/metrics").json()["cache"]
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+
+    @patch("atlas.api.main.Arch")
+    def test_query_order_shares_cache_entry(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.return_value = 1
+        mock_arch.search.return_value = []
+
+        client = TestClient(create_app(db_path=":memory:"))
+        client.get("/v1/search?q=income&limit=5")
+        response = client.get("/v1/search?limit=5&q=income")
+
+        assert response.headers["x-cache"] == "HIT"
+        assert mock_arch.search.call_count == 1
+
+    @patch("atlas.api.main.Arch")
+    def test_if_none_match_returns_304(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.return_value = 1
+        mock_arch.list_titles.return_value = []
+
+        client = TestClient(create_app(db_path=":memory:"))
+        etag = client.get("/v1/titles").headers["etag"]
+        response = client.get("/v1/titles", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @patch("atlas.api.main.Arch")
+    def test_errors_not_cached(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.return_value = 1
+        mock_arch.get_with_tree.return_value = None
+
+        client = TestClient(create_app(db_path=":memory:"))
+        client.get("/v1/sections/99/999")
+        response = client.get("/v1/sections/99/999")
+
+        assert response.status_code == 404
+        assert mock_arch.get_with_tree.call_count == 2
+
+    @patch("atlas.api.main.Arch")
+    def test_cache_disabled(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.list_titles.return_value = []
+
+        client = TestClient(create_app(db_path=":memory:", cache_size=0))
+        client.get("/v1/titles")
+        response = client.get("/v1/titles")
+
+        assert "etag" not in response.headers
+        assert mock_arch.list_titles.call_count == 2
+        assert client.get("/v1/metrics").json() == {"cache": None}
+
+    @patch("atlas.api.main.Arch")
+    def test_generation_change_invalidates_cache(self, mock_arch_cls):
+        from fastapi.testclient import TestClient
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.return_value = 1
+        mock_arch.list_titles.return_value = []
+
+        client = TestClient(create_app(db_path=":memory:"))
+        client.get("/v1/titles")
+        mock_arch.storage.get_generation.return_value = 2
+        with patch("atlas.api.cache.time.monotonic", return_value=float("inf")):
+            response = client.get("/v1/titles")
+
+        assert response.headers["x-cache"] == "MISS"
+        assert mock_arch.list_titles.call_count == 2
+        assert client.get("/v1/metrics").json()["cache"]["invalidations"] == 1
+
+    @patch("atlas.api.main.Arch")
+    def test_generation_read_off_event_loop(self, mock_arch_cls):
+        import asyncio
+
+        from fastapi.testclient import TestClient
+
+        def generation():
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()  # Only a worker thread has no loop
+            return 1
+
+        mock_arch = MagicMock()
+        mock_arch_cls.return_value = mock_arch
+        mock_arch.storage.get_generation.side_effect = generation
+        mock_arch.list_titles.return_value = []
+
+        client = TestClient(create_app(db_path=":memory:"))
+        assert client.get("/v1/titles").status_code == 200
+        mock_arch.storage.get_generation.assert_called_once()
@@ -49,7 +49,7 @@ class TestArchGet:
 
         assert result is section
         mock_storage.get_section.assert_called_once_with(
-            title=26, section="32", subsection=None, as_of=None
+            title=26, section="32", subsection=None, as_of=None, text_only=False
         )
 
     def test_get_by_citation(self):
@@ -63,6 +63,28 @@ class TestArchGet:
 
         assert result is section
 
+    def test_get_many(self):
+        mock_storage = MagicMock()
+        section = _make_section()
+        mock_storage.get_sections.return_value = {(26, "32"): section}
+
+        arch = Arch(storage=mock_storage)
+        result = arch.get_many(["26 USC 32", Citation(title=26, section="24")], text_only=True)
+
+        assert result == {"26 USC 32": section, "26 USC 24": None}
+        mock_storage.get_sections.assert_called_once_with(
+            [(26, "32"), (26, "24")], text_only=True
+        )
+
+    def test_export_title(self):
+        mock_storage = MagicMock()
+        mock_storage.iter_sections.return_value = iter([_make_section()])
+
+        arch = Arch(storage=mock_storage)
+
+        assert len(list(arch.export_title(26, text_only=True))) == 1
+        mock_storage.iter_sections.assert_called_once_with(26, text_only=True)
+
     def test_get_with_subsection(self):
         mock_storage = MagicMock()
         mock_storage.get_section.return_value = _make_section()
@@ -82,7 +104,7 @@ class TestArchGet:
 
         assert result is None
         mock_storage.get_section.assert_called_once_with(
-            title=26, section="32", subsection=None, as_of=date(2020, 1, 1)
+            title=26, section="32", subsection=None, as_of=date(2020, 1, 1), text_only=False
         )
 
     def test_get_not_found(self):
@@ -94,6 +116,44 @@ class TestArchGet:
         assert result is None
 
 
+class TestArchGetSubsection:
+    def test_get_subsection(self):
+        mock_storage = MagicMock()
+        arch = Arch(storage=mock_storage)
+
+        result = arch.get_subsection("26 USC 32(b)(1)")
+
+        assert result is mock_storage.get_subsection.return_value
+        mock_storage.get_subsection.assert_called_once_with(26, "32", "b/1")
+
+    def test_get_subsection_requires_path(self):
+        mock_storage = MagicMock()
+        assert Arch(storage=mock_storage).get_subsection(Citation(title=26, section="32")) is None
+        mock_storage.get_subsection.assert_not_called()
+
+
+class TestArchGetSubsectionTree:
+    def test_get_subsection_tree(self):
+        mock_storage = MagicMock()
+        arch = Arch(storage=mock_storage)
+
+        result = arch.get_subsection_tree("26 USC 32(a)")
+
+        assert result is mock_storage.get_subsection_tree.return_value
+        mock_storage.get_subsection_tree.assert_called_once_with(26, "32")
+
+    def test_get_with_tree(self):
+        mock_storage = MagicMock()
+        arch = Arch(storage=mock_storage)
+
+        result = arch.get_with_tree("26 USC 32", as_of=date(2020, 1, 1))
+
+        assert result is mock_storage.get_section_with_tree.return_value
+        mock_storage.get_section_with_tree.assert_called_once_with(
+            26, "32", as_of=date(2020, 1, 1)
+        )
+
+
 class TestArchSearch:
     def test_search(self):
         mock_storage = MagicMock()
@@ -171,6 +231,7 @@ class TestArchIngestTitle:
     @patch("atlas.parsers.us.statutes.USLMParser")
     def test_ingest_title(self, mock_parser_cls):
         mock_storage = MagicMock()
+        mock_storage.store_sections.side_effect = lambda sections: len(list(sections))
         mock_parser = MagicMock()
         mock_parser_cls.return_value = mock_parser
         mock_parser.get_title_number.return_value = 26
@@ -184,4 +245,61 @@ class TestArchIngestTitle:
         count = arch.ingest_title("data/uscode/usc26.xml")
 
         assert count == 2
-        assert mock_storage.store_section.call_count == 2
+        mock_storage.store_sections.assert_called_once()
+        mock_parser_cls.assert_called_once_with("data/uscode/usc26.xml", streaming=True)
+
+    @patch("atlas.parsers.us.statutes.USLMParser")
+    def test_ingest_title_reports_progress(self, mock_parser_cls, capsys):
+        mock_storage = MagicMock()
+        mock_storage.store_sections.side_effect = lambda sections: len(list(sections))
+        mock_parser = mock_parser_cls.return_value
+        mock_parser.get_title_number.return_value = 26
+        mock_parser.get_title_name.return_value = "Internal Revenue Code"
+        mock_parser.iter_sections.return_value = [
+            _make_section(citation=Citation(title=26, section=str(i))) for i in range(100)
+        ]
+
+        count = Arch(storage=mock_storage).ingest_title("data/uscode/usc26.xml")
+
+        assert count == 100
+        assert "Processed 100 sections" in capsys.readouterr().out
+
+
+class TestArchIngestTitles:
+    def test_ingest_titles_writes_chunks(self, tmp_path):
+        from atlas.parsers.us.statutes import ParsedChunk
+        from atlas.storage.sqlite import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "atlas.db")
+        chunks = [
+            ParsedChunk("usc26.xml", 26, "Internal Revenue Code", [_make_section()]),
+            ParsedChunk("usc99.xml", None, None, [], final=True, error="bad XML"),
+            ParsedChunk(
+                "usc26.xml",
+                26,
+                "Internal Revenue Code",
+                [_make_section(citation=Citation(title=26, section="32A"))],
+                final=True,
+                count=2,
+            ),
+        ]
+
+        with patch("atlas.parsers.us.statutes.iter_titles_parallel", return_value=(c for c in chunks)):
+            count = Arch(storage=storage).ingest_titles(["usc26.xml", "usc99.xml"], workers=2)
+
+        assert count == 2
+        assert [(t.number, t.section_count) for t in storage.list_titles()] == [(26, 2)]
+        assert len(storage.search("tax")) == 2
+
+    def test_ingest_titles_other_backend(self):
+        from atlas.parsers.us.statutes import ParsedChunk
+
+        mock_storage = MagicMock()
+        mock_storage.store_sections.return_value = 1
+        chunks = [ParsedChunk("usc5.xml", 5, "Government", [_make_section()], final=True, count=1)]
+
+        with patch("atlas.parsers.us.statutes.iter_titles_parallel", return_value=(c for c in chunks)):
+            count = Arch(storage=mock_storage).ingest_titles(["usc5.xml"])
+
+        assert count == 1
+        mock_storage.update_title_metadata.assert_called_once_with(5, "Government", True)
@@ -172,6 +172,94 @@ class TestEncodeCommand:
         assert "citation" in result.output.lower() or "encode" in result.output.lower()
 
 
+class TestSupabaseLoadCommands:
+    @patch("atlas.ingest.SupabaseIngestor")
+    def test_sb_ingest_copy(self, mock_ingestor_cls, tmp_path):
+        ingestor = mock_ingestor_cls.return_value.__enter__.return_value
+        ingestor.ingest_all_usc.return_value = 42
+
+        result = CliRunner().invoke(
+            main,
+            ["sb-ingest", "-t", "26", "--input-dir", str(tmp_path), "--copy"],
+            env={"COSILICO_SUPABASE_DB_URL": "postgresql://db"},
+        )
+
+        assert result.exit_code == 0
+        assert "42 rules" in result.output
+        mock_ingestor_cls.assert_called_once_with(db_url="postgresql://db")
+        ingestor.ingest_all_usc.assert_called_once_with(
+            uscode_path=tmp_path, titles=[26], workers=None
+        )
+
+    def test_sb_ingest_copy_requires_db_url(self, tmp_path):
+        result = CliRunner().invoke(
+            main,
+            ["sb-ingest", "--input-dir", str(tmp_path), "--copy"],
+            env={"COSILICO_SUPABASE_DB_URL": ""},
+        )
+        assert result.exit_code != 0
+        assert "--db-url" in result.output
+
+    @patch("atlas.storage.supabase.SupabaseStorage")
+    @patch("atlas.sources.base.load_source")
+    def test_sb_store_no_copy(self, mock_load_source, mock_storage_cls):
+        mock_storage_cls.return_value.batch_store.return_value = 3
+
+        result = CliRunner().invoke(
+            main, ["sb-store", "us-ca", "-c", "RTC", "--no-copy", "--db-url", "postgresql://db"]
+        )
+
+        assert result.exit_code == 0
+        assert "3 statutes" in result.output
+        source = mock_load_source.return_value
+        source.download_jurisdiction.assert_called_once_with(
+            codes=["RTC"], max_sections_per_code=None
+        )
+        mock_storage_cls.return_value.batch_store.assert_called_once_with(
+            source.download_jurisdiction.return_value, copy=False
+        )
+
+    @patch("atlas.storage.supabase.SupabaseStorage")
+    @patch("atlas.sources.base.load_source")
+    def test_sb_store_http_cache(self, mock_load_source, mock_storage_cls, tmp_path):
+        from atlas.http_cache import HTTPCache
+
+        mock_storage_cls.return_value.batch_store.return_value = 0
+
+        result = CliRunner().invoke(
+            main,
+            ["sb-store", "us-ca", "--db-url", "postgresql://db", "--http-cache", str(tmp_path)],
+        )
+
+        assert result.exit_code == 0
+        http_cache = mock_load_source.call_args.kwargs["http_cache"]
+        assert isinstance(http_cache, HTTPCache)
+        assert http_cache.root == tmp_path
+        mock_load_source.return_value.close.assert_called_once()
+
+
+class TestR2SyncCommand:
+    @patch("atlas.storage.r2.get_r2_rules_xml")
+    def test_r2_sync(self, mock_get_r2, tmp_path):
+        r2 = mock_get_r2.return_value
+        r2.bucket = "rules-xml"
+        r2.iter_prefix_sharded.return_value = iter(
+            [{"Key": "s/ak/1.xml", "Size": 10, "ETag": '"a"'}]
+        )
+        manifest_path = tmp_path / "manifest.db"
+
+        result = CliRunner().invoke(
+            main,
+            ["r2-sync", "s/", "--bucket", "rules-xml", "--manifest", str(manifest_path)],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Added: 1" in result.output
+        assert "Previous sync: never" in result.output
+        r2.iter_prefix_sharded.assert_called_once_with("s/", workers=8)
+        assert manifest_path.exists()
+
+
 class TestValidateCommand:
     def test_validate_help(self):
         runner = CliRunner()
@@ -187,12 +275,92 @@ class TestDownloadCommand:
         assert "title" in result.output.lower() or "download" in result.output.lower()
 
 
+class TestExportCommand:
+    @patch("atlas.cli.Arch")
+    def test_export_ndjson(self, mock_arch_cls, tmp_path):
+        mock_arch_cls.return_value.export_title.return_value = iter([_make_section()])
+        output = tmp_path / "out.ndjson"
+
+        result = CliRunner().invoke(main, ["export", "--title", "26", "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert "Exported 1 sections" in result.output
+        assert Section.model_validate_json(output.read_text()).citation.section == "32"
+        mock_arch_cls.return_value.export_title.assert_called_once_with(26, text_only=False)
+
+    @patch("atlas.cli.Arch")
+    def test_export_default_gzip_path(self, mock_arch_cls, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        mock_arch_cls.return_value.export_title.return_value = iter([_make_section()])
+
+        result = CliRunner().invoke(main, ["export", "-t", "26", "--gzip"])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "usc26.ndjson.gz").exists()
+
+    @patch("atlas.cli.Arch")
+    def test_export_empty_title(self, mock_arch_cls, tmp_path):
+        mock_arch_cls.return_value.export_title.return_value = iter([])
+
+        result = CliRunner().invoke(
+            main, ["export", "-t", "99", "-o", str(tmp_path / "out.ndjson")]
+        )
+
+        assert result.exit_code == 1
+        assert not (tmp_path / "out.ndjson").exists()
+
+    @patch("atlas.cli.Arch")
+    def test_export_parquet_missing_pyarrow(self, mock_arch_cls, tmp_path):
+        mock_arch_cls.return_value.export_title.return_value = iter([_make_section()])
+
+        with patch("atlas.export.write_parquet", side_effect=ImportError("needs pyarrow")):
+            result = CliRunner().invoke(
+                main, ["export", "-t", "26", "--format", "parquet", "-o", str(tmp_path / "x")]
+            )
+
+        assert result.exit_code != 0
+        assert "needs pyarrow" in result.output
+
+
 class TestIngestCommand:
     def test_ingest_help(self):
         runner = CliRunner()
         result = runner.invoke(main, ["ingest", "--help"])
         assert result.exit_code == 0
 
+    @patch("atlas.cli.Arch")
+    def test_ingest_single_title(self, mock_arch_cls, tmp_path):
+        xml_path = tmp_path / "usc26.xml"
+        xml_path.write_text("<uscDoc/>")
+        mock_arch_cls.return_value.ingest_title.return_value = 5
+
+        result = CliRunner().invoke(main, ["ingest", str(xml_path)])
+
+        assert result.exit_code == 0
+        assert "5 sections" in result.output
+        mock_arch_cls.return_value.ingest_title.assert_called_once_with(xml_path)
+
+    @patch("atlas.cli.Arch")
+    def test_ingest_all_uses_workers(self, mock_arch_cls, tmp_path):
+        for n in (1, 26):
+            (tmp_path / f"usc{n}.xml").write_text("<uscDoc/>")
+        mock_arch_cls.return_value.ingest_titles.return_value = 12
+
+        result = CliRunner().invoke(
+            main, ["ingest", "--all", "--input-dir", str(tmp_path), "--workers", "4"]
+        )
+
+        assert result.exit_code == 0
+        assert "12 sections" in result.output
+        mock_arch_cls.return_value.ingest_titles.assert_called_once_with(
+            [tmp_path / "usc1.xml", tmp_path / "usc26.xml"], workers=4
+        )
+
+    def test_ingest_requires_paths(self, tmp_path):
+        result = CliRunner().invoke(main, ["ingest", "--all", "--input-dir", str(tmp_path)])
+        assert result.exit_code != 0
+        assert "--all" in result.output
+
 
 class TestValidateCommand:
     def test_validate_passing(self, tmp_path):
@@ -12,7 +12,10 @@ from atlas.crawl import (
     R2_BUCKET,
     R2_ENDPOINT,
     SECTION_PATTERNS,
+    StateCrawler,
+    iter_page_links,
 )
+from atlas.sources.base import SourceConfig
 
 
 class TestConstants:
@@ -73,3 +76,38 @@ class TestCrawlStatsDataclass:
         pattern = SECTION_PATTERNS.get("us-fl")
         if pattern:
             assert re.search(pattern, "/statutes/220.02")
+
+
+class TestLinkDiscovery:
+    def _crawler(self):
+        config = SourceConfig(
+            jurisdiction="us-oh",
+            name="Ohio",
+            source_type="html",
+            base_url="https://codes.ohio.gov",
+        )
+        return StateCrawler(config, delay_between_requests=0)
+
+    def test_iter_page_links(self):
+        html = (
+            '<ul><li><a href="/chapter-1"> Chapter <b>1</b> </a></li>'
+            '<li><a name="top">no href</a></li><li><a href="">empty</a></li></ul>'
+        )
+        assert list(iter_page_links(html)) == [("/chapter-1", "Chapter 1")]
+
+    def test_iter_page_links_empty_page(self):
+        assert list(iter_page_links("  ")) == []
+
+    def test_iter_page_links_with_encoding_declaration(self):
+        html = '<?xml version="1.0" encoding="ISO-8859-1"?><html><a href="/s">Título</a></html>'
+        assert list(iter_page_links(html)) == [("/s", "Título")]
+
+    def test_section_pattern_compiled_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            "atlas.crawl.get_section_pattern", lambda j: calls.append(j) or None
+        )
+        crawler = self._crawler()
+        assert crawler._is_section_url("https://codes.ohio.gov/section-5747.02")
+        assert not crawler._is_section_url("https://codes.ohio.gov/about")
+        assert calls == ["us-oh"]
@@ -0,0 +1,193 @@
+"""Tests for the durable crawl frontier and resumable StateCrawler runs.
+
+HTTP is served by an httpx.MockTransport; uploads are recorded in memory.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from atlas.crawl import StateCrawler, open_frontier
+from atlas.crawl_frontier import FAILED, FETCHED, UPLOADED, CrawlFrontier
+from atlas.sources.base import SourceConfig
+
+PAGES = {
+    "/code/rc": '<a href="/section-1">1</a><a href="/section-2">2</a>'
+    '<a href="/chapter-2">Chapter 2</a>',
+    "/chapter-2": '<a href="/section-3">3</a>',
+    "/section-1": "<p>one</p>",
+    "/section-2": "<p>two</p>",
+    "/section-3": "<p>three</p>",
+}
+
+
+def _config():
+    return SourceConfig(
+        jurisdiction="us-zz",
+        name="Testland",
+        source_type="html",
+        base_url="https://law.test",
+        toc_url_pattern="/code/{code}",
+        codes={"rc": "Revised Code"},
+    )
+
+
+def _run(crawler, requested, max_sections=None):
+    def handler(request):
+        requested.append(request.url.path)
+        body = PAGES.get(request.url.path)
+        return httpx.Response(200, text=body) if body else httpx.Response(404)
+
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    with patch("atlas.crawl.httpx.AsyncClient", client):
+        return asyncio.run(crawler.crawl(max_sections))
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    f = CrawlFrontier(tmp_path / "frontier.db", "us-zz")
+    yield f
+    f.close()
+
+
+class TestCrawlFrontier:
+    def test_pages_and_sections(self, frontier):
+        frontier.add_pages([("https://a/toc", 0), ("https://a/ch1", 1)])
+        frontier.mark_crawled("https://a/toc")
+        frontier.add_sections(["https://a/s1", "https://a/s2"])
+        frontier.mark("https://a/s1", UPLOADED)
+        frontier.mark("https://a/s2", FAILED)
+
+        assert frontier.crawled_pages() == {"https://a/toc"}
+        assert frontier.pending_pages() == [("https://a/ch1", 1)]
+        assert frontier.remaining_sections() == ["https://a/s2"]
+        assert frontier.counts() == {UPLOADED: 1, FAILED: 1}
+
+    def test_rediscovery_keeps_status(self, frontier):
+        frontier.add_sections(["https://a/s1"])
+        frontier.mark("https://a/s1", UPLOADED)
+        frontier.add_sections(["https://a/s1"])
+        assert frontier.remaining_sections() == []
+
+    def test_open_frontier_resets_unless_resuming(self, tmp_path):
+        path = tmp_path / "f.db"
+        first = open_frontier("us-zz", path, resume=False)
+        first.add_sections(["https://a/s1"])
+        first.mark_discovery_complete()
+        first.close()
+
+        resumed = open_frontier("us-zz", path, resume=True)
+        assert resumed.discovery_complete()
+        resumed.close()
+
+        fresh = open_frontier("us-zz", path, resume=False)
+        assert not fresh.discovery_complete()
+        assert fresh.section_urls() == []
+        fresh.close()
+        assert open_frontier("us-zz", None, resume=True) is None
+
+
+class TestResumableCrawl:
+    def test_crawl_records_progress(self, frontier):
+        crawler = StateCrawler(_config(), delay_between_requests=0, frontier=frontier)
+        uploaded = []
+        crawler.upload_to_r2 = lambda url, html: uploaded.append(url) or True
+
+        stats = _run(crawler, [])
+
+        assert stats.sections_fetched == 3
+        assert len(uploaded) == 3
+        assert frontier.discovery_complete()
+        assert frontier.counts() == {UPLOADED: 3}
+
+    def test_uploads_run_off_the_event_loop(self, frontier):
+        crawler = StateCrawler(_config(), delay_between_requests=0, frontier=frontier)
+
+        def upload(url, html):
+            with pytest.raises(RuntimeError):
+                asyncio.get_running_loop()  # Only a worker thread has no loop
+            return True
+
+        crawler.upload_to_r2 = upload
+
+        stats = _run(crawler, [])
+
+        assert stats.errors == []
+        assert frontier.counts() == {UPLOADED: 3}
+
+    def test_resume_fetches_only_missing(self, frontier):
+        crawler = StateCrawler(_config(), delay_between_requests=0, frontier=frontier)
+        crawler.upload_to_r2 = lambda url, html: not url.endswith("section-3")
+        _run(crawler, [])
+        assert frontier.remaining_sections() == ["https://law.test/section-3"]
+        assert frontier.counts()[FETCHED] == 1
+
+        requested = []
+        resumed = StateCrawler(_config(), delay_between_requests=0, frontier=frontier)
+        resumed.upload_to_r2 = lambda url, html: True
+        stats = _run(resumed, requested)
+
+        # Discovery was complete, so only the missing section is requested
+        assert requested == ["/section-3"]
+        assert stats.sections_fetched == 1
+        assert frontier.remaining_sections() == []
+
+    def test_resume_continues_discovery(self, frontier):
+        # A previous run crawled the TOC but stopped before chapter 2
+        frontier.add_pages([("https://law.test/code/rc", 0), ("https://law.test/chapter-2", 1)])
+        frontier.mark_crawled("https://law.test/code/rc")
+        frontier.add_sections(["https://law.test/section-1", "https://law.test/section-2"])
+
+        requested = []
+        crawler = StateCrawler(_config(), delay_between_requests=0, frontier=frontier)
+        crawler.upload_to_r2 = lambda url, html: True
+        stats = _run(crawler, requested)
+
+        assert "/code/rc" not in requested
+        assert "/chapter-2" in requested
+        assert stats.sections_discovered == 3
+        assert frontier.counts() == {UPLOADED: 3}
+
+    def test_dry_run_does_not_mark_uploaded(self, frontier):
+        crawler = StateCrawler(
+            _config(), dry_run=True, delay_between_requests=0, frontier=frontier
+        )
+        _run(crawler, [])
+        assert frontier.counts() == {FETCHED: 3}
+
+
+class TestStreamingCrawl:
+    def test_discovery_reports_sections_as_found(self):
+        crawler = StateCrawler(_config(), delay_between_requests=0)
+        found = []
+
+        async def on_section(url):
+            found.append(url)
+
+        async def discover():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await crawler.discover_sections(client, on_section=on_section)
+
+        def handler(request):
+            body = PAGES.get(request.url.path)
+            return httpx.Response(200, text=body) if body else httpx.Response(404)
+
+        sections = asyncio.run(discover())
+        assert sorted(found) == sorted(sections)
+        assert len(found) == 3
+
+    def test_max_sections_stops_fetching(self):
+        crawler = StateCrawler(_config(), delay_between_requests=0)
+        uploaded = []
+        crawler.upload_to_r2 = lambda url, html: uploaded.append(url) or True
+
+        stats = _run(crawler, [], max_sections=2)
+
+        assert stats.sections_fetched == 2
+        assert len(uploaded) == 2
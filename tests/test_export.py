@@ -0,0 +1,92 @@
+"""Tests for bulk section export."""
+
+import gzip
+import json
+import sys
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from atlas.export import gzip_stream, iter_ndjson, section_record, write_ndjson, write_parquet
+from atlas.models import Citation, Section, Subsection
+
+
+def _section(num: str) -> Section:
+    return Section(
+        citation=Citation(title=26, section=num),
+        title_name="Internal Revenue Code",
+        section_title=f"Section {num}",
+        text="Text",
+        subsections=[Subsection(identifier="a", text="Allowance")],
+        source_url="https://uscode.house.gov",
+        retrieved_at=date(2024, 1, 1),
+    )
+
+
+class TestNdjson:
+    def test_one_line_per_section(self):
+        lines = list(iter_ndjson([_section("1"), _section("2")]))
+
+        assert len(lines) == 2
+        assert all(line.endswith(b"\n") for line in lines)
+        assert Section.model_validate_json(lines[1]).citation.section == "2"
+
+    def test_gzip_stream_round_trips(self):
+        chunks = [b"first\n", b"", b"second\n"]
+        assert gzip.decompress(b"".join(gzip_stream(chunks))) == b"first\nsecond\n"
+
+    def test_write_ndjson(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+        assert write_ndjson([_section("1"), _section("2")], path) == 2
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_write_ndjson_gzip(self, tmp_path):
+        path = tmp_path / "out.ndjson.gz"
+        assert write_ndjson([_section("1")], path, compress=True) == 1
+        assert json.loads(gzip.decompress(path.read_bytes()))["section_title"] == "Section 1"
+
+
+class TestParquet:
+    def test_section_record(self):
+        record = section_record(_section("32"))
+
+        assert record["citation"] == "26 USC 32"
+        assert record["title"] == 26
+        assert json.loads(record["subsections_json"])[0]["text"] == "Allowance"
+
+    def test_write_parquet_without_pyarrow(self, tmp_path):
+        with patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}):
+            with pytest.raises(ImportError, match="atlas\\[parquet\\]"):
+                write_parquet([_section("1")], tmp_path / "out.parquet")
+
+    def test_write_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        assert write_parquet([_section(str(i)) for i in range(5)], path, batch_size=2) == 5
+        table = pq.read_table(path)
+        assert table.num_rows == 5
+        assert table.column("section").to_pylist() == ["0", "1", "2", "3", "4"]
+
+    def test_write_parquet_round_trips_fields(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+        section = _section("32").model_copy(
+            update={"public_laws": ["Pub. L. 95-600"], "references_to": ["26 USC 1"]}
+        )
+
+        assert write_parquet([section], path) == 1
+        (row,) = pq.read_table(path).to_pylist()
+        assert row["citation"] == "26 USC 32"
+        assert row["public_laws"] == ["Pub. L. 95-600"]
+        assert row["references_to"] == ["26 USC 1"]
+        assert row["retrieved_at"] == section.retrieved_at
+        assert json.loads(row["subsections_json"])[0]["text"] == "Allowance"
+
+    def test_write_parquet_empty(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        assert write_parquet([], path) == 0
+        assert pq.read_table(path).num_rows == 0
@@ -0,0 +1,252 @@
+"""Tests for conditional HTTP revalidation (ETag / Last-Modified)."""
+
+import asyncio
+import gzip
+import threading
+from unittest.mock import patch
+
+import httpx
+
+from atlas.crawl import StateCrawler
+from atlas.http_cache import HTTPCache, is_revalidated
+from atlas.sources.base import SourceConfig
+
+
+class FakeServer:
+    """Serves one page with an ETag, answering conditional requests with 304."""
+
+    def __init__(self, body=b"<p>statute</p>", etag='"v1"', last_modified=None):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.etag and request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        if self.last_modified and request.headers.get("if-modified-since") == self.last_modified:
+            return httpx.Response(304)
+        headers = {"content-type": "text/html"}
+        if self.etag:
+            headers["etag"] = self.etag
+        if self.last_modified:
+            headers["last-modified"] = self.last_modified
+        return httpx.Response(200, headers=headers, content=self.body)
+
+
+def _client(cache, server):
+    return httpx.Client(transport=cache.transport(httpx.MockTransport(server)))
+
+
+class TestHTTPCache:
+    def test_second_request_is_revalidated(self):
+        cache = HTTPCache()
+        server = FakeServer()
+        client = _client(cache, server)
+
+        first = client.get("https://law.test/s/1")
+        second = client.get("https://law.test/s/1")
+
+        assert not is_revalidated(first)
+        assert is_revalidated(second)
+        assert second.status_code == 200
+        assert second.text == "<p>statute</p>"
+        assert server.requests[1].headers["if-none-match"] == '"v1"'
+        assert cache.stats() == {"requests": 2, "revalidated": 1, "stored": 1}
+
+    def test_changed_page_is_refreshed(self):
+        cache = HTTPCache()
+        server = FakeServer()
+        client = _client(cache, server)
+        client.get("https://law.test/s/1")
+
+        server.body, server.etag = b"<p>amended</p>", '"v2"'
+        response = client.get("https://law.test/s/1")
+
+        assert not is_revalidated(response)
+        assert response.text == "<p>amended</p>"
+        assert cache.get("https://law.test/s/1").etag == '"v2"'
+
+    def test_last_modified(self):
+        cache = HTTPCache()
+        server = FakeServer(etag=None, last_modified="Tue, 01 Sep 2026 00:00:00 GMT")
+        client = _client(cache, server)
+        client.get("https://law.test/s/1")
+
+        assert is_revalidated(client.get("https://law.test/s/1"))
+        assert "if-none-match" not in server.requests[1].headers
+
+    def test_responses_without_validators_are_not_stored(self):
+        cache = HTTPCache()
+        server = FakeServer(etag=None)
+        client = _client(cache, server)
+        client.get("https://law.test/s/1")
+        client.get("https://law.test/s/1")
+
+        assert "if-modified-since" not in server.requests[1].headers
+        assert cache.stats()["stored"] == 0
+
+    def test_page_losing_validators_is_evicted(self, tmp_path):
+        cache = HTTPCache(tmp_path)
+        server = FakeServer()
+        client = _client(cache, server)
+        client.get("https://law.test/s/1")
+
+        server.body, server.etag = b"<p>amended</p>", None
+        assert client.get("https://law.test/s/1").text == "<p>amended</p>"
+
+        assert cache.get("https://law.test/s/1") is None
+        assert HTTPCache(tmp_path).get("https://law.test/s/1") is None
+
+    def test_memory_cache_is_bounded(self):
+        cache = HTTPCache(memory_size=1)
+        client = _client(cache, FakeServer())
+        client.get("https://law.test/s/1")
+        client.get("https://law.test/s/2")
+
+        assert cache.get("https://law.test/s/1") is None
+        assert cache.get("https://law.test/s/2") is not None
+
+    def test_non_get_requests_pass_through(self):
+        cache = HTTPCache()
+        server = FakeServer()
+        client = _client(cache, server)
+
+        assert client.post("https://law.test/s/1").status_code == 200
+        assert cache.stats() == {"requests": 0, "revalidated": 0, "stored": 0}
+
+    def test_caller_revalidation_is_left_alone(self):
+        cache = HTTPCache()
+        server = FakeServer()
+        client = _client(cache, server)
+
+        response = client.get("https://law.test/s/1", headers={"If-None-Match": '"v1"'})
+
+        assert response.status_code == 304
+        assert cache.stats()["requests"] == 0
+
+    def test_async_transport(self):
+        cache = HTTPCache()
+        server = FakeServer()
+
+        async def fetch():
+            transport = cache.async_transport(httpx.MockTransport(server))
+            async with httpx.AsyncClient(transport=transport) as client:
+                await client.get("https://law.test/s/1")
+                posted = await client.post("https://law.test/s/1")
+                return posted, await client.get("https://law.test/s/1")
+
+        posted, revalidated = asyncio.run(fetch())
+        assert posted.status_code == 200
+        assert is_revalidated(revalidated)
+
+    def test_async_transport_keeps_disk_io_off_the_event_loop(self, tmp_path):
+        cache = HTTPCache(tmp_path)
+        loop_thread = []
+        io_threads = []
+        prepare, finish = cache.prepare, cache.finish
+
+        def record(method):
+            def wrapper(*args):
+                io_threads.append(threading.get_ident())
+                return method(*args)
+
+            return wrapper
+
+        async def fetch():
+            loop_thread.append(threading.get_ident())
+            transport = cache.async_transport(httpx.MockTransport(FakeServer()))
+            async with httpx.AsyncClient(transport=transport) as client:
+                await client.get("https://law.test/s/1")
+
+        with patch.object(cache, "prepare", record(prepare)), patch.object(cache, "finish", record(finish)):
+            asyncio.run(fetch())
+        assert len(io_threads) == 2
+        assert loop_thread[0] not in io_threads
+
+    def test_close_closes_inner_transport(self):
+        inner = httpx.MockTransport(FakeServer())
+        with patch.object(inner, "close") as close:
+            HTTPCache().transport(inner).close()
+        close.assert_called_once()
+
+    def test_compressed_body_stored_decoded(self):
+        cache = HTTPCache()
+
+        def server(request):
+            if request.headers.get("if-none-match") == '"gz"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                headers={"etag": '"gz"', "content-encoding": "gzip"},
+                content=gzip.compress(b"<p>zipped</p>"),
+            )
+
+        client = _client(cache, server)
+        assert client.get("https://law.test/gz").text == "<p>zipped</p>"
+        assert client.get("https://law.test/gz").text == "<p>zipped</p>"
+
+    def test_persists_to_disk(self, tmp_path):
+        server = FakeServer()
+        _client(HTTPCache(tmp_path), server).get("https://law.test/s/1")
+
+        response = _client(HTTPCache(tmp_path), server).get("https://law.test/s/1")
+        assert is_revalidated(response)
+        assert response.text == "<p>statute</p>"
+
+    def test_install_replaces_lazy_client(self):
+        class Converter:
+            def __init__(self):
+                self._client = None
+
+            @property
+            def client(self):
+                if self._client is None:
+                    self._client = httpx.Client(headers={"User-Agent": "Arch/1.0"}, timeout=60.0)
+                return self._client
+
+        converter = Converter()
+        assert HTTPCache().install(converter)
+        assert converter.client.headers["User-Agent"] == "Arch/1.0"
+        assert converter.client.timeout.read == 60.0
+        assert not HTTPCache().install(object())
+
+        class AsyncOwner:
+            _client = None
+            client = httpx.AsyncClient()
+
+        assert not HTTPCache().install(AsyncOwner())
+
+
+class TestCrawlerRevalidation:
+    def test_not_modified_counted_in_stats(self):
+        pages = {
+            "/code/rc": FakeServer(body=b'<a href="/section-1">1</a>', etag=None),
+            "/section-1": FakeServer(),
+        }
+        config = SourceConfig(
+            jurisdiction="us-zz",
+            name="Testland",
+            source_type="html",
+            base_url="https://law.test",
+            toc_url_pattern="/code/{code}",
+            codes={"rc": "Revised Code"},
+        )
+        transport = httpx.MockTransport(lambda request: pages[request.url.path](request))
+        cache = HTTPCache()
+
+        def crawl():
+            crawler = StateCrawler(
+                config, dry_run=True, delay_between_requests=0, http_cache=cache
+            )
+            with patch("atlas.http_cache.httpx.AsyncHTTPTransport", return_value=transport):
+                return asyncio.run(crawler.crawl())
+
+        first, second = crawl(), crawl()
+
+        assert first.sections_not_modified == 0
+        assert second.sections_fetched == 1
+        assert second.sections_not_modified == 1
+        assert second.bytes_fetched == 0
+
@@ -0,0 +1,216 @@
+"""Tests for the SupabaseIngestor upload path.
+
+PostgREST is served by an httpx.MockTransport, so no network is used.
+"""
+
+import json
+import threading
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from atlas.ingest.supabase import SupabaseIngestor
+from atlas.models import Citation, Section
+
+
+def _rule(n: int, body: str = "text") -> dict:
+    return {"citation_path": f"us/statute/26/{n}", "body": body}
+
+
+def _ingestor(handler, **kwargs) -> SupabaseIngestor:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return SupabaseIngestor(url="https://proj.supabase.co", key="k", client=client, **kwargs)
+
+
+class TestUpsertStream:
+    def test_batches_by_payload_bytes(self):
+        posted = []
+        lock = threading.Lock()
+
+        def handler(request):
+            with lock:
+                posted.append(json.loads(request.content))
+            return httpx.Response(201)
+
+        ingestor = _ingestor(handler, max_batch_bytes=400)
+        rules = [_rule(i, body="x" * 100) for i in range(6)]
+
+        assert ingestor.upsert_stream(iter(rules), progress=False) == 6
+        assert len(posted) == 3
+        assert all(len(batch) == 2 for batch in posted)
+        assert posted[0][0]["line_count"] == 1
+
+    def test_batch_size_caps_rows(self):
+        posted = []
+
+        def handler(request):
+            posted.append(len(json.loads(request.content)))
+            return httpx.Response(201)
+
+        ingestor = _ingestor(handler, max_in_flight=1)
+        assert ingestor.upsert_stream((_rule(i) for i in range(5)), batch_size=2) == 5
+        assert posted == [2, 2, 1]
+
+    def test_sends_upsert_headers(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(201)
+
+        _ingestor(handler)._upsert_rules([_rule(1)])
+
+        request = seen[0]
+        assert request.url == "https://proj.supabase.co/rest/v1/rules"
+        assert request.headers["Content-Profile"] == "arch"
+        assert "resolution=merge-duplicates" in request.headers["Prefer"]
+
+    def test_retries_429_with_retry_after(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(201)
+
+        with patch("atlas.ingest.supabase.time.sleep") as sleep:
+            assert _ingestor(handler)._upsert_rules([_rule(1)]) == 1
+        sleep.assert_called_once_with(7.0)
+        assert len(calls) == 2
+
+    def test_retries_dropped_connections(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.RemoteProtocolError("connection reset", request=request)
+            return httpx.Response(201)
+
+        with patch("atlas.ingest.supabase.time.sleep") as sleep:
+            assert _ingestor(handler)._upsert_rules([_rule(1)]) == 1
+        sleep.assert_called_once_with(1)
+        assert len(calls) == 2
+
+    def test_client_error_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _ingestor(handler).upsert_stream([_rule(1)], progress=False)
+        assert len(calls) == 1
+
+    def test_reuses_owned_client_until_closed(self):
+        with patch("atlas.ingest.supabase.httpx.Client") as client_cls:
+            client_cls.return_value.post.return_value = httpx.Response(
+                201, request=httpx.Request("POST", "https://proj.supabase.co")
+            )
+            with SupabaseIngestor(url="https://proj.supabase.co", key="k") as ingestor:
+                ingestor._upsert_rules([_rule(1)])
+                ingestor._upsert_rules([_rule(2)])
+            client_cls.assert_called_once()
+            client_cls.return_value.close.assert_called_once()
+
+    def test_repeated_id_keeps_last_row_in_batch(self):
+        posted = []
+
+        def handler(request):
+            posted.append(json.loads(request.content))
+            return httpx.Response(201)
+
+        rules = [_rule(1, body="old"), _rule(2), _rule(1, body="new")]
+        assert _ingestor(handler).upsert_stream(rules, progress=False) == 2
+        assert [(row["citation_path"], row["body"]) for row in posted[0]] == [
+            ("us/statute/26/2", "text"),
+            ("us/statute/26/1", "new"),
+        ]
+
+    def test_repeated_id_across_batches_is_written_last(self):
+        table = {}
+        old_posted = threading.Event()
+
+        def handler(request):
+            rows = json.loads(request.content)
+            if rows[0]["body"] == "old":
+                # A concurrent post of the later row would land first
+                old_posted.wait(0.2)
+            for row in rows:
+                table[row["citation_path"]] = row["body"]
+            if rows[0]["body"] == "new":
+                old_posted.set()
+            return httpx.Response(201)
+
+        ingestor = _ingestor(handler, max_in_flight=4)
+        rules = [_rule(1, body="old"), _rule(2), _rule(1, body="new")]
+        assert ingestor.upsert_stream(rules, batch_size=1, progress=False) == 3
+        assert table == {"us/statute/26/1": "new", "us/statute/26/2": "text"}
+
+    def test_usc_ingest_dedupes_repeated_section(self, tmp_path):
+        (tmp_path / "usc26.xml").write_text("<uscDoc/>")
+        posted = []
+
+        def handler(request):
+            posted.append(json.loads(request.content))
+            return httpx.Response(201)
+
+        def section(text):
+            return Section(
+                citation=Citation(title=26, section="1"),
+                title_name="Internal Revenue Code",
+                section_title="Tax imposed",
+                text=text,
+                subsections=[],
+                source_url="https://uscode.house.gov",
+                retrieved_at=date.today(),
+            )
+
+        ingestor = _ingestor(handler)
+        with patch("atlas.ingest.supabase.USLMParser") as parser_cls:
+            parser_cls.return_value.iter_sections.return_value = iter(
+                [section("first"), section("second")]
+            )
+            assert ingestor.ingest_usc_title(26, tmp_path) == 1
+        assert len(posted) == 1
+        assert [row["body"] for row in posted[0]] == ["second"]
+
+    def test_state_ingest_dedupes_across_sections(self, tmp_path):
+        xml_path = tmp_path / "oh.xml"
+        xml_path.write_text("<lawDoc/>")
+        posted = []
+
+        def handler(request):
+            posted.extend(row["citation_path"] for row in json.loads(request.content))
+            return httpx.Response(201)
+
+        ingestor = _ingestor(handler)
+        sections = ["s1", "s2"]
+        with (
+            patch("atlas.ingest.supabase.USLMParser") as parser_cls,
+            patch.object(
+                ingestor,
+                "_state_section_to_rules",
+                side_effect=lambda section, state: iter([_rule(1), _rule(2)]),
+            ),
+        ):
+            parser_cls.return_value.iter_sections.return_value = iter(sections)
+            assert ingestor.ingest_state_uslm(xml_path, "oh") == 2
+        assert sorted(posted) == ["us/statute/26/1", "us/statute/26/2"]
+
+
+class TestCopyMode:
+    def test_db_url_loads_with_copy(self):
+        with patch("atlas.ingest.supabase.PostgresBulkLoader") as loader_cls:
+            loader_cls.return_value.load.side_effect = lambda table, rows, **kw: len(list(rows))
+            with SupabaseIngestor(db_url="postgresql://test") as ingestor:
+                assert ingestor.key is None
+                assert ingestor.upsert_stream([_rule(1, body="a\nb")], progress=False) == 1
+            loader_cls.assert_called_once_with("postgresql://test")
+            loader_cls.return_value.close.assert_called_once()
+            rows = loader_cls.return_value.load.call_args
+            assert rows.args[0].name == "rules"
@@ -229,3 +229,71 @@ class TestSectionGetSubsection:
         """get_subsection_text returns None for missing path."""
         section = self._make_section()
         assert section.get_subsection_text("z") is None
+
+    def test_first_duplicate_identifier_wins(self):
+        """Duplicate sibling identifiers resolve to the first, as a linear scan would."""
+        from atlas.models import Subsection
+
+        section = self._make_section()
+        section.subsections.append(Subsection(identifier="a", text="Duplicate."))
+        section.subsections = list(section.subsections)
+        assert section.get_subsection("a").text == "Credit shall be allowed."
+
+    def test_index_follows_reassigned_subsections(self):
+        """Replacing the subsection list rebuilds the path index."""
+        from atlas.models import Subsection
+
+        section = self._make_section()
+        assert section.get_subsection("c") is not None
+        section.subsections = [Subsection(identifier="d", text="New.")]
+        assert section.get_subsection("c") is None
+        assert section.get_subsection("d").text == "New."
+
+
+class TestSubsectionTree:
+    """Tests for the lazily decoded SubsectionTree."""
+
+    RAW = (
+        '[{"identifier": "a", "heading": "Allowance", "text": "Allowed.", "children": '
+        '[{"identifier": "1", "heading": null, "text": "In general.", "children": []}]},'
+        ' {"identifier": "b", "heading": null, "text": "Limits.", "children": []}]'
+    )
+
+    def test_not_decoded_until_used(self):
+        from atlas.models import SubsectionTree
+
+        tree = SubsectionTree(self.RAW)
+        assert tree._nodes is None
+        assert tree.raw_json == self.RAW
+        assert [n["identifier"] for n in tree.nodes] == ["a", "b"]
+
+    def test_get_by_path(self):
+        from atlas.models import SubsectionTree
+
+        tree = SubsectionTree(self.RAW)
+        assert tree.get("a/1")["text"] == "In general."
+        assert tree.get("b")["text"] == "Limits."
+        assert tree.get("a/9") is None
+        assert tree.get("") is None
+
+    def test_get_subsection_builds_one_branch(self):
+        from atlas.models import SubsectionTree
+
+        tree = SubsectionTree(self.RAW)
+        sub = tree.get_subsection("a")
+        assert sub.heading == "Allowance"
+        assert sub.children[0].identifier == "1"
+        assert tree.get_subsection("z") is None
+
+    def test_to_subsections(self):
+        from atlas.models import SubsectionTree
+
+        subs = SubsectionTree(self.RAW).to_subsections()
+        assert [s.identifier for s in subs] == ["a", "b"]
+
+    def test_empty(self):
+        from atlas.models import SubsectionTree
+
+        tree = SubsectionTree(None)
+        assert tree.raw_json == "[]"
+        assert tree.nodes == []
@@ -8,6 +8,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from atlas.storage.r2_manifest import DEFAULT_MANIFEST_PATH
+
 try:
     from atlas.pipeline.cli import main as pipeline_main
     _IMPORT_OK = True
@@ -33,24 +35,40 @@ class TestPipelineCLI:
         with patch("sys.argv", ["cli", "--state", "ak"]):
             pipeline_main()
 
-        mock_pipeline_cls.assert_called_once_with("ak", dry_run=False)
-
-    @patch("atlas.pipeline.cli.StatePipeline")
+        mock_pipeline_cls.assert_called_once_with(
+            "ak",
+            dry_run=False,
+            fetch_cache=None,
+            skip_unchanged=False,
+            http_cache=None,
+            host_limiter=None,
+            manifest_path=DEFAULT_MANIFEST_PATH,
+        )
+
+    @patch("atlas.pipeline.cli.run_states")
     @patch("atlas.pipeline.cli.STATE_CONVERTERS", {"ak": "a", "oh": "b"})
-    def test_main_all_states(self, mock_pipeline_cls):
-        mock_pipeline = MagicMock()
-        mock_pipeline_cls.return_value = mock_pipeline
-        mock_pipeline.run.return_value = {
+    def test_main_all_states(self, mock_run_states):
+        stats = {
             "sections_found": 5,
             "raw_uploaded": 5,
             "akn_uploaded": 5,
             "errors": 0,
         }
+        mock_run_states.return_value = {"ak": stats, "oh": stats}
 
-        with patch("sys.argv", ["cli", "--all-states"]):
+        with patch("sys.argv", ["cli", "--all-states", "--workers", "4"]):
             pipeline_main()
 
-        assert mock_pipeline_cls.call_count == 2
+        mock_run_states.assert_called_once_with(
+            ["ak", "oh"],
+            workers=4,
+            dry_run=False,
+            fetch_cache=None,
+            skip_unchanged=False,
+            http_cache=None,
+            host_limiter=None,
+            manifest_path=DEFAULT_MANIFEST_PATH,
+        )
 
     @patch("atlas.pipeline.cli.StatePipeline")
     @patch("atlas.pipeline.cli.STATE_CONVERTERS", {"ak": "a"})
@@ -67,7 +85,67 @@ class TestPipelineCLI:
         with patch("sys.argv", ["cli", "--state", "ak", "--dry-run"]):
             pipeline_main()
 
-        mock_pipeline_cls.assert_called_once_with("ak", dry_run=True)
+        mock_pipeline_cls.assert_called_once_with(
+            "ak",
+            dry_run=True,
+            fetch_cache=None,
+            skip_unchanged=False,
+            http_cache=None,
+            host_limiter=None,
+            manifest_path=DEFAULT_MANIFEST_PATH,
+        )
+
+    @patch("atlas.pipeline.cli.StatePipeline")
+    def test_main_cache_dir(self, mock_pipeline_cls, tmp_path):
+        mock_pipeline_cls.return_value.run.return_value = {
+            "sections_found": 0,
+            "raw_uploaded": 0,
+            "akn_uploaded": 0,
+            "errors": 0,
+        }
+
+        with patch("sys.argv", ["cli", "--state", "ak", "--cache-dir", str(tmp_path), "--offline"]):
+            pipeline_main()
+
+        cache = mock_pipeline_cls.call_args.kwargs["fetch_cache"]
+        assert cache.root == tmp_path
+        assert cache.offline is True
+        assert cache.max_age == 24 * 60 * 60
+
+    @patch("atlas.pipeline.cli.StatePipeline")
+    def test_main_cache_max_age_and_http_cache(self, mock_pipeline_cls, tmp_path, capsys):
+        mock_pipeline_cls.return_value.run.return_value = {
+            "sections_found": 0,
+            "raw_uploaded": 0,
+            "akn_uploaded": 0,
+            "errors": 0,
+        }
+        argv = [
+            "cli",
+            "--state",
+            "ak",
+            "--cache-dir",
+            str(tmp_path / "pages"),
+            "--cache-max-age",
+            "60",
+            "--http-cache",
+            str(tmp_path / "http"),
+        ]
+
+        with patch("sys.argv", argv):
+            pipeline_main()
+
+        kwargs = mock_pipeline_cls.call_args.kwargs
+        assert kwargs["fetch_cache"].max_age == 60
+        assert kwargs["http_cache"] is not None
+        assert "HTTP cache:" in capsys.readouterr().out
+
+    @patch("builtins.print")
+    def test_main_offline_requires_cache_dir(self, mock_print):
+        with patch("sys.argv", ["cli", "--state", "ak", "--offline"]):
+            pipeline_main()
+
+        mock_print.assert_called_with("--offline requires --cache-dir")
 
     @patch("builtins.print")
     def test_main_no_args(self, mock_print):
@@ -0,0 +1,99 @@
+"""Tests for the pipeline fetch-through cache."""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from atlas.pipeline.fetch_cache import FetchCache, FetchCacheMissError
+
+
+class TestFetchCache:
+    def test_fetches_each_url_once(self):
+        cache = FetchCache()
+        fetcher = MagicMock(return_value="<html/>")
+
+        assert cache.fetch("https://example.com/a", fetcher) == "<html/>"
+        assert cache.fetch("https://example.com/a", fetcher) == "<html/>"
+
+        fetcher.assert_called_once_with("https://example.com/a")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_memory_lru_is_bounded(self):
+        cache = FetchCache(memory_size=2)
+        for url in ("a", "b", "c"):
+            cache.put(url, url)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == "c"
+
+    def test_disk_cache_survives_instances(self, tmp_path):
+        FetchCache(tmp_path).put("https://example.com/a", "text")
+        FetchCache(tmp_path).put("https://example.com/b", b"\x00bytes")
+
+        cache = FetchCache(tmp_path, offline=True)
+        assert cache.fetch("https://example.com/a", MagicMock()) == "text"
+        assert cache.fetch("https://example.com/b", MagicMock()) == b"\x00bytes"
+
+    def test_offline_miss_raises(self, tmp_path):
+        cache = FetchCache(tmp_path, offline=True)
+        fetcher = MagicMock()
+
+        with pytest.raises(FetchCacheMissError, match="example.com"):
+            cache.fetch("https://example.com/missing", fetcher)
+        fetcher.assert_not_called()
+
+    def test_non_page_results_not_cached(self):
+        cache = FetchCache()
+        fetcher = MagicMock(return_value={"result": 1})
+
+        cache.fetch("/laws", fetcher)
+        cache.fetch("/laws", fetcher)
+
+        assert fetcher.call_count == 2
+
+    def test_wrap_passes_extra_arguments_through(self):
+        cache = FetchCache()
+        fetcher = MagicMock(return_value="page")
+        cached_get = cache.wrap(fetcher)
+
+        cached_get("https://example.com/a")
+        cached_get("https://example.com/a")
+        cached_get("/laws", {"limit": 10})
+
+        assert fetcher.call_count == 2
+        fetcher.assert_called_with("/laws", {"limit": 10})
+
+    def test_wrap_offline_extra_arguments_raise(self, tmp_path):
+        cache = FetchCache(tmp_path, offline=True)
+        fetcher = MagicMock()
+
+        with pytest.raises(FetchCacheMissError, match="/laws"):
+            cache.wrap(fetcher)("/laws", {"limit": 10})
+        fetcher.assert_not_called()
+        assert cache.misses == 1
+
+    def test_stale_disk_pages_refetched_online(self, tmp_path):
+        FetchCache(tmp_path).put("https://example.com/a", "old")
+        FetchCache(tmp_path).put("https://example.com/b", b"old")
+        day_ago = time.time() - 2 * 24 * 60 * 60
+        for path in tmp_path.rglob("*.*"):
+            os.utime(path, (day_ago, day_ago))
+
+        cache = FetchCache(tmp_path, max_age=60)
+        assert cache.fetch("https://example.com/a", MagicMock(return_value="new")) == "new"
+        assert cache.fetch("https://example.com/b", MagicMock(return_value=b"new")) == b"new"
+        assert cache.misses == 2
+
+        # The refetched page replaced the stale one on disk
+        assert FetchCache(tmp_path, max_age=60).get("https://example.com/a") == "new"
+
+    def test_offline_and_unlimited_age_use_stale_pages(self, tmp_path):
+        FetchCache(tmp_path).put("https://example.com/a", "old")
+        day_ago = time.time() - 2 * 24 * 60 * 60
+        for path in tmp_path.rglob("*.txt"):
+            os.utime(path, (day_ago, day_ago))
+
+        assert FetchCache(tmp_path, offline=True, max_age=60).get("https://example.com/a") == "old"
+        assert FetchCache(tmp_path, max_age=None).get("https://example.com/a") == "old"
@@ -3,10 +3,18 @@
 from datetime import date
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from atlas.models import Citation, Section
-from atlas.pipeline.runner import STATE_CONVERTERS, StatePipeline
+from atlas.pipeline.runner import (
+    STATE_CONVERTERS,
+    StatePipeline,
+    run_states,
+)
+from atlas.rate_limit import HostRateLimiter, RateLimitedTransport
+from atlas.storage.r2 import R2Storage, content_md5
+from atlas.storage.r2_manifest import R2Manifest
 
 
 def _make_section(section_id="AK-43.05.010", **kwargs):
@@ -23,6 +31,12 @@ def _make_section(section_id="AK-43.05.010", **kwargs):
     return Section(**defaults)
 
 
+def _r2(bucket="atlas"):
+    """R2Storage with a mock boto3 client, so upload_many runs for real."""
+    with patch("atlas.storage.r2.boto3"):
+        return R2Storage("https://r2.example.com", "key", "secret", bucket=bucket)
+
+
 class TestStateConvertersRegistry:
     def test_has_many_states(self):
         assert len(STATE_CONVERTERS) >= 40
@@ -237,8 +251,8 @@ class TestStatePipelineRun:
         mock_rules.upload_raw.assert_not_called()
 
     def test_run_with_upload(self):
-        mock_arch = MagicMock()
-        mock_rules = MagicMock()
+        mock_arch = _r2("atlas")
+        mock_rules = _r2("rules-xml")
         pipeline = StatePipeline("ak", dry_run=False, r2_arch=mock_arch, r2_rules=mock_rules)
 
         mock_converter = MagicMock()
@@ -251,13 +265,14 @@ class TestStatePipelineRun:
             with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
                 with patch.object(pipeline, "_get_chapter_url", return_value="https://example.com"):
                     with patch.object(pipeline, "_get_sections", return_value=sections):
-                        with patch("atlas.pipeline.runner.time.sleep"):
-                            stats = pipeline.run()
+                        stats = pipeline.run()
 
         assert stats["sections_found"] == 1
         assert stats["raw_uploaded"] == 1
         assert stats["akn_uploaded"] == 1
         assert stats["errors"] == 0
+        mock_arch.client.put_object.assert_called_once()
+        mock_rules.client.put_object.assert_called_once()
 
     def test_run_converter_load_failure(self):
         mock_arch = MagicMock()
@@ -285,6 +300,259 @@ class TestStatePipelineRun:
         assert stats["sections_found"] == 0
 
 
+class TestStatePipelineRateLimit:
+    def test_default_limiter_paces_converter_client(self):
+        class FakeConverter:
+            rate_limit_delay = 0.5
+
+            def __init__(self):
+                self._client = None
+
+            @property
+            def client(self):
+                if self._client is None:
+                    self._client = httpx.Client(timeout=30)
+                return self._client
+
+        pipeline = StatePipeline("ak", r2_arch=MagicMock(), r2_rules=MagicMock())
+        pipeline.converter = FakeConverter()
+
+        pipeline._install_transports()
+
+        assert isinstance(pipeline.host_limiter, HostRateLimiter)
+        transport = pipeline.converter.client._transport
+        assert isinstance(transport, RateLimitedTransport)
+        assert transport.limiter is pipeline.host_limiter
+        # The limiter now paces requests, so the converter's own delay is off
+        assert pipeline.converter.rate_limit_delay == 0
+        pipeline.converter.client.close()
+
+    def test_fallback_fetch_waits_on_limiter(self):
+        limiter = MagicMock()
+        pipeline = StatePipeline(
+            "ak", r2_arch=MagicMock(), r2_rules=MagicMock(), host_limiter=limiter
+        )
+        pipeline.converter = object()
+
+        with patch("httpx.get") as mock_get:
+            mock_get.return_value.text = "<html/>"
+            assert pipeline._fetch_raw_html("https://ak.gov/c") == "<html/>"
+
+        limiter.wait.assert_called_once_with("https://ak.gov/c")
+
+
+class TestStatePipelineFetchCache:
+    def test_chapter_page_fetched_once(self):
+        class FakeConverter:
+            def __init__(self):
+                self.fetched = []
+
+            def _get(self, url):
+                self.fetched.append(url)
+                return "<html/>"
+
+            def iter_chapter(self, title, chapter):
+                self._get("https://ak.gov/c")
+                return [_make_section()]
+
+        converter = FakeConverter()
+        pipeline = StatePipeline("ak", dry_run=True, r2_arch=MagicMock(), r2_rules=MagicMock())
+
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    stats = pipeline.run()
+
+        assert stats["akn_uploaded"] == 1
+        assert converter.fetched == ["https://ak.gov/c"]
+        assert pipeline.fetch_cache.hits == 1
+
+
+class TestStatePipelineTransports:
+    def test_http_cache_wraps_limiter_transport(self):
+        http_cache, host_limiter = MagicMock(), MagicMock()
+        pipeline = StatePipeline(
+            "ak",
+            r2_arch=MagicMock(),
+            r2_rules=MagicMock(),
+            http_cache=http_cache,
+            host_limiter=host_limiter,
+        )
+        pipeline.converter = MagicMock()
+
+        pipeline._install_transports()
+
+        http_cache.install.assert_called_once_with(
+            pipeline.converter, host_limiter.transport.return_value
+        )
+
+
+class TestStatePipelineStages:
+    def test_uploads_run_in_stages_with_metrics(self):
+        mock_arch = _r2("atlas")
+        mock_rules = _r2("rules-xml")
+        pipeline = StatePipeline(
+            "ak", r2_arch=mock_arch, r2_rules=mock_rules, convert_workers=2, upload_workers=2
+        )
+        converter = MagicMock()
+        converter._get.return_value = "<html/>"
+        sections = [_make_section(f"AK-43.05.{i:03d}") for i in range(5)]
+
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43), ("10", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    with patch.object(pipeline, "_get_sections", return_value=sections):
+                        stats = pipeline.run()
+
+        assert stats == {
+            "sections_found": 10,
+            "raw_uploaded": 2,
+            "akn_uploaded": 10,
+            "skipped": 0,
+            "errors": 0,
+        }
+        assert mock_rules.client.put_object.call_count == 10
+        # One parse and one convert job per chapter; one upload batch per
+        # chapter and bucket
+        assert pipeline.metrics["fetch"].items == 2
+        assert pipeline.metrics["parse"].items == 2
+        assert pipeline.metrics["convert"].items == 2
+        assert pipeline.metrics["upload"].items == 4
+
+    def test_process_pool_conversion_matches_in_thread(self):
+        from atlas.pipeline.akn import section_to_akn_xml
+        from atlas.pipeline.runner import _sections_to_akn
+
+        section = _make_section()
+        expected = section_to_akn_xml(section, "ak")
+
+        assert _sections_to_akn("ak", [section.model_dump_json()]) == [(expected, None)]
+
+        mock_rules = _r2("rules-xml")
+        pipeline = StatePipeline("ak", r2_arch=_r2(), r2_rules=mock_rules, convert_workers=1)
+        converter = MagicMock()
+        converter._get.return_value = None
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    with patch.object(pipeline, "_get_sections", return_value=[section]):
+                        pipeline.run()
+
+        assert mock_rules.client.put_object.call_args[1]["Body"] == expected.encode()
+        assert pipeline._convert_pool is None
+
+    def test_upload_failures_counted(self):
+        mock_rules = _r2("rules-xml")
+        mock_rules.client.put_object.side_effect = RuntimeError("R2 down")
+        pipeline = StatePipeline("ak", r2_arch=_r2(), r2_rules=mock_rules)
+        converter = MagicMock()
+        converter._get.return_value = None
+
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    with patch.object(pipeline, "_get_sections", return_value=[_make_section()]):
+                        stats = pipeline.run()
+
+        assert stats["errors"] == 1
+        assert stats["akn_uploaded"] == 0
+
+    def test_convert_failure_keeps_rest_of_chapter(self):
+        mock_rules = _r2("rules-xml")
+        # Convert on threads so the patched section_to_akn_xml applies
+        pipeline = StatePipeline(
+            "ak", r2_arch=_r2(), r2_rules=mock_rules, convert_in_processes=False
+        )
+        converter = MagicMock()
+        converter._get.return_value = None
+        sections = [_make_section("AK-1"), _make_section("AK-2")]
+
+        def convert(section, state):
+            if section.citation.section == "AK-1":
+                raise ValueError("bad section")
+            return "<akn/>"
+
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    with patch.object(pipeline, "_get_sections", return_value=sections):
+                        with patch("atlas.pipeline.runner.section_to_akn_xml", convert):
+                            stats = pipeline.run()
+
+        assert stats["errors"] == 1
+        assert stats["akn_uploaded"] == 1
+        assert mock_rules.client.put_object.call_args[1]["Key"] == "us/statutes/states/ak/AK-2.xml"
+
+    def test_skip_unchanged_uses_persisted_manifest(self, tmp_path):
+        path = tmp_path / "manifest.db"
+        mock_arch = _r2("atlas")
+        mock_rules = _r2("rules-xml")
+        prefix = "us/statutes/states/ak/"
+        mock_rules.client.list_objects_v2.return_value = {}
+        unchanged = R2Manifest(path, "rules-xml")
+        unchanged.sync(mock_rules, prefix)
+        unchanged.record(f"{prefix}AK-1.xml", content_md5("<akn/>"), 6)
+        unchanged.close()
+        # The arch bucket's prefix was never synced, so it is listed once
+        mock_arch.client.list_objects_v2.return_value = {}
+        mock_rules.client.list_objects_v2.reset_mock()
+        pipeline = StatePipeline(
+            "ak",
+            r2_arch=mock_arch,
+            r2_rules=mock_rules,
+            skip_unchanged=True,
+            manifest_path=path,
+            convert_in_processes=False,
+        )
+        converter = MagicMock()
+        converter._get.return_value = "<html/>"
+
+        with patch.object(pipeline, "_load_converter", return_value=converter):
+            with patch.object(pipeline, "_get_chapters", return_value=[("05", 43)]):
+                with patch.object(pipeline, "_get_chapter_url", return_value="https://ak.gov/c"):
+                    with patch.object(pipeline, "_get_sections", return_value=[_make_section("AK-1")]):
+                        with patch("atlas.pipeline.runner.section_to_akn_xml", return_value="<akn/>"):
+                            stats = pipeline.run()
+
+        assert stats["raw_uploaded"] == 1
+        assert stats["akn_uploaded"] == 0
+        assert stats["skipped"] == 1
+        mock_rules.client.put_object.assert_not_called()
+        mock_rules.client.list_objects_v2.assert_not_called()
+        assert pipeline._manifests == {}
+        # The raw upload was recorded, so the next run skips it without listing
+        arch = R2Manifest(path, "atlas")
+        assert arch.last_synced(prefix) is not None
+        assert len(arch.etags(f"{prefix}raw/")) == 1
+        arch.close()
+
+
+class TestRunStates:
+    @patch("atlas.pipeline.runner.get_r2_rules_xml")
+    @patch("atlas.pipeline.runner.get_r2_atlas")
+    def test_runs_each_state_with_shared_resources(self, mock_atlas, mock_rules):
+        seen = []
+
+        def fake_run(self):
+            seen.append((self.state, self.r2_arch, self.host_limiter))
+            if self.state == "oh":
+                raise RuntimeError("boom")
+            return {"sections_found": 1, "raw_uploaded": 1, "akn_uploaded": 1, "errors": 0}
+
+        with patch.object(StatePipeline, "run", fake_run):
+            results = run_states(["ak", "oh", "ny"], workers=3)
+
+        assert list(results) == ["ak", "oh", "ny"]
+        assert results["ak"]["sections_found"] == 1
+        assert results["oh"]["errors"] == 1
+        assert {state for state, _, _ in seen} == {"ak", "oh", "ny"}
+        assert all(r2 is mock_atlas.return_value for _, r2, _ in seen)
+        limiters = {id(limiter) for _, _, limiter in seen}
+        assert len(limiters) == 1
+        assert isinstance(seen[0][2], HostRateLimiter)
+        mock_atlas.assert_called_once()
+
+
 class TestStatePipelineGetSections:
     def test_get_sections_ak(self):
         mock_arch = MagicMock()
@@ -0,0 +1,91 @@
+"""Tests for bounded pipeline stages."""
+
+import threading
+import time
+
+from atlas.pipeline.stages import Stage, StageMetrics
+
+
+class TestStage:
+    def test_handles_every_item(self):
+        seen = []
+        lock = threading.Lock()
+
+        def handler(item):
+            with lock:
+                seen.append(item)
+
+        stage = Stage("collect", handler, workers=3)
+        for i in range(20):
+            stage.put(i)
+        metrics = stage.close()
+
+        assert sorted(seen) == list(range(20))
+        assert metrics.items == 20
+        assert metrics.errors == 0
+
+    def test_chained_stages(self):
+        results = []
+        sink = Stage("sink", results.append)
+        double = Stage("double", lambda x: sink.put(x * 2), workers=2)
+        for i in range(5):
+            double.put(i)
+        double.close()
+        sink.close()
+
+        assert sorted(results) == [0, 2, 4, 6, 8]
+
+    def test_errors_are_counted_and_reported(self):
+        failures = []
+
+        def handler(item):
+            if item == "bad":
+                raise ValueError("nope")
+
+        stage = Stage("check", handler, on_error=lambda item, e: failures.append((item, str(e))))
+        stage.put("good")
+        stage.put("bad")
+        metrics = stage.close()
+
+        assert metrics.errors == 1
+        assert failures == [("bad", "nope")]
+
+    def test_full_queue_applies_backpressure(self):
+        release = threading.Event()
+        stage = Stage("slow", lambda item: release.wait(), maxsize=1)
+        stage.put(1)  # Taken by the worker, which blocks
+        stage.put(2)  # Fills the queue
+
+        threading.Timer(0.05, release.set).start()
+        stage.put(3)  # Blocks until the worker frees a slot
+        metrics = stage.close()
+
+        assert metrics.items == 3
+        assert metrics.wait_seconds > 0
+
+
+class TestStageMetrics:
+    def test_rates(self):
+        metrics = StageMetrics("x", workers=2, items=10, busy_seconds=1.0)
+        metrics.started_at = time.monotonic() - 1.0
+        metrics.finished_at = metrics.started_at + 1.0
+
+        assert metrics.throughput == 10.0
+        assert metrics.utilization == 0.5
+        assert "x: 10 items, 10.0/s, 50% busy" in metrics.summary()
+
+    def test_timed(self):
+        metrics = StageMetrics("x")
+        with metrics.timed():
+            pass
+        metrics.finish()
+
+        assert metrics.items == 1
+        assert metrics.finished_at is not None
+
+    def test_zero_elapsed(self):
+        metrics = StageMetrics("x")
+        metrics.finished_at = metrics.started_at
+
+        assert metrics.throughput == 0.0
+        assert metrics.utilization == 0.0
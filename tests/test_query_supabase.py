@@ -4,10 +4,15 @@ Tests cover Rule/Section dataclasses and SupabaseQuery class.
 HTTP calls are mocked.
 """
 
+import fnmatch
 import os
+import re
 from unittest.mock import patch
 
-from atlas.query.supabase import Rule, Section, SupabaseQuery
+import httpx
+import pytest
+
+from atlas.query.supabase import AsyncSupabaseQuery, Rule, Section, SupabaseQuery
 
 
 def _make_rule(**kwargs):
@@ -124,3 +129,271 @@ class TestSupabaseQuery:
         with patch.dict(os.environ, {"COSILICO_SUPABASE_URL": "https://env.supabase.co"}):
             query = SupabaseQuery()
             assert query.url == "https://env.supabase.co"
+
+
+def _row(source_path, **kwargs):
+    row = {
+        "id": source_path,
+        "jurisdiction": "us",
+        "doc_type": "statute",
+        "level": source_path.count("/") - 2,
+        "source_path": source_path,
+    }
+    row.update(kwargs)
+    return row
+
+
+class TestSupabaseQueryLookups:
+    def test_get_section_single_request_prefers_exact(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        rows = [_row("usc/26/32"), _row("26/32")]
+        with patch.object(SupabaseQuery, "_request", return_value=rows) as request:
+            rule = query.get_section("26/32")
+
+        assert rule.source_path == "26/32"
+        request.assert_called_once()
+        params = request.call_args.args[1]
+        assert params["source_path"] == 'in.("26/32","usc/26/32")'
+
+    def test_get_section_other_jurisdiction_no_prefix(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        with patch.object(SupabaseQuery, "_request", return_value=[]) as request:
+            assert query.get_section("ita/2007/1", "uk") is None
+        assert request.call_args.args[1]["source_path"] == 'in.("ita/2007/1")'
+
+    def test_get_subtree_pages_through_rpc(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        pages = [
+            [_row("usc/26/32"), _row("usc/26/32/a")],
+            [_row("usc/26/32/b")],
+        ]
+        with patch.object(SupabaseQuery, "_request", side_effect=pages) as request:
+            rules = query.get_subtree("26/32", page_size=2)
+
+        assert [r.source_path for r in rules] == ["usc/26/32", "usc/26/32/a", "usc/26/32/b"]
+        assert [c.args[0] for c in request.call_args_list] == ["rpc/get_rule_subtree"] * 2
+        first, second = (c.args[1] for c in request.call_args_list)
+        assert "p_after" not in first
+        assert second["p_after"] == "usc/26/32/a"
+        assert second["p_after_id"] == "usc/26/32/a"
+        assert second["p_source_path"] == "26/32"
+
+    def test_subtree_pages_past_duplicate_paths(self):
+        rows = [_row("usc/26/32"), _row("usc/26/32/a", id="1"), _row("usc/26/32/a", id="2")]
+        client = httpx.Client(transport=httpx.MockTransport(PostgrestStub(rows)))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+        rules = query.get_subtree("26/32", page_size=2)
+
+        assert [r.id for r in rules] == ["usc/26/32", "1", "2"]
+
+    def test_subtree_falls_back_without_rpc(self):
+        stub = PostgrestStub(STUB_ROWS, rpc=False)
+        client = httpx.Client(transport=httpx.MockTransport(stub))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+        section = query.get_section_with_children("26/32", deep=True)
+
+        assert [c.source_path for c in section.children] == ["usc/26/32/a"]
+        assert stub.requests[-1].url.params["source_path"] == "like.usc/26/32/*"
+        assert query.get_subtree("26/999") == []
+
+    def test_subtree_other_errors_propagate(self):
+        client = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(500)))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+        with pytest.raises(httpx.HTTPStatusError):
+            query.get_subtree("26/32")
+
+    def test_deep_section_from_subtree(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        rows = [
+            _row("usc/26/32", heading="Earned income", body="Intro"),
+            _row("usc/26/32/a", heading="Allowance", body="Credit allowed"),
+        ]
+        with patch.object(SupabaseQuery, "_request", return_value=rows) as request:
+            text = query.get_section_deep("26/32")
+
+        request.assert_called_once()
+        assert text.startswith("# usc/26/32: Earned income")
+        assert "  ## usc/26/32/a: Allowance" in text
+
+    def test_deep_section_not_found(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        with patch.object(SupabaseQuery, "_request", return_value=[]):
+            assert query.get_section_with_children("99/1", deep=True) is None
+
+
+class PostgrestStub:
+    """Just enough of PostgREST over an in-memory arch.rules for the clients.
+
+    Handles eq./in.()/like. filters, the get_rule_subtree RPC (or its 404
+    when ``rpc`` is False) and HEAD counts, and records each request so
+    tests can check what was sent.
+    """
+
+    def __init__(self, rows, rpc=True):
+        self.rows = rows
+        self.rpc = rpc
+        self.requests = []
+
+    def _matches(self, row, params):
+        for column, condition in params.items():
+            if column in ("limit", "order", "select"):
+                continue
+            op, _, value = condition.partition(".")
+            if op == "eq" and str(row.get(column)) != value:
+                return False
+            if op == "in" and row.get(column) not in re.findall(r'"([^"]*)"', value):
+                return False
+            if op == "like" and not fnmatch.fnmatchcase(str(row.get(column)), value):
+                return False
+        return True
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = dict(request.url.params)
+        if request.url.path.endswith("/rpc/get_rule_subtree"):
+            if not self.rpc:
+                return httpx.Response(404, json={"code": "PGRST202"})
+            root = params["p_source_path"]
+            rows = sorted(
+                (
+                    r
+                    for r in self.rows
+                    if r["source_path"] in (root, f"usc/{root}")
+                    or r["source_path"].startswith((f"{root}/", f"usc/{root}/"))
+                ),
+                key=lambda r: (r["source_path"], r["id"]),
+            )
+            if "p_after" in params:
+                after = (params["p_after"], params["p_after_id"])
+                rows = [r for r in rows if (r["source_path"], r["id"]) > after]
+            return httpx.Response(200, json=rows[: int(params["p_limit"])])
+
+        rows = [r for r in self.rows if self._matches(r, params)]
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"content-range": f"0-0/{len(rows)}"})
+        if "limit" in params:
+            rows = rows[: int(params["limit"])]
+        return httpx.Response(200, json=rows)
+
+
+STUB_ROWS = [
+    _row("usc/26/32", heading="Earned income", body="Intro"),
+    _row("usc/26/32/a", parent_id="usc/26/32", heading="Allowance"),
+    _row("usc/26/24", heading="Child tax credit"),
+    _row("ita/2007/1", jurisdiction="uk"),
+]
+
+
+class TestPooledClient:
+    def test_requests_share_one_client(self):
+        stub = PostgrestStub(STUB_ROWS)
+        client = httpx.Client(transport=httpx.MockTransport(stub))
+        with SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client) as query:
+            with patch("httpx.Client") as new_client:
+                query.get_section("26/32")
+                query.get_stats()
+            new_client.assert_not_called()
+        assert len(stub.requests) == 4
+        assert all(r.headers["Accept-Profile"] == "arch" for r in stub.requests)
+        # A client passed in belongs to the caller
+        assert not client.is_closed
+
+    def test_owned_client_created_lazily_and_closed(self):
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k")
+        client = query.client
+        assert query.client is client
+        query.close()
+        assert client.is_closed
+
+    def test_get_many_uses_in_filter(self):
+        stub = PostgrestStub(STUB_ROWS)
+        client = httpx.Client(transport=httpx.MockTransport(stub))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+        found = query.get_many(["26/32", "usc/26/24", "26/999"])
+
+        assert found["26/32"].source_path == "usc/26/32"
+        assert found["usc/26/24"].heading == "Child tax credit"
+        assert found["26/999"] is None
+        assert len(stub.requests) == 1
+        assert stub.requests[0].url.params["source_path"].startswith("in.(")
+
+    def test_get_many_duplicate_rows_do_not_hide_others(self):
+        rows = [_row("usc/26/32", id="a"), _row("usc/26/32", id="b"), _row("usc/26/24")]
+        client = httpx.Client(transport=httpx.MockTransport(PostgrestStub(rows)))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+        found = query.get_many(["usc/26/32", "usc/26/24"])
+
+        assert found["usc/26/32"].id == "a"
+        assert found["usc/26/24"] is not None
+
+    def test_get_many_chunks_long_lists(self):
+        stub = PostgrestStub(STUB_ROWS)
+        client = httpx.Client(transport=httpx.MockTransport(stub))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+        paths = [f"usc/26/{n}" for n in range(250)]
+        found = query.get_many(paths)
+
+        assert len(stub.requests) == 3
+        assert found["usc/26/32"].heading == "Earned income"
+        assert sum(rule is not None for rule in found.values()) == 2
+
+    def test_get_stats_against_stub(self):
+        client = httpx.Client(transport=httpx.MockTransport(PostgrestStub(STUB_ROWS)))
+        query = SupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+        assert query.get_stats() == {"us": 3, "uk": 1, "canada": 0, "total": 4}
+
+
+class TestAsyncSupabaseQuery:
+    def _query(self, stub):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+        return AsyncSupabaseQuery(url="https://test.supabase.co", anon_key="k", client=client)
+
+    async def test_get_section_and_many(self):
+        query = self._query(PostgrestStub(STUB_ROWS))
+        rule = await query.get_section("26/32")
+        found = await query.get_many(["26/24", "ita/2007/1"])
+
+        assert rule.heading == "Earned income"
+        assert found["26/24"].source_path == "usc/26/24"
+        assert found["ita/2007/1"] is None  # wrong jurisdiction
+
+    async def test_children_and_deep_text(self):
+        stub = PostgrestStub(STUB_ROWS)
+        query = self._query(stub)
+
+        section = await query.get_by_citation(26, "32")
+        assert [c.source_path for c in section.children] == ["usc/26/32/a"]
+
+        text = await query.get_section_deep("26/32")
+        assert text.startswith("# usc/26/32: Earned income")
+        assert "## usc/26/32/a: Allowance" in text
+
+    async def test_subtree_pages(self):
+        stub = PostgrestStub(STUB_ROWS)
+        query = self._query(stub)
+        rules = await query.get_subtree("26/32", page_size=1)
+
+        assert [r.source_path for r in rules] == ["usc/26/32", "usc/26/32/a"]
+        assert len(stub.requests) == 3
+
+    async def test_subtree_falls_back_without_rpc(self):
+        query = self._query(PostgrestStub(STUB_ROWS, rpc=False))
+
+        rules = await query.get_subtree("26/32")
+
+        assert [r.source_path for r in rules] == ["usc/26/32", "usc/26/32/a"]
+        assert await query.get_subtree("26/999") == []
+
+    async def test_get_stats(self):
+        query = self._query(PostgrestStub(STUB_ROWS))
+        assert await query.get_stats() == {"us": 3, "uk": 1, "canada": 0, "total": 4}
+
+    async def test_context_manager_closes_owned_client(self):
+        async with AsyncSupabaseQuery(url="https://test.supabase.co", anon_key="k") as query:
+            client = query.client
+        assert client.is_closed
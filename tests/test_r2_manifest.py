@@ -0,0 +1,94 @@
+"""Tests for the local SQLite manifest of R2 objects."""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from atlas.storage.r2_manifest import R2Manifest
+
+
+class FakeR2:
+    """Stands in for R2Storage's listing."""
+
+    def __init__(self, objects):
+        self.objects = objects
+
+    def iter_prefix_sharded(self, prefix, workers=8):
+        for key, (size, etag) in sorted(self.objects.items()):
+            if key.startswith(prefix):
+                yield {
+                    "Key": key,
+                    "Size": size,
+                    "ETag": f'"{etag}"',
+                    "LastModified": datetime(2026, 1, 1, tzinfo=timezone.utc),
+                }
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    m = R2Manifest(tmp_path / "manifest.db", "rules-xml")
+    yield m
+    m.close()
+
+
+class TestR2Manifest:
+    def test_first_sync_adds_everything(self, manifest):
+        r2 = FakeR2({"s/ak/1.xml": (10, "a"), "s/ak/2.xml": (20, "b"), "s/ny/1.xml": (5, "c")})
+
+        changes = manifest.sync(r2, "s/")
+
+        assert changes.added == ["s/ak/1.xml", "s/ak/2.xml", "s/ny/1.xml"]
+        assert len(changes) == 3
+        assert manifest.stats("s/ak/") == {"count": 2, "total_bytes": 30}
+        assert manifest.etags("s/ny/") == {"s/ny/1.xml": "c"}
+        assert manifest.get("s/ak/1.xml")["last_modified"].startswith("2026-01-01")
+        assert manifest.last_synced("s/") is not None
+
+    def test_resync_reports_changes(self, manifest):
+        r2 = FakeR2({"s/ak/1.xml": (10, "a"), "s/ak/2.xml": (20, "b")})
+        manifest.sync(r2, "s/")
+
+        r2.objects = {"s/ak/1.xml": (10, "a"), "s/ak/2.xml": (21, "b2"), "s/ak/3.xml": (1, "d")}
+        changes = manifest.sync(r2, "s/")
+
+        assert changes.added == ["s/ak/3.xml"]
+        assert changes.changed == ["s/ak/2.xml"]
+        assert changes.removed == []
+
+        del r2.objects["s/ak/1.xml"]
+        assert manifest.sync(r2, "s/").removed == ["s/ak/1.xml"]
+        assert manifest.get("s/ak/1.xml") is None
+
+    def test_sync_leaves_other_prefixes_alone(self, manifest):
+        manifest.sync(FakeR2({"s/ak/1.xml": (1, "a"), "s/ny/1.xml": (1, "b")}), "s/")
+        changes = manifest.sync(FakeR2({}), "s/ak/")
+
+        assert changes.removed == ["s/ak/1.xml"]
+        assert manifest.etags() == {"s/ny/1.xml": "b"}
+
+    def test_sync_flushes_in_batches(self, manifest):
+        objects = {f"s/{i}.xml": (i, str(i)) for i in range(5)}
+
+        with patch("atlas.storage.r2_manifest.SYNC_BATCH_SIZE", 2):
+            changes = manifest.sync(FakeR2(objects), "s/")
+
+        assert len(changes.added) == 5
+        assert manifest.stats("s/") == {"count": 5, "total_bytes": 10}
+
+    def test_record_and_diff(self, manifest):
+        manifest.record("s/ak/1.xml", "a", 10)
+
+        assert manifest.diff({"s/ak/1.xml": "a", "s/ak/2.xml": "x"}) == ["s/ak/2.xml"]
+        assert manifest.diff({"s/ak/1.xml": "changed"}) == ["s/ak/1.xml"]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "nested" / "manifest.db"
+        first = R2Manifest(path, "atlas")
+        first.record("k", "e", 3)
+        first.close()
+
+        second = R2Manifest(path, "atlas")
+        assert second.etags() == {"k": "e"}
+        assert R2Manifest(path, "other-bucket").etags() == {}
+        second.close()
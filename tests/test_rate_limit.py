@@ -0,0 +1,220 @@
+"""Tests for the per-host adaptive (AIMD) token-bucket rate limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from atlas.crawl import StateCrawler
+from atlas.pipeline.runner import StatePipeline
+from atlas.rate_limit import HostRateLimiter, parse_retry_after
+from atlas.sources.base import SourceConfig
+
+
+class TestReserve:
+    def test_same_host_is_spaced(self):
+        limiter = HostRateLimiter(rate=2.0)
+
+        assert limiter.reserve("https://a.test/1") == 0
+        assert limiter.reserve("https://a.test/2") == pytest.approx(0.5, abs=0.01)
+        assert limiter.reserve("https://a.test/3") == pytest.approx(1.0, abs=0.01)
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter(rate=0.1)
+        limiter.reserve("https://a.test/1")
+        assert limiter.reserve("https://b.test/1") == 0
+
+    def test_burst(self):
+        limiter = HostRateLimiter(rate=1.0, burst=3)
+        delays = [limiter.reserve("https://a.test/") for _ in range(4)]
+        assert delays[:3] == [0, 0, 0]
+        assert delays[3] == pytest.approx(1.0, abs=0.01)
+
+
+class TestAdaptation:
+    def test_success_increases_rate_up_to_max(self):
+        limiter = HostRateLimiter(rate=1.0, max_rate=1.2, increase=0.1)
+        for _ in range(5):
+            limiter.record("https://a.test/", 200)
+        assert limiter.rates() == {"a.test": 1.2}
+
+    def test_throttle_halves_rate_once_per_burst(self):
+        limiter = HostRateLimiter(rate=4.0, min_rate=0.5)
+        for _ in range(3):  # Concurrent failures count as one signal
+            limiter.record("https://a.test/", 429)
+        assert limiter.rates()["a.test"] == 2.0
+
+    def test_rate_never_below_min(self):
+        limiter = HostRateLimiter(rate=1.0, min_rate=0.8)
+        limiter.record("https://a.test/", 503)
+        assert limiter.rates()["a.test"] == 0.8
+
+    def test_failed_request_backs_off(self):
+        limiter = HostRateLimiter(rate=2.0)
+        limiter.record("https://a.test/", None)
+        assert limiter.rates()["a.test"] == 1.0
+
+    def test_retry_after_blocks_host(self):
+        limiter = HostRateLimiter(rate=10.0)
+        limiter.record("https://a.test/", 429, retry_after="5")
+
+        first = limiter.reserve("https://a.test/")
+        second = limiter.reserve("https://a.test/")
+        assert first == pytest.approx(5.0, abs=0.05)
+        # Slots after the block are spaced at the reduced rate, not released at once
+        assert second - first == pytest.approx(0.2, abs=0.01)
+        assert limiter.reserve("https://b.test/") == 0
+
+    def test_retry_after_keeps_queued_slots(self):
+        limiter = HostRateLimiter(rate=10.0)
+        for _ in range(3):
+            limiter.reserve("https://a.test/")
+        limiter.record("https://a.test/", 429, retry_after="5")
+
+        # Two callers already hold slots, so the next one waits for the block
+        # and for them at the reduced rate of 5/s
+        assert limiter.reserve("https://a.test/") == pytest.approx(5.6, abs=0.05)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestTransports:
+    def test_sync_transport_records_responses(self):
+        statuses = iter([200, 429])
+        limiter = HostRateLimiter(rate=100.0, max_rate=200.0, increase=1.0)
+        transport = limiter.transport(
+            httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+        )
+        client = httpx.Client(transport=transport)
+
+        client.get("https://a.test/1")
+        assert limiter.rates()["a.test"] == 101.0
+        client.get("https://a.test/2")
+        assert limiter.rates()["a.test"] == 50.5
+
+    def test_sync_transport_records_failures(self):
+        def fail(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        limiter = HostRateLimiter(rate=2.0)
+        client = httpx.Client(transport=limiter.transport(httpx.MockTransport(fail)))
+
+        with pytest.raises(httpx.ConnectError):
+            client.get("https://a.test/1")
+        assert limiter.rates()["a.test"] == 1.0
+
+    def test_async_transport_records_failures(self):
+        def fail(request):
+            raise httpx.ReadTimeout("slow", request=request)
+
+        limiter = HostRateLimiter(rate=2.0)
+        transport = limiter.async_transport(httpx.MockTransport(fail))
+
+        async def main():
+            async with httpx.AsyncClient(transport=transport) as client:
+                await client.get("https://a.test/1")
+
+        with pytest.raises(httpx.ReadTimeout):
+            asyncio.run(main())
+        assert limiter.rates()["a.test"] == 1.0
+
+    def test_transports_close_inner(self):
+        inner = MagicMock()
+        HostRateLimiter().transport(inner).close()
+        inner.close.assert_called_once()
+
+        async_inner = MagicMock()
+        async_inner.aclose = AsyncMock()
+        asyncio.run(HostRateLimiter().async_transport(async_inner).aclose())
+        async_inner.aclose.assert_awaited_once()
+
+    def test_async_transport_spaces_concurrent_requests(self):
+        limiter = HostRateLimiter(rate=50.0)
+        waits = []
+        original = limiter.acquire
+
+        async def acquire(url):
+            waits.append(await original(url))
+            return waits[-1]
+
+        limiter.acquire = acquire
+        transport = limiter.async_transport(httpx.MockTransport(lambda r: httpx.Response(200)))
+
+        async def main():
+            async with httpx.AsyncClient(transport=transport) as client:
+                await asyncio.gather(*(client.get(f"https://a.test/{i}") for i in range(5)))
+
+        asyncio.run(main())
+        assert sorted(waits)[0] == 0
+        assert sorted(waits)[-1] == pytest.approx(0.08, abs=0.02)
+
+    def test_pipeline_installs_limiter_on_converter(self):
+        class Converter:
+            def __init__(self):
+                self._client = None
+
+            @property
+            def client(self):
+                if self._client is None:
+                    self._client = httpx.Client(headers={"User-Agent": "Arch/1.0"})
+                return self._client
+
+        converter = Converter()
+        limiter = HostRateLimiter()
+        pipeline = StatePipeline(
+            "ak", r2_arch=MagicMock(), r2_rules=MagicMock(), host_limiter=limiter
+        )
+        pipeline.converter = converter
+
+        with patch("atlas.rate_limit.httpx.HTTPTransport") as mock_transport:
+            mock_transport.return_value = httpx.MockTransport(lambda r: httpx.Response(200))
+            pipeline._install_transports()
+            converter.client.get("https://ak.gov/statutes")
+
+        assert "ak.gov" in limiter.rates()
+        assert converter.client.headers["User-Agent"] == "Arch/1.0"
+
+
+class TestCrawlerLimiting:
+    def test_crawler_backs_off_on_429(self):
+        config = SourceConfig(
+            jurisdiction="us-zz",
+            name="Testland",
+            source_type="html",
+            base_url="https://law.test",
+            toc_url_pattern="/code/{code}",
+            codes={"rc": "Revised Code"},
+        )
+        section_calls = []
+
+        def handler(request):
+            if request.url.path == "/code/rc":
+                return httpx.Response(200, text='<a href="/section-1">1</a>')
+            section_calls.append(request)
+            if len(section_calls) == 1:
+                return httpx.Response(429, headers={"retry-after": "0"})
+            return httpx.Response(200, text="<p>one</p>")
+
+        limiter = HostRateLimiter(rate=100.0)
+        crawler = StateCrawler(config, dry_run=True, rate_limiter=limiter)
+        with patch(
+            "atlas.rate_limit.httpx.AsyncHTTPTransport",
+            return_value=httpx.MockTransport(handler),
+        ):
+            stats = asyncio.run(crawler.crawl())
+
+        assert stats.sections_fetched == 1
+        assert len(section_calls) == 2
+        assert limiter.rates()["law.test"] < 100.0
+
+    def test_no_delay_means_no_limiter(self):
+        config = SourceConfig(
+            jurisdiction="us-zz", name="Testland", source_type="html", base_url="https://x"
+        )
+        assert StateCrawler(config, delay_between_requests=0).rate_limiter is None
+        assert StateCrawler(config, delay_between_requests=0.5).rate_limiter.initial_rate == 2.0
@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from atlas.http_cache import HTTPCache, RevalidatingTransport
+from atlas.rate_limit import HostRateLimiter, RateLimitedTransport
 from atlas.models_statute import Statute
 from atlas.sources.base import SourceConfig, StatuteSource, load_source
 
@@ -98,6 +100,55 @@ class TestStatuteSource:
         # Second call returns same client
         assert source.client is client
 
+    def test_client_revalidates_through_http_cache(self):
+        config = SourceConfig(
+            jurisdiction="test",
+            name="Test",
+            source_type="html",
+            base_url="https://example.com",
+        )
+
+        class ConcreteSource(StatuteSource):
+            def get_section(self, code, section, **kwargs):
+                return None
+
+            def list_sections(self, code, **kwargs):
+                yield from []
+
+        http_cache = HTTPCache()
+        source = ConcreteSource(config, http_cache=http_cache)
+        assert source.http_cache is http_cache
+        assert isinstance(source.client._transport, RevalidatingTransport)
+        # Revalidations still go through the host limiter
+        assert isinstance(source.client._transport.inner, RateLimitedTransport)
+        source.close()
+
+    def test_client_paced_by_host_limiter(self):
+        config = SourceConfig(
+            jurisdiction="test",
+            name="Test",
+            source_type="html",
+            base_url="https://example.com",
+            rate_limit=0.25,
+        )
+
+        class ConcreteSource(StatuteSource):
+            def get_section(self, code, section, **kwargs):
+                return None
+
+            def list_sections(self, code, **kwargs):
+                yield from []
+
+        source = ConcreteSource(config)
+        assert source.host_limiter.initial_rate == 4.0
+        assert isinstance(source.client._transport, RateLimitedTransport)
+        source.close()
+
+        shared = HostRateLimiter()
+        source = ConcreteSource(config, host_limiter=shared)
+        assert source.client._transport.limiter is shared
+        source.close()
+
     def test_close(self):
         config = SourceConfig(
             jurisdiction="test",
@@ -335,6 +386,12 @@ class TestLoadSource:
         result = load_source("us-oh")
         assert result is mock_source
 
+    @patch("atlas.sources.registry.get_source_for_jurisdiction")
+    def test_load_passes_http_cache(self, mock_get):
+        http_cache = HTTPCache()
+        load_source("us-oh", http_cache=http_cache)
+        mock_get.assert_called_once_with("us-oh", http_cache=http_cache, host_limiter=None)
+
     @patch("atlas.sources.registry.get_source_for_jurisdiction")
     def test_load_nonexistent_raises(self, mock_get):
         mock_get.return_value = None
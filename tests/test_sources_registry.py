@@ -205,6 +205,20 @@ class TestGetSourceForJurisdiction:
         finally:
             registry_module._SOURCE_CONFIGS = old
 
+    def test_source_gets_http_cache(self):
+        import atlas.sources.registry as registry_module
+        from atlas.http_cache import HTTPCache
+
+        old = registry_module._SOURCE_CONFIGS
+        registry_module._SOURCE_CONFIGS = {}
+        try:
+            http_cache = HTTPCache()
+            for jurisdiction in ("us", "us-oh"):
+                source = get_source_for_jurisdiction(jurisdiction, http_cache=http_cache)
+                assert source.http_cache is http_cache
+        finally:
+            registry_module._SOURCE_CONFIGS = old
+
     def test_api_source(self):
         import atlas.sources.registry as registry_module
 
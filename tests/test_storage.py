@@ -1,5 +1,6 @@
 """Tests for storage backends."""
 
+import sqlite3
 import tempfile
 from datetime import date
 from pathlib import Path
@@ -7,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from atlas.models import Citation, Section, Subsection
-from atlas.storage.sqlite import SQLiteStorage
+from atlas.storage.sqlite import SQLiteReadPool, SQLiteStorage
 
 
 @pytest.fixture
@@ -120,6 +121,124 @@ class TestSQLiteStorage:
         retrieved = storage.get_section(26, "32")
         assert retrieved.section_title == "Updated title"
 
+    def test_get_section_text_only(self, storage, sample_section):
+        """text_only skips the subsection tree and public laws."""
+        sample_section.public_laws = ["Pub. L. 115-97"]
+        storage.store_section(sample_section)
+
+        full = storage.get_section(26, "32")
+        text_only = storage.get_section(26, "32", text_only=True)
+
+        assert full.public_laws == ["Pub. L. 115-97"]
+        assert text_only.subsections == []
+        assert text_only.public_laws == []
+        assert text_only.text == full.text
+        assert text_only.references_to == full.references_to
+
+    def test_get_section_preserves_dates(self, storage, sample_section):
+        """Optional date columns round-trip."""
+        sample_section.enacted_date = date(1975, 3, 29)
+        sample_section.last_amended = date(2017, 12, 22)
+        sample_section.effective_date = date(2018, 1, 1)
+        storage.store_section(sample_section)
+
+        retrieved = storage.get_section(26, "32")
+
+        assert retrieved.enacted_date == date(1975, 3, 29)
+        assert retrieved.last_amended == date(2017, 12, 22)
+        assert retrieved.effective_date == date(2018, 1, 1)
+        assert retrieved.uslm_id == "/us/usc/t26/s32"
+
+    def test_get_subsection_tree(self, storage, sample_section):
+        """The stored subsection JSON is returned undecoded."""
+        storage.store_section(sample_section)
+
+        tree = storage.get_subsection_tree(26, "32")
+
+        assert '"identifier": "a"' in tree.raw_json
+        assert tree.get("a/1")["heading"] == "In general"
+        assert storage.get_subsection_tree(99, "1") is None
+
+    def test_get_section_with_tree(self, storage, sample_section):
+        """Text and raw subsection JSON come back from one row."""
+        storage.store_section(sample_section)
+
+        section, tree = storage.get_section_with_tree(26, "32")
+
+        assert section.section_title == sample_section.section_title
+        assert section.subsections == []
+        assert tree.get("a/1")["heading"] == "In general"
+        assert storage.get_section_with_tree(99, "1") is None
+
+    def test_get_subsection_by_path(self, storage, sample_section):
+        """A single subtree is sliced out of the stored JSON."""
+        storage.store_section(sample_section)
+
+        sub = storage.get_subsection(26, "32", "a")
+        assert sub.heading == "Allowance of credit"
+        assert sub.children[0].identifier == "1"
+        assert storage.get_subsection(26, "32", "a/1").text == "The credit shall be..."
+        assert storage.get_subsection(26, "32", "b") is None
+        assert storage.get_subsection(99, "1", "a") is None
+
+    def test_get_subsection_without_path_index(self, storage, sample_section):
+        """Rows stored before subsection_paths existed fall back to decoding."""
+        storage.store_section(sample_section)
+        storage.db.execute("DELETE FROM subsection_paths")
+
+        assert storage.get_subsection(26, "32", "a/1").heading == "In general"
+
+    def test_subsection_spans_match_json(self, storage):
+        """Every recorded span is exactly that subsection's JSON object."""
+        import json
+
+        subs = [
+            Subsection(
+                identifier="a",
+                heading="Caf\u00e9 \"quoted\"",
+                text="Line\nbreak",
+                children=[
+                    Subsection(identifier="1", text="One"),
+                    Subsection(identifier="2", text="Two", children=[Subsection(identifier="A", text="x")]),
+                ],
+            ),
+            Subsection(identifier="b", text="Bee"),
+            Subsection(identifier="a", text="Duplicate"),
+        ]
+        dumped, spans = storage._dump_subsections(subs)
+
+        assert dumped == json.dumps([s.model_dump() for s in subs])
+        by_path = {}
+        for path, start, length in spans:
+            by_path.setdefault(path, json.loads(dumped[start : start + length]))
+        assert by_path["a"]["heading"] == "Caf\u00e9 \"quoted\""
+        assert by_path["a/2/A"]["text"] == "x"
+        assert by_path["b"]["text"] == "Bee"
+
+    def test_get_sections(self, storage, sample_section):
+        """Many sections come back from one lookup, missing ones omitted."""
+        storage.store_section(sample_section)
+        storage.store_section(
+            sample_section.model_copy(
+                update={"citation": Citation(title=26, section="24"), "uslm_id": "/us/usc/t26/s24"}
+            )
+        )
+
+        found = storage.get_sections([(26, "32"), (26, "24"), (26, "999"), (26, "32")])
+
+        assert set(found) == {(26, "32"), (26, "24")}
+        assert found[(26, "24")].citation.section == "24"
+        assert found[(26, "32")].subsections[0].identifier == "a"
+
+    def test_get_sections_text_only(self, storage, sample_section):
+        storage.store_section(sample_section)
+        found = storage.get_sections([(26, "32")], text_only=True)
+        assert found[(26, "32")].subsections == []
+        assert found[(26, "32")].references_to == ["26 USC 24", "26 USC 152"]
+
+    def test_get_sections_empty(self, storage):
+        assert storage.get_sections([]) == {}
+
     def test_subsections_preserved(self, storage, sample_section):
         """Nested subsections are preserved."""
         storage.store_section(sample_section)
@@ -129,3 +248,189 @@ class TestSQLiteStorage:
         assert retrieved.subsections[0].identifier == "a"
         assert len(retrieved.subsections[0].children) == 1
         assert retrieved.subsections[0].children[0].identifier == "1"
+
+
+class TestSQLiteGeneration:
+    """Tests for the write generation counter used to invalidate caches."""
+
+    def test_generation_advances_on_writes(self, storage, sample_section):
+        start = storage.get_generation()
+
+        storage.store_section(sample_section)
+        after_store = storage.get_generation()
+        storage.store_sections([sample_section])
+        after_bulk = storage.get_generation()
+        storage.update_title_metadata(26, "Internal Revenue Code", False)
+
+        assert start < after_store < after_bulk < storage.get_generation()
+
+    def test_generation_unchanged_by_reads(self, storage, sample_section):
+        storage.store_section(sample_section)
+        generation = storage.get_generation()
+
+        storage.get_section(26, "32")
+        storage.search("credit")
+
+        assert storage.get_generation() == generation
+
+    def test_generation_survives_reopen(self, temp_db, sample_section):
+        SQLiteStorage(temp_db).store_section(sample_section)
+        generation = SQLiteStorage(temp_db).get_generation()
+
+        assert generation > 0
+        assert SQLiteStorage(temp_db).get_generation() == generation
+
+
+class TestSQLiteReadPool:
+    """Tests for per-thread read connections."""
+
+    def test_reads_use_pool_and_see_writes(self, temp_db, sample_section):
+        storage = SQLiteStorage(temp_db, read_pool=True)
+        storage.enable_wal()
+        storage.store_section(sample_section)
+
+        assert storage.get_section(26, "32").section_title == "Earned income"
+        assert storage.get_subsection(26, "32", "a/1").heading == "In general"
+        assert storage.search("credit")
+        assert storage.read_pool._connections
+        assert storage.db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_opening_does_not_switch_to_wal(self, temp_db):
+        storage = SQLiteStorage(temp_db, read_pool=True)
+        assert storage.db.execute("PRAGMA journal_mode").fetchone()[0] != "wal"
+
+    def test_one_connection_per_thread(self, temp_db, sample_section):
+        from concurrent.futures import ThreadPoolExecutor
+
+        storage = SQLiteStorage(temp_db, read_pool=True)
+        storage.store_section(sample_section)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sections = list(pool.map(lambda _: storage.get_section(26, "32"), range(20)))
+
+        assert [s.section_title for s in sections] == ["Earned income"] * 20
+        assert 1 <= len(storage.read_pool._connections) <= 4
+
+    def test_read_connections_are_query_only(self, temp_db):
+        SQLiteStorage(temp_db)
+        pool = SQLiteReadPool(temp_db)
+        conn = pool.connection()
+
+        assert conn is pool.connection()
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM sections")
+        pool.close()
+        assert pool._connections == []
+
+    def test_export_uses_its_own_connection(self, temp_db, sample_section):
+        storage = SQLiteStorage(temp_db, read_pool=True)
+        storage.enable_wal()
+        storage.store_section(sample_section)
+        generation = storage.get_generation()
+
+        # A paused export must not pin this thread's snapshot
+        sections = storage.iter_sections(26)
+        assert next(sections).section_title == "Earned income"
+        storage.store_section(sample_section)
+        assert storage.get_generation() > generation
+        assert len(storage.read_pool._connections) == 1
+
+        sections.close()
+        assert sections.gi_frame is None
+
+    def test_memory_database_has_no_pool(self):
+        storage = SQLiteStorage(":memory:", read_pool=True)
+        storage.enable_wal()
+        assert storage.read_pool is None
+        assert storage.list_titles() == []
+
+
+class TestSQLiteBulkStore:
+    """Tests for the batched store_sections path."""
+
+    def _sections(self, sample_section, n):
+        return [
+            sample_section.model_copy(
+                update={
+                    "citation": Citation(title=26, section=str(i)),
+                    "uslm_id": f"/us/usc/t26/s{i}",
+                    "section_title": f"Earned income {i}",
+                }
+            )
+            for i in range(n)
+        ]
+
+    def test_get_sections_spans_chunks(self, storage, sample_section):
+        storage.store_sections(self._sections(sample_section, 450))
+
+        found = storage.get_sections([(26, str(i)) for i in range(450)], text_only=True)
+
+        assert len(found) == 450
+        assert found[(26, "449")].section_title == "Earned income 449"
+
+    def test_iter_sections_in_section_order(self, storage, sample_section):
+        sections = self._sections(sample_section, 12)
+        for extra in ("2A", "App"):
+            sections.append(
+                sample_section.model_copy(
+                    update={
+                        "citation": Citation(title=26, section=extra),
+                        "uslm_id": f"/us/usc/t26/s{extra}",
+                    }
+                )
+            )
+        storage.store_sections(sections)
+
+        exported = list(storage.iter_sections(26))
+
+        assert [s.citation.section for s in exported][:4] == ["0", "1", "2", "2A"]
+        # Unnumbered sections come after the numbered ones, as in PostgresStorage
+        assert [s.citation.section for s in exported][-2:] == ["11", "App"]
+        assert exported[0].subsections[0].identifier == "a"
+        assert list(storage.iter_sections(26, text_only=True))[0].subsections == []
+        assert list(storage.iter_sections(99)) == []
+
+    def test_store_sections_in_batches(self, storage, sample_section):
+        count = storage.store_sections(self._sections(sample_section, 7), batch_size=3)
+
+        assert count == 7
+        assert storage.get_subsection(26, "5", "a/1").heading == "In general"
+        assert storage.get_section(26, "6").section_title == "Earned income 6"
+        assert "26 USC 24" in storage.get_references_to(26, "4")
+        assert len(storage.search("earned")) == 7
+
+    def test_store_sections_replaces_references(self, storage, sample_section):
+        storage.store_section(sample_section)
+        updated = sample_section.model_copy(update={"references_to": ["26 USC 1", "bogus"]})
+
+        storage.store_sections([updated])
+
+        assert storage.get_references_to(26, "32") == ["26 USC 1"]
+
+    def test_store_sections_defer_fts(self, storage, sample_section):
+        count = storage.store_sections(self._sections(sample_section, 5), defer_fts=True)
+
+        assert count == 5
+        assert len(storage.search("earned")) == 5
+        triggers = {
+            row[0]
+            for row in storage.db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).fetchall()
+        }
+        assert triggers == {"sections_ai", "sections_ad", "sections_au"}
+
+        # Triggers are back, so single-row writes are indexed again
+        storage.store_section(sample_section)
+        assert len(storage.search("eligible")) == 6
+
+    def test_store_sections_rolls_back_failed_batch(self, storage, sample_section):
+        def sections():
+            yield from self._sections(sample_section, 2)
+            raise RuntimeError("parser failed")
+
+        with pytest.raises(RuntimeError):
+            storage.store_sections(sections(), batch_size=1)
+
+        assert storage.get_section(26, "1") is not None
+        assert len(storage.search("earned")) == 2
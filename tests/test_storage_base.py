@@ -30,9 +30,117 @@ class TestStorageBackend:
             def get_referenced_by(self, title, section):
                 return []
 
+            def iter_sections(self, title, text_only=False):
+                return iter([])
+
         storage = ConcreteStorage()
         assert storage.get_section(26, "32") is None
         assert storage.search("test") == []
         assert storage.list_titles() == []
         assert storage.get_references_to(26, "32") == []
         assert storage.get_referenced_by(26, "32") == []
+        assert list(storage.iter_sections(26)) == []
+        assert storage.get_generation() == 0
+
+    def test_store_sections_default_loops(self):
+        class RecordingStorage(StorageBackend):
+            def __init__(self):
+                self.stored = []
+
+            def store_section(self, section):
+                self.stored.append(section)
+
+            def get_section(self, title, section, subsection=None, as_of=None):
+                return None
+
+            def search(self, query, title=None, limit=20):
+                return []
+
+            def list_titles(self):
+                return []
+
+            def get_references_to(self, title, section):
+                return []
+
+            def get_referenced_by(self, title, section):
+                return []
+
+            def iter_sections(self, title, text_only=False):
+                return iter([])
+
+        storage = RecordingStorage()
+        assert storage.store_sections(iter(["a", "b", "c"])) == 3
+        assert storage.stored == ["a", "b", "c"]
+
+    def test_get_subsection_tree_default(self):
+        from datetime import date
+
+        from atlas.models import Citation, Section, Subsection
+
+        section = Section(
+            citation=Citation(title=26, section="32"),
+            title_name="Internal Revenue Code",
+            section_title="Earned income",
+            text="Text",
+            subsections=[Subsection(identifier="a", text="Allowance")],
+            source_url="https://uscode.house.gov",
+            retrieved_at=date(2024, 1, 1),
+        )
+
+        class OneSectionStorage(StorageBackend):
+            def store_section(self, section):
+                pass
+
+            def get_section(
+                self, title, section_num, subsection=None, as_of=None, text_only=False
+            ):
+                return section if section_num == "32" else None
+
+            def search(self, query, title=None, limit=20):
+                return []
+
+            def list_titles(self):
+                return []
+
+            def get_references_to(self, title, section):
+                return []
+
+            def get_referenced_by(self, title, section):
+                return []
+
+            def iter_sections(self, title, text_only=False):
+                return iter([])
+
+        storage = OneSectionStorage()
+        assert storage.get_subsection_tree(26, "32").get("a")["text"] == "Allowance"
+        assert storage.get_subsection_tree(26, "1") is None
+        found, tree = storage.get_section_with_tree(26, "32")
+        assert found is section
+        assert tree.get("a")["text"] == "Allowance"
+        assert storage.get_section_with_tree(26, "1") is None
+        assert storage.get_subsection(26, "32", "a").text == "Allowance"
+        assert storage.get_subsection(26, "1", "a") is None
+        assert storage.get_sections([(26, "32"), (26, "1"), (26, "32")]) == {(26, "32"): section}
+
+    def test_iter_sections_is_required(self):
+        class NoExportStorage(StorageBackend):
+            def store_section(self, section):
+                pass
+
+            def get_section(self, title, section, subsection=None, as_of=None):
+                return None
+
+            def search(self, query, title=None, limit=20):
+                return []
+
+            def list_titles(self):
+                return []
+
+            def get_references_to(self, title, section):
+                return []
+
+            def get_referenced_by(self, title, section):
+                return []
+
+        with pytest.raises(TypeError, match="iter_sections"):
+            NoExportStorage()
@@ -0,0 +1,170 @@
+"""Tests for the COPY-based PostgreSQL bulk loader.
+
+The connection is mocked by default. Set ATLAS_TEST_POSTGRES_URL to a
+scratch database to also run the loader against a real PostgreSQL.
+"""
+
+import importlib.util
+import os
+import sys
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import atlas.storage.bulk
+from atlas.storage.bulk import (
+    HAS_PSYCOPG,
+    ROW_COLUMN,
+    RULES_TABLE,
+    STATUTES_TABLE,
+    BulkTable,
+    PostgresBulkLoader,
+)
+
+pytestmark = pytest.mark.skipif(not HAS_PSYCOPG, reason="psycopg not installed")
+
+TEST_DB_URL = os.environ.get("ATLAS_TEST_POSTGRES_URL")
+
+
+def _mock_conn():
+    """A psycopg-like connection that records SQL and copied rows."""
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    copy = cur.copy.return_value.__enter__.return_value
+    return conn, cur, copy
+
+
+def _sql(statement) -> str:
+    return statement.as_string(None)
+
+
+class TestPostgresBulkLoader:
+    def test_requires_url_or_conn(self):
+        with pytest.raises(ValueError, match="db_url or conn"):
+            PostgresBulkLoader()
+
+    def test_load_batches_and_commits(self):
+        conn, cur, copy = _mock_conn()
+        loader = PostgresBulkLoader(conn=conn)
+        rows = ({"id": str(i), "body": "text"} for i in range(5))
+
+        totals = []
+        assert loader.load(RULES_TABLE, rows, batch_size=2, progress=totals.append) == 5
+
+        assert totals == [2, 4, 5]
+        assert conn.commit.call_count == 3
+        assert copy.write_row.call_count == 5
+        first = copy.write_row.call_args_list[0].args[0]
+        assert len(first) == len(RULES_TABLE.columns) + 1
+        assert first[RULES_TABLE.columns.index("body")] == "text"
+        assert first[RULES_TABLE.columns.index("heading")] is None
+        # Rows are numbered within their batch so the merge can keep the last
+        assert [c.args[0][-1] for c in copy.write_row.call_args_list] == [0, 1, 0, 1, 0]
+
+    def test_staging_table_created_once(self):
+        conn, cur, _ = _mock_conn()
+        loader = PostgresBulkLoader(conn=conn)
+        loader.load(RULES_TABLE, [{"id": "a"}, {"id": "b"}], batch_size=1)
+
+        statements = [_sql(c.args[0]) for c in cur.execute.call_args_list]
+        creates = [s for s in statements if s.startswith("CREATE TEMP TABLE")]
+        assert len(creates) == 1
+        assert '"_stage_rules" ON COMMIT DELETE ROWS' in creates[0]
+        assert 'FROM "arch"."rules" WITH NO DATA' in creates[0]
+
+    def test_merge_updates_non_key_columns(self):
+        merge = _sql(PostgresBulkLoader(conn=MagicMock())._merge_sql(STATUTES_TABLE))
+        key = '"jurisdiction", "code", "section", "subsection_path"'
+        assert merge.startswith('INSERT INTO "arch"."statutes"')
+        assert f"SELECT DISTINCT ON ({key})" in merge
+        assert f"ON CONFLICT ({key}) DO UPDATE SET" in merge
+        assert f'ORDER BY {key}, "{ROW_COLUMN}" DESC' in merge
+        assert '"text" = EXCLUDED."text"' in merge
+        assert '"code" = EXCLUDED."code"' not in merge
+        assert f'"{ROW_COLUMN}" = EXCLUDED' not in merge
+
+    def test_failed_batch_rolls_back_and_restages(self):
+        conn, cur, copy = _mock_conn()
+        copy.write_row.side_effect = [RuntimeError("bad row"), None]
+        loader = PostgresBulkLoader(conn=conn)
+
+        with pytest.raises(RuntimeError):
+            loader.load_batch(RULES_TABLE, [{"id": "a"}])
+        conn.rollback.assert_called_once()
+
+        loader.load_batch(RULES_TABLE, [{"id": "a"}])
+        creates = [
+            c for c in cur.execute.call_args_list if _sql(c.args[0]).startswith("CREATE TEMP")
+        ]
+        assert len(creates) == 2
+
+    def test_empty_batch_is_a_noop(self):
+        conn, _, _ = _mock_conn()
+        loader = PostgresBulkLoader(conn=conn)
+        assert loader.load(RULES_TABLE, []) == 0
+        assert loader.load_batch(RULES_TABLE, []) == 0
+        conn.cursor.assert_not_called()
+
+    def test_connects_lazily_and_closes_own_connection(self):
+        with patch("atlas.storage.bulk.psycopg.connect") as connect:
+            with PostgresBulkLoader("postgresql://db") as loader:
+                connect.assert_not_called()
+                assert loader.conn is loader.conn
+            connect.assert_called_once_with("postgresql://db")
+            connect.return_value.close.assert_called_once()
+            assert loader._conn is None
+
+    def test_does_not_close_borrowed_connection(self):
+        conn = MagicMock()
+        with PostgresBulkLoader(conn=conn):
+            pass
+        conn.close.assert_not_called()
+
+    def test_url_requires_psycopg(self):
+        with patch("atlas.storage.bulk.HAS_PSYCOPG", False):
+            with pytest.raises(ImportError, match="psycopg"):
+                PostgresBulkLoader("postgresql://db")
+            # A caller's connection needs no psycopg import
+            PostgresBulkLoader(conn=MagicMock())
+
+    def test_imports_without_psycopg(self):
+        spec = importlib.util.spec_from_file_location(
+            "_bulk_without_psycopg", atlas.storage.bulk.__file__
+        )
+        module = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"psycopg": None}):
+            spec.loader.exec_module(module)
+        assert not module.HAS_PSYCOPG
+
+
+@pytest.mark.skipif(not TEST_DB_URL, reason="ATLAS_TEST_POSTGRES_URL not set")
+class TestPostgresBulkLoaderLive:
+    @pytest.fixture
+    def table(self):
+        import psycopg
+
+        schema = f"bulk_test_{uuid.uuid4().hex[:8]}"
+        with psycopg.connect(TEST_DB_URL, autocommit=True) as conn:
+            conn.execute(f"CREATE SCHEMA {schema}")
+            conn.execute(f"CREATE TABLE {schema}.items (id TEXT PRIMARY KEY, body TEXT, n INTEGER)")
+            yield BulkTable(
+                schema=schema, name="items", columns=("id", "body", "n"), conflict=("id",)
+            )
+            conn.execute(f"DROP SCHEMA {schema} CASCADE")
+
+    def test_copy_and_merge(self, table):
+        import psycopg
+
+        with PostgresBulkLoader(TEST_DB_URL) as loader:
+            loader.load(table, [{"id": "a", "body": "one", "n": 1}, {"id": "b", "body": "x\ty"}])
+            # Second load updates in place; of a key repeated in a batch, the last wins
+            loader.load(
+                table, [{"id": "a", "body": "eins", "n": 3}, {"id": "a", "body": "uno", "n": 2}]
+            )
+
+        with psycopg.connect(TEST_DB_URL) as conn:
+            rows = conn.execute(
+                f"SELECT id, body, n FROM {table.schema}.items ORDER BY id"
+            ).fetchall()
+        assert rows == [("a", "uno", 2), ("b", "x\ty", None)]
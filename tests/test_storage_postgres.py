@@ -72,3 +72,106 @@ class TestPostgresStorageSubsectionConversion:
         assert isinstance(result, Subsection)
         assert result.identifier == "a"
         assert len(result.children) == 1
+
+
+def _executed_sql(conn) -> list[str]:
+    return [str(c.args[0]) for c in conn.execute.call_args_list]
+
+
+@pytest.mark.skipif(not POSTGRES_AVAILABLE, reason="SQLAlchemy not installed")
+class TestPostgresStorageSearch:
+    @pytest.fixture
+    def storage(self):
+        with patch("atlas.storage.postgres.get_engine") as mock_engine:
+            storage = PostgresStorage("postgresql://localhost/test")
+        storage.Session = MagicMock()
+        return storage, mock_engine.return_value
+
+    def test_schema_adds_weighted_search_vector(self, storage):
+        _, engine = storage
+        conn = engine.connect.return_value.__enter__.return_value
+        statements = _executed_sql(conn)
+
+        (column,) = [s for s in statements if "search_vector tsvector" in s]
+        assert column.strip().startswith("CREATE TABLE IF NOT EXISTS sections")
+        assert "GENERATED ALWAYS AS" in column and "STORED" in column
+        assert "setweight(to_tsvector('english', COALESCE(section_title, '')), 'A')" in column
+        assert "setweight(to_tsvector('english', COALESCE(text, '')), 'B')" in column
+        assert any("USING GIN (search_vector)" in s for s in statements)
+        # Startup never rewrites an existing table
+        assert not any("ALTER TABLE" in s for s in statements)
+
+    def test_existing_table_keeps_expression_index_until_migrated(self):
+        with patch("atlas.storage.postgres.get_engine") as mock_engine:
+            conn = mock_engine.return_value.connect.return_value.__enter__.return_value
+            conn.execute.return_value.scalar.return_value = None
+            storage = PostgresStorage("postgresql://localhost/test")
+        storage.Session = MagicMock()
+        session = storage.Session.return_value.__enter__.return_value
+        session.execute.return_value.fetchall.return_value = []
+
+        assert not storage.has_search_vector
+        statements = _executed_sql(conn)
+        assert any("idx_sections_text_search" in s for s in statements)
+        assert not any("USING GIN (search_vector)" in s for s in statements)
+        storage.search("earned income")
+        sql = str(session.execute.call_args.args[0])
+        assert "ts_rank(to_tsvector('english', COALESCE(section_title, '') ||" in sql
+
+        conn.execute.reset_mock()
+        storage.migrate_search_vector()
+        statements = _executed_sql(conn)
+        assert "ADD COLUMN IF NOT EXISTS search_vector" in statements[0]
+        assert any("USING GIN (search_vector)" in s for s in statements)
+        assert "DROP INDEX IF EXISTS idx_sections_text_search" in statements
+        assert storage.has_search_vector
+
+    def test_search_ranks_on_stored_vector(self, storage):
+        storage, _ = storage
+        session = storage.Session.return_value.__enter__.return_value
+        row = MagicMock(
+            title=26, section="32", section_title="Earned income", snippet="<mark>x</mark>", score=0.6
+        )
+        session.execute.return_value.fetchall.return_value = [row]
+
+        results = storage.search("earned income", title=26, limit=5)
+
+        assert len(results) == 1
+        assert results[0].citation.section == "32"
+        assert results[0].score == pytest.approx(0.6)
+
+        sql = str(session.execute.call_args.args[0])
+        params = session.execute.call_args.args[1]
+        assert params == {"query": "earned income", "limit": 5, "title": 26}
+        assert "to_tsvector" not in sql
+        assert "ts_rank(search_vector" in sql
+        # Headlines are built outside the ranked, limited subquery
+        inner = sql[sql.index("FROM (") : sql.index(") AS top")]
+        assert "LIMIT :limit" in inner
+        assert "ts_headline" not in inner
+        assert "ts_headline" in sql
+
+
+@pytest.mark.skipif(not POSTGRES_AVAILABLE, reason="SQLAlchemy not installed")
+class TestPostgresStorageLookups:
+    @pytest.fixture
+    def storage(self):
+        with patch("atlas.storage.postgres.get_engine"):
+            storage = PostgresStorage("postgresql://localhost/test")
+        storage.Session = MagicMock()
+        return storage
+
+    def test_get_section_and_get_sections_pick_the_same_doc_type(self, storage):
+        session = storage.Session.return_value.__enter__.return_value
+        session.execute.return_value.fetchone.return_value = None
+        session.execute.return_value.fetchall.return_value = []
+
+        storage.get_section(26, "32")
+        single = str(session.execute.call_args.args[0])
+        storage.get_sections([(26, "32"), (26, "24")])
+        batch = str(session.execute.call_args.args[0])
+
+        tiebreak = "doc_type = 'statute' DESC, doc_type"
+        assert f"ORDER BY {tiebreak}" in single
+        assert "DISTINCT ON (title, section)" in batch
+        assert f"ORDER BY title, section, {tiebreak}" in batch
@@ -8,7 +8,14 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from atlas.storage.r2 import R2Storage, get_r2, get_r2_atlas, get_r2_rules_xml
+from atlas.storage.r2 import (
+    R2Storage,
+    content_md5,
+    get_r2,
+    get_r2_atlas,
+    get_r2_rules_xml,
+)
+from atlas.storage.r2_manifest import R2Manifest
 
 
 class TestR2StorageInit:
@@ -260,6 +267,135 @@ class TestR2StorageQuery:
         assert result == []
 
 
+class TestR2StorageUploadMany:
+    @patch("atlas.storage.r2.boto3")
+    def test_upload_many(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        uploads = ((f"k{i}.xml", f"<s{i}/>", {"n": str(i)}) for i in range(50))
+        summary = r2.upload_many(uploads, workers=4)
+
+        assert summary.uploaded == 50
+        assert summary.skipped == 0
+        assert summary.failed == []
+        assert mock_client.put_object.call_count == 50
+        keys = {c[1]["Key"] for c in mock_client.put_object.call_args_list}
+        assert keys == {f"k{i}.xml" for i in range(50)}
+
+    @patch("atlas.storage.r2.boto3")
+    def test_upload_many_with_manifest_and_failures(self, mock_boto3):
+        mock_client = MagicMock()
+
+        def put_object(**kwargs):
+            if kwargs["Key"] == "bad.xml":
+                raise RuntimeError("R2 down")
+
+        mock_client.put_object.side_effect = put_object
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+        manifest = R2Manifest(":memory:", r2.bucket)
+        manifest.record("same.xml", content_md5("<same/>"), 7)
+
+        summary = r2.upload_many(
+            [("same.xml", "<same/>"), ("new.xml", "<new/>"), ("bad.xml", "<bad/>")],
+            manifest=manifest,
+        )
+
+        assert summary.uploaded == 1
+        assert summary.skipped == 1
+        assert summary.failed == [("bad.xml", "R2 down")]
+        assert manifest.get("new.xml")["etag"] == content_md5("<new/>")
+        assert manifest.get("bad.xml") is None
+        manifest.close()
+
+
+class TestR2StoragePagination:
+    @patch("atlas.storage.r2.boto3")
+    def test_iter_prefix_follows_continuation_tokens(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": f"a/{i}", "Size": 1} for i in range(1000)],
+                "IsTruncated": True,
+                "NextContinuationToken": "t1",
+            },
+            {"Contents": [{"Key": "a/last", "Size": 1}], "IsTruncated": False},
+        ]
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        assert len(list(r2.iter_prefix("a/"))) == 1001
+        second = mock_client.list_objects_v2.call_args_list[1][1]
+        assert second["ContinuationToken"] == "t1"
+
+    @patch("atlas.storage.r2.boto3")
+    def test_list_prefix_max_keys(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {
+            "Contents": [{"Key": f"a/{i}", "Size": 1} for i in range(5)]
+        }
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        assert len(r2.list_prefix("a/", max_keys=3)) == 3
+        assert mock_client.list_objects_v2.call_args[1]["MaxKeys"] == 3
+
+    @patch("atlas.storage.r2.boto3")
+    def test_iter_prefix_sharded(self, mock_boto3):
+        mock_client = MagicMock()
+
+        def list_objects_v2(**kwargs):
+            if kwargs.get("Delimiter") == "/":
+                return {
+                    "CommonPrefixes": [{"Prefix": "s/ak/"}, {"Prefix": "s/ny/"}],
+                    "Contents": [{"Key": "s/index.json", "Size": 1}],
+                }
+            state = kwargs["Prefix"]
+            return {"Contents": [{"Key": f"{state}{i}.xml", "Size": 1} for i in range(3)]}
+
+        mock_client.list_objects_v2.side_effect = list_objects_v2
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        keys = [obj["Key"] for obj in r2.iter_prefix_sharded("s/", workers=2)]
+        assert keys[0] == "s/index.json"
+        assert sorted(keys[1:]) == sorted(
+            [f"s/ak/{i}.xml" for i in range(3)] + [f"s/ny/{i}.xml" for i in range(3)]
+        )
+
+    @patch("atlas.storage.r2.boto3")
+    def test_list_shards_follows_continuation(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "CommonPrefixes": [{"Prefix": "s/ak/"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "t1",
+            },
+            {"CommonPrefixes": [{"Prefix": "s/ny/"}], "Contents": [{"Key": "s/x", "Size": 1}]},
+        ]
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        shards, objects = r2.list_shards("s/")
+
+        assert shards == ["s/ak/", "s/ny/"]
+        assert [o["Key"] for o in objects] == ["s/x"]
+        assert mock_client.list_objects_v2.call_args[1]["ContinuationToken"] == "t1"
+
+    @patch("atlas.storage.r2.boto3")
+    def test_iter_prefix_sharded_without_shards(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.return_value = {"Contents": [{"Key": "s/a", "Size": 1}]}
+        mock_boto3.client.return_value = mock_client
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+
+        assert [o["Key"] for o in r2.iter_prefix_sharded("s/")] == ["s/a"]
+        assert mock_client.list_objects_v2.call_count == 1
+
+
 class TestR2StorageStats:
     @patch("atlas.storage.r2.boto3")
     def test_get_state_stats(self, mock_boto3):
@@ -277,6 +413,22 @@ class TestR2StorageStats:
         assert stats["count"] == 2
         assert stats["total_bytes"] == 3500
 
+    @patch("atlas.storage.r2.boto3")
+    def test_get_state_stats_counts_every_page(self, mock_boto3):
+        mock_client = MagicMock()
+        mock_client.list_objects_v2.side_effect = [
+            {
+                "Contents": [{"Key": f"k{i}", "Size": 2} for i in range(1000)],
+                "IsTruncated": True,
+                "NextContinuationToken": "t1",
+            },
+            {"Contents": [{"Key": "k1000", "Size": 2}]},
+        ]
+        mock_boto3.client.return_value = mock_client
+
+        r2 = R2Storage("https://r2.example.com", "key", "secret")
+        assert r2.get_state_stats("ak") == {"count": 1001, "total_bytes": 2002}
+
 
 class TestConvenienceFunctions:
     @patch("atlas.storage.r2.R2Storage.from_config")
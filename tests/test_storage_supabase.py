@@ -50,3 +50,45 @@ class TestSupabaseStorageInit:
     def test_init_without_psycopg(self):
         with pytest.raises(ImportError, match="psycopg"):
             SupabaseStorage(db_url="postgresql://test")
+
+
+class TestSupabaseStorageBatchStore:
+    def _storage(self):
+        from unittest.mock import MagicMock
+
+        storage = SupabaseStorage(db_url="postgresql://test")
+        storage._conn = MagicMock()
+        return storage
+
+    def _statutes(self, n):
+        from atlas.models_statute import Statute
+
+        for i in range(n):
+            yield Statute(
+                jurisdiction="us-ca",
+                code="RTC",
+                code_name="Revenue and Taxation Code",
+                section=str(i),
+                title=f"Section {i}",
+                text="text",
+                source_url=f"https://example.com/{i}",
+            )
+
+    @pytest.mark.skipif(not HAS_PSYCOPG, reason="psycopg not installed")
+    def test_copy_loads_in_batches(self):
+        storage = self._storage()
+        with patch("atlas.storage.supabase.PostgresBulkLoader") as loader_cls:
+            loader_cls.return_value.load.side_effect = lambda table, rows, batch_size: len(
+                list(rows)
+            )
+            assert storage.batch_store(self._statutes(3)) == 3
+        loader_cls.assert_called_once_with(conn=storage._conn)
+        storage._conn = None
+
+    @pytest.mark.skipif(not HAS_PSYCOPG, reason="psycopg not installed")
+    def test_row_by_row(self):
+        storage = self._storage()
+        with patch.object(SupabaseStorage, "store_statute") as store:
+            assert storage.batch_store(self._statutes(2), copy=False) == 2
+        assert store.call_count == 2
+        storage._conn = None
@@ -0,0 +1,29 @@
+"""Tests for the USLM parser against a real US Code title.
+
+Needs data/uscode/usc26.xml (``atlas download 26``); skipped otherwise.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from atlas.parsers.us.statutes import USLMParser
+
+USC26 = Path(__file__).parent.parent / "data" / "uscode" / "usc26.xml"
+
+pytestmark = pytest.mark.skipif(not USC26.exists(), reason="usc26.xml not downloaded")
+
+
+class TestTitle26:
+    def test_title_metadata(self):
+        parser = USLMParser(USC26, streaming=True)
+        assert parser.get_title_number() == 26
+        assert parser.get_title_name() == USLMParser(USC26).get_title_name()
+
+    def test_streaming_matches_dom_parser(self):
+        streamed = USLMParser(USC26, streaming=True).iter_sections()
+        loaded = USLMParser(USC26).iter_sections()
+        for a, b in zip(streamed, loaded, strict=True):
+            assert a.model_dump(exclude={"retrieved_at"}) == b.model_dump(
+                exclude={"retrieved_at"}
+            )
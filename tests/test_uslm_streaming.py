@@ -0,0 +1,257 @@
+"""Tests for the USLM (US Code) parser on small synthetic documents."""
+
+import queue
+import threading
+
+import pytest
+
+from atlas.parsers.us.statutes import (
+    USLM_NS_GPO,
+    USLM_NS_HOUSE,
+    USLMParser,
+    _parse_title_to_queue,
+    _put,
+    iter_titles_parallel,
+)
+
+USLM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0" identifier="/us/usc/t26">
+  <meta>
+    <docNumber>26</docNumber>
+  </meta>
+  <main>
+    <title identifier="/us/usc/t26">
+      <num value="26">Title 26—</num>
+      <heading>INTERNAL REVENUE CODE</heading>
+      <chapter identifier="/us/usc/t26/ch1">
+        <heading>NORMAL TAXES AND SURTAXES</heading>
+        <section identifier="/us/usc/t26/s1">
+          <num value="1">§ 1.</num>
+          <heading>Tax imposed</heading>
+          <subsection identifier="/us/usc/t26/s1/a">
+            <heading>Married individuals</heading>
+            <content>There is hereby imposed a tax. See <ref href="/us/usc/t26/s6013">section 6013</ref>.</content>
+          </subsection>
+        </section>
+        <section identifier="/us/usc/t26/s32">
+          <num value="32">§ 32.</num>
+          <heading>Earned income</heading>
+          <subsection identifier="/us/usc/t26/s32/a">
+            <heading>Allowance of credit</heading>
+            <chapeau>In the case of an eligible individual—</chapeau>
+            <paragraph identifier="/us/usc/t26/s32/a/1">
+              <heading>In general</heading>
+              <content>A credit is allowed.</content>
+            </paragraph>
+          </subsection>
+          <notes>
+            <quotedContent>
+              <section identifier="/us/usc/t26/s32A">
+                <heading>Quoted amendment</heading>
+                <content>Amended text.</content>
+              </section>
+            </quotedContent>
+          </notes>
+        </section>
+      </chapter>
+    </title>
+  </main>
+</uscDoc>
+"""
+
+
+@pytest.fixture
+def uslm_path(tmp_path):
+    path = tmp_path / "usc26.xml"
+    path.write_text(USLM_XML)
+    return path
+
+
+def _dump(sections):
+    return [s.model_dump(exclude={"retrieved_at"}) for s in sections]
+
+
+class TestNamespaceFor:
+    def test_house_namespace(self, uslm_path):
+        parser = USLMParser(uslm_path, streaming=True)
+        list(parser.iter_sections())
+        assert parser.ns == USLM_NS_HOUSE
+
+    def test_gpo_namespace(self, tmp_path):
+        path = tmp_path / "gpo.xml"
+        path.write_text('<uscDoc xmlns="http://schemas.gpo.gov/xml/uslm"/>')
+        parser = USLMParser(path, streaming=True)
+        list(parser.iter_sections())
+        assert parser.ns == USLM_NS_GPO
+
+    def test_unknown_namespace_defaults_to_gpo(self, tmp_path):
+        path = tmp_path / "plain.xml"
+        path.write_text("<uscDoc/>")
+        parser = USLMParser(path, streaming=True)
+        list(parser.iter_sections())
+        assert parser.ns == USLM_NS_GPO
+
+    def test_house_in_root_tag(self, tmp_path):
+        path = tmp_path / "prefixed.xml"
+        path.write_text('<u:uscDoc xmlns:u="http://house.gov/uslm"/>')
+        parser = USLMParser(path, streaming=True)
+        list(parser.iter_sections())
+        assert parser.ns == USLM_NS_HOUSE
+
+
+class TestStreamingParser:
+    def test_title_metadata_from_header(self, uslm_path):
+        parser = USLMParser(uslm_path, streaming=True)
+        assert parser.get_title_number() == 26
+        assert parser.get_title_name() == "INTERNAL REVENUE CODE"
+        assert parser._tree is None
+
+    def test_matches_dom_parser(self, uslm_path):
+        streamed = _dump(USLMParser(uslm_path, streaming=True).iter_sections())
+        loaded = _dump(USLMParser(uslm_path).iter_sections())
+        assert streamed == loaded
+        assert [s["citation"]["section"] for s in streamed] == ["1", "32", "32A"]
+
+    def test_section_contents(self, uslm_path):
+        sections = list(USLMParser(uslm_path, streaming=True).iter_sections())
+        s32 = sections[1]
+        assert s32.title_name == "INTERNAL REVENUE CODE"
+        assert s32.section_title == "Earned income"
+        assert s32.get_subsection("a/1").text.endswith("A credit is allowed.")
+        assert sections[0].references_to == ["26 USC 6013"]
+
+    def test_header_scan_closes_stream(self, uslm_path):
+        parser = USLMParser(uslm_path, streaming=True)
+        streams = []
+        original = parser._iterparse
+
+        def tracked():
+            stream = original()
+            streams.append(stream)
+            return stream
+
+        parser._iterparse = tracked
+        parser.get_title_number()
+        # Closed as soon as the scan hits the first section, not left suspended
+        assert len(streams) == 1
+        assert streams[0].gi_frame is None
+
+    def test_does_not_load_tree(self, uslm_path):
+        parser = USLMParser(uslm_path, streaming=True)
+        list(parser.iter_sections())
+        assert parser._tree is None
+
+    def test_title_number_from_title_identifier(self, tmp_path):
+        path = tmp_path / "usc5.xml"
+        path.write_text(
+            '<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0"><main>'
+            '<title identifier="/us/usc/t5"><section identifier="/us/usc/t5/s101">'
+            "<heading>Executive departments</heading></section></title></main></uscDoc>"
+        )
+        parser = USLMParser(path, streaming=True)
+        sections = list(parser.iter_sections())
+        assert sections[0].citation.title == 5
+        assert sections[0].title_name == "Title 5"
+
+    def test_missing_title_number_raises(self, tmp_path):
+        path = tmp_path / "bad.xml"
+        path.write_text('<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0"/>')
+        with pytest.raises(ValueError, match="Cannot determine title number"):
+            USLMParser(path, streaming=True).get_title_number()
+
+    def test_bad_section_is_skipped(self, uslm_path, capsys, monkeypatch):
+        parser = USLMParser(uslm_path, streaming=True)
+        original = parser._parse_section
+
+        def flaky(elem, title_num, title_name):
+            if elem.get("identifier") == "/us/usc/t26/s1":
+                raise RuntimeError("boom")
+            return original(elem, title_num, title_name)
+
+        monkeypatch.setattr(parser, "_parse_section", flaky)
+        sections = list(parser.iter_sections())
+        assert [s.citation.section for s in sections] == ["32", "32A"]
+        assert "Failed to parse section /us/usc/t26/s1" in capsys.readouterr().out
+
+
+class TestIterTitlesParallel:
+    def test_parses_titles_in_workers(self, tmp_path, uslm_path):
+        other = tmp_path / "usc5.xml"
+        other.write_text(
+            USLM_XML.replace("<docNumber>26</docNumber>", "<docNumber>5</docNumber>")
+            .replace("/t26", "/t5")
+        )
+
+        chunks = list(iter_titles_parallel([uslm_path, other], workers=2, chunk_size=2))
+
+        finals = {c.title_num: c for c in chunks if c.final}
+        assert set(finals) == {5, 26}
+        assert all(c.count == 3 and c.error is None for c in finals.values())
+        sections = [s for c in chunks if c.title_num == 26 for s in c.sections]
+        assert [s.citation.section for s in sections] == ["1", "32", "32A"]
+        assert len([c for c in chunks if c.title_num == 26]) == 2
+
+    def test_reports_worker_errors(self, tmp_path):
+        bad = tmp_path / "usc99.xml"
+        bad.write_text("<uscDoc")
+
+        chunks = list(iter_titles_parallel([bad], workers=1))
+
+        assert len(chunks) == 1
+        assert chunks[0].final
+        assert chunks[0].error
+
+    def test_early_stop_releases_workers(self, tmp_path, uslm_path):
+        paths = []
+        for n in range(4):
+            path = tmp_path / f"copy{n}.xml"
+            path.write_text(USLM_XML)
+            paths.append(path)
+        chunks = iter_titles_parallel(paths, workers=1, chunk_size=1)
+        first = next(chunks)
+
+        # The worker is blocked on the full queue; closing must not hang on it
+        closer = threading.Thread(target=chunks.close)
+        closer.start()
+        closer.join(timeout=30)
+
+        assert not closer.is_alive()
+        assert first.title_num == 26
+
+
+class TestParseTitleWorker:
+    """The worker body, run in-process (coverage doesn't follow the pool)."""
+
+    def test_puts_chunks_then_final(self, uslm_path):
+        out = queue.Queue()
+        _parse_title_to_queue(str(uslm_path), out, threading.Event(), chunk_size=2)
+
+        messages = [out.get_nowait() for _ in range(out.qsize())]
+        assert [len(m[3]) for m in messages] == [2, 1]
+        assert [m[4] for m in messages] == [False, True]
+        assert messages[-1][5] == 3
+
+    def test_reports_error(self, tmp_path):
+        bad = tmp_path / "bad.xml"
+        bad.write_text("<uscDoc")
+        out = queue.Queue()
+        _parse_title_to_queue(str(bad), out, threading.Event(), chunk_size=2)
+
+        (message,) = [out.get_nowait()]
+        assert message[4] is True
+        assert message[6]
+
+    def test_stops_when_consumer_gone(self, uslm_path):
+        out = queue.Queue(maxsize=1)
+        stop = threading.Event()
+        stop.set()
+        _parse_title_to_queue(str(uslm_path), out, stop, chunk_size=1)
+        assert out.empty()
+
+    def test_put_retries_while_full(self):
+        out = queue.Queue(maxsize=1)
+        out.put("x")
+        stop = threading.Event()
+        threading.Timer(0.15, out.get).start()
+        assert _put(out, stop, "y")
+        assert out.get_nowait() == "y"